@@ -13,6 +13,10 @@ from datetime import datetime
 import asyncio
 import httpx
 
+from sei_dlp_ai.models.tick_math import (
+    align_price_ranges, align_tick, max_usable_tick, min_usable_tick, sqrt_price_x96_to_price, tick_to_price
+)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -41,6 +45,7 @@ class VaultAnalysisRequest(BaseModel):
     liquidity: float
     timeframe: str = "1d"
     chain_id: int = 1328
+    sqrt_price_x96: Optional[int] = None
 
 class MarketPredictionRequest(BaseModel):
     symbol: str
@@ -102,6 +107,14 @@ class DeltaNeutralResponse(BaseModel):
     revenue_breakdown: Dict[str, float]
     reasoning: str
 
+# SEI standard tick spacing
+SEI_TICK_SPACING = 60
+
+def price_range_to_ticks(lower_price: float, upper_price: float, tick_spacing: int = SEI_TICK_SPACING) -> tuple:
+    """Align a price range to the tick grid, returning (lower_tick, upper_tick, lower_price, upper_price)"""
+    lower_tick, upper_tick = (int(tick) for tick in align_price_ranges([lower_price], [upper_price], tick_spacing)[0])
+    return lower_tick, upper_tick, float(tick_to_price(lower_tick)), float(tick_to_price(upper_tick))
+
 # API Endpoints
 
 @app.api_route("/", methods=["GET", "HEAD"])
@@ -145,18 +158,15 @@ async def predict_optimal_range(request: VaultAnalysisRequest):
         volatility_factor = min(request.volatility, 1.0)
         price_buffer = request.current_price * volatility_factor * 0.1
         
-        # SEI-specific tick spacing optimization
-        tick_spacing = 60  # SEI standard
-        current_tick = int(request.current_price * 10000)  # Simplified conversion
-        
-        optimal_range_width = int(price_buffer * 10000 / tick_spacing) * tick_spacing
-        
-        lower_tick = current_tick - optimal_range_width // 2
-        upper_tick = current_tick + optimal_range_width // 2
+        # Center the range on the pool price, preferring the exact on-chain sqrt price
+        current_price = request.current_price
+        if request.sqrt_price_x96:
+            current_price = float(sqrt_price_x96_to_price(request.sqrt_price_x96))
         
-        # Align to tick spacing
-        lower_tick = (lower_tick // tick_spacing) * tick_spacing  
-        upper_tick = (upper_tick // tick_spacing) * tick_spacing
+        # SEI-specific tick spacing optimization
+        lower_tick, upper_tick, lower_price, upper_price = price_range_to_ticks(
+            current_price - price_buffer / 2, current_price + price_buffer / 2
+        )
         
         # Calculate confidence based on market conditions
         confidence = 0.85 - (volatility_factor * 0.2)
@@ -168,8 +178,8 @@ async def predict_optimal_range(request: VaultAnalysisRequest):
         return OptimalRangeResponse(
             lower_tick=lower_tick,
             upper_tick=upper_tick,
-            lower_price=lower_tick / 10000,  # Convert back to price
-            upper_price=upper_tick / 10000,
+            lower_price=lower_price,
+            upper_price=upper_price,
             confidence=confidence,
             expected_apr=expected_apr,
             risk_score=risk_score,
@@ -266,10 +276,16 @@ async def analyze_rebalance_need(request: RebalanceRecommendationRequest):
             new_lower_tick = request.current_tick - new_range_width // 2
             new_upper_tick = request.current_tick + new_range_width // 2
             
-            # Align to SEI tick spacing
-            tick_spacing = 60
-            new_lower_tick = (new_lower_tick // tick_spacing) * tick_spacing
-            new_upper_tick = (new_upper_tick // tick_spacing) * tick_spacing
+            # Align to SEI tick spacing, keeping the current tick inside the range
+            new_lower_tick = align_tick(new_lower_tick, SEI_TICK_SPACING, rounding="floor")
+            new_upper_tick = align_tick(new_upper_tick, SEI_TICK_SPACING, rounding="ceil")
+            if new_upper_tick <= new_lower_tick:
+                new_upper_tick = new_lower_tick + SEI_TICK_SPACING
+            
+            # Keep a non-empty range inside the usable tick bounds
+            new_upper_tick = min(new_upper_tick, max_usable_tick(SEI_TICK_SPACING))
+            new_lower_tick = max(min(new_lower_tick, new_upper_tick - SEI_TICK_SPACING),
+                                 min_usable_tick(SEI_TICK_SPACING))
         else:
             new_lower_tick = request.lower_tick
             new_upper_tick = request.upper_tick
@@ -329,17 +345,9 @@ async def predict_delta_neutral_optimization(request: DeltaNeutralRequest):
         price_buffer = request.current_price * volatility_factor * 0.08  # Tighter than regular LP
         
         # SEI-specific tick spacing optimization
-        tick_spacing = 60
-        current_tick = int(request.current_price * 10000)
-        
-        optimal_range_width = int(price_buffer * 10000 / tick_spacing) * tick_spacing
-        
-        lower_tick = current_tick - optimal_range_width // 2
-        upper_tick = current_tick + optimal_range_width // 2
-        
-        # Align to tick spacing
-        lower_tick = (lower_tick // tick_spacing) * tick_spacing
-        upper_tick = (upper_tick // tick_spacing) * tick_spacing
+        lower_tick, upper_tick, lower_price, upper_price = price_range_to_ticks(
+            request.current_price - price_buffer / 2, request.current_price + price_buffer / 2
+        )
         
         # Calculate expected neutrality (how close to delta neutral)
         expected_neutrality = hedge_ratio * 0.98  # Small margin for imperfection
@@ -375,8 +383,8 @@ async def predict_delta_neutral_optimization(request: DeltaNeutralRequest):
             hedge_ratio=hedge_ratio,
             lower_tick=lower_tick,
             upper_tick=upper_tick,
-            lower_price=lower_tick / 10000,
-            upper_price=upper_tick / 10000,
+            lower_price=lower_price,
+            upper_price=upper_price,
             expected_neutrality=expected_neutrality,
             expected_apr=expected_apr,
             revenue_breakdown=revenue_breakdown,
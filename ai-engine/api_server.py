@@ -140,6 +140,8 @@ class LSTMPredictionRequest(BaseModel):
     historical_data: Optional[List[Dict[str, float]]] = Field(None, description="Historical price data")
     sequence_length: int = Field(168, description="Number of past hours to use")
     prediction_horizon: int = Field(24, description="Hours to predict ahead")
+    n_samples: int = Field(0, ge=0, le=256,
+                           description="MC dropout samples for prediction intervals (0 for a single pass)")
 
 
 class LSTMPredictionResponse(BaseModel):
@@ -149,6 +151,8 @@ class LSTMPredictionResponse(BaseModel):
     trend: str
     support_levels: List[float]
     resistance_levels: List[float]
+    prediction_intervals: Optional[Dict[str, Dict[str, List[float]]]] = None
+    intervals_calibrated: Optional[bool] = None
 
 
 class ILPredictionRequest(BaseModel):
@@ -335,6 +339,13 @@ async def predict_lstm_price(request: LSTMPredictionRequest):
     if models['lstm_forecaster'] is None:
         raise HTTPException(status_code=503, detail="LSTM Forecaster not loaded")
 
+    # Support/resistance need the 50% and 80% intervals; a calibrated model only serves its calibrated levels
+    calibration = models['lstm_forecaster'].interval_calibration
+    if request.n_samples > 0 and calibration is not None:
+        missing = [level for level in (0.5, 0.8) if level not in calibration['coverage']]
+        if missing:
+            raise HTTPException(status_code=400, detail=f"Prediction intervals are not calibrated for coverage {missing}")
+
     try:
         # Prepare data
         if request.historical_data:
@@ -357,9 +368,25 @@ async def predict_lstm_price(request: LSTMPredictionRequest):
         predictions = results['predictions']
         trend = "BULLISH" if predictions[-1] > predictions[0] else "BEARISH"
 
-        # Calculate support/resistance levels
-        support_levels = [float(np.percentile(predictions, q)) for q in [10, 25]]
-        resistance_levels = [float(np.percentile(predictions, q)) for q in [75, 90]]
+        prediction_intervals = None
+        intervals_calibrated = None
+        if request.n_samples > 0:
+            # Support/resistance from the 50% and 80% prediction intervals over the horizon
+            probabilistic = models['lstm_forecaster'].predict_intervals(
+                df, n_samples=request.n_samples, coverage=(0.5, 0.8)
+            )
+            intervals = probabilistic['intervals']
+            support_levels = [float(intervals[0.8]['lower'].min()), float(intervals[0.5]['lower'].min())]
+            resistance_levels = [float(intervals[0.5]['upper'].max()), float(intervals[0.8]['upper'].max())]
+            prediction_intervals = {
+                str(level): {bound: values.tolist() for bound, values in interval.items()}
+                for level, interval in intervals.items()
+            }
+            intervals_calibrated = probabilistic['calibrated']
+        else:
+            # Calculate support/resistance levels
+            support_levels = [float(np.percentile(predictions, q)) for q in [10, 25]]
+            resistance_levels = [float(np.percentile(predictions, q)) for q in [75, 90]]
 
         # Generate timestamps
         current_time = datetime.now()
@@ -372,7 +399,9 @@ async def predict_lstm_price(request: LSTMPredictionRequest):
             uncertainty=results.get('uncertainty', []).tolist(),
             trend=trend,
             support_levels=support_levels,
-            resistance_levels=resistance_levels
+            resistance_levels=resistance_levels,
+            prediction_intervals=prediction_intervals,
+            intervals_calibrated=intervals_calibrated
         )
 
         return response
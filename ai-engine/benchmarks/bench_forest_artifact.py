@@ -0,0 +1,67 @@
+"""
+Microbenchmark: joblib pickle vs compact memory-mapped forest artifact
+
+Usage:
+    python benchmarks/bench_forest_artifact.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sei_dlp_ai.models.liquidity_optimizer import LiquidityOptimizer
+from sei_dlp_ai.models.forest_artifact import CompactForest
+
+
+def timeit(fn, *args, repeats: int = 5) -> float:
+    """Best-of-N wall time in milliseconds"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    rng = np.random.default_rng(0)
+    n_samples, n_features = 4000, 29
+    data = pd.DataFrame(rng.normal(size=(n_samples, n_features)), columns=[f"feature_{i}" for i in range(n_features)])
+    data['lower_bound'] = rng.uniform(0.40, 0.44, n_samples)
+    data['upper_bound'] = rng.uniform(0.46, 0.50, n_samples)
+    data['confidence'] = rng.uniform(0.6, 0.9, n_samples)
+
+    optimizer = LiquidityOptimizer()
+    optimizer.train_model(data)
+    features = rng.normal(size=(256, n_features))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pickle_path = os.path.join(tmp, "model.joblib")
+        artifact_path = os.path.join(tmp, "model.forest")
+        joblib.dump((optimizer.scaler, optimizer.ml_model), pickle_path)
+        optimizer.save_model(artifact_path)
+
+        scaler, model = joblib.load(pickle_path)
+        forest = CompactForest.load(artifact_path)
+
+        print(f"{'':>22} {'joblib':>10} {'artifact':>10}")
+        print(f"{'file size MB':>22} {os.path.getsize(pickle_path) / 1e6:>10.2f} {os.path.getsize(artifact_path) / 1e6:>10.2f}")
+        print(f"{'load ms':>22} {timeit(joblib.load, pickle_path):>10.2f} {timeit(CompactForest.load, artifact_path):>10.2f}")
+        print(f"{'predict 1 row ms':>22} "
+              f"{timeit(lambda: model.predict(scaler.transform(features[:1]))):>10.2f} "
+              f"{timeit(forest.predict, features[:1]):>10.2f}")
+        print(f"{'predict 256 rows ms':>22} "
+              f"{timeit(lambda: model.predict(scaler.transform(features))):>10.2f} "
+              f"{timeit(forest.predict, features):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
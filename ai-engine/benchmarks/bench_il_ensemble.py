@@ -0,0 +1,62 @@
+"""
+Benchmark: sequential vs scheduled ImpermanentLossPredictor ensemble training
+
+Sequential: the previous loop, every member fit in turn with its default n_jobs=-1.
+Scheduled: EnsembleScheduler, members fit concurrently with a per-member thread budget.
+Prints wall time and the per-member train/predict times the scheduler records.
+
+Usage:
+    python benchmarks/bench_il_ensemble.py
+"""
+
+import copy
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sei_dlp_ai.models.impermanent_loss_predictor import ImpermanentLossPredictor
+
+
+def sequential_fit(models, X, y):
+    for model in models.values():
+        model.fit(X, y)
+
+
+def main():
+    os.chdir(tempfile.mkdtemp())
+    rng = np.random.default_rng(0)
+    n_rows, n_features = 20000, 30
+    X = pd.DataFrame(rng.normal(0, 1, (n_rows, n_features)), columns=[f"f{i}" for i in range(n_features)])
+    y = pd.Series(0.1 * X['f0'] ** 2 - 0.05 * X['f1'] + rng.normal(0, 0.01, n_rows))
+
+    predictor = ImpermanentLossPredictor(feature_engineering=False, n_estimators=100, max_depth=10)
+    predictor.feature_names = X.columns.tolist()
+    models = copy.deepcopy(predictor.models)
+
+    start = time.perf_counter()
+    sequential_fit(models, predictor.scaler.fit_transform(X), y)
+    sequential = time.perf_counter() - start
+
+    start = time.perf_counter()
+    predictor.train(X, y, validation_split=0.2, feature_selection=False)
+    scheduled = time.perf_counter() - start
+    predictor.predict(X.iloc[:1000])
+
+    n_workers, n_threads = predictor.scheduler.budget(len(predictor.models))
+    print(f"cores: {os.cpu_count()}, workers: {n_workers} x {n_threads} threads")
+    print(f"sequential fit: {sequential:.2f}s, scheduled train (fit + metrics): {scheduled:.2f}s")
+    print(f"{'member':>18} {'train s':>8} {'predict ms':>11}")
+    for name, timing in predictor.member_timings.items():
+        print(f"{name:>18} {timing['train_seconds']:>8.2f} {timing['predict_seconds'] * 1000:>11.2f}")
+    predictor.scheduler.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark: Python IL ensemble vs single-graph ONNX ensemble
+
+Trains a 5-member ImpermanentLossPredictor, exports it with export_onnx and
+compares predict() latency. Memory is the resident-set growth of a fresh
+process that loads only one backend (joblib members vs the ONNX graph) and
+runs one prediction.
+
+Usage:
+    python benchmarks/bench_il_ensemble_onnx.py
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sei_dlp_ai.models.impermanent_loss_predictor import ImpermanentLossPredictor
+
+FEATURES = [f"f{i}" for i in range(20)]
+
+
+def make_data(n_rows: int, seed: int):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame(rng.normal(0, 1, (n_rows, len(FEATURES))), columns=FEATURES)
+    y = pd.Series(-0.1 * X['f0'] ** 2 + 0.05 * X['f1'] + rng.normal(0, 0.01, n_rows))
+    return X, y
+
+
+def timeit(fn, *args, repeats: int = 30) -> float:
+    """Best-of-N wall time in milliseconds"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def rss_mb() -> float:
+    """Current resident set size (ru_maxrss would carry the parent's peak across exec)"""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def load_and_predict(backend: str, workdir: str):
+    """Child process: load one backend, predict once, print RSS growth over the imports in MB"""
+    os.chdir(workdir)
+    predictor = ImpermanentLossPredictor(feature_engineering=False)
+    predictor.feature_names = FEATURES
+    baseline = rss_mb()
+    if backend == "onnx":
+        predictor.load_onnx_model("il_ensemble.onnx")
+    else:
+        predictor.load_model(f"{predictor.save_path}/{predictor.model_name}.pkl")
+    predictor.predict(make_data(64, 1)[0])
+    print(rss_mb() - baseline)
+
+
+def main():
+    workdir = tempfile.mkdtemp()
+    os.chdir(workdir)
+    X, y = make_data(20000, 0)
+    predictor = ImpermanentLossPredictor(feature_engineering=False, max_workers=1)
+    predictor.feature_names = FEATURES
+    predictor.train(X, y, feature_selection=False)
+    predictor.save_model()
+    predictor.export_onnx("il_ensemble.onnx")
+
+    compiled = ImpermanentLossPredictor(feature_engineering=False)
+    compiled.load_onnx_model("il_ensemble.onnx")
+
+    print(f"{'rows':>6} {'python ms':>10} {'onnx ms':>8} {'speedup':>8}")
+    for n_rows in [1, 64, 4096]:
+        batch = make_data(n_rows, 2)[0]
+        python_ms = timeit(predictor.predict, batch)
+        onnx_ms = timeit(compiled.predict, batch)
+        print(f"{n_rows:>6} {python_ms:>10.2f} {onnx_ms:>8.2f} {python_ms / onnx_ms:>7.1f}x")
+    predictor.scheduler.shutdown()
+
+    print(f"\n{'backend':>8} {'model RSS MB':>13}")
+    for backend in ["python", "onnx"]:
+        output = subprocess.run([sys.executable, __file__, backend, workdir], capture_output=True, text=True, check=True)
+        print(f"{backend:>8} {float(output.stdout.split()[0]):>13.1f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        load_and_predict(sys.argv[1], sys.argv[2])
+    else:
+        main()
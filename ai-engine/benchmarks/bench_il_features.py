@@ -0,0 +1,91 @@
+"""
+Microbenchmark: pandas feature engineering + selection + scaling vs the compiled ILFeaturePipeline
+
+Usage:
+    python benchmarks/bench_il_features.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sei_dlp_ai.models.il_feature_pipeline import ILFeaturePipeline, engineered_columns
+
+RAW = ['price_token0', 'price_token1', 'initial_price_token0', 'initial_price_token1',
+       'volatility_token0', 'volatility_token1', 'correlation', 'volume_token0', 'volume_token1',
+       'liquidity', 'range_lower', 'range_upper', 'time_in_pool', 'fee_tier', 'market_trend', 'var_95']
+
+
+def engineer_pandas(X):
+    """Previous per-request engineering from ImpermanentLossPredictor.predict"""
+    X_eng = X.copy()
+    X_eng['price_ratio'] = X['price_token0'] / (X['price_token1'] + 1e-8)
+    X_eng['log_price_ratio'] = np.log1p(X_eng['price_ratio'])
+    X_eng['sqrt_price_ratio'] = np.sqrt(X_eng['price_ratio'])
+    X_eng['price_ratio_squared'] = X_eng['price_ratio'] ** 2
+    initial_ratio = X['initial_price_token0'] / (X['initial_price_token1'] + 1e-8)
+    X_eng['price_divergence'] = np.abs(X_eng['price_ratio'] - initial_ratio) / initial_ratio
+    X_eng['price_divergence_squared'] = X_eng['price_divergence'] ** 2
+    X_eng['volatility_product'] = X['volatility_token0'] * X['volatility_token1']
+    X_eng['volatility_ratio'] = X['volatility_token0'] / (X['volatility_token1'] + 1e-8)
+    X_eng['max_volatility'] = np.maximum(X['volatility_token0'], X['volatility_token1'])
+    X_eng['volatility_diff'] = np.abs(X['volatility_token0'] - X['volatility_token1'])
+    X_eng['correlation_squared'] = X['correlation'] ** 2
+    X_eng['correlation_inverse'] = 1 / (np.abs(X['correlation']) + 0.1)
+    X_eng['decorrelation'] = 1 - np.abs(X['correlation'])
+    X_eng['volume_ratio'] = X['volume_token0'] / (X['volume_token1'] + 1e-8)
+    X_eng['total_volume'] = X['volume_token0'] + X['volume_token1']
+    X_eng['volume_imbalance'] = np.abs(X['volume_token0'] - X['volume_token1']) / (X_eng['total_volume'] + 1e-8)
+    X_eng['log_liquidity'] = np.log1p(X['liquidity'])
+    X_eng['liquidity_sqrt'] = np.sqrt(X['liquidity'])
+    X_eng['range_width'] = X['range_upper'] - X['range_lower']
+    X_eng['liquidity_concentration'] = X['liquidity'] / (X_eng['range_width'] + 1)
+    X_eng['time_in_pool_sqrt'] = np.sqrt(X['time_in_pool'])
+    X_eng['time_in_pool_log'] = np.log1p(X['time_in_pool'])
+    X_eng['fee_impact'] = X['fee_tier'] * 10000
+    X_eng['fee_to_volatility_ratio'] = X['fee_tier'] / (X_eng['max_volatility'] + 1e-8)
+    X_eng['abs_market_trend'] = np.abs(X['market_trend'])
+    X_eng['market_trend_squared'] = X['market_trend'] ** 2
+    X_eng['risk_normalized'] = X['var_95'] / (X_eng['total_volume'] + 1e-8)
+    return X_eng
+
+
+def timeit(fn, *args, repeats: int = 20) -> float:
+    """Best-of-N wall time in milliseconds"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    rng = np.random.default_rng(0)
+    train = pd.DataFrame({column: rng.uniform(0.1, 2.0, 4096) for column in RAW})
+
+    pipeline = ILFeaturePipeline(engineered_columns(train.columns))
+    selected = pipeline.feature_columns[::2]
+    pipeline.select(selected).fit(train)
+    scaler = StandardScaler().fit(engineer_pandas(train)[selected])
+
+    def old(X):
+        return scaler.transform(engineer_pandas(X)[selected])
+
+    print(f"{'rows':>6} {'pandas ms':>10} {'pipeline ms':>12} {'speedup':>8}")
+    for n_rows in [1, 64, 4096]:
+        X = train.iloc[:n_rows]
+        np.testing.assert_allclose(pipeline.transform(X), old(X))
+        slow = timeit(old, X)
+        fast = timeit(pipeline.transform, X)
+        print(f"{n_rows:>6} {slow:>10.2f} {fast:>12.3f} {slow / fast:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Microbenchmark: per-tree bootstrap loop vs vectorized ImpermanentLossPredictor uncertainty
+
+Old path: 100 rounds x 100 trees, re-selecting and re-scaling the input for every tree.
+New path: scale once, one (n_trees, n_samples) prediction matrix, resample by index.
+
+Usage:
+    python benchmarks/bench_il_uncertainty.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestRegressor
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sei_dlp_ai.models.impermanent_loss_predictor import ImpermanentLossPredictor
+
+FEATURES = [f"feature_{i}" for i in range(20)]
+
+
+def looped(predictor, X, n_estimations=100):
+    """Original implementation"""
+    predictions = []
+    for _ in range(n_estimations):
+        n_trees = len(predictor.models['random_forest'].estimators_)
+        tree_indices = np.random.choice(n_trees, n_trees, replace=True)
+        tree_predictions = []
+        for idx in tree_indices[:n_trees // 2]:
+            tree = predictor.models['random_forest'].estimators_[idx]
+            X_scaled = predictor.scaler.transform(X[predictor.feature_names])
+            tree_predictions.append(tree.predict(X_scaled))
+        predictions.append(np.mean(tree_predictions, axis=0))
+    return np.array(predictions)
+
+
+def timeit(fn, *args, repeats: int = 3) -> float:
+    """Best-of-N wall time in milliseconds"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    os.chdir(tempfile.mkdtemp())
+    rng = np.random.default_rng(0)
+    X_train = pd.DataFrame(rng.normal(0, 1, (2000, len(FEATURES))), columns=FEATURES)
+    y_train = X_train.iloc[:, 0] ** 2 + rng.normal(0, 0.1, 2000)
+
+    predictor = ImpermanentLossPredictor(use_ensemble=False, feature_engineering=False)
+    predictor.feature_names = FEATURES
+    predictor.models = {'random_forest': RandomForestRegressor(n_estimators=100, max_depth=15, random_state=0)}
+    predictor.models['random_forest'].fit(predictor.scaler.fit_transform(X_train), y_train)
+
+    print(f"{'rows':>6} {'loop ms':>9} {'vectorized ms':>14} {'speedup':>8}")
+    for n_rows in [1, 32, 1000]:
+        X = pd.DataFrame(rng.normal(0, 1, (n_rows, len(FEATURES))), columns=FEATURES)
+        slow = timeit(looped, predictor, X, repeats=1)
+        fast = timeit(predictor.predict_with_uncertainty, X)
+        print(f"{n_rows:>6} {slow:>9.1f} {fast:>14.2f} {slow / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
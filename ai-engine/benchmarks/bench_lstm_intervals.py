@@ -0,0 +1,62 @@
+"""
+Microbenchmark: LSTMForecaster point forecast vs Monte Carlo dropout intervals
+
+Compares a single predict() call against predict_intervals() with K dropout
+samples. The encoder runs once and only the dropout head is sampled, so the
+interval path should stay within 2x of the single-pass latency at K=32.
+
+Usage:
+    python benchmarks/bench_lstm_intervals.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import torch
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sei_dlp_ai.models.lstm_forecaster import LSTMForecaster
+
+FEATURES = ['price', 'volume', 'volatility', 'high', 'low']
+
+
+def timeit(fn, *args, repeats: int = 50, **kwargs) -> float:
+    """Best-of-N wall time in milliseconds"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main():
+    os.chdir(tempfile.mkdtemp())
+    torch.manual_seed(0)
+    rng = np.random.default_rng(0)
+    price = 1.5 + np.cumsum(rng.normal(0, 0.01, 400))
+    frame = pd.DataFrame({
+        'price': price, 'volume': rng.uniform(1e5, 2e5, 400), 'volatility': rng.uniform(0.01, 0.05, 400),
+        'high': price * 1.01, 'low': price * 0.99
+    })
+
+    forecaster = LSTMForecaster(hidden_dim=256, num_layers=3, device="cpu")
+    forecaster.model = forecaster.create_model(len(FEATURES))
+    forecaster.prepare_data(frame, FEATURES)
+    window = frame.iloc[-forecaster.sequence_length:]
+
+    single = timeit(forecaster.predict, window)
+    print(f"{'samples':>8} {'predict ms':>11} {'intervals ms':>13} {'ratio':>6}")
+    for n_samples in [8, 32, 128]:
+        sampled = timeit(forecaster.predict_intervals, window, n_samples=n_samples)
+        print(f"{n_samples:>8} {single:>11.2f} {sampled:>13.2f} {sampled / single:>5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
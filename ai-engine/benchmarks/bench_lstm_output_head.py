@@ -0,0 +1,80 @@
+"""
+Microbenchmark: per-horizon Linear loop vs fused output head of AttentionLSTM
+
+Times the output head alone and the full forward pass at batch sizes 1 and
+256; the loop variant rebuilds the old 24-layer ModuleList from the fused weights.
+
+Usage:
+    python benchmarks/bench_lstm_output_head.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import torch
+import torch.nn as nn
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sei_dlp_ai.models.lstm_forecaster import AttentionLSTM
+
+
+def split_head(model: AttentionLSTM) -> nn.ModuleList:
+    """The old per-horizon layers, with the fused head's weights"""
+    weight = model.output_head.weight.view(model.prediction_horizon, model.output_dim, -1)
+    bias = model.output_head.bias.view(model.prediction_horizon, model.output_dim)
+    layers = nn.ModuleList([nn.Linear(weight.shape[2], model.output_dim) for _ in range(model.prediction_horizon)])
+    for i, layer in enumerate(layers):
+        layer.weight.data = weight[i].clone()
+        layer.bias.data = bias[i].clone()
+    return layers
+
+
+def looped_head(layers, features):
+    return torch.stack([layer(features) for layer in layers], dim=1)
+
+
+def fused_head(model, features):
+    return model.output_head(features).view(-1, model.prediction_horizon, model.output_dim)
+
+
+def looped_forward(model, layers, x):
+    lstm_out, _ = model.lstm(x)
+    attended, _ = model.attention(lstm_out, lstm_out, lstm_out)
+    features = model.feature_extractor((lstm_out + attended)[:, -1])
+    return looped_head(layers, features), torch.sigmoid(model.uncertainty_layer(features))
+
+
+def timeit(fn, *args, repeats: int = 20) -> float:
+    """Best-of-N wall time in milliseconds"""
+    best = float("inf")
+    with torch.no_grad():
+        fn(*args)
+        for _ in range(repeats):
+            start = time.perf_counter()
+            fn(*args)
+            best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    torch.manual_seed(0)
+    model = AttentionLSTM(5, 256, 3, 1, 24).eval()
+    layers = split_head(model)
+
+    print(f"{'batch':>6} {'stage':>8} {'loop ms':>9} {'fused ms':>9} {'speedup':>8} {'fused seq/s':>12}")
+    for batch_size in [1, 256]:
+        features = torch.randn(batch_size, model.output_head.in_features)
+        x = torch.randn(batch_size, 168, 5)
+        stages = [
+            ("head", timeit(looped_head, layers, features, repeats=200), timeit(fused_head, model, features, repeats=200)),
+            ("forward", timeit(looped_forward, model, layers, x, repeats=3), timeit(model, x, repeats=3)),
+        ]
+        for stage, slow, fast in stages:
+            print(f"{batch_size:>6} {stage:>8} {slow:>9.3f} {fast:>9.3f} {slow / fast:>7.1f}x "
+                  f"{batch_size / fast * 1000:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Microbenchmark: per-window LSTMForecaster.predict vs predict_batch
+
+Evaluates every 168-hour sliding window of a test set with the default model size.
+
+Usage:
+    python benchmarks/bench_lstm_predict_batch.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sei_dlp_ai.models.lstm_forecaster import LSTMForecaster
+
+FEATURES = ['price', 'volume', 'volatility', 'high', 'low']
+
+
+def main():
+    rng = np.random.default_rng(0)
+    n_hours = 24 * 21
+    price = 1.5 + np.cumsum(rng.normal(0, 0.01, n_hours))
+    frame = pd.DataFrame({
+        'price': price, 'volume': rng.uniform(1e5, 2e5, n_hours), 'volatility': rng.uniform(0.01, 0.05, n_hours),
+        'high': price * 1.01, 'low': price * 0.99
+    })
+
+    os.chdir(tempfile.mkdtemp())
+    forecaster = LSTMForecaster(device="cpu")
+    forecaster.model = forecaster.create_model(len(FEATURES))
+    forecaster.prepare_data(frame, FEATURES)
+
+    windows = [frame.iloc[i:i + 168] for i in range(n_hours - 168 - 24)]
+
+    start = time.perf_counter()
+    looped = np.array([forecaster.predict(window)["predictions"] for window in windows])
+    slow = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = forecaster.predict_batch(windows, batch_size=256)["predictions"]
+    fast = time.perf_counter() - start
+
+    print(f"{len(windows)} windows: loop {slow:.2f}s, predict_batch {fast:.2f}s ({slow / fast:.1f}x), "
+          f"max abs diff {np.abs(looped - batched).max():.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Microbenchmark: LSTMForecaster input/output scaling, sklearn vs precomputed vectors
+
+Old path: convert the whole DataFrame, MinMaxScaler.transform the window and
+inverse_transform the price through a horizon x n_features dummy array.
+New path: slice the tail first, scale with cached vectors, invert in closed form.
+
+Usage:
+    python benchmarks/bench_lstm_preprocess.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sei_dlp_ai.models.lstm_forecaster import LSTMForecaster
+
+FEATURES = ['price', 'volume', 'volatility', 'high', 'low']
+
+
+def sklearn_path(forecaster, frame, predictions):
+    data = frame[forecaster.feature_names].values
+    scaled = forecaster.scaler.transform(data[-forecaster.sequence_length:]).astype(np.float32)
+    dummy = np.zeros((len(predictions), len(forecaster.feature_names)))
+    dummy[:, 0] = predictions
+    return scaled, forecaster.scaler.inverse_transform(dummy)[:, 0]
+
+
+def precomputed_path(forecaster, frame, predictions):
+    return forecaster._transform(forecaster._tail_values(frame)), forecaster._inverse_transform_price(predictions)
+
+
+def timeit(fn, *args, repeats: int = 2000) -> float:
+    """Best-of-N wall time in microseconds"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6
+
+
+def main():
+    os.chdir(tempfile.mkdtemp())
+    rng = np.random.default_rng(0)
+    forecaster = LSTMForecaster(device="cpu")
+    predictions = rng.random(forecaster.prediction_horizon)
+
+    print(f"{'history rows':>12} {'sklearn us':>11} {'precomputed us':>15} {'speedup':>8}")
+    for n_rows in [168, 2000, 20000]:
+        price = 1.5 + np.cumsum(rng.normal(0, 0.01, n_rows))
+        frame = pd.DataFrame({
+            'price': price, 'volume': rng.uniform(1e5, 2e5, n_rows), 'volatility': rng.uniform(0.01, 0.05, n_rows),
+            'high': price * 1.01, 'low': price * 0.99, 'unused': rng.random(n_rows)
+        })
+        forecaster.prepare_data(frame, FEATURES)
+
+        slow = timeit(sklearn_path, forecaster, frame, predictions)
+        fast = timeit(precomputed_path, forecaster, frame, predictions)
+        print(f"{n_rows:>12} {slow:>11.1f} {fast:>15.1f} {slow / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
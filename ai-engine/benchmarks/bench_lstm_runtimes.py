@@ -0,0 +1,53 @@
+"""
+Microbenchmark: eager vs TorchScript vs ONNX Runtime (fp32 and dynamic int8) for the LSTM forecaster
+
+Reports each runtime's p50/p99 latency for single-sequence and batched calls
+and its largest deviation from the eager model (in scaled price units).
+
+Usage:
+    python benchmarks/bench_lstm_runtimes.py
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import torch
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sei_dlp_ai.models import lstm_runtime
+from sei_dlp_ai.models.lstm_forecaster import LSTMForecaster
+
+N_FEATURES = 5
+
+
+def main():
+    torch.manual_seed(0)
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        forecaster = LSTMForecaster(device="cpu")
+        forecaster.model = forecaster.create_model(N_FEATURES)
+        forecaster.model.eval()
+
+        rng = np.random.default_rng(0)
+        single = rng.random((1, forecaster.sequence_length, N_FEATURES), dtype=np.float32)
+        batch = rng.random((32, forecaster.sequence_length, N_FEATURES), dtype=np.float32)
+
+        exported = forecaster.export_runtimes(workdir, sample=batch, latency_runs=5)
+        eager = lstm_runtime.EagerRuntime(forecaster.model)
+        runtimes = [eager] + [lstm_runtime.load_runtime(backend, workdir) for backend in exported["paths"]]
+
+        print(f"{'runtime':>17} {'max delta':>10} {'p50 x1':>8} {'p99 x1':>8} {'p50 x32':>8} {'p99 x32':>8}")
+        for runtime in runtimes:
+            delta = exported["report"][runtime.name]["max_abs_prediction_delta"]
+            one = lstm_runtime.measure_latency(runtime, single, runs=50)
+            many = lstm_runtime.measure_latency(runtime, batch, runs=10)
+            print(f"{runtime.name:>17} {delta:>10.2e} {one['p50_ms']:>8.1f} {one['p99_ms']:>8.1f} "
+                  f"{many['p50_ms']:>8.1f} {many['p99_ms']:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Microbenchmark: streaming AttentionLSTM updates vs full-window recompute
+
+Reports per-tick latency and how far streaming predictions drift from a full
+168-step recompute as the stream ages (the accuracy side of the trade-off).
+
+Usage:
+    python benchmarks/bench_lstm_streaming.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import torch
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sei_dlp_ai.models.lstm_forecaster import AttentionLSTM
+
+
+def main():
+    torch.manual_seed(0)
+    sequence_length, n_ticks = 168, 200
+    model = AttentionLSTM(5, 256, 3, 1, 24, bidirectional=False).eval()
+    series = torch.randn(1, sequence_length + n_ticks, 5)
+
+    with torch.no_grad():
+        state = model.init_stream(series[:, :sequence_length], sequence_length)
+        stream_time = recompute_time = 0.0
+        drift = []
+        for t in range(sequence_length, sequence_length + n_ticks):
+            start = time.perf_counter()
+            streamed, _, state = model.stream_step(series[:, t], state)
+            stream_time += time.perf_counter() - start
+
+            start = time.perf_counter()
+            recomputed, _ = model(series[:, t + 1 - sequence_length:t + 1])
+            recompute_time += time.perf_counter() - start
+
+            drift.append(((streamed - recomputed).abs().mean() / recomputed.abs().mean()).item())
+
+    print(f"per tick: stream {stream_time / n_ticks * 1000:.2f} ms, "
+          f"recompute {recompute_time / n_ticks * 1000:.2f} ms ({recompute_time / stream_time:.0f}x)")
+    for age in [1, 24, 168, n_ticks]:
+        print(f"relative drift after {age:>3} ticks: {drift[age - 1]:.2e}")
+
+
+if __name__ == "__main__":
+    main()
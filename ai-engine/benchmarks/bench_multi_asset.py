@@ -0,0 +1,57 @@
+"""
+Microbenchmark: one LSTMForecaster model per asset vs one shared-encoder multi-asset model
+
+Compares parameter memory and the latency of forecasting every asset once.
+
+Usage:
+    python benchmarks/bench_multi_asset.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import torch
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sei_dlp_ai.models.lstm_forecaster import AttentionLSTM
+from sei_dlp_ai.models.multi_asset_forecaster import MultiAssetAttentionLSTM
+
+ASSETS = ["SEI", "ETH", "BTC", "ATOM"]
+
+
+def timeit(fn, repeats: int = 5) -> float:
+    """Best-of-N wall time in milliseconds"""
+    best = float("inf")
+    with torch.no_grad():
+        fn()
+        for _ in range(repeats):
+            start = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def megabytes(*models) -> float:
+    return sum(p.numel() * p.element_size() for model in models for p in model.parameters()) / 1e6
+
+
+def main():
+    torch.manual_seed(0)
+    per_asset = [AttentionLSTM(5, 256, 3, 1, 24).eval() for _ in ASSETS]
+    shared = MultiAssetAttentionLSTM(5, 256, 3, len(ASSETS), 24).eval()
+    x = torch.randn(len(ASSETS), 168, 5)
+    asset_ids = torch.arange(len(ASSETS))
+
+    separate = timeit(lambda: [model(x[i:i + 1]) for i, model in enumerate(per_asset)])
+    batched = timeit(lambda: shared(x, asset_ids))
+
+    print(f"{'variant':>18} {'params MB':>10} {'all assets ms':>14}")
+    print(f"{'model per asset':>18} {megabytes(*per_asset):>10.1f} {separate:>14.1f}")
+    print(f"{'shared encoder':>18} {megabytes(shared):>10.1f} {batched:>14.1f}")
+    print(f"{'ratio':>18} {megabytes(*per_asset) / megabytes(shared):>9.1f}x {separate / batched:>13.1f}x")
+
+
+if __name__ == "__main__":
+    main()
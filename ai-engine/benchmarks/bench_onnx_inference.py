@@ -0,0 +1,74 @@
+"""
+Microbenchmark: sklearn vs ONNX Runtime inference for the liquidity RandomForest
+
+Compares scaler + RandomForestRegressor.predict against the exported graph
+(scaler folded in) run through OnnxInferenceSession.
+
+Usage:
+    python benchmarks/bench_onnx_inference.py
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sei_dlp_ai.models.liquidity_optimizer import LiquidityOptimizer
+from sei_dlp_ai.models.liquidity_features import FEATURE_NAMES
+from sei_dlp_ai.models.onnx_runtime import OnnxInferenceSession
+
+
+def make_training_data(n_rows: int = 2000) -> pd.DataFrame:
+    """Create synthetic training data with the production feature layout"""
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(rng.normal(50, 10, (n_rows, len(FEATURE_NAMES))), columns=FEATURE_NAMES)
+    data['lower_bound'] = 0.9 + 0.01 * data['sei_price']
+    data['upper_bound'] = data['lower_bound'] + 0.1 + 0.001 * data['position_size']
+    data['confidence'] = 0.5 + 0.002 * data['liquidity']
+    return data
+
+
+def timeit(fn, repeats: int) -> float:
+    """Median wall time in milliseconds"""
+    fn()
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return float(np.median(times)) * 1000
+
+
+def main():
+    optimizer = LiquidityOptimizer()
+    optimizer.train_model(make_training_data())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = str(Path(tmp) / "liquidity.onnx")
+        optimizer.export_onnx(path)
+        session = OnnxInferenceSession.load(path, intra_op_threads=1, inter_op_threads=1)
+
+        rng = np.random.default_rng(1)
+        print(f"{'batch':>6} {'sklearn ms':>11} {'onnx ms':>9} {'speedup':>8}")
+        for batch_size in [1, 64, 1024]:
+            features = rng.normal(50, 10, (batch_size, len(FEATURE_NAMES)))
+
+            def sklearn_path():
+                optimizer.ml_model.predict(optimizer.scaler.transform(features))
+
+            def onnx_path():
+                session.run(features)
+
+            repeats = 50 if batch_size < 1024 else 20
+            slow = timeit(sklearn_path, repeats)
+            fast = timeit(onnx_path, repeats)
+            print(f"{batch_size:>6} {slow:>11.3f} {fast:>9.3f} {slow / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
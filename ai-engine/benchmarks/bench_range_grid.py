@@ -0,0 +1,69 @@
+"""
+Microbenchmark: per-candidate loop vs vectorized Monte Carlo range grid search
+
+Usage:
+    python benchmarks/bench_range_grid.py
+"""
+
+import sys
+import math
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sei_dlp_ai.models.range_grid_optimizer import RangeGridOptimizer
+
+LOG_TICK_BASE = math.log(1.0001)
+
+
+def looped(optimizer, candidates, price, volatility, fee_tier, volume_to_liquidity):
+    """Score each candidate separately by scanning every simulated step"""
+    log_prices = optimizer.simulate_log_prices(price, volatility).astype(np.float64)
+    ticks = log_prices / LOG_TICK_BASE
+    final_price = np.exp(log_prices[:, -1])
+    scores = []
+    for lower, upper in zip(candidates.lower_ticks, candidates.upper_ticks):
+        time_in_range = ((ticks >= lower) & (ticks < upper)).mean(axis=1)
+        pa, pb = 1.0001 ** lower, 1.0001 ** upper
+        sqrt_final = np.clip(np.sqrt(final_price), math.sqrt(pa), math.sqrt(pb))
+        value = final_price * (1 / sqrt_final - 1 / math.sqrt(pb)) + sqrt_final - math.sqrt(pa)
+        hold = final_price * (1 / math.sqrt(price) - 1 / math.sqrt(pb)) + math.sqrt(price) - math.sqrt(pa)
+        fees = fee_tier * volume_to_liquidity / (1 - (pa / pb) ** 0.25) * time_in_range
+        scores.append((fees - np.maximum(1 - value / hold, 0)).mean())
+    return scores
+
+
+def timeit(fn, *args, repeats: int = 3) -> float:
+    """Best-of-N wall time in milliseconds"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    price, volatility, fee_tier, volume_to_liquidity = 0.45, 0.004, 0.003, 0.5
+    print(f"{'candidates':>10} {'paths':>6} {'loop ms':>10} {'vectorized ms':>14} {'speedup':>8}")
+    for grid_size in [10, 30, 100]:
+        optimizer = RangeGridOptimizer(grid_size=grid_size, n_paths=1000, n_steps=288)
+        candidates = optimizer.evaluate(price, volatility, 60, fee_tier, volume_to_liquidity)
+
+        # The loop is too slow to time on the full grid; extrapolate from a sample
+        sample = min(len(candidates), 200)
+        subset = type(candidates)(**{
+            name: value[:sample] if name in ("lower_ticks", "upper_ticks") else value
+            for name, value in vars(candidates).items()
+        })
+        slow = timeit(looped, optimizer, subset, price, volatility, fee_tier, volume_to_liquidity, repeats=1)
+        slow *= len(candidates) / sample
+        fast = timeit(optimizer.optimize, price, volatility, 60, fee_tier, volume_to_liquidity)
+        print(f"{len(candidates):>10} {optimizer.n_paths:>6} {slow:>10.1f} {fast:>14.1f} {slow / fast:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,9 +11,10 @@ from ..types import (
     ChainId, AssetSymbol, MarketData, Position, LiquidityPool,
     TradingSignal, LiquidityRange, Portfolio, RiskMetrics, ArbitrageOpportunity
 )
-from ..models.liquidity_optimizer import LiquidityOptimizer
+from ..models.liquidity_optimizer import LiquidityOptimizer, TrainingStats
 from ..models.risk_manager import RiskManager
 from ..integrations.elizaos_client import ElizaOSClient, ElizaOSConfig
+from .inference_executor import InferenceExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -29,12 +30,28 @@ class SEIDLPEngine:
     - Real-time trading signals and execution
     """
     
-    def __init__(self, elizaos_config: Optional[ElizaOSConfig] = None):
-        """Initialize the SEI DLP AI Engine"""
+    def __init__(
+        self,
+        elizaos_config: Optional[ElizaOSConfig] = None,
+        inference_executor: Optional[InferenceExecutor] = None
+    ):
+        """
+        Initialize the SEI DLP AI Engine
+        
+        Args:
+            elizaos_config: ElizaOS connection settings
+            inference_executor: Executor that runs model inference off the event loop
+                (inference runs inline on the loop if omitted)
+        """
         # Core components
         self.liquidity_optimizer = LiquidityOptimizer()
         self.risk_manager = RiskManager()
         
+        # Off-loop model inference
+        self.inference_executor = inference_executor
+        if inference_executor is not None:
+            self.liquidity_optimizer.enable_inference_executor(inference_executor)
+        
         # ElizaOS integration
         self.elizaos_config = elizaos_config or ElizaOSConfig()
         self.elizaos_client: Optional[ElizaOSClient] = None
@@ -89,6 +106,9 @@ class SEIDLPEngine:
         if self.elizaos_client:
             await self.elizaos_client.disconnect()
         
+        if self.inference_executor:
+            self.inference_executor.shutdown(wait=False)
+        
         logger.info("SEI DLP Engine stopped")
     
     def _register_message_handlers(self) -> None:
@@ -336,16 +356,29 @@ class SEIDLPEngine:
             asset, side, size, leverage, order_type
         )
     
-    def train_liquidity_model(self, training_data: pd.DataFrame) -> None:
-        """Train the liquidity optimization ML model"""
-        self.liquidity_optimizer.train_model(training_data)
-        logger.info("Liquidity optimization model trained successfully")
+    def train_liquidity_model(self, training_data: pd.DataFrame, **kwargs: Any) -> TrainingStats:
+        """Train the liquidity optimization ML model (kwargs are passed to LiquidityOptimizer.train_model)"""
+        stats = self.liquidity_optimizer.train_model(training_data, **kwargs)
+        if stats.skipped:
+            logger.info("Liquidity optimization model unchanged; training data identical to last fit")
+        else:
+            logger.info(
+                f"Liquidity optimization model trained successfully in {stats.wall_time_seconds:.2f}s "
+                f"({stats.n_estimators} trees, {stats.trees_added} added)"
+            )
+        return stats
     
     def load_onnx_model(self, model_path: str) -> None:
         """Load ONNX model for production inference"""
         self.liquidity_optimizer.load_onnx_model(model_path)
         logger.info(f"ONNX model loaded from {model_path}")
     
+    def get_inference_metrics(self) -> Dict[str, Any]:
+        """Queue wait and compute time of off-loop inference (empty if inference runs inline)"""
+        if not self.inference_executor:
+            return {}
+        return self.inference_executor.metrics()
+    
     async def __aenter__(self):
         """Async context manager entry"""
         await self.start()
@@ -0,0 +1,239 @@
+"""CPU offload for model inference in the SEI DLP Engine
+
+Model calls are synchronous and can take tens of milliseconds, which would
+stall the event loop that also serves the ElizaOS websocket and the
+monitoring loop. InferenceExecutor runs them off the loop:
+
+* a thread pool for backends that release the GIL (ONNX Runtime, NumPy);
+* a process pool for scikit-learn, whose tree traversal holds the GIL.
+  Workers are primed once with the model through an initializer, so each
+  call only ships the feature matrix.
+
+In-flight requests (queued + running) are bounded; once the bound is reached
+callers wait up to `submit_timeout` for a slot and are then rejected with
+InferenceQueueFull, so overload surfaces as fast errors instead of an
+unbounded backlog. Queue wait and compute time are tracked per pool.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+THREAD = "thread"
+PROCESS = "process"
+
+
+class InferenceQueueFull(RuntimeError):
+    """Raised when no inference slot frees up within the submit timeout"""
+
+
+@dataclass
+class InferenceMetrics:
+    """Counters and timings for one pool"""
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    rejected: int = 0
+    queue_wait_seconds: float = 0.0
+    compute_seconds: float = 0.0
+    max_queue_wait_seconds: float = 0.0
+    max_compute_seconds: float = 0.0
+
+    @property
+    def mean_queue_wait_seconds(self) -> float:
+        finished = self.completed + self.failed
+        return self.queue_wait_seconds / finished if finished else 0.0
+
+    @property
+    def mean_compute_seconds(self) -> float:
+        finished = self.completed + self.failed
+        return self.compute_seconds / finished if finished else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        data = asdict(self)
+        data["mean_queue_wait_seconds"] = self.mean_queue_wait_seconds
+        data["mean_compute_seconds"] = self.mean_compute_seconds
+        return data
+
+
+def _timed_call(fn: Callable[..., T], args: Tuple[Any, ...]) -> Tuple[Optional[T], Optional[Exception], float, float]:
+    """Run fn in a worker and report when it started and finished (monotonic clock is system-wide)"""
+    started = time.monotonic()
+    try:
+        return fn(*args), None, started, time.monotonic()
+    except Exception as e:
+        return None, e, started, time.monotonic()
+
+
+class InferenceExecutor:
+    """Bounded thread + process pools for running model inference off the event loop"""
+
+    def __init__(
+        self,
+        max_threads: Optional[int] = None,
+        max_processes: Optional[int] = None,
+        max_queue_depth: int = 64,
+        submit_timeout: Optional[float] = 1.0,
+        mp_start_method: str = "spawn"
+    ) -> None:
+        """
+        Initialize the executor; pools are created on first use
+
+        Args:
+            max_threads: Thread pool size (defaults to the CPU count)
+            max_processes: Process pool size (defaults to the CPU count)
+            max_queue_depth: Maximum in-flight requests across both pools
+            submit_timeout: Seconds to wait for a free slot before rejecting (None waits forever)
+            mp_start_method: multiprocessing start method for the process pool
+        """
+        if max_queue_depth <= 0:
+            raise ValueError("max_queue_depth must be positive")
+
+        cpu_count = os.cpu_count() or 1
+        self.max_threads = max_threads or cpu_count
+        self.max_processes = max_processes or cpu_count
+        self.max_queue_depth = max_queue_depth
+        self.submit_timeout = submit_timeout
+        self.mp_start_method = mp_start_method
+
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._process_initializer: Optional[Callable[..., None]] = None
+        self._process_initargs: Tuple[Any, ...] = ()
+
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._in_flight = 0
+        self._metrics: Dict[str, InferenceMetrics] = {THREAD: InferenceMetrics(), PROCESS: InferenceMetrics()}
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently queued or running"""
+        return self._in_flight
+
+    @property
+    def has_process_workers(self) -> bool:
+        """Whether process workers have been given an initializer (e.g. a model to load)"""
+        return self._process_initializer is not None
+
+    def set_process_initializer(self, initializer: Callable[..., None], initargs: Tuple[Any, ...] = ()) -> None:
+        """
+        Prime process workers with state, e.g. a freshly trained model
+
+        Running workers are retired; the next process call starts new ones.
+
+        Args:
+            initializer: Picklable module-level function run once in every worker
+            initargs: Arguments pickled to every worker
+        """
+        self._process_initializer = initializer
+        self._process_initargs = initargs
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=False, cancel_futures=False)
+            self._process_pool = None
+
+    def _pool(self, backend: str) -> Executor:
+        if backend == THREAD:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    max_workers=self.max_threads, thread_name_prefix="sei-dlp-inference"
+                )
+            return self._thread_pool
+        if backend == PROCESS:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.max_processes,
+                    mp_context=multiprocessing.get_context(self.mp_start_method),
+                    initializer=self._process_initializer,
+                    initargs=self._process_initargs
+                )
+            return self._process_pool
+        raise ValueError(f"Unknown inference backend: {backend}")
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        """Semaphore bounding in-flight requests, bound to the running loop"""
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_queue_depth)
+            self._slots_loop = loop
+        return self._slots
+
+    async def run(self, fn: Callable[..., T], *args: Any, backend: str = THREAD) -> T:
+        """
+        Run fn(*args) in the given pool without blocking the event loop
+
+        Args:
+            fn: Callable to run; must be picklable for the process backend
+            *args: Arguments for fn
+            backend: "thread" or "process"
+
+        Returns:
+            fn's return value
+
+        Raises:
+            InferenceQueueFull: When no slot frees up within submit_timeout
+        """
+        pool = self._pool(backend)
+        metrics = self._metrics[backend]
+        slots = self._get_slots()
+
+        submitted = time.monotonic()
+        try:
+            await asyncio.wait_for(slots.acquire(), timeout=self.submit_timeout)
+        except asyncio.TimeoutError:
+            metrics.rejected += 1
+            raise InferenceQueueFull(
+                f"Inference queue full ({self.max_queue_depth} in flight) after {self.submit_timeout}s"
+            ) from None
+
+        metrics.submitted += 1
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            result, error, started, finished = await loop.run_in_executor(pool, _timed_call, fn, args)
+        except BaseException:
+            metrics.failed += 1
+            raise
+        finally:
+            self._in_flight -= 1
+            slots.release()
+
+        queue_wait = max(0.0, started - submitted)
+        compute = finished - started
+        metrics.queue_wait_seconds += queue_wait
+        metrics.compute_seconds += compute
+        metrics.max_queue_wait_seconds = max(metrics.max_queue_wait_seconds, queue_wait)
+        metrics.max_compute_seconds = max(metrics.max_compute_seconds, compute)
+
+        if error is not None:
+            metrics.failed += 1
+            raise error
+        metrics.completed += 1
+        return result
+
+    def metrics(self) -> Dict[str, Any]:
+        """Per-pool counters plus the current in-flight count"""
+        return {
+            THREAD: self._metrics[THREAD].to_dict(),
+            PROCESS: self._metrics[PROCESS].to_dict(),
+            "in_flight": self._in_flight,
+            "max_queue_depth": self.max_queue_depth
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop both pools; they are recreated if the executor is used again"""
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=wait)
+            self._thread_pool = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=wait)
+            self._process_pool = None
@@ -0,0 +1,128 @@
+"""
+Single-graph ONNX export of the impermanent loss ensemble
+
+Converts the fitted StandardScaler, every ensemble member (scikit-learn
+forests and boosting, XGBoost, LightGBM) and the R2-weighted average into one
+ONNX model. ImpermanentLossPredictor can then answer a request with a single
+ONNX Runtime call instead of five Python model calls.
+
+The graph takes float64 features and scales them in float64 before the cast
+to float32 that every tree backend applies. This is the same arithmetic as
+StandardScaler.transform followed by the estimators' own float32 cast, so
+split decisions match the Python models exactly. A float32 Scaler op would
+flip comparisons near thresholds.
+"""
+
+import json
+import logging
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from sklearn.preprocessing import StandardScaler
+
+from sei_dlp_ai.models.onnx_runtime import SCALER_FOLDED_KEY, prepend_scaler
+
+logger = logging.getLogger(__name__)
+
+FEATURE_COLUMNS_KEY = "sei_dlp.feature_columns"
+SCHEMA_COLUMNS_KEY = "sei_dlp.schema_columns"
+ENSEMBLE_WEIGHTS_KEY = "sei_dlp.ensemble_weights"
+
+DEFAULT_OPSET = 17
+# Highest ai.onnx.ml version the onnxmltools XGBoost/LightGBM converters emit
+ML_OPSET = 3
+
+_converters_registered = False
+
+
+def _register_boosting_converters():
+    """Teach skl2onnx to convert XGBoost and LightGBM regressors through onnxmltools"""
+    global _converters_registered
+    if _converters_registered:
+        return
+
+    try:
+        import lightgbm as lgb
+        import xgboost as xgb
+        from onnxmltools.convert.lightgbm.operator_converters.LightGbm import convert_lightgbm
+        from onnxmltools.convert.xgboost.operator_converters.XGBoost import convert_xgboost
+        from skl2onnx import update_registered_converter
+        from skl2onnx.common.shape_calculator import calculate_linear_regressor_output_shapes
+    except ImportError as e:
+        raise ImportError("onnxmltools is required to export XGBoost/LightGBM members: pip install onnxmltools") from e
+
+    update_registered_converter(xgb.XGBRegressor, "XGBoostXGBRegressor",
+                                calculate_linear_regressor_output_shapes, convert_xgboost)
+    update_registered_converter(lgb.LGBMRegressor, "LightGbmLGBMRegressor",
+                                calculate_linear_regressor_output_shapes, convert_lightgbm,
+                                options={"split": None})
+    _converters_registered = True
+
+
+def convert_ensemble(models: Dict[str, Any],
+                     weights: Dict[str, float],
+                     scaler: StandardScaler,
+                     feature_columns: List[str],
+                     target_opset: Optional[int] = None,
+                     schema_columns: Optional[List[str]] = None):
+    """
+    Convert a scaler plus weighted tree ensemble into one ONNX model
+
+    Args:
+        models: Fitted ensemble members by name
+        weights: Averaging weight per member (normalized here)
+        scaler: Fitted StandardScaler applied before every member
+        feature_columns: Input column order, stored in the model metadata
+        target_opset: ONNX opset to target (defaults to 17)
+        schema_columns: Feature columns before selection, stored in the model metadata
+
+    Returns:
+        onnx.ModelProto with a float64 "features" input and a float32 "predictions" output
+    """
+    try:
+        from skl2onnx import convert_sklearn
+        from skl2onnx.common.data_types import FloatTensorType
+        from sklearn.ensemble import VotingRegressor
+        from sklearn.utils import Bunch
+    except ImportError as e:
+        raise ImportError("skl2onnx is required for ONNX export: pip install skl2onnx") from e
+
+    names = list(models)
+    member_weights = np.array([weights[name] for name in names], dtype=np.float64)
+    if not np.isfinite(member_weights).all() or member_weights.sum() <= 0:
+        raise ValueError(f"Ensemble weights must be finite with a positive sum, got {weights}")
+    member_weights /= member_weights.sum()
+    _register_boosting_converters()
+
+    # VotingRegressor computes exactly the weighted average used by ImpermanentLossPredictor.predict
+    ensemble = VotingRegressor([(name, models[name]) for name in names], weights=member_weights)
+    ensemble.estimators_ = [models[name] for name in names]
+    ensemble.named_estimators_ = Bunch(**models)
+
+    n_features = len(feature_columns)
+    onnx_model = convert_sklearn(
+        ensemble,
+        initial_types=[("scaled", FloatTensorType([None, n_features]))],
+        final_types=[("predictions", FloatTensorType([None, 1]))],
+        target_opset={"": target_opset or DEFAULT_OPSET, "ai.onnx.ml": ML_OPSET}
+    )
+
+    # Prepend float64 scaling: features -> (features - mean) / scale -> float32 "scaled"
+    mean = scaler.mean_ if scaler.mean_ is not None else np.zeros(n_features)
+    scale = scaler.scale_ if scaler.scale_ is not None else np.ones(n_features)
+    prepend_scaler(onnx_model, mean, scale)
+
+    metadata = {
+        SCALER_FOLDED_KEY: "true",
+        FEATURE_COLUMNS_KEY: ",".join(feature_columns),
+        ENSEMBLE_WEIGHTS_KEY: json.dumps(dict(zip(names, member_weights.tolist())))
+    }
+    if schema_columns is not None:
+        metadata[SCHEMA_COLUMNS_KEY] = ",".join(schema_columns)
+    for key, value in metadata.items():
+        prop = onnx_model.metadata_props.add()
+        prop.key = key
+        prop.value = value
+
+    logger.info(f"Converted {len(names)}-member ensemble to ONNX ({onnx_model.ByteSize() / 1e6:.1f} MB)")
+    return onnx_model
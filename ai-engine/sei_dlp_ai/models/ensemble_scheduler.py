@@ -0,0 +1,176 @@
+"""
+Concurrent training and inference for the impermanent loss ensemble
+
+ImpermanentLossPredictor fits RandomForest, XGBoost, LightGBM,
+GradientBoosting and ExtraTrees. Fitting them one after another leaves cores
+idle during single-threaded members (GradientBoosting), while the n_jobs=-1
+members each start one thread per core and oversubscribe the machine when run
+side by side.
+
+EnsembleScheduler splits a core budget between members instead: members are
+fit concurrently in a process pool and each gets a fixed thread budget. The
+budget is applied through the estimator's n_jobs and through threadpoolctl for
+OpenMP/BLAS pools. Inference runs every member in a thread pool, since the
+tree libraries release the GIL during prediction. Per-member train and
+predict wall times are recorded.
+"""
+
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+from threadpoolctl import threadpool_limits
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MemberFit:
+    """One fitted ensemble member with its in-sample and validation predictions"""
+    model: Any
+    train_pred: np.ndarray
+    val_pred: np.ndarray
+    train_seconds: float
+    n_threads: int
+
+
+def set_thread_budget(model: Any, n_threads: int) -> Any:
+    """Cap an estimator's own parallelism at n_threads (no-op for single-threaded estimators)"""
+    if 'n_jobs' in model.get_params(deep=False):
+        model.set_params(n_jobs=n_threads)
+    return model
+
+
+def _fit_member(model: Any,
+                n_threads: int,
+                X_train: np.ndarray,
+                y_train: np.ndarray,
+                X_val: np.ndarray) -> Tuple[Any, np.ndarray, np.ndarray, float]:
+    """Fit one member under its thread budget (runs in a worker process)"""
+    start = time.perf_counter()
+    with threadpool_limits(limits=n_threads):
+        set_thread_budget(model, n_threads)
+        model.fit(X_train, y_train)
+        train_seconds = time.perf_counter() - start
+        return model, model.predict(X_train), model.predict(X_val), train_seconds
+
+
+class EnsembleScheduler:
+    """Shares cores between ensemble members for training and inference"""
+
+    def __init__(self,
+                 max_workers: Optional[int] = None,
+                 n_threads: Optional[int] = None,
+                 mp_start_method: str = "spawn"):
+        """
+        Initialize the scheduler
+
+        Args:
+            max_workers: Members trained at once (defaults to one per member, capped at n_threads)
+            n_threads: Total cores to share between members (defaults to os.cpu_count())
+            mp_start_method: Multiprocessing start method for the training pool
+        """
+        self.max_workers = max_workers
+        self.n_threads = n_threads or os.cpu_count() or 1
+        self.mp_start_method = mp_start_method
+        self.timings: Dict[str, Dict[str, float]] = {}
+        self._predict_pool: Optional[ThreadPoolExecutor] = None
+
+    def budget(self, n_members: int) -> Tuple[int, int]:
+        """
+        Split the core budget between concurrently running members
+
+        Args:
+            n_members: Number of ensemble members
+
+        Returns:
+            Number of concurrent workers and threads per member
+        """
+        n_workers = min(n_members, self.max_workers or n_members, self.n_threads)
+        n_workers = max(n_workers, 1)
+        return n_workers, max(1, self.n_threads // n_workers)
+
+    def fit(self,
+            models: Dict[str, Any],
+            X_train: np.ndarray,
+            y_train: np.ndarray,
+            X_val: np.ndarray) -> Dict[str, MemberFit]:
+        """
+        Fit every member concurrently
+
+        Args:
+            models: Unfitted estimators by name
+            X_train: Training features
+            y_train: Training target
+            X_val: Validation features
+
+        Returns:
+            Fitted members by name, in the order of models
+        """
+        n_workers, n_threads = self.budget(len(models))
+        logger.info(f"Training {len(models)} ensemble members on {n_workers} workers x {n_threads} threads")
+
+        X_train, y_train, X_val = np.asarray(X_train), np.asarray(y_train), np.asarray(X_val)
+        try:
+            if n_workers == 1:
+                outputs = {name: _fit_member(model, n_threads, X_train, y_train, X_val)
+                           for name, model in models.items()}
+            else:
+                with ProcessPoolExecutor(
+                    max_workers=n_workers, mp_context=multiprocessing.get_context(self.mp_start_method)
+                ) as pool:
+                    futures = {name: pool.submit(_fit_member, model, n_threads, X_train, y_train, X_val)
+                               for name, model in models.items()}
+                    outputs = {name: future.result() for name, future in futures.items()}
+        except Exception as e:
+            logger.error(f"Ensemble training failed: {e}")
+            raise
+
+        fits = {}
+        for name, (model, train_pred, val_pred, train_seconds) in outputs.items():
+            fits[name] = MemberFit(model, train_pred, val_pred, train_seconds, n_threads)
+            self.timings.setdefault(name, {})['train_seconds'] = train_seconds
+        return fits
+
+    def predict(self, models: Dict[str, Any], X: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Predict with every member in a shared thread pool
+
+        Args:
+            models: Fitted estimators by name
+            X: Features
+
+        Returns:
+            Predictions by name, in the order of models
+        """
+        n_workers, _ = self.budget(len(models))
+        if n_workers == 1:
+            return {name: self._timed_predict(name, model, X) for name, model in models.items()}
+
+        if self._predict_pool is None:
+            self._predict_pool = ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="il-ensemble")
+        futures = {name: self._predict_pool.submit(self._timed_predict, name, model, X)
+                   for name, model in models.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+    def _timed_predict(self, name: str, model: Any, X: np.ndarray) -> np.ndarray:
+        start = time.perf_counter()
+        prediction = model.predict(X)
+        self.timings.setdefault(name, {})['predict_seconds'] = time.perf_counter() - start
+        return prediction
+
+    def shutdown(self):
+        """Stop the inference thread pool"""
+        if self._predict_pool is not None:
+            self._predict_pool.shutdown(wait=True)
+            self._predict_pool = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_predict_pool'] = None
+        return state
@@ -0,0 +1,274 @@
+"""Compact memory-mappable artifact for the Liquidity Optimizer forest
+
+The trained StandardScaler and RandomForestRegressor are flattened into a few
+contiguous node arrays (int32 children/features, float32 thresholds/leaf
+values) and written to a single versioned file:
+
+    magic (8 bytes) | format version (uint32) | header length (uint32)
+    | JSON header | arrays, each aligned to 64 bytes
+
+Loading maps the file read-only and builds NumPy views straight onto the
+mapped pages, so startup does no unpickling and every worker process that
+loads the same file shares one copy of the model in the page cache.
+
+Thresholds are rounded down to float32, which routes float32 inputs exactly
+as scikit-learn does (trees compare float32 features against float64
+thresholds), so only the leaf values lose precision.
+"""
+
+import json
+import os
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence
+from numpy.typing import NDArray
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.preprocessing import StandardScaler
+
+FORMAT_MAGIC = b"SEIDLPFA"
+FORMAT_VERSION = 1
+
+_ALIGNMENT = 64
+_PREAMBLE_SIZE = len(FORMAT_MAGIC) + 8
+_LEAF = -1
+
+# Array name -> on-disk dtype (little endian regardless of the host)
+_ARRAY_DTYPES = {
+    "scaler_mean": "<f8",
+    "scaler_scale": "<f8",
+    "roots": "<i4",
+    "feature": "<i4",
+    "threshold": "<f4",
+    "children": "<i4",
+    "value": "<f4",
+}
+
+
+def _float32_floor(values: NDArray[np.float64]) -> NDArray[np.float32]:
+    """Largest float32 <= each value, so `x32 <= t32` iff `x32 <= t64`"""
+    rounded = values.astype(np.float32)
+    too_high = rounded.astype(np.float64) > values
+    rounded[too_high] = np.nextafter(rounded[too_high], np.float32(-np.inf))
+    return rounded
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+class CompactForest:
+    """Flattened scaler + forest with vectorized, allocation-light inference"""
+
+    def __init__(
+        self,
+        arrays: Dict[str, NDArray[Any]],
+        feature_columns: Sequence[str],
+        max_depth: int,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Wrap flattened forest arrays (in memory or memory-mapped)
+
+        Args:
+            arrays: Node and scaler arrays keyed as in the artifact format
+            feature_columns: Feature names the forest was trained on
+            max_depth: Deepest root-to-leaf path over all trees
+            metadata: Extra header fields stored with the artifact
+        """
+        missing = set(_ARRAY_DTYPES) - set(arrays)
+        if missing:
+            raise ValueError(f"Missing forest arrays: {sorted(missing)}")
+
+        self.arrays = arrays
+        self.feature_columns: List[str] = list(feature_columns)
+        self.max_depth = int(max_depth)
+        self.metadata: Dict[str, Any] = dict(metadata or {})
+
+        self.scaler_mean = arrays["scaler_mean"]
+        self.scaler_scale = arrays["scaler_scale"]
+        self.roots = arrays["roots"]
+        self.feature = arrays["feature"]
+        self.threshold = arrays["threshold"]
+        self.children = arrays["children"]
+        self.value = arrays["value"]
+
+        # Leaves are the nodes whose children point back at themselves
+        self._is_leaf = self.children[:, 0] == np.arange(len(self.children))
+
+    @property
+    def n_features(self) -> int:
+        return len(self.scaler_mean)
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    @property
+    def n_outputs(self) -> int:
+        return self.value.shape[1]
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the model arrays"""
+        return sum(array.nbytes for array in self.arrays.values())
+
+    @classmethod
+    def from_sklearn(
+        cls,
+        model: RandomForestRegressor,
+        scaler: StandardScaler,
+        feature_columns: Sequence[str],
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> "CompactForest":
+        """
+        Flatten a fitted scaler and forest
+
+        Args:
+            model: Fitted RandomForestRegressor
+            scaler: StandardScaler the model's inputs were scaled with
+            feature_columns: Feature names the model was trained on
+            metadata: Extra header fields to store with the artifact
+
+        Returns:
+            In-memory compact forest
+        """
+        n_features = int(scaler.n_features_in_)
+        mean = scaler.mean_ if scaler.mean_ is not None else np.zeros(n_features)
+        scale = scaler.scale_ if scaler.scale_ is not None else np.ones(n_features)
+
+        roots, features, thresholds, children, values = [], [], [], [], []
+        offset = 0
+        max_depth = 0
+        for estimator in model.estimators_:
+            tree = estimator.tree_
+            node_ids = np.arange(tree.node_count, dtype=np.int64) + offset
+            is_leaf = tree.children_left == _LEAF
+
+            # Leaves point at themselves, so extra traversal steps are no-ops
+            left = np.where(is_leaf, node_ids, tree.children_left + offset)
+            right = np.where(is_leaf, node_ids, tree.children_right + offset)
+
+            roots.append(offset)
+            features.append(np.where(is_leaf, 0, tree.feature))
+            thresholds.append(np.where(is_leaf, 0.0, tree.threshold))
+            children.append(np.column_stack([left, right]))
+            values.append(tree.value[:, :, 0])
+            offset += tree.node_count
+            max_depth = max(max_depth, int(tree.max_depth))
+
+        if offset > np.iinfo(np.int32).max:
+            raise ValueError("Forest has too many nodes for int32 node indices")
+
+        arrays = {
+            "scaler_mean": np.asarray(mean, dtype=_ARRAY_DTYPES["scaler_mean"]),
+            "scaler_scale": np.asarray(scale, dtype=_ARRAY_DTYPES["scaler_scale"]),
+            "roots": np.asarray(roots, dtype=_ARRAY_DTYPES["roots"]),
+            "feature": np.concatenate(features).astype(_ARRAY_DTYPES["feature"]),
+            "threshold": _float32_floor(np.concatenate(thresholds)).astype(_ARRAY_DTYPES["threshold"]),
+            "children": np.concatenate(children).astype(_ARRAY_DTYPES["children"]),
+            "value": np.concatenate(values).astype(_ARRAY_DTYPES["value"]),
+        }
+        return cls(arrays, feature_columns, max_depth, metadata)
+
+    def save(self, path: str) -> None:
+        """
+        Write the artifact file (atomically replacing any existing file)
+
+        Args:
+            path: Destination file
+        """
+        layout: Dict[str, Dict[str, Any]] = {}
+        offset = 0
+        for name, dtype in _ARRAY_DTYPES.items():
+            array = np.ascontiguousarray(self.arrays[name], dtype=dtype)
+            layout[name] = {"offset": offset, "dtype": dtype, "shape": list(array.shape)}
+            offset = _aligned(offset + array.nbytes)
+
+        header = json.dumps({
+            "feature_columns": self.feature_columns,
+            "max_depth": self.max_depth,
+            "arrays": layout,
+            "metadata": self.metadata,
+        }).encode()
+        data_start = _aligned(_PREAMBLE_SIZE + len(header))
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(FORMAT_MAGIC)
+            f.write(np.array([FORMAT_VERSION, len(header)], dtype="<u4").tobytes())
+            f.write(header)
+            for name, dtype in _ARRAY_DTYPES.items():
+                f.seek(data_start + layout[name]["offset"])
+                f.write(np.ascontiguousarray(self.arrays[name], dtype=dtype).tobytes())
+            f.truncate(data_start + offset)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "CompactForest":
+        """
+        Memory-map an artifact file; arrays are read-only views onto the mapping
+
+        Args:
+            path: Artifact file written by save()
+
+        Returns:
+            Compact forest backed by the mapped file
+        """
+        mapped = np.memmap(path, dtype=np.uint8, mode="r")
+        if len(mapped) < _PREAMBLE_SIZE or bytes(mapped[:len(FORMAT_MAGIC)]) != FORMAT_MAGIC:
+            raise ValueError(f"{path} is not a forest artifact")
+
+        version, header_length = np.frombuffer(mapped[len(FORMAT_MAGIC):_PREAMBLE_SIZE], dtype="<u4")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported forest artifact version {version} (expected {FORMAT_VERSION})")
+
+        header_end = _PREAMBLE_SIZE + int(header_length)
+        header = json.loads(bytes(mapped[_PREAMBLE_SIZE:header_end]))
+        data_start = _aligned(header_end)
+
+        arrays = {}
+        for name, spec in header["arrays"].items():
+            dtype = np.dtype(spec["dtype"])
+            count = int(np.prod(spec["shape"], dtype=np.int64))
+            start = data_start + spec["offset"]
+            arrays[name] = mapped[start:start + count * dtype.itemsize].view(dtype).reshape(spec["shape"])
+
+        return cls(arrays, header["feature_columns"], header["max_depth"], header.get("metadata"))
+
+    def transform(self, features: NDArray[np.float64]) -> NDArray[np.float32]:
+        """Apply the stored scaler and cast to the float32 the trees compare against"""
+        scaled = np.array(features, dtype=np.float64, ndmin=2)
+        if scaled.shape[1] != self.n_features:
+            raise ValueError(f"Expected {self.n_features} features, got {scaled.shape[1]}")
+        scaled -= self.scaler_mean
+        scaled /= self.scaler_scale
+        return scaled.astype(np.float32)
+
+    def predict(self, features: NDArray[np.float64]) -> NDArray[np.float64]:
+        """
+        Predict raw (unscaled) feature rows
+
+        All (row, tree) pairs are traversed together, one level per step;
+        pairs drop out of the active set as soon as they reach a leaf.
+
+        Args:
+            features: Array of shape (n_samples, n_features)
+
+        Returns:
+            Forest-averaged predictions of shape (n_samples, n_outputs)
+        """
+        X = self.transform(features)
+        n_samples = X.shape[0]
+        nodes = np.tile(self.roots.astype(np.intp), n_samples)
+        rows = np.repeat(np.arange(n_samples), self.n_trees)
+        active = np.arange(nodes.size)
+
+        for _ in range(self.max_depth):
+            current = nodes[active]
+            go_right = X[rows[active], self.feature[current]] > self.threshold[current]
+            reached = self.children[current, go_right.view(np.int8)]
+            nodes[active] = reached
+            active = active[~self._is_leaf[reached]]
+            if active.size == 0:
+                break
+
+        return self.value[nodes.reshape(n_samples, self.n_trees)].mean(axis=1, dtype=np.float64)
@@ -0,0 +1,213 @@
+"""
+Compiled feature pipeline for the impermanent loss predictor
+
+Engineering, selection and scaling used to be spread over
+ImpermanentLossPredictor: predict() rebuilt ~30 engineered columns with pandas
+on every call, predict_with_uncertainty() skipped engineering, and feature
+selection trained on unscaled columns while predict() scaled them.
+
+ILFeaturePipeline fixes the schema once, when the model is trained: the raw input columns,
+the engineered columns computed from them (in dependency order) and the output
+column order. transform() pulls the raw columns out of the frame in one step
+and computes only the engineered columns the output needs, with NumPy. It then
+scales in place. The pipeline is pickled with the model, so training and
+serving run the same transform.
+"""
+
+import logging
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+logger = logging.getLogger(__name__)
+
+Columns = Dict[str, np.ndarray]
+
+# Engineered features in computation order. Each maps to alternative (inputs, formula) pairs;
+# the first alternative whose inputs are available is used
+ENGINEERED_FEATURES: Dict[str, List[Tuple[Tuple[str, ...], Callable[[Columns], np.ndarray]]]] = {
+    # Price ratio and its transformations
+    'price_ratio': [(('price_token0', 'price_token1'), lambda c: c['price_token0'] / (c['price_token1'] + 1e-8))],
+    'log_price_ratio': [(('price_ratio',), lambda c: np.log1p(c['price_ratio']))],
+    'sqrt_price_ratio': [(('price_ratio',), lambda c: np.sqrt(c['price_ratio']))],
+    'price_ratio_squared': [(('price_ratio',), lambda c: c['price_ratio'] ** 2)],
+    # Price divergence from initial
+    'price_divergence': [(('price_ratio', 'initial_price_token0', 'initial_price_token1'), lambda c: (
+        np.abs(c['price_ratio'] - c['initial_price_token0'] / (c['initial_price_token1'] + 1e-8))
+        / (c['initial_price_token0'] / (c['initial_price_token1'] + 1e-8))
+    ))],
+    'price_divergence_squared': [(('price_divergence',), lambda c: c['price_divergence'] ** 2)],
+    # Volatility
+    'volatility_product': [(('volatility_token0', 'volatility_token1'),
+                            lambda c: c['volatility_token0'] * c['volatility_token1'])],
+    'volatility_ratio': [(('volatility_token0', 'volatility_token1'),
+                          lambda c: c['volatility_token0'] / (c['volatility_token1'] + 1e-8))],
+    'max_volatility': [(('volatility_token0', 'volatility_token1'),
+                        lambda c: np.maximum(c['volatility_token0'], c['volatility_token1']))],
+    'volatility_diff': [(('volatility_token0', 'volatility_token1'),
+                         lambda c: np.abs(c['volatility_token0'] - c['volatility_token1']))],
+    # Correlation
+    'correlation_squared': [(('correlation',), lambda c: c['correlation'] ** 2)],
+    'correlation_inverse': [(('correlation',), lambda c: 1 / (np.abs(c['correlation']) + 0.1))],
+    'decorrelation': [(('correlation',), lambda c: 1 - np.abs(c['correlation']))],
+    # Volume
+    'volume_ratio': [(('volume_token0', 'volume_token1'),
+                      lambda c: c['volume_token0'] / (c['volume_token1'] + 1e-8))],
+    'total_volume': [(('volume_token0', 'volume_token1'), lambda c: c['volume_token0'] + c['volume_token1'])],
+    'volume_imbalance': [(('volume_token0', 'volume_token1', 'total_volume'),
+                          lambda c: np.abs(c['volume_token0'] - c['volume_token1']) / (c['total_volume'] + 1e-8))],
+    # Liquidity and its concentration
+    'log_liquidity': [(('liquidity',), lambda c: np.log1p(c['liquidity']))],
+    'liquidity_sqrt': [(('liquidity',), lambda c: np.sqrt(c['liquidity']))],
+    'range_width': [(('liquidity', 'range_lower', 'range_upper'), lambda c: c['range_upper'] - c['range_lower'])],
+    'liquidity_concentration': [(('liquidity', 'range_width'), lambda c: c['liquidity'] / (c['range_width'] + 1))],
+    # Time in pool
+    'time_in_pool_sqrt': [(('time_in_pool',), lambda c: np.sqrt(c['time_in_pool']))],
+    'time_in_pool_log': [(('time_in_pool',), lambda c: np.log1p(c['time_in_pool']))],
+    # Fee tier
+    'fee_impact': [(('fee_tier',), lambda c: c['fee_tier'] * 10000)],  # Basis points
+    'fee_to_volatility_ratio': [(('fee_tier', 'max_volatility'),
+                                 lambda c: c['fee_tier'] / (c['max_volatility'] + 1e-8))],
+    # Market conditions
+    'abs_market_trend': [(('market_trend',), lambda c: np.abs(c['market_trend']))],
+    'market_trend_squared': [(('market_trend',), lambda c: c['market_trend'] ** 2)],
+    # Value at Risk, normalized by volume when available
+    'risk_normalized': [(('var_95', 'total_volume'), lambda c: c['var_95'] / (c['total_volume'] + 1e-8)),
+                        (('var_95',), lambda c: c['var_95'])],
+}
+
+# Columns that are never model inputs
+NON_FEATURE_COLUMNS = ('impermanent_loss', 'timestamp', 'pool_address', 'pair_name')
+
+
+def _resolve(name: str, available: Sequence[str]) -> Optional[Tuple[str, ...]]:
+    """Inputs of the first usable formula for an engineered feature, or None"""
+    for inputs, _ in ENGINEERED_FEATURES[name]:
+        if all(column in available for column in inputs):
+            return inputs
+    return None
+
+
+def engineered_columns(columns: Sequence[str], engineer: bool = True) -> List[str]:
+    """
+    Feature columns produced from raw columns: the raw columns, then every derivable engineered feature
+
+    Args:
+        columns: Raw input columns
+        engineer: Whether to add engineered features
+
+    Returns:
+        Output column order (a raw column named like an engineered feature keeps its position)
+    """
+    output = [column for column in columns if column not in NON_FEATURE_COLUMNS]
+    if engineer:
+        for name in ENGINEERED_FEATURES:
+            if name not in output and _resolve(name, output) is not None:
+                output.append(name)
+    return output
+
+
+class ILFeaturePipeline:
+    """Fixed-schema feature engineering, selection and scaling on NumPy arrays"""
+
+    def __init__(self, feature_columns: Sequence[str], engineer: bool = True):
+        """
+        Compile the transform that produces feature_columns
+
+        Args:
+            feature_columns: Columns the models are trained on, in order. Engineered feature
+                names whose inputs are among them are computed; all others are raw inputs
+            engineer: Whether engineered feature names are computed (False treats every column as raw)
+        """
+        self.engineer = engineer
+        self.feature_columns: List[str] = list(feature_columns)
+        self.scaler = StandardScaler()
+
+        # Engineered features computable from the schema, in dependency order, with their inputs
+        self._sources: Dict[str, Tuple[str, ...]] = {}
+        if engineer:
+            available = [column for column in self.feature_columns if column not in ENGINEERED_FEATURES]
+            for name in ENGINEERED_FEATURES:
+                if name in self.feature_columns:
+                    inputs = _resolve(name, available)
+                    if inputs is not None:
+                        self._sources[name] = inputs
+                    available.append(name)
+        self._compile(self.feature_columns)
+
+    def _plan(self, output_columns: Sequence[str]) -> Tuple[List[str], List[str]]:
+        """Raw inputs and engineered features (in dependency order) needed for output_columns"""
+        needed = set(output_columns)
+        for name in reversed(list(self._sources)):
+            if name in needed:
+                needed.update(self._sources[name])
+        engineered = [name for name in self._sources if name in needed]
+        inputs = [column for column in self.feature_columns if column in needed and column not in self._sources]
+        return inputs, engineered
+
+    def _compile(self, output_columns: Sequence[str]):
+        self.output_columns: List[str] = list(output_columns)
+        self.input_columns, self.engineered = self._plan(self.output_columns)
+
+    def select(self, columns: Sequence[str]) -> "ILFeaturePipeline":
+        """Restrict the output to a subset of feature_columns (refit the scaler afterwards)"""
+        unknown = [column for column in columns if column not in self.feature_columns]
+        if unknown:
+            raise ValueError(f"Unknown feature columns: {unknown}")
+        self._compile(columns)
+        self.scaler = StandardScaler()
+        return self
+
+    def fit(self, X: Union[pd.DataFrame, np.ndarray]) -> "ILFeaturePipeline":
+        """Fit the scaler on the unscaled outputs of X"""
+        self.scaler.fit(self.transform(X, scale=False))
+        return self
+
+    def engineer_frame(self, X: pd.DataFrame) -> pd.DataFrame:
+        """Every feature column, unscaled, as a DataFrame (for training-set preparation)"""
+        inputs, engineered = self._plan(self.feature_columns)
+        values = self._compute(X, inputs, engineered, self.feature_columns)
+        return pd.DataFrame(values, columns=self.feature_columns, index=X.index)
+
+    def transform(self, X: Union[pd.DataFrame, np.ndarray], scale: bool = True) -> np.ndarray:
+        """
+        Raw features -> model input matrix in one pass
+
+        Args:
+            X: Raw features as a DataFrame, or an array whose columns follow input_columns
+            scale: Whether to apply the fitted scaler
+
+        Returns:
+            float64 array of shape (n_samples, len(output_columns))
+        """
+        out = self._compute(X, self.input_columns, self.engineered, self.output_columns)
+        if scale:
+            if not hasattr(self.scaler, 'scale_'):
+                raise ValueError("Feature pipeline scaler is not fitted")
+            out -= self.scaler.mean_
+            out /= self.scaler.scale_
+        return out
+
+    def _compute(self,
+                 X: Union[pd.DataFrame, np.ndarray],
+                 inputs: List[str],
+                 engineered: List[str],
+                 outputs: List[str]) -> np.ndarray:
+        if isinstance(X, pd.DataFrame):
+            missing = [column for column in inputs if column not in X.columns]
+            if missing:
+                raise ValueError(f"Missing feature columns: {missing}")
+            raw = X[inputs].to_numpy(dtype=np.float64)
+        else:
+            raw = np.asarray(X, dtype=np.float64).reshape(-1, len(inputs))
+
+        columns: Columns = {name: raw[:, i] for i, name in enumerate(inputs)}
+        for name in engineered:
+            columns[name] = dict(ENGINEERED_FEATURES[name])[self._sources[name]](columns)
+
+        out = np.empty((raw.shape[0], len(outputs)), dtype=np.float64)
+        for j, name in enumerate(outputs):
+            out[:, j] = columns[name]
+        return out
@@ -0,0 +1,94 @@
+"""Vectorized impermanent loss for SEI DLP
+
+Closed-form impermanent loss of a liquidity position relative to holding the
+deposited tokens, evaluated over NumPy arrays:
+
+* full-range (constant product) IL: 2 * sqrt(r) / (1 + r) - 1;
+* concentrated-liquidity IL for a position over [lower, upper], with the
+  bounds given as multiples of the entry price.
+
+Here r is the current price ratio divided by the initial one. IL is returned
+as a non-positive fraction of the hold value (-0.05 means 5% less than holding).
+Ratios that are zero or negative have no defined IL. They map to ``invalid``.
+NaN inputs propagate as NaN.
+"""
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+from typing import Tuple, Union
+
+
+def _price_change(initial_ratio: ArrayLike, current_ratio: ArrayLike) -> Tuple[NDArray[np.float64], NDArray[np.bool_]]:
+    """Relative price move current / initial and the mask of non-positive ratios"""
+    initial = np.asarray(initial_ratio, dtype=np.float64)
+    current = np.asarray(current_ratio, dtype=np.float64)
+    undefined = (initial <= 0) | (current <= 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = current / initial
+    return np.where(undefined, 1.0, change), undefined
+
+
+def impermanent_loss(initial_ratio: ArrayLike,
+                     current_ratio: ArrayLike,
+                     invalid: float = 0.0) -> Union[NDArray[np.float64], np.float64]:
+    """
+    Full-range (constant product) impermanent loss
+
+    Args:
+        initial_ratio: Price ratio(s) at entry
+        current_ratio: Price ratio(s) now
+        invalid: Value returned where either ratio is zero or negative
+
+    Returns:
+        Impermanent loss with the broadcast shape of the inputs (a scalar for scalar inputs)
+    """
+    change, undefined = _price_change(initial_ratio, current_ratio)
+    sqrt_change = np.sqrt(change)
+    with np.errstate(divide="ignore"):
+        # 2 * sqrt(r) / (1 + r) written so that r -> inf tends to -1 instead of NaN
+        il = 2.0 / (sqrt_change + 1.0 / sqrt_change) - 1.0
+    return np.where(undefined, invalid, il)[()]
+
+
+def concentrated_impermanent_loss(initial_ratio: ArrayLike,
+                                  current_ratio: ArrayLike,
+                                  lower: ArrayLike,
+                                  upper: ArrayLike,
+                                  invalid: float = 0.0) -> Union[NDArray[np.float64], np.float64]:
+    """
+    Impermanent loss of a concentrated-liquidity position over [lower, upper]
+
+    The bounds are multiples of the entry price, e.g. lower=0.9, upper=1.1 for
+    a +/-10% range. lower=0 with upper=inf reduces to :func:`impermanent_loss`.
+    A position whose entry price lies outside its range holds a single token,
+    as it would on-chain.
+
+    Args:
+        initial_ratio: Price ratio(s) at entry
+        current_ratio: Price ratio(s) now
+        lower: Lower range bound(s) relative to the entry price, >= 0
+        upper: Upper range bound(s) relative to the entry price, > lower
+        invalid: Value returned where either ratio is zero or negative
+
+    Returns:
+        Impermanent loss with the broadcast shape of the inputs (a scalar for scalar inputs)
+    """
+    lower = np.asarray(lower, dtype=np.float64)
+    upper = np.asarray(upper, dtype=np.float64)
+    if np.any(lower < 0) or np.any(upper <= lower):
+        raise ValueError("Range bounds must satisfy 0 <= lower < upper")
+
+    change, undefined = _price_change(initial_ratio, current_ratio)
+
+    # Position and hold values per unit liquidity, entry price normalized to 1
+    sqrt_lower = np.sqrt(lower)
+    sqrt_upper = np.sqrt(upper)
+    inv_sqrt_upper = 1.0 / sqrt_upper
+    sqrt_entry = np.clip(1.0, sqrt_lower, sqrt_upper)
+    sqrt_current = np.clip(np.sqrt(change), sqrt_lower, sqrt_upper)
+
+    with np.errstate(invalid="ignore"):
+        position_value = change * (1.0 / sqrt_current - inv_sqrt_upper) + sqrt_current - sqrt_lower
+        hold_value = change * (1.0 / sqrt_entry - inv_sqrt_upper) + sqrt_entry - sqrt_lower
+        il = position_value / hold_value - 1.0
+    return np.where(undefined, invalid, il)[()]
@@ -19,6 +19,13 @@ import os
 import json
 from datetime import datetime
 import warnings
+
+from sei_dlp_ai.models.ensemble_onnx import FEATURE_COLUMNS_KEY, SCHEMA_COLUMNS_KEY, convert_ensemble
+from sei_dlp_ai.models.ensemble_scheduler import EnsembleScheduler
+from sei_dlp_ai.models.il_feature_pipeline import ILFeaturePipeline, engineered_columns
+from sei_dlp_ai.models.impermanent_loss import impermanent_loss
+from sei_dlp_ai.models.onnx_runtime import OnnxInferenceSession
+
 warnings.filterwarnings('ignore')
 
 logger = logging.getLogger(__name__)
@@ -37,7 +44,9 @@ class ImpermanentLossPredictor:
                  n_estimators: int = 200,
                  max_depth: int = 15,
                  min_samples_split: int = 5,
-                 random_state: int = 42):
+                 random_state: int = 42,
+                 max_workers: Optional[int] = None,
+                 n_threads: Optional[int] = None):
         """
         Initialize the Impermanent Loss Predictor
 
@@ -49,6 +58,8 @@ class ImpermanentLossPredictor:
             max_depth: Maximum depth of trees
             min_samples_split: Minimum samples to split internal node
             random_state: Random seed for reproducibility
+            max_workers: Ensemble members trained concurrently (defaults to all members)
+            n_threads: Total cores shared between ensemble members (defaults to all cores)
         """
         self.model_name = model_name
         self.use_ensemble = use_ensemble
@@ -67,10 +78,19 @@ class ImpermanentLossPredictor:
         self.selected_features = []
         self.feature_importance = {}
 
+        # Engineering, selection and scaling with the schema fixed at training time
+        self.feature_pipeline: Optional[ILFeaturePipeline] = None
+
         # Model performance metrics
         self.training_metrics = {}
         self.validation_metrics = {}
 
+        # Shares cores between ensemble members for training and inference
+        self.scheduler = EnsembleScheduler(max_workers=max_workers, n_threads=n_threads)
+
+        # Optional compiled ensemble (see export_onnx / load_onnx_model)
+        self.onnx_session: Optional[OnnxInferenceSession] = None
+
         # Paths for saving
         self.save_path = f"models/il_predictor/{model_name}"
         os.makedirs(self.save_path, exist_ok=True)
@@ -154,98 +174,6 @@ class ImpermanentLossPredictor:
                 random_state=self.random_state
             )
 
-    def _engineer_features(self, X: pd.DataFrame) -> pd.DataFrame:
-        """
-        Engineer advanced features for IL prediction
-
-        Args:
-            X: Input features DataFrame
-
-        Returns:
-            DataFrame with engineered features
-        """
-        X_eng = X.copy()
-
-        # Price-based features
-        if 'price_token0' in X.columns and 'price_token1' in X.columns:
-            # Price ratio and its transformations
-            X_eng['price_ratio'] = X['price_token0'] / (X['price_token1'] + 1e-8)
-            X_eng['log_price_ratio'] = np.log1p(X_eng['price_ratio'])
-            X_eng['sqrt_price_ratio'] = np.sqrt(X_eng['price_ratio'])
-            X_eng['price_ratio_squared'] = X_eng['price_ratio'] ** 2
-
-            # Price divergence from initial
-            if 'initial_price_token0' in X.columns and 'initial_price_token1' in X.columns:
-                initial_ratio = X['initial_price_token0'] / (X['initial_price_token1'] + 1e-8)
-                X_eng['price_divergence'] = np.abs(X_eng['price_ratio'] - initial_ratio) / initial_ratio
-                X_eng['price_divergence_squared'] = X_eng['price_divergence'] ** 2
-
-        # Volatility-based features
-        if 'volatility_token0' in X.columns and 'volatility_token1' in X.columns:
-            X_eng['volatility_product'] = X['volatility_token0'] * X['volatility_token1']
-            X_eng['volatility_ratio'] = X['volatility_token0'] / (X['volatility_token1'] + 1e-8)
-            X_eng['max_volatility'] = np.maximum(X['volatility_token0'], X['volatility_token1'])
-            X_eng['volatility_diff'] = np.abs(X['volatility_token0'] - X['volatility_token1'])
-
-        # Correlation features
-        if 'correlation' in X.columns:
-            X_eng['correlation_squared'] = X['correlation'] ** 2
-            X_eng['correlation_inverse'] = 1 / (np.abs(X['correlation']) + 0.1)
-            X_eng['decorrelation'] = 1 - np.abs(X['correlation'])
-
-        # Volume-based features
-        if 'volume_token0' in X.columns and 'volume_token1' in X.columns:
-            X_eng['volume_ratio'] = X['volume_token0'] / (X['volume_token1'] + 1e-8)
-            X_eng['total_volume'] = X['volume_token0'] + X['volume_token1']
-            X_eng['volume_imbalance'] = np.abs(X['volume_token0'] - X['volume_token1']) / (X_eng['total_volume'] + 1e-8)
-
-        # Liquidity features
-        if 'liquidity' in X.columns:
-            X_eng['log_liquidity'] = np.log1p(X['liquidity'])
-            X_eng['liquidity_sqrt'] = np.sqrt(X['liquidity'])
-
-            # Liquidity concentration
-            if 'range_lower' in X.columns and 'range_upper' in X.columns:
-                X_eng['range_width'] = X['range_upper'] - X['range_lower']
-                X_eng['liquidity_concentration'] = X['liquidity'] / (X_eng['range_width'] + 1)
-
-        # Time-based features
-        if 'time_in_pool' in X.columns:
-            X_eng['time_in_pool_sqrt'] = np.sqrt(X['time_in_pool'])
-            X_eng['time_in_pool_log'] = np.log1p(X['time_in_pool'])
-
-        # Fee tier features
-        if 'fee_tier' in X.columns:
-            X_eng['fee_impact'] = X['fee_tier'] * 10000  # Convert to basis points
-            if 'volatility_token0' in X_eng.columns:
-                X_eng['fee_to_volatility_ratio'] = X['fee_tier'] / (X_eng['max_volatility'] + 1e-8)
-
-        # Market conditions
-        if 'market_trend' in X.columns:
-            X_eng['abs_market_trend'] = np.abs(X['market_trend'])
-            X_eng['market_trend_squared'] = X['market_trend'] ** 2
-
-        # Risk metrics
-        if 'var_95' in X.columns:  # Value at Risk
-            X_eng['risk_normalized'] = X['var_95'] / (X_eng['total_volume'] + 1e-8) if 'total_volume' in X_eng.columns else X['var_95']
-
-        return X_eng
-
-    def _calculate_impermanent_loss(self, initial_ratio: float, current_ratio: float) -> float:
-        """
-        Calculate actual impermanent loss
-
-        Args:
-            initial_ratio: Initial price ratio
-            current_ratio: Current price ratio
-
-        Returns:
-            Impermanent loss percentage
-        """
-        price_ratio = current_ratio / initial_ratio
-        il = 2 * np.sqrt(price_ratio) / (1 + price_ratio) - 1
-        return il
-
     def prepare_training_data(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
         """
         Prepare data for training including feature engineering and IL calculation
@@ -256,28 +184,23 @@ class ImpermanentLossPredictor:
         Returns:
             Features DataFrame and target Series
         """
-        # Engineer features
-        if self.feature_engineering:
-            X = self._engineer_features(df)
-        else:
-            X = df.copy()
+        # Engineer features (target and non-feature columns are dropped)
+        pipeline = ILFeaturePipeline(engineered_columns(df.columns, self.feature_engineering),
+                                     engineer=self.feature_engineering)
+        X = pipeline.engineer_frame(df)
 
         # Calculate target (impermanent loss) if not present
         if 'impermanent_loss' not in df.columns:
             if 'initial_price_ratio' in df.columns and 'current_price_ratio' in df.columns:
-                y = df.apply(lambda row: self._calculate_impermanent_loss(
-                    row['initial_price_ratio'],
-                    row['current_price_ratio']
-                ), axis=1)
+                y = pd.Series(impermanent_loss(df['initial_price_ratio'].to_numpy(),
+                                               df['current_price_ratio'].to_numpy(),
+                                               invalid=np.nan),
+                              index=df.index)
             else:
                 raise ValueError("Cannot calculate impermanent loss: missing price ratio columns")
         else:
             y = df['impermanent_loss']
 
-        # Remove target and non-feature columns from X
-        columns_to_drop = ['impermanent_loss', 'timestamp', 'pool_address', 'pair_name']
-        X = X.drop(columns=[col for col in columns_to_drop if col in X.columns], errors='ignore')
-
         # Store feature names
         self.feature_names = X.columns.tolist()
 
@@ -303,14 +226,22 @@ class ImpermanentLossPredictor:
         """
         logger.info(f"Training IL predictor with {len(X)} samples and {len(X.columns)} features")
 
+        # A compiled ensemble would keep serving the previous models
+        self.onnx_session = None
+
+        # Fix the feature schema; predict() runs this same pipeline
+        self.feature_pipeline = ILFeaturePipeline(X.columns, engineer=self.feature_engineering)
+        self.feature_names = list(X.columns)
+        self.selected_features = []
+
         # Split data
         X_train, X_val, y_train, y_val = train_test_split(
             X, y, test_size=validation_split, random_state=self.random_state
         )
 
         # Scale features
-        X_train_scaled = self.scaler.fit_transform(X_train)
-        X_val_scaled = self.scaler.transform(X_val)
+        X_train_scaled = self.feature_pipeline.fit(X_train).transform(X_train)
+        X_val_scaled = self.feature_pipeline.transform(X_val)
 
         # Feature selection
         if feature_selection and len(X.columns) > 20:
@@ -331,33 +262,33 @@ class ImpermanentLossPredictor:
             self.selected_features = feature_importance.head(n_features)['feature'].tolist()
             self.feature_importance = feature_importance.set_index('feature')['importance'].to_dict()
 
-            # Filter features
-            X_train_scaled = X_train[self.selected_features].values
-            X_val_scaled = X_val[self.selected_features].values
+            # Filter features and refit the scaler on the selected columns only
+            self.feature_pipeline.select(self.selected_features).fit(X_train)
+            X_train_scaled = self.feature_pipeline.transform(X_train)
+            X_val_scaled = self.feature_pipeline.transform(X_val)
 
             logger.info(f"Selected {len(self.selected_features)} features")
 
+        self.scaler = self.feature_pipeline.scaler
+
         # Hyperparameter optimization
         if optimize_hyperparameters:
             logger.info("Optimizing hyperparameters...")
             self._optimize_hyperparameters(X_train_scaled, y_train, cv_folds)
 
-        # Train models
+        # Train models concurrently, each under its share of the cores
         logger.info("Training models...")
-        for name, model in self.models.items():
-            logger.info(f"Training {name}...")
-
-            # Train model
-            model.fit(X_train_scaled, y_train)
+        fits = self.scheduler.fit(self.models, X_train_scaled, y_train, X_val_scaled)
+        for name, fit in fits.items():
+            self.models[name] = fit.model
+            train_pred, val_pred = fit.train_pred, fit.val_pred
 
             # Evaluate on training set
-            train_pred = model.predict(X_train_scaled)
             train_mse = mean_squared_error(y_train, train_pred)
             train_mae = mean_absolute_error(y_train, train_pred)
             train_r2 = r2_score(y_train, train_pred)
 
             # Evaluate on validation set
-            val_pred = model.predict(X_val_scaled)
             val_mse = mean_squared_error(y_val, val_pred)
             val_mae = mean_absolute_error(y_val, val_pred)
             val_r2 = r2_score(y_val, val_pred)
@@ -375,7 +306,7 @@ class ImpermanentLossPredictor:
                 'r2': val_r2
             }
 
-            logger.info(f"{name} - Train R2: {train_r2:.4f}, Val R2: {val_r2:.4f}")
+            logger.info(f"{name} - Train R2: {train_r2:.4f}, Val R2: {val_r2:.4f} ({fit.train_seconds:.2f}s)")
 
         # Get feature importance from all models
         self._aggregate_feature_importance()
@@ -443,6 +374,18 @@ class ImpermanentLossPredictor:
             feature: np.mean(scores) for feature, scores in importance_dict.items()
         }
 
+    def _get_feature_pipeline(self) -> ILFeaturePipeline:
+        """Feature pipeline of the trained model, rebuilt from the metadata for models saved without one"""
+        if self.feature_pipeline is None:
+            if not self.feature_names:
+                raise ValueError("Model not trained")
+            pipeline = ILFeaturePipeline(self.feature_names, engineer=self.feature_engineering)
+            if self.selected_features:
+                pipeline.select(self.selected_features)
+            pipeline.scaler = self.scaler
+            self.feature_pipeline = pipeline
+        return self.feature_pipeline
+
     def predict(self, X: pd.DataFrame, return_individual: bool = False) -> np.ndarray:
         """
         Predict impermanent loss
@@ -454,23 +397,17 @@ class ImpermanentLossPredictor:
         Returns:
             Predicted impermanent loss values
         """
-        # Engineer features
-        if self.feature_engineering:
-            X = self._engineer_features(X)
+        pipeline = self._get_feature_pipeline()
 
-        # Select features
-        if self.selected_features:
-            X = X[self.selected_features]
-        else:
-            X = X[self.feature_names]
+        # Compiled ensemble: scaling, every member and the weighted average in one call
+        if self.onnx_session is not None and not return_individual:
+            return self.onnx_session.run(pipeline.transform(X, scale=False))[:, 0].astype(np.float64)
 
-        # Scale features
-        X_scaled = self.scaler.transform(X)
+        # Engineer, select and scale features
+        X_scaled = pipeline.transform(X)
 
         # Get predictions from each model
-        predictions = {}
-        for name, model in self.models.items():
-            predictions[name] = model.predict(X_scaled)
+        predictions = self.scheduler.predict(self.models, X_scaled)
 
         if return_individual:
             return predictions
@@ -498,6 +435,9 @@ class ImpermanentLossPredictor:
         """
         Predict with uncertainty estimation using bootstrapping
 
+        Every tree of the random forest is evaluated once; bootstrap rounds resample
+        that (n_trees, n_samples) prediction matrix.
+
         Args:
             X: Feature DataFrame
             n_estimations: Number of bootstrap estimations
@@ -505,25 +445,24 @@ class ImpermanentLossPredictor:
         Returns:
             Dictionary with predictions, lower and upper bounds
         """
-        predictions = []
-
-        for _ in range(n_estimations):
-            # Random subsample of trees (for Random Forest)
-            if 'random_forest' in self.models:
-                n_trees = len(self.models['random_forest'].estimators_)
-                tree_indices = np.random.choice(n_trees, n_trees, replace=True)
-
-                # Get predictions from subsampled trees
-                tree_predictions = []
-                for idx in tree_indices[:n_trees//2]:  # Use half the trees
-                    tree = self.models['random_forest'].estimators_[idx]
-                    X_processed = X[self.selected_features] if self.selected_features else X[self.feature_names]
-                    X_scaled = self.scaler.transform(X_processed)
-                    tree_predictions.append(tree.predict(X_scaled))
-
-                predictions.append(np.mean(tree_predictions, axis=0))
-
-        predictions = np.array(predictions)
+        if 'random_forest' not in self.models:
+            predictions = np.array([])
+        else:
+            estimators = self.models['random_forest'].estimators_
+            n_trees = len(estimators)
+
+            # Transform once and evaluate every tree once: (n_trees, n_samples)
+            X_scaled = self._get_feature_pipeline().transform(X).astype(np.float32)
+            tree_predictions = np.stack([tree.predict(X_scaled, check_input=False) for tree in estimators])
+
+            # Each round averages the first half of a with-replacement draw of trees. Drawing all
+            # rounds at once consumes the RNG exactly like one np.random.choice per round, and the
+            # per-round tree counts turn the averaging into a single matmul
+            tree_indices = np.random.choice(n_trees, (n_estimations, n_trees), replace=True)[:, :n_trees // 2]
+            rounds = np.repeat(np.arange(n_estimations), tree_indices.shape[1])
+            weights = np.zeros((n_estimations, n_trees))
+            np.add.at(weights, (rounds, tree_indices.ravel()), 1.0 / tree_indices.shape[1])
+            predictions = weights @ tree_predictions
 
         return {
             'prediction': np.mean(predictions, axis=0),
@@ -532,6 +471,68 @@ class ImpermanentLossPredictor:
             'std': np.std(predictions, axis=0)
         }
 
+    def export_onnx(self, model_path: str, target_opset: Optional[int] = None) -> None:
+        """
+        Export the scaler, every ensemble member and the R2-weighted average as one ONNX graph
+
+        The averaging weights are taken from the current validation metrics and fixed in the graph.
+
+        Args:
+            model_path: Destination .onnx file
+            target_opset: ONNX opset to target (defaults to 17)
+        """
+        if not self.training_metrics:
+            raise ValueError("Model not trained")
+
+        try:
+            if self.use_ensemble:
+                models = self.models
+                weights = {name: max(0, self.validation_metrics[name]['r2']) for name in models}
+            else:
+                models = {'random_forest': self.models['random_forest']}
+                weights = {'random_forest': 1.0}
+
+            pipeline = self._get_feature_pipeline()
+            onnx_model = convert_ensemble(models, weights, pipeline.scaler, pipeline.output_columns,
+                                          target_opset=target_opset, schema_columns=pipeline.feature_columns)
+
+            with open(model_path, "wb") as f:
+                f.write(onnx_model.SerializeToString())
+        except Exception as e:
+            logger.error(f"Error exporting ONNX ensemble: {e}")
+            raise
+
+    def load_onnx_model(self, model_path: str, intra_op_threads: int = 0, inter_op_threads: int = 0) -> None:
+        """
+        Serve predict() from a compiled ensemble written by export_onnx
+
+        Args:
+            model_path: Path to the .onnx file
+            intra_op_threads: Threads used inside an operator (0 lets ONNX Runtime decide)
+            inter_op_threads: Threads used across operators (0 lets ONNX Runtime decide)
+        """
+        try:
+            session = OnnxInferenceSession.load(model_path, intra_op_threads, inter_op_threads)
+        except Exception as e:
+            logger.error(f"Error loading ONNX ensemble: {e}")
+            raise
+
+        feature_columns = session.metadata.get(FEATURE_COLUMNS_KEY, "").split(",")
+        if self.feature_names and feature_columns != (self.selected_features or self.feature_names):
+            raise ValueError(f"ONNX ensemble expects features {feature_columns}")
+        if not self.feature_names:
+            # Rebuild the feature schema so engineered inputs are computed from the raw columns
+            schema_columns = session.metadata.get(SCHEMA_COLUMNS_KEY)
+            self.feature_names = schema_columns.split(",") if schema_columns else feature_columns
+            self.selected_features = feature_columns if feature_columns != self.feature_names else []
+            self.feature_pipeline = None
+        self.onnx_session = session
+
+    @property
+    def member_timings(self) -> Dict[str, Dict[str, float]]:
+        """Last train and predict wall time of each ensemble member, in seconds"""
+        return self.scheduler.timings
+
     def save_model(self, suffix: str = ""):
         """Save the trained models"""
         save_name = f"{self.model_name}_{suffix}" if suffix else self.model_name
@@ -545,6 +546,11 @@ class ImpermanentLossPredictor:
         scaler_path = os.path.join(self.save_path, f"{save_name}_scaler.pkl")
         joblib.dump(self.scaler, scaler_path)
 
+        # Save feature pipeline
+        if self.feature_pipeline is not None:
+            pipeline_path = os.path.join(self.save_path, f"{save_name}_features.pkl")
+            joblib.dump(self.feature_pipeline, pipeline_path)
+
         # Save metadata
         metadata = {
             'model_name': self.model_name,
@@ -555,7 +561,8 @@ class ImpermanentLossPredictor:
             'training_metrics': self.training_metrics,
             'validation_metrics': self.validation_metrics,
             'use_ensemble': self.use_ensemble,
-            'feature_engineering': self.feature_engineering
+            'feature_engineering': self.feature_engineering,
+            'member_timings': self.member_timings
         }
 
         metadata_path = os.path.join(self.save_path, f"{save_name}_metadata.json")
@@ -591,5 +598,14 @@ class ImpermanentLossPredictor:
                 self.feature_importance = metadata.get('feature_importance', {})
                 self.training_metrics = metadata.get('training_metrics', {})
                 self.validation_metrics = metadata.get('validation_metrics', {})
+                self.feature_engineering = metadata.get('feature_engineering', self.feature_engineering)
+
+        # Load feature pipeline (models saved before it existed rebuild it from the metadata)
+        pipeline_path = os.path.join(base_path, f"{base_name}_features.pkl")
+        if os.path.exists(pipeline_path):
+            self.feature_pipeline = joblib.load(pipeline_path)
+            self.scaler = self.feature_pipeline.scaler
+        else:
+            self.feature_pipeline = None
 
         logger.info(f"Models loaded from {base_path}")
\ No newline at end of file
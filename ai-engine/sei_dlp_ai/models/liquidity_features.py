@@ -0,0 +1,280 @@
+"""Columnar feature extraction for the Liquidity Optimizer
+
+Converts batches of MarketData/LiquidityPool objects into NumPy columns once
+and computes the optimizer feature matrix with vectorized operations.
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import List, Sequence
+from numpy.typing import NDArray
+from decimal import Decimal
+
+from sei_dlp_ai.types import AssetSymbol, MarketData, LiquidityPool
+
+
+MARKET_FEATURE_NAMES = [
+    "sei_price", "sei_volume_24h", "sei_price_change_24h", "sei_confidence", "sei_funding_rate",
+    "usdc_price", "usdc_volume_24h", "eth_price", "eth_volume_24h", "sei_usdc_ratio",
+    "market_data_points", "avg_confidence", "avg_volume_24h", "avg_price_change_24h",
+    "positive_funding_ratio"
+]
+
+VOLATILITY_FEATURE_NAMES = [
+    "price_volatility_1h", "price_volatility_24h", "volume_volatility_24h",
+    "funding_rate_volatility", "cross_correlation"
+]
+
+SEI_FEATURE_NAMES = [
+    "finality_advantage", "gas_efficiency", "liquidity_utilization", "market_depth"
+]
+
+POOL_FEATURE_NAMES = ["reserve0", "reserve1", "fee_tier", "liquidity"]
+
+FEATURE_NAMES = (
+    MARKET_FEATURE_NAMES +
+    VOLATILITY_FEATURE_NAMES +
+    SEI_FEATURE_NAMES +
+    ["position_size"] +
+    POOL_FEATURE_NAMES
+)
+
+
+def to_float(value: object, default: float = 0.0) -> float:
+    """Convert a Decimal/number attribute to float, falling back to a default"""
+    try:
+        return float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return default
+
+
+@dataclass
+class MarketColumns:
+    """Market data batch stored as NumPy columns"""
+    symbols: List[AssetSymbol]
+    price: NDArray[np.float64]
+    volume_24h: NDArray[np.float64]
+    price_change_24h: NDArray[np.float64]
+    confidence_score: NDArray[np.float64]
+    funding_rate: NDArray[np.float64]
+
+    @classmethod
+    def from_market_data(cls, market_data: Sequence[MarketData]) -> "MarketColumns":
+        """Convert market data objects to columns with a single pass"""
+        return cls(
+            symbols=[data.symbol for data in market_data],
+            price=np.array([float(data.price) for data in market_data], dtype=np.float64),
+            volume_24h=np.array([float(data.volume_24h) for data in market_data], dtype=np.float64),
+            price_change_24h=np.array([float(data.price_change_24h) for data in market_data], dtype=np.float64),
+            confidence_score=np.array([data.confidence_score for data in market_data], dtype=np.float64),
+            funding_rate=np.array(
+                [float(data.funding_rate) if data.funding_rate else 0.0 for data in market_data],
+                dtype=np.float64
+            )
+        )
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def last_index(self, symbol: AssetSymbol) -> int:
+        """Index of the last entry for a symbol, or -1 if absent"""
+        for i in range(len(self.symbols) - 1, -1, -1):
+            if self.symbols[i] == symbol:
+                return i
+        return -1
+
+    @property
+    def average_volume(self) -> float:
+        """Mean 24h volume across all entries (0 when empty)"""
+        return float(self.volume_24h.mean()) if len(self) else 0.0
+
+
+@dataclass
+class PoolColumns:
+    """Liquidity pool batch stored as NumPy columns"""
+    reserve0: NDArray[np.float64]
+    reserve1: NDArray[np.float64]
+    fee_tier: NDArray[np.float64]
+    liquidity: NDArray[np.float64]
+
+    @classmethod
+    def from_pools(cls, pools: Sequence[LiquidityPool]) -> "PoolColumns":
+        """Convert pool objects to columns with a single pass"""
+        return cls(
+            reserve0=np.array([to_float(getattr(pool, 'reserve0', 0)) for pool in pools], dtype=np.float64),
+            reserve1=np.array([to_float(getattr(pool, 'reserve1', 0)) for pool in pools], dtype=np.float64),
+            fee_tier=np.array(
+                [to_float(getattr(pool, 'fee_tier', 0.003), 0.003) for pool in pools], dtype=np.float64
+            ),
+            liquidity=np.array([to_float(getattr(pool, 'liquidity', 0)) for pool in pools], dtype=np.float64)
+        )
+
+    def __len__(self) -> int:
+        return len(self.reserve0)
+
+
+class LiquidityFeatureExtractor:
+    """Vectorized feature extraction matching LiquidityOptimizer's feature layout"""
+
+    def __init__(self, sei_finality_ms: int = 400, gas_optimization_factor: float = 0.95) -> None:
+        """
+        Initialize the extractor
+
+        Args:
+            sei_finality_ms: SEI block finality in milliseconds
+            gas_optimization_factor: Gas efficiency factor applied to ranges
+        """
+        self.sei_finality_ms = sei_finality_ms
+        self.gas_optimization_factor = gas_optimization_factor
+
+    @property
+    def n_features(self) -> int:
+        return len(FEATURE_NAMES)
+
+    def market_features(self, market: MarketColumns) -> NDArray[np.float64]:
+        """Compute the 15 market features shared by every pool"""
+        features = np.zeros(len(MARKET_FEATURE_NAMES), dtype=np.float64)
+        if len(market) == 0:
+            return features
+
+        sei_idx = market.last_index(AssetSymbol.SEI)
+        usdc_idx = market.last_index(AssetSymbol.USDC)
+        eth_idx = market.last_index(AssetSymbol.ETH)
+
+        if sei_idx >= 0:
+            features[0] = market.price[sei_idx]
+            features[1] = market.volume_24h[sei_idx]
+            features[2] = market.price_change_24h[sei_idx]
+            features[3] = market.confidence_score[sei_idx]
+            features[4] = market.funding_rate[sei_idx]
+
+        if usdc_idx >= 0:
+            features[5] = market.price[usdc_idx]
+            features[6] = market.volume_24h[usdc_idx]
+
+        if eth_idx >= 0:
+            features[7] = market.price[eth_idx]
+            features[8] = market.volume_24h[eth_idx]
+
+        if sei_idx >= 0 and usdc_idx >= 0:
+            features[9] = market.price[sei_idx] / market.price[usdc_idx]
+
+        features[10] = float(len(market))
+        features[11] = market.confidence_score.mean()
+        features[12] = market.volume_24h.mean()
+        features[13] = market.price_change_24h.mean()
+        features[14] = np.count_nonzero(market.funding_rate > 0) / len(market)
+
+        return features
+
+    def sei_features(self, pools: PoolColumns, market: MarketColumns) -> NDArray[np.float64]:
+        """Compute the 4 SEI-specific features for every pool"""
+        features = np.zeros((len(pools), len(SEI_FEATURE_NAMES)), dtype=np.float64)
+        features[:, 0] = 1.0 - (self.sei_finality_ms / 12000.0)
+        features[:, 1] = self.gas_optimization_factor
+
+        total_reserves = pools.reserve0 + pools.reserve1
+        has_liquidity = pools.liquidity > 0
+        np.divide(total_reserves, pools.liquidity, out=features[:, 2], where=has_liquidity)
+
+        if len(market):
+            features[:, 3] = min(1.0, market.average_volume / 10000000.0)
+
+        return features
+
+    def transform(
+        self,
+        pools: Sequence[LiquidityPool],
+        market_data: Sequence[MarketData],
+        volatility: NDArray[np.float64],
+        sizes: Sequence[Decimal]
+    ) -> NDArray[np.float64]:
+        """
+        Build the full feature matrix for a batch of pools
+
+        Args:
+            pools: Liquidity pools
+            market_data: Market data shared by all pools
+            volatility: Volatility features, shape (n_pools, 5)
+            sizes: Position sizes, one per pool
+
+        Returns:
+            Feature matrix of shape (n_pools, n_features)
+        """
+        return self.transform_columns(
+            PoolColumns.from_pools(pools),
+            MarketColumns.from_market_data(market_data),
+            volatility,
+            np.array([float(size) for size in sizes], dtype=np.float64)
+        )
+
+    def transform_columns(
+        self,
+        pools: PoolColumns,
+        market: MarketColumns,
+        volatility: NDArray[np.float64],
+        sizes: NDArray[np.float64]
+    ) -> NDArray[np.float64]:
+        """Build the feature matrix from pre-converted columns"""
+        n_pools = len(pools)
+        n_market = len(MARKET_FEATURE_NAMES)
+        n_volatility = len(VOLATILITY_FEATURE_NAMES)
+        n_sei = len(SEI_FEATURE_NAMES)
+
+        features = np.empty((n_pools, self.n_features), dtype=np.float64)
+        col = 0
+        features[:, col:col + n_market] = self.market_features(market)
+        col += n_market
+        features[:, col:col + n_volatility] = np.asarray(volatility, dtype=np.float64).reshape(n_pools, n_volatility)
+        col += n_volatility
+        features[:, col:col + n_sei] = self.sei_features(pools, market)
+        col += n_sei
+        features[:, col] = sizes
+        col += 1
+        features[:, col:] = np.column_stack([pools.reserve0, pools.reserve1, pools.fee_tier, pools.liquidity])
+
+        return features
+
+    @staticmethod
+    def performance_metrics(
+        lower_price: NDArray[np.float64],
+        upper_price: NDArray[np.float64],
+        fee_tier: NDArray[np.float64],
+        average_volume: float
+    ) -> dict:
+        """
+        Vectorized expected fees, IL risk and capital efficiency
+
+        Args:
+            lower_price: Lower range bounds
+            upper_price: Upper range bounds
+            fee_tier: Pool fee tiers
+            average_volume: Mean 24h market volume
+
+        Returns:
+            Dictionary of metric arrays keyed like _calculate_performance_metrics
+        """
+        lower_price = np.asarray(lower_price, dtype=np.float64)
+        upper_price = np.asarray(upper_price, dtype=np.float64)
+        range_width = upper_price - lower_price
+        center_price = (lower_price + upper_price) / 2
+
+        expected_fees = average_volume * np.asarray(fee_tier, dtype=np.float64) * 0.01
+
+        il_risk = np.full_like(center_price, 0.1)
+        positive_center = center_price > 0
+        il_risk[positive_center] = np.minimum(
+            0.5, range_width[positive_center] / center_price[positive_center] * 0.2
+        )
+
+        capital_efficiency = np.full_like(range_width, 0.5)
+        positive_width = range_width > 0
+        capital_efficiency[positive_width] = np.minimum(
+            1.0, center_price[positive_width] / range_width[positive_width]
+        )
+
+        return {
+            "expected_fees": expected_fees,
+            "il_risk": il_risk,
+            "capital_efficiency": capital_efficiency
+        }
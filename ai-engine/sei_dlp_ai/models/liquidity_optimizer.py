@@ -1,11 +1,17 @@
 """Liquidity Optimizer ML model for SEI DLP"""
 
 import asyncio
+import functools
+import hashlib
 import logging
+import sys
+import time
+import tracemalloc
 import numpy as np
 import pandas as pd
 from typing import Dict, Any, List, Optional, Union
 from numpy.typing import NDArray
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
 from sklearn.ensemble import RandomForestRegressor
@@ -16,9 +22,67 @@ from sei_dlp_ai.types import (
     ChainId, AssetSymbol, MarketData, Position, LiquidityPool,
     TradingSignal, LiquidityRange, VolatilityFeatures
 )
+from sei_dlp_ai.models.liquidity_features import (
+    LiquidityFeatureExtractor, MarketColumns, PoolColumns, VOLATILITY_FEATURE_NAMES, to_float
+)
+from sei_dlp_ai.models.rolling_volatility import RollingVolatilityState
+from sei_dlp_ai.models.prediction_cache import RangePredictionCache
+from sei_dlp_ai.models.range_grid_optimizer import RangeGridOptimizer
+from sei_dlp_ai.models.tick_math import (
+    MIN_TICK, MAX_TICK, align_tick, align_price_ranges, price_to_tick, tick_to_price, ticks_to_prices
+)
+from sei_dlp_ai.models.onnx_runtime import OnnxInferenceSession, SCALER_FOLDED_KEY, prepend_scaler, session_options
+from sei_dlp_ai.models.forest_artifact import CompactForest
+from sei_dlp_ai.core.inference_executor import InferenceExecutor, PROCESS, THREAD
 
 logger = logging.getLogger(__name__)
 
+# Historical input accepted by the optimizer: a full DataFrame or a streaming state
+HistoricalData = Union[pd.DataFrame, RollingVolatilityState]
+
+# Model loaded into each inference worker process (see enable_inference_executor)
+_worker_model: Optional[Any] = None
+_worker_scaler: Optional[StandardScaler] = None
+
+
+def _init_sklearn_worker(scaler: StandardScaler, model: RandomForestRegressor) -> None:
+    """Process pool initializer: keep the scaler and forest resident in the worker"""
+    global _worker_model, _worker_scaler
+    _worker_scaler = scaler
+    _worker_model = model
+
+
+def _sklearn_worker_predict(features: NDArray[np.float64]) -> NDArray[np.float64]:
+    """Scale and predict inside a worker primed by _init_sklearn_worker"""
+    if _worker_model is None or _worker_scaler is None:
+        raise ValueError("Inference worker has no model loaded")
+    return np.asarray(_worker_model.predict(_worker_scaler.transform(features)))
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    """High-water resident set size of this process in bytes (None where getrusage is unavailable)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return int(peak) if sys.platform == "darwin" else int(peak) * 1024
+
+
+@dataclass
+class TrainingStats:
+    """Outcome of a train_model call"""
+    wall_time_seconds: float
+    peak_rss_bytes: Optional[int]
+    peak_python_heap_bytes: Optional[int]
+    n_samples: int
+    n_estimators: int
+    trees_added: int
+    warm_started: bool
+    skipped: bool
+    data_fingerprint: str
+
 
 class LiquidityOptimizer:
     """ML-driven liquidity range optimization for SEI DLP vaults"""
@@ -31,14 +95,37 @@ class LiquidityOptimizer:
         self.min_tick_spacing = 60
         self.gas_optimization_factor = 0.95
         
+        # Columnar feature extraction used by the prediction path
+        self.feature_extractor = LiquidityFeatureExtractor(
+            sei_finality_ms=self.sei_finality_ms,
+            gas_optimization_factor=self.gas_optimization_factor
+        )
+        
+        # Streaming volatility state per pool address
+        self.volatility_states: Dict[str, RollingVolatilityState] = {}
+        
+        # Optional cache of recent range predictions (see enable_prediction_cache)
+        self.prediction_cache: Optional[RangePredictionCache] = None
+        
+        # Optional Monte Carlo range search for the statistical fallback (see enable_range_grid_search)
+        self.range_grid_optimizer: Optional[RangeGridOptimizer] = None
+        
         # ML model components
         self.is_trained = False
         self.ml_model: Optional[RandomForestRegressor] = None
         self.scaler: Optional[StandardScaler] = None
         self.feature_columns: List[str] = []
+        self.training_stats: Optional[TrainingStats] = None
+        self._training_fingerprint: Optional[str] = None
+        
+        # Memory-mapped forest loaded with load_model
+        self.compact_forest: Optional[CompactForest] = None
+        
+        # Optional off-loop inference (see enable_inference_executor)
+        self.inference_executor: Optional[InferenceExecutor] = None
         
         # ONNX session for production inference
-        self.onnx_session: Optional[ort.InferenceSession] = None
+        self.onnx_session: Optional[Union[OnnxInferenceSession, ort.InferenceSession]] = None
         try:
             # Try to initialize ONNX session if model exists
             self.onnx_session = None  # Will be loaded explicitly
@@ -46,6 +133,84 @@ class LiquidityOptimizer:
             logger.warning(f"ONNX session initialization failed: {e}")
             self.onnx_session = None
     
+    def enable_prediction_cache(
+        self,
+        max_size: int = 4096,
+        ttl_seconds: float = 2.0,
+        price_bucket: float = 0.001,
+        volume_bucket: float = 0.05
+    ) -> RangePredictionCache:
+        """
+        Serve repeat queries for near-identical pool states from an LRU + TTL cache
+        
+        Args:
+            max_size: Maximum number of cached predictions
+            ttl_seconds: Lifetime of a cached prediction
+            price_bucket: Relative bucket width for price-like features
+            volume_bucket: Relative bucket width for volume/reserve/size features
+            
+        Returns:
+            The cache, for inspecting its stats
+        """
+        self.prediction_cache = RangePredictionCache(
+            max_size=max_size,
+            ttl_seconds=ttl_seconds,
+            price_bucket=price_bucket,
+            volume_bucket=volume_bucket
+        )
+        return self.prediction_cache
+    
+    def enable_range_grid_search(
+        self,
+        grid_size: int = 100,
+        n_paths: int = 1000,
+        n_steps: int = 288
+    ) -> RangeGridOptimizer:
+        """
+        Replace the single-volatility statistical fallback with a Monte Carlo grid search
+        
+        Args:
+            grid_size: Candidate bounds per side (grid_size ** 2 candidate ranges)
+            n_paths: Number of simulated price paths
+            n_steps: Five-minute steps per path
+            
+        Returns:
+            The grid optimizer
+        """
+        self.range_grid_optimizer = RangeGridOptimizer(grid_size=grid_size, n_paths=n_paths, n_steps=n_steps)
+        return self.range_grid_optimizer
+    
+    def enable_inference_executor(self, executor: Optional[InferenceExecutor] = None) -> InferenceExecutor:
+        """
+        Run model inference on an executor instead of the event loop
+        
+        ONNX and compact-forest inference run on the executor's thread pool;
+        sklearn inference runs on its process pool, whose workers are primed with
+        the current model (and re-primed after every retrain).
+        
+        Args:
+            executor: Executor to use (a default InferenceExecutor if omitted)
+            
+        Returns:
+            The executor, for inspecting its metrics
+        """
+        self.inference_executor = executor or InferenceExecutor()
+        self._prime_inference_workers()
+        return self.inference_executor
+    
+    def _prime_inference_workers(self) -> None:
+        """Load the trained sklearn model into the executor's process workers"""
+        if self.inference_executor is None:
+            return
+        if isinstance(self.ml_model, RandomForestRegressor) and isinstance(self.scaler, StandardScaler) and self.is_trained:
+            self.inference_executor.set_process_initializer(_init_sklearn_worker, (self.scaler, self.ml_model))
+    
+    async def _run_inference(self, fn: Any, features: NDArray[np.float64], backend: str = THREAD) -> NDArray[np.float64]:
+        """Call a synchronous inference function inline or on the inference executor"""
+        if self.inference_executor is None:
+            return fn(features)
+        return await self.inference_executor.run(fn, features, backend=backend)
+    
     def validate_sei_chain(self) -> bool:
         """Validate that we're operating on a valid SEI chain"""
         try:
@@ -54,7 +219,7 @@ class LiquidityOptimizer:
             return False
     
     def _extract_market_features(self, market_data: List[MarketData]) -> List[float]:
-        """Extract market features for ML model"""
+        """Extract market features for ML model (per-object reference for LiquidityFeatureExtractor)"""
         features = [0.0] * 15  # Fixed length feature vector
         
         if not market_data:
@@ -101,8 +266,30 @@ class LiquidityOptimizer:
         
         return features
     
-    def _calculate_volatility_features(self, historical_data: pd.DataFrame) -> Dict[str, float]:
+    def update_market_tick(
+        self,
+        pool_address: str,
+        price: float,
+        volume: Optional[float] = None,
+        funding_rate: Optional[float] = None
+    ) -> RollingVolatilityState:
+        """
+        Absorb a new price/volume tick into the pool's streaming volatility state
+        
+        The returned state can be passed as historical_data to the prediction
+        methods in place of a DataFrame.
+        """
+        state = self.volatility_states.get(pool_address)
+        if state is None:
+            state = self.volatility_states[pool_address] = RollingVolatilityState()
+        state.update(price, volume, funding_rate)
+        return state
+    
+    def _calculate_volatility_features(self, historical_data: HistoricalData) -> Dict[str, float]:
         """Calculate volatility-based features"""
+        if isinstance(historical_data, RollingVolatilityState):
+            return historical_data.features()
+        
         features = {
             "price_volatility_1h": 0.0,
             "price_volatility_24h": 0.0,
@@ -156,7 +343,7 @@ class LiquidityOptimizer:
         return features
     
     def _extract_sei_features(self, pool: LiquidityPool, market_data: List[MarketData]) -> List[float]:
-        """Extract SEI-specific features"""
+        """Extract SEI-specific features (per-object reference for LiquidityFeatureExtractor)"""
         features = [0.0] * 4
         
         # SEI finality advantage factor
@@ -182,18 +369,18 @@ class LiquidityOptimizer:
         
         return features
     
+    def _tick_spacing(self, pool: LiquidityPool) -> int:
+        """Tick spacing of a pool, defaulting to the SEI standard spacing"""
+        tick_spacing = getattr(pool, 'tick_spacing', self.min_tick_spacing)
+        if isinstance(tick_spacing, int) and not isinstance(tick_spacing, bool) and tick_spacing > 0:
+            return tick_spacing
+        return self.min_tick_spacing
+    
     def _align_to_tick_spacing(self, price: Decimal, pool: LiquidityPool) -> Decimal:
-        """Align price to SEI tick spacing"""
+        """Align price to the nearest usable tick of the pool's tick spacing"""
         try:
-            tick_spacing = getattr(pool, 'tick_spacing', self.min_tick_spacing)
-            price_float = float(price)
-            
-            # Simple tick alignment
-            tick_value = price_float * 10000  # Convert to tick representation
-            aligned_tick = round(tick_value / tick_spacing) * tick_spacing
-            aligned_price = Decimal(str(aligned_tick / 10000))
-            
-            return max(aligned_price, Decimal('0.001'))  # Minimum price
+            aligned_tick = align_tick(price_to_tick(price), self._tick_spacing(pool))
+            return tick_to_price(aligned_tick)
         except Exception:
             return price
     
@@ -201,47 +388,35 @@ class LiquidityOptimizer:
         self, 
         pool: LiquidityPool, 
         market_data: List[MarketData], 
-        historical_data: pd.DataFrame, 
+        historical_data: HistoricalData, 
         position_size: Decimal
     ) -> NDArray[np.float64]:
         """Extract complete feature set for ML model"""
-        # Market features
-        market_features = self._extract_market_features(market_data)
-        
-        # Volatility features
-        volatility_dict = self._calculate_volatility_features(historical_data)
-        volatility_features = list(volatility_dict.values())
-        
-        # SEI-specific features
-        sei_features = self._extract_sei_features(pool, market_data)
-        
-        # Position size feature
-        position_features = [float(position_size)]
-        
-        # Pool features
-        pool_features = [
-            float(getattr(pool, 'reserve0', 0)),
-            float(getattr(pool, 'reserve1', 0)),
-            float(getattr(pool, 'fee_tier', 0.003)),
-            float(getattr(pool, 'liquidity', 0))
-        ]
-        
-        # Combine all features
-        all_features = (
-            market_features + 
-            volatility_features + 
-            sei_features + 
-            position_features + 
-            pool_features
-        )
+        return self._stack_features([pool], market_data, [historical_data], [position_size])
+    
+    def _stack_features(
+        self,
+        pools: List[LiquidityPool],
+        market_data: List[MarketData],
+        histories: List[HistoricalData],
+        sizes: List[Decimal]
+    ) -> NDArray[np.float64]:
+        """Build one feature matrix for a batch of pools sharing the same market data"""
+        volatility = np.array(
+            [
+                [features[name] for name in VOLATILITY_FEATURE_NAMES]
+                for features in map(self._calculate_volatility_features, histories)
+            ],
+            dtype=np.float64
+        ).reshape(len(pools), len(VOLATILITY_FEATURE_NAMES))
         
-        return np.array([all_features])
+        return self.feature_extractor.transform(pools, market_data, volatility, sizes)
     
     async def _predict_statistical(
         self,
         pool: LiquidityPool,
         market_data: List[MarketData],
-        historical_data: pd.DataFrame,
+        historical_data: HistoricalData,
         risk_tolerance: float
     ) -> Dict[str, Any]:
         """Statistical fallback prediction method"""
@@ -258,7 +433,10 @@ class LiquidityOptimizer:
         
         # Calculate volatility from historical data
         volatility = 0.3  # Default
-        if not historical_data.empty and 'price' in historical_data.columns:
+        if isinstance(historical_data, RollingVolatilityState):
+            if historical_data.price_volatility is not None:
+                volatility = historical_data.price_volatility
+        elif not historical_data.empty and 'price' in historical_data.columns:
             returns = historical_data['price'].pct_change().dropna()
             if len(returns) > 0:
                 volatility = float(returns.std())
@@ -270,6 +448,15 @@ class LiquidityOptimizer:
         
         confidence = 0.6 if historical_data.empty else min(0.8, 0.4 + len(historical_data) / 1000)
         
+        if self.range_grid_optimizer is not None:
+            # The grid search is CPU-bound; keep it off the event loop
+            search = functools.partial(
+                self._predict_grid_search, pool, market_data, current_price, volatility, risk_tolerance, confidence
+            )
+            if self.inference_executor is not None:
+                return await self.inference_executor.run(search)
+            return await asyncio.to_thread(search)
+        
         return {
             "lower_price": lower_price,
             "upper_price": upper_price,
@@ -277,30 +464,88 @@ class LiquidityOptimizer:
             "reasoning": "Statistical volatility-based range calculation using historical price data"
         }
     
+    def _predict_grid_search(
+        self,
+        pool: LiquidityPool,
+        market_data: List[MarketData],
+        current_price: float,
+        volatility: float,
+        risk_tolerance: float,
+        confidence: float
+    ) -> Dict[str, Any]:
+        """Pick the Pareto-best range from a Monte Carlo grid search"""
+        # Daily volume relative to pool TVL drives fee income
+        fee_tier = to_float(getattr(pool, 'fee_tier', 0.003), 0.003)
+        tvl = to_float(getattr(pool, 'reserve0', 0)) * current_price + to_float(getattr(pool, 'reserve1', 0))
+        sei_data = next((data for data in market_data if data.symbol == AssetSymbol.SEI), None)
+        volume_to_liquidity = float(sei_data.volume_24h) / tvl if sei_data and tvl > 0 else 1.0
+        
+        result = self.range_grid_optimizer.optimize(
+            current_price,
+            volatility,
+            tick_spacing=self._tick_spacing(pool),
+            fee_tier=fee_tier,
+            volume_to_liquidity=volume_to_liquidity,
+            risk_tolerance=risk_tolerance
+        )
+        
+        return {
+            "lower_price": Decimal(str(result.lower_price)),
+            "upper_price": Decimal(str(result.upper_price)),
+            "confidence": confidence,
+            "reasoning": (
+                f"Monte Carlo grid search over {len(result.candidates)} tick-aligned ranges: "
+                f"{result.time_in_range:.0%} expected time in range, "
+                f"{result.expected_fees:.2%} expected fees vs {result.expected_il:.2%} impermanent loss"
+            )
+        }
+    
     def _optimize_for_sei(self, range_prediction: Dict[str, Any], pool: LiquidityPool) -> Dict[str, Any]:
         """Apply SEI-specific optimizations"""
-        original_lower = range_prediction["lower_price"]
-        original_upper = range_prediction["upper_price"]
-        original_range = original_upper - original_lower
-        
-        # Apply gas optimization (slightly tighter range)
-        optimized_range = original_range * Decimal(str(self.gas_optimization_factor))
+        return self._optimize_ranges_for_sei([range_prediction], [pool])[0]
+    
+    def _optimize_ranges_for_sei(
+        self,
+        range_predictions: List[Dict[str, Any]],
+        pools: List[LiquidityPool]
+    ) -> List[Dict[str, Any]]:
+        """Apply gas optimization and vectorized tick alignment to a batch of range predictions"""
+        gas_factor = Decimal(str(self.gas_optimization_factor))
+        lower_prices = np.empty(len(range_predictions), dtype=np.float64)
+        upper_prices = np.empty(len(range_predictions), dtype=np.float64)
         
-        # Center the optimized range
-        center_price = (original_lower + original_upper) / 2
-        optimized_lower = center_price - (optimized_range / 2)
-        optimized_upper = center_price + (optimized_range / 2)
+        for i, range_prediction in enumerate(range_predictions):
+            original_lower = range_prediction["lower_price"]
+            original_upper = range_prediction["upper_price"]
+            
+            # Apply gas optimization (slightly tighter range), centered on the original range
+            optimized_range = (original_upper - original_lower) * gas_factor
+            center_price = (original_lower + original_upper) / 2
+            lower_prices[i] = float(center_price - optimized_range / 2)
+            upper_prices[i] = float(center_price + optimized_range / 2)
         
-        # Align to tick spacing
-        optimized_lower = self._align_to_tick_spacing(optimized_lower, pool)
-        optimized_upper = self._align_to_tick_spacing(optimized_upper, pool)
+        # Align to tick spacing, one vectorized pass per distinct spacing
+        min_price, max_price = ticks_to_prices([MIN_TICK, MAX_TICK])
+        lower_prices = np.clip(lower_prices, min_price, max_price)
+        upper_prices = np.clip(upper_prices, min_price, max_price)
+        spacings = np.array([self._tick_spacing(pool) for pool in pools], dtype=np.int64)
+        ticks = np.empty((len(range_predictions), 2), dtype=np.int64)
+        for tick_spacing in np.unique(spacings):
+            mask = spacings == tick_spacing
+            ticks[mask] = align_price_ranges(lower_prices[mask], upper_prices[mask], int(tick_spacing))
+        aligned_prices = ticks_to_prices(ticks)
         
-        return {
-            **range_prediction,
-            "lower_price": optimized_lower,
-            "upper_price": optimized_upper,
-            "reasoning": f"{range_prediction.get('reasoning', '')} Enhanced with SEI gas optimization and tick alignment."
-        }
+        return [
+            {
+                **range_prediction,
+                "lower_price": Decimal(str(float(aligned_prices[i, 0]))),
+                "upper_price": Decimal(str(float(aligned_prices[i, 1]))),
+                "lower_tick": int(ticks[i, 0]),
+                "upper_tick": int(ticks[i, 1]),
+                "reasoning": f"{range_prediction.get('reasoning', '')} Enhanced with SEI gas optimization and tick alignment."
+            }
+            for i, range_prediction in enumerate(range_predictions)
+        ]
     
     async def _calculate_performance_metrics(
         self,
@@ -309,7 +554,7 @@ class LiquidityOptimizer:
         market_data: List[MarketData],
         position_size: Decimal
     ) -> Dict[str, float]:
-        """Calculate expected performance metrics"""
+        """Calculate expected performance metrics (per-object reference for LiquidityFeatureExtractor)"""
         try:
             lower_price = range_prediction["lower_price"]
             upper_price = range_prediction["upper_price"]
@@ -344,7 +589,7 @@ class LiquidityOptimizer:
         self,
         pool: LiquidityPool,
         market_data: List[MarketData],
-        historical_data: pd.DataFrame,
+        historical_data: HistoricalData,
         position_size: Decimal,
         risk_tolerance: float = 0.5
     ) -> LiquidityRange:
@@ -352,39 +597,158 @@ class LiquidityOptimizer:
         if not self.validate_sei_chain():
             raise ValueError("Invalid chain ID for SEI operations")
         
+        if self.prediction_cache is not None:
+            ranges = await self.predict_optimal_ranges(
+                [pool], market_data, [historical_data], [position_size], risk_tolerance
+            )
+            return ranges[0]
+        
         try:
-            # Try ONNX first, then sklearn, then statistical fallback
+            # Try ONNX first, then the compact forest, then sklearn, then statistical fallback
             if self.onnx_session is not None:
                 features = await self._extract_features(pool, market_data, historical_data, position_size)
                 prediction = await self._predict_with_onnx(features)
+            elif self.compact_forest is not None:
+                features = await self._extract_features(pool, market_data, historical_data, position_size)
+                prediction = (await self._predict_batch_with_compact_forest(features))[0]
             elif self.ml_model is not None and self.is_trained:
                 features = await self._extract_features(pool, market_data, historical_data, position_size)
                 prediction = await self._predict_with_sklearn(features)
             else:
                 prediction = await self._predict_statistical(pool, market_data, historical_data, risk_tolerance)
             
-            # Apply SEI optimizations
-            optimized_prediction = self._optimize_for_sei(prediction, pool)
+            return self._build_liquidity_ranges([prediction], [pool], market_data)[0]
+        
+        except Exception as e:
+            logger.error(f"Error in predict_optimal_range: {e}")
+            raise
+    
+    async def predict_optimal_ranges(
+        self,
+        pools: List[LiquidityPool],
+        market_data: List[MarketData],
+        histories: List[HistoricalData],
+        sizes: List[Decimal],
+        risk_tolerance: float = 0.5
+    ) -> List[LiquidityRange]:
+        """
+        Predict optimal liquidity ranges for many pools at once
+        
+        Features for every pool are stacked into a single matrix so the scaler
+        and the model (ONNX or sklearn) each run exactly once per batch. When a
+        prediction cache is enabled, only pools that miss the cache are predicted.
+        
+        Args:
+            pools: Liquidity pools to optimize
+            market_data: Current market data shared by all pools
+            histories: Historical price/volume data (DataFrame or RollingVolatilityState), one per pool
+            sizes: Position sizes, one per pool
+            risk_tolerance: Risk tolerance (0-1) for the statistical fallback
             
-            # Calculate performance metrics
-            metrics = await self._calculate_performance_metrics(
-                optimized_prediction, pool, market_data, position_size
-            )
+        Returns:
+            List of LiquidityRange in the same order as pools
+        """
+        if not self.validate_sei_chain():
+            raise ValueError("Invalid chain ID for SEI operations")
+        
+        if not (len(pools) == len(histories) == len(sizes)):
+            raise ValueError("pools, histories and sizes must have the same length")
+        
+        if not pools:
+            return []
+        
+        try:
+            if self.prediction_cache is None:
+                return await self._predict_ranges(pools, market_data, histories, sizes, risk_tolerance)
             
-            return LiquidityRange(
-                lower_price=optimized_prediction["lower_price"],
-                upper_price=optimized_prediction["upper_price"],
-                confidence=optimized_prediction["confidence"],
-                expected_fees=Decimal(str(metrics["expected_fees"])),
-                impermanent_loss_risk=metrics["il_risk"],
-                capital_efficiency=metrics["capital_efficiency"],
-                reasoning=optimized_prediction["reasoning"]
-            )
+            # Serve cached pools, then predict only the misses in one batch
+            cache = self.prediction_cache
+            features = self._stack_features(pools, market_data, histories, sizes)
+            results: List[Optional[LiquidityRange]] = [
+                cache.get(pool, row, risk_tolerance) for pool, row in zip(pools, features)
+            ]
+            missing = [i for i, result in enumerate(results) if result is None]
+            
+            if missing:
+                ranges = await self._predict_ranges(
+                    [pools[i] for i in missing],
+                    market_data,
+                    [histories[i] for i in missing],
+                    [sizes[i] for i in missing],
+                    risk_tolerance,
+                    features=features[missing]
+                )
+                for i, liquidity_range in zip(missing, ranges):
+                    cache.put(pools[i], features[i], risk_tolerance, liquidity_range)
+                    results[i] = liquidity_range
+            
+            return results  # type: ignore[return-value]
         
         except Exception as e:
-            logger.error(f"Error in predict_optimal_range: {e}")
+            logger.error(f"Error in predict_optimal_ranges: {e}")
             raise
     
+    async def _predict_ranges(
+        self,
+        pools: List[LiquidityPool],
+        market_data: List[MarketData],
+        histories: List[HistoricalData],
+        sizes: List[Decimal],
+        risk_tolerance: float,
+        features: Optional[NDArray[np.float64]] = None
+    ) -> List[LiquidityRange]:
+        """Run the model (or statistical fallback) for a batch, reusing stacked features if given"""
+        if self.onnx_session is not None:
+            if features is None:
+                features = self._stack_features(pools, market_data, histories, sizes)
+            predictions = await self._predict_batch_with_onnx(features)
+        elif self.compact_forest is not None:
+            if features is None:
+                features = self._stack_features(pools, market_data, histories, sizes)
+            predictions = await self._predict_batch_with_compact_forest(features)
+        elif self.ml_model is not None and self.is_trained:
+            if features is None:
+                features = self._stack_features(pools, market_data, histories, sizes)
+            predictions = await self._predict_batch_with_sklearn(features)
+        else:
+            predictions = list(await asyncio.gather(*(
+                self._predict_statistical(pool, market_data, historical_data, risk_tolerance)
+                for pool, historical_data in zip(pools, histories)
+            )))
+        
+        return self._build_liquidity_ranges(predictions, pools, market_data)
+    
+    def _build_liquidity_ranges(
+        self,
+        predictions: List[Dict[str, Any]],
+        pools: List[LiquidityPool],
+        market_data: List[MarketData]
+    ) -> List[LiquidityRange]:
+        """Apply SEI optimizations and vectorized performance metrics to raw range predictions"""
+        # Apply SEI optimizations
+        optimized_predictions = self._optimize_ranges_for_sei(predictions, pools)
+        
+        # Calculate performance metrics for the whole batch at once
+        metrics = self.feature_extractor.performance_metrics(
+            np.array([float(p["lower_price"]) for p in optimized_predictions]),
+            np.array([float(p["upper_price"]) for p in optimized_predictions]),
+            PoolColumns.from_pools(pools).fee_tier,
+            MarketColumns.from_market_data(market_data).average_volume
+        )
+        
+        return [
+            LiquidityRange(
+                lower_price=prediction["lower_price"],
+                upper_price=prediction["upper_price"],
+                confidence=prediction["confidence"],
+                expected_fees=Decimal(str(float(metrics["expected_fees"][i]))),
+                impermanent_loss_risk=float(metrics["il_risk"][i]),
+                capital_efficiency=float(metrics["capital_efficiency"][i]),
+                reasoning=prediction["reasoning"]
+            )
+            for i, prediction in enumerate(optimized_predictions)
+        ]
+    
     async def generate_rebalance_signal(
         self,
         position: Position,
@@ -428,8 +792,33 @@ class LiquidityOptimizer:
             logger.warning(f"Error generating rebalance signal: {e}")
             return None
     
-    def train_model(self, training_data: pd.DataFrame) -> None:
-        """Train the ML model"""
+    def train_model(
+        self,
+        training_data: pd.DataFrame,
+        n_estimators: int = 100,
+        n_jobs: Optional[int] = -1,
+        warm_start: bool = False,
+        skip_if_unchanged: bool = False,
+        trace_python_heap: bool = False
+    ) -> TrainingStats:
+        """
+        Train the ML model
+        
+        Args:
+            training_data: Feature columns plus lower_bound, upper_bound and confidence targets
+            n_estimators: Trees in a fresh forest, or trees added on a warm start
+            n_jobs: Cores used to fit trees (-1 for all cores)
+            warm_start: Keep the trained forest and scaler and add n_estimators trees fit on this data
+            skip_if_unchanged: Return without refitting when the data matches the last fit
+            trace_python_heap: Also record the peak Python heap with tracemalloc. This sees
+                Python objects and NumPy buffers only, not the native tree storage that
+                dominates a forest's footprint, and slows fitting by roughly 20%
+            
+        Returns:
+            Wall time, memory and forest size of the fit. peak_rss_bytes is the process's
+            high-water resident set size after the fit, so it includes native allocations
+            but also any earlier peak of the process
+        """
         try:
             # Identify feature columns (exclude target columns)
             target_columns = ['lower_bound', 'upper_bound', 'confidence']
@@ -438,104 +827,327 @@ class LiquidityOptimizer:
             if len(feature_columns) == 0:
                 raise ValueError("No feature columns found in training data")
             
-            # Extract features and targets
-            X = training_data[feature_columns].values
-            y = training_data[target_columns].values
-            
-            # Ensure X is 2D
-            if X.ndim == 1:
-                X = X.reshape(-1, 1)
-            
-            # Convert to proper numpy arrays
-            X = np.asarray(X, dtype=np.float64)
-            y = np.asarray(y, dtype=np.float64)
+            started = time.perf_counter()
+            start_tracing = trace_python_heap and not tracemalloc.is_tracing()
+            if start_tracing:
+                tracemalloc.start()
+            elif trace_python_heap:
+                tracemalloc.reset_peak()
             
-            # Validate data shapes
-            if X.shape[0] == 0:
-                raise ValueError("Training data cannot be empty")
-            if y.shape[0] == 0:
-                raise ValueError("Target data cannot be empty")
-            if X.shape[0] != y.shape[0]:
-                raise ValueError("Features and targets must have the same number of samples")
-            
-            # Initialize components
-            self.scaler = StandardScaler()
-            self.ml_model = RandomForestRegressor(n_estimators=100, random_state=42)
-            
-            # Scale features
-            X_scaled = self.scaler.fit_transform(X)
-            
-            # Train model
-            self.ml_model.fit(X_scaled, y)
+            try:
+                # Extract features and targets
+                X = training_data[feature_columns].values
+                y = training_data[target_columns].values
+                
+                # Ensure X is 2D
+                if X.ndim == 1:
+                    X = X.reshape(-1, 1)
+                
+                # Convert to proper numpy arrays
+                X = np.asarray(X, dtype=np.float64)
+                y = np.asarray(y, dtype=np.float64)
+                
+                # Validate data shapes
+                if X.shape[0] == 0:
+                    raise ValueError("Training data cannot be empty")
+                if y.shape[0] == 0:
+                    raise ValueError("Target data cannot be empty")
+                if X.shape[0] != y.shape[0]:
+                    raise ValueError("Features and targets must have the same number of samples")
+                
+                fingerprint = self._data_fingerprint(feature_columns, X, y)
+                if skip_if_unchanged and self.is_trained and fingerprint == self._training_fingerprint:
+                    logger.info("Training data unchanged since last fit; skipping retrain")
+                    skipped = True
+                    trees_added = 0
+                    warm_started = False
+                else:
+                    skipped = False
+                    warm_started = (
+                        warm_start and self.is_trained and self.ml_model is not None
+                        and self.scaler is not None and feature_columns == self.feature_columns
+                    )
+                    if warm_start and not warm_started:
+                        logger.info("No compatible trained model to warm start from; fitting a fresh forest")
+                    
+                    if warm_started:
+                        # New trees see the data through the scaler the existing trees were fit with
+                        X_scaled = self.scaler.transform(X)
+                        trees_added = n_estimators
+                        self.ml_model.set_params(
+                            warm_start=True,
+                            n_estimators=len(self.ml_model.estimators_) + n_estimators,
+                            n_jobs=n_jobs
+                        )
+                    else:
+                        # Initialize components
+                        self.scaler = StandardScaler()
+                        self.ml_model = RandomForestRegressor(
+                            n_estimators=n_estimators, random_state=42, n_jobs=n_jobs
+                        )
+                        trees_added = n_estimators
+                        
+                        # Scale features
+                        X_scaled = self.scaler.fit_transform(X)
+                    
+                    # Train model
+                    self.ml_model.fit(X_scaled, y)
+                    
+                    # Single-row inference is faster without the thread pool
+                    self.ml_model.set_params(n_jobs=None)
+                    
+                    # Store feature columns and mark as trained
+                    self.feature_columns = feature_columns
+                    self._training_fingerprint = fingerprint
+                    self.is_trained = True
+                    
+                    # A loaded artifact would shadow the new model
+                    self.compact_forest = None
+                    self._prime_inference_workers()
+                    
+                    # Cached ranges came from the previous model
+                    if self.prediction_cache is not None:
+                        self.prediction_cache.invalidate()
+                
+                peak_heap = tracemalloc.get_traced_memory()[1] if trace_python_heap else None
+            finally:
+                if start_tracing:
+                    tracemalloc.stop()
             
-            # Store feature columns and mark as trained
-            self.feature_columns = feature_columns
-            self.is_trained = True
+            self.training_stats = TrainingStats(
+                wall_time_seconds=time.perf_counter() - started,
+                peak_rss_bytes=_peak_rss_bytes(),
+                peak_python_heap_bytes=peak_heap,
+                n_samples=int(X.shape[0]),
+                n_estimators=len(getattr(self.ml_model, 'estimators_', [])),
+                trees_added=trees_added,
+                warm_started=warm_started,
+                skipped=skipped,
+                data_fingerprint=fingerprint
+            )
+            return self.training_stats
             
         except Exception as e:
             logger.error(f"Error training model: {e}")
             raise
     
+    @staticmethod
+    def _data_fingerprint(feature_columns: List[str], X: NDArray[np.float64], y: NDArray[np.float64]) -> str:
+        """Hash of the training window, used to skip refits on unchanged data"""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update("\x1f".join(map(str, feature_columns)).encode())
+        digest.update(repr(X.shape).encode())
+        digest.update(np.ascontiguousarray(X).tobytes())
+        digest.update(np.ascontiguousarray(y).tobytes())
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _prediction_to_range(pred: NDArray[np.float64], reasoning: str) -> Dict[str, Any]:
+        """Convert a raw (lower, upper, confidence) model output row into a range prediction"""
+        return {
+            "lower_price": Decimal(str(max(0.01, pred[0]))),
+            "upper_price": Decimal(str(max(pred[0] + 0.01, pred[1]))),
+            "confidence": max(0.1, min(0.9, pred[2])),
+            "reasoning": reasoning
+        }
+    
     async def _predict_with_sklearn(self, features: NDArray[np.float64]) -> Dict[str, Any]:
         """Predict using trained sklearn model"""
+        predictions = await self._predict_batch_with_sklearn(features)
+        return predictions[0]  # First (and only) prediction
+    
+    async def _predict_batch_with_sklearn(self, features: NDArray[np.float64]) -> List[Dict[str, Any]]:
+        """Predict a stacked feature matrix with one scaler pass and one model call"""
         if self.ml_model is None or not self.is_trained:
             raise ValueError("ML model not initialized or not trained")
         
         try:
-            # Scale features
             if self.scaler is None:
                 raise ValueError("Scaler not initialized")
-            features_scaled = self.scaler.transform(features)
             
-            # Make prediction
-            prediction = self.ml_model.predict(features_scaled)
-            pred = prediction[0]  # First (and only) prediction
+            if self.inference_executor is not None and self.inference_executor.has_process_workers:
+                # Workers hold their own copy of the model; only features are shipped
+                prediction = await self._run_inference(_sklearn_worker_predict, features, backend=PROCESS)
+            else:
+                prediction = await self._run_inference(self._sklearn_predict, features)
             
-            return {
-                "lower_price": Decimal(str(max(0.01, pred[0]))),
-                "upper_price": Decimal(str(max(pred[0] + 0.01, pred[1]))),
-                "confidence": max(0.1, min(0.9, pred[2])),
-                "reasoning": "ML model prediction using trained Random Forest"
-            }
+            return [
+                self._prediction_to_range(pred, "ML model prediction using trained Random Forest")
+                for pred in prediction
+            ]
         
         except Exception as e:
             logger.error(f"Error in sklearn prediction: {e}")
             raise
     
-    def load_onnx_model(self, model_path: str) -> None:
-        """Load ONNX model for inference"""
+    def _sklearn_predict(self, features: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Scale features and run the in-process forest"""
+        features_scaled = self.scaler.transform(features)
+        return np.asarray(self.ml_model.predict(features_scaled))
+    
+    def export_onnx(self, model_path: str, target_opset: Optional[int] = None) -> None:
+        """
+        Export the trained scaler and forest as a single ONNX graph with a float64 input
+        
+        Args:
+            model_path: Destination .onnx file
+            target_opset: ONNX opset to target (defaults to the converter's latest)
+        """
+        if self.ml_model is None or self.scaler is None or not self.is_trained:
+            raise ValueError("ML model not initialized or not trained")
+        
         try:
-            self.onnx_session = ort.InferenceSession(model_path)
+            from skl2onnx import convert_sklearn
+            from skl2onnx.common.data_types import FloatTensorType
+        except ImportError as e:
+            raise ImportError("skl2onnx is required for ONNX export: pip install skl2onnx") from e
+        
+        try:
+            n_features = int(self.scaler.n_features_in_)
+            n_outputs = int(getattr(self.ml_model, "n_outputs_", 1))
+            onnx_model = convert_sklearn(
+                self.ml_model,
+                initial_types=[("scaled", FloatTensorType([None, n_features]))],
+                final_types=[("predictions", FloatTensorType([None, n_outputs]))],
+                target_opset=target_opset
+            )
+            
+            # Scale in float64 ahead of the forest's float32 cast, exactly like the sklearn path
+            prepend_scaler(onnx_model, self.scaler.mean_, self.scaler.scale_)
+            
+            metadata = {
+                SCALER_FOLDED_KEY: "true",
+                "sei_dlp.feature_columns": ",".join(self.feature_columns)
+            }
+            for key, value in metadata.items():
+                prop = onnx_model.metadata_props.add()
+                prop.key = key
+                prop.value = value
+            
+            with open(model_path, "wb") as f:
+                f.write(onnx_model.SerializeToString())
+        except Exception as e:
+            logger.error(f"Error exporting ONNX model: {e}")
+            raise
+    
+    def save_model(self, model_path: str) -> None:
+        """
+        Save the trained scaler and forest as a compact memory-mappable artifact
+        
+        Args:
+            model_path: Destination artifact file
+        """
+        if self.ml_model is None or self.scaler is None or not self.is_trained:
+            raise ValueError("ML model not initialized or not trained")
+        
+        try:
+            forest = CompactForest.from_sklearn(
+                self.ml_model,
+                self.scaler,
+                self.feature_columns,
+                metadata={"saved_at": datetime.now(timezone.utc).isoformat(), "fingerprint": self._training_fingerprint}
+            )
+            forest.save(model_path)
+            logger.info(f"Saved {forest.n_trees}-tree forest ({forest.nbytes / 2 ** 20:.1f} MiB) to {model_path}")
+        except Exception as e:
+            logger.error(f"Error saving model: {e}")
+            raise
+    
+    def load_model(self, model_path: str) -> None:
+        """
+        Memory-map a forest artifact written by save_model for zero-copy inference
+        
+        Worker processes loading the same file share its pages, so the model is
+        held in memory once per host rather than once per process.
+        
+        Args:
+            model_path: Artifact file
+        """
+        try:
+            self.compact_forest = CompactForest.load(model_path)
+            self.feature_columns = list(self.compact_forest.feature_columns)
+            
+            # Cached ranges came from the previous model
+            if self.prediction_cache is not None:
+                self.prediction_cache.invalidate()
+        except Exception as e:
+            logger.error(f"Error loading model: {e}")
+            raise
+    
+    async def _predict_batch_with_compact_forest(self, features: NDArray[np.float64]) -> List[Dict[str, Any]]:
+        """Predict a stacked feature matrix with the memory-mapped forest (scaler included)"""
+        if self.compact_forest is None:
+            raise ValueError("Compact forest not loaded")
+        
+        try:
+            prediction = await self._run_inference(self.compact_forest.predict, features)
+            
+            return [
+                self._prediction_to_range(pred, "ML model prediction using memory-mapped Random Forest")
+                for pred in prediction
+            ]
+        
+        except Exception as e:
+            logger.error(f"Error in compact forest prediction: {e}")
+            raise
+    
+    def load_onnx_model(self, model_path: str, intra_op_threads: int = 0, inter_op_threads: int = 0) -> None:
+        """
+        Load ONNX model for inference
+        
+        Args:
+            model_path: Path to the .onnx file
+            intra_op_threads: Threads used inside an operator (0 lets ONNX Runtime decide)
+            inter_op_threads: Threads used across operators (0 lets ONNX Runtime decide)
+        """
+        try:
+            session = ort.InferenceSession(
+                model_path,
+                sess_options=session_options(intra_op_threads, inter_op_threads),
+                providers=["CPUExecutionProvider"]
+            )
+            self.onnx_session = OnnxInferenceSession(session)
+            
+            # Cached ranges came from the previous model
+            if self.prediction_cache is not None:
+                self.prediction_cache.invalidate()
         except Exception as e:
             logger.error(f"Error loading ONNX model: {e}")
             raise
     
     async def _predict_with_onnx(self, features: NDArray[np.float64]) -> Dict[str, Any]:
         """Predict using ONNX model"""
+        predictions = await self._predict_batch_with_onnx(features)
+        return predictions[0]  # First prediction
+    
+    def _onnx_predict(self, features: NDArray[np.float64]) -> NDArray[np.float64]:
+        """Scale (unless folded into the graph) and run the ONNX session"""
+        # Scale features unless the exported graph already contains the scaler
+        scaler_folded = isinstance(self.onnx_session, OnnxInferenceSession) and self.onnx_session.scaler_folded
+        if self.scaler is not None and not scaler_folded:
+            features_scaled = self.scaler.transform(features)
+        else:
+            features_scaled = features
+        
+        # Run inference
+        if isinstance(self.onnx_session, OnnxInferenceSession):
+            return self.onnx_session.run(features_scaled)
+        input_name = self.onnx_session.get_inputs()[0].name
+        result = self.onnx_session.run(None, {input_name: np.asarray(features_scaled, dtype=np.float32)})
+        return np.asarray(result[0])
+    
+    async def _predict_batch_with_onnx(self, features: NDArray[np.float64]) -> List[Dict[str, Any]]:
+        """Predict a stacked feature matrix with one scaler pass and one ONNX run"""
         if self.onnx_session is None:
             raise ValueError("ONNX session not initialized")
         
         try:
-            # Scale features if scaler is available
-            if self.scaler is not None:
-                features_scaled = self.scaler.transform(features)
-            else:
-                features_scaled = features
-            
-            # Get input name
-            input_name = self.onnx_session.get_inputs()[0].name
-            
-            # Run inference
-            result = self.onnx_session.run(None, {input_name: features_scaled.astype(np.float32)})
-            output_tensor = np.asarray(result[0])
-            pred = output_tensor[0]  # First prediction
+            output_tensor = await self._run_inference(self._onnx_predict, features)
             
-            return {
-                "lower_price": Decimal(str(max(0.01, pred[0]))),
-                "upper_price": Decimal(str(max(pred[0] + 0.01, pred[1]))),
-                "confidence": max(0.1, min(0.9, pred[2])),
-                "reasoning": "ONNX model prediction with optimized inference"
-            }
+            return [
+                self._prediction_to_range(pred, "ONNX model prediction with optimized inference")
+                for pred in output_tensor
+            ]
         
         except Exception as e:
             logger.error(f"Error in ONNX prediction: {e}")
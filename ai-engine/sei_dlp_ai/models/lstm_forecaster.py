@@ -8,17 +8,24 @@ import pandas as pd
 import torch
 import torch.nn as nn
 import torch.optim as optim
-from torch.utils.data import Dataset, DataLoader
+from torch.utils.data import Dataset
 from typing import Dict, Any, Tuple, Optional, List, Union
 from sklearn.preprocessing import MinMaxScaler, StandardScaler
 from sklearn.metrics import mean_squared_error, mean_absolute_error, mean_absolute_percentage_error
+from scipy.stats import norm
+import copy
 import logging
 import os
 import json
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
 
+from sei_dlp_ai.models.window_loader import StridedWindowLoader
+from sei_dlp_ai.models import lstm_runtime
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,6 +57,22 @@ class DeFiPriceDataset(Dataset):
         return x, y
 
 
+@dataclass
+class StreamingState:
+    """
+    Encoder state of a unidirectional AttentionLSTM for incremental inference
+
+    hidden/cell carry the LSTM state after the last absorbed tick; keys/values
+    hold the attention projections of the last `max_length` LSTM outputs.
+    """
+    hidden: torch.Tensor
+    cell: torch.Tensor
+    keys: torch.Tensor
+    values: torch.Tensor
+    max_length: int
+    ticks: int = 0
+
+
 class AttentionLSTM(nn.Module):
     """LSTM with Attention Mechanism for Time Series Forecasting"""
 
@@ -59,7 +82,8 @@ class AttentionLSTM(nn.Module):
                  num_layers: int,
                  output_dim: int,
                  prediction_horizon: int,
-                 dropout: float = 0.2):
+                 dropout: float = 0.2,
+                 bidirectional: bool = True):
         """
         Initialize LSTM with Attention
 
@@ -70,12 +94,15 @@ class AttentionLSTM(nn.Module):
             output_dim: Output dimension (usually 1 for price)
             prediction_horizon: Number of timesteps to predict
             dropout: Dropout rate
+            bidirectional: Use a bidirectional LSTM; unidirectional models support streaming inference
         """
         super(AttentionLSTM, self).__init__()
 
         self.hidden_dim = hidden_dim
         self.num_layers = num_layers
         self.prediction_horizon = prediction_horizon
+        self.bidirectional = bidirectional
+        encoder_dim = hidden_dim * (2 if bidirectional else 1)
 
         # LSTM layers
         self.lstm = nn.LSTM(
@@ -84,12 +111,12 @@ class AttentionLSTM(nn.Module):
             num_layers=num_layers,
             dropout=dropout if num_layers > 1 else 0,
             batch_first=True,
-            bidirectional=True
+            bidirectional=bidirectional
         )
 
         # Attention mechanism
         self.attention = nn.MultiheadAttention(
-            embed_dim=hidden_dim * 2,  # Bidirectional
+            embed_dim=encoder_dim,
             num_heads=8,
             dropout=dropout,
             batch_first=True
@@ -97,7 +124,7 @@ class AttentionLSTM(nn.Module):
 
         # Feature extraction layers
         self.feature_extractor = nn.Sequential(
-            nn.Linear(hidden_dim * 2, hidden_dim),
+            nn.Linear(encoder_dim, hidden_dim),
             nn.ReLU(),
             nn.Dropout(dropout),
             nn.Linear(hidden_dim, hidden_dim // 2),
@@ -105,11 +132,9 @@ class AttentionLSTM(nn.Module):
             nn.Dropout(dropout)
         )
 
-        # Output layers for multi-step prediction
-        self.output_layers = nn.ModuleList([
-            nn.Linear(hidden_dim // 2, output_dim)
-            for _ in range(prediction_horizon)
-        ])
+        # Output head for multi-step prediction: all horizons in one Linear, rows ordered (horizon, output)
+        self.output_dim = output_dim
+        self.output_head = nn.Linear(hidden_dim // 2, prediction_horizon * output_dim)
 
         # Additional components for uncertainty estimation
         self.uncertainty_layer = nn.Linear(hidden_dim // 2, prediction_horizon)
@@ -125,8 +150,10 @@ class AttentionLSTM(nn.Module):
             predictions: Predicted values (batch_size, prediction_horizon, output_dim)
             uncertainty: Uncertainty estimates (batch_size, prediction_horizon)
         """
-        batch_size = x.size(0)
+        return self._head(self.encode(x))
 
+    def encode(self, x: torch.Tensor) -> torch.Tensor:
+        """Encoder output at the last timestep (LSTM + attention residual), shape (batch_size, encoder_dim)"""
         # LSTM forward pass
         lstm_out, (hidden, cell) = self.lstm(x)
 
@@ -137,24 +164,128 @@ class AttentionLSTM(nn.Module):
         combined = lstm_out + attended_out  # Residual connection
 
         # Take the last timestep output
-        last_output = combined[:, -1, :]
+        return combined[:, -1, :]
 
+    def _head(self, last_output: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Prediction and uncertainty heads applied to the last combined encoder output"""
         # Extract features
         features = self.feature_extractor(last_output)
 
-        # Generate predictions for each timestep
-        predictions = []
-        for i in range(self.prediction_horizon):
-            pred = self.output_layers[i](features)
-            predictions.append(pred)
-
-        predictions = torch.stack(predictions, dim=1)
+        # Generate predictions for all timesteps at once
+        predictions = self.output_head(features).view(-1, self.prediction_horizon, self.output_dim)
 
         # Estimate uncertainty
         uncertainty = torch.sigmoid(self.uncertainty_layer(features))
 
         return predictions, uncertainty
 
+    def sample(self, x: torch.Tensor, n_samples: int) -> torch.Tensor:
+        """
+        Monte Carlo dropout samples of the predictions
+
+        The encoder runs once; the last encoder output is repeated n_samples
+        times and passed through the head with its dropout active, so all
+        samples come from one batched head call. Only head dropout is sampled.
+
+        Args:
+            x: Input tensor of shape (batch_size, sequence_length, input_dim)
+            n_samples: Samples per sequence
+
+        Returns:
+            Sampled predictions of shape (batch_size, n_samples, prediction_horizon * output_dim)
+        """
+        last_output = self.encode(x)
+        was_training = self.feature_extractor.training
+        self.feature_extractor.train()
+        try:
+            predictions, _ = self._head(last_output.repeat_interleave(n_samples, dim=0))
+        finally:
+            self.feature_extractor.train(was_training)
+        return predictions.reshape(x.shape[0], n_samples, -1)
+
+    def _load_from_state_dict(self, state_dict, prefix, *args, **kwargs):
+        """Accept checkpoints with one output_layers.{i} Linear per horizon by stacking them into output_head"""
+        for name in ("weight", "bias"):
+            legacy_keys = [f"{prefix}output_layers.{i}.{name}" for i in range(self.prediction_horizon)]
+            if f"{prefix}output_head.{name}" not in state_dict and all(key in state_dict for key in legacy_keys):
+                state_dict[f"{prefix}output_head.{name}"] = torch.cat([state_dict.pop(key) for key in legacy_keys])
+        super()._load_from_state_dict(state_dict, prefix, *args, **kwargs)
+
+    def _project(self, x: torch.Tensor, part: int) -> torch.Tensor:
+        """Attention input projection: part 0 = queries, 1 = keys, 2 = values; split into heads"""
+        embed_dim = self.attention.embed_dim
+        weight = self.attention.in_proj_weight[part * embed_dim:(part + 1) * embed_dim]
+        bias = self.attention.in_proj_bias[part * embed_dim:(part + 1) * embed_dim]
+        projected = nn.functional.linear(x, weight, bias)
+        batch_size, length, _ = projected.shape
+        return projected.view(batch_size, length, self.attention.num_heads, -1).transpose(1, 2)
+
+    def _attend_last(self, last: torch.Tensor, keys: torch.Tensor, values: torch.Tensor) -> torch.Tensor:
+        """Attention output of the newest position over cached keys/values (eval mode, no dropout)"""
+        query = self._project(last, 0)
+        attended = nn.functional.scaled_dot_product_attention(query, keys, values)
+        batch_size = attended.shape[0]
+        attended = attended.transpose(1, 2).reshape(batch_size, 1, self.attention.embed_dim)
+        return self.attention.out_proj(attended)
+
+    def init_stream(self, x: torch.Tensor, max_length: int) -> StreamingState:
+        """
+        Prime streaming inference with a history window
+
+        Args:
+            x: History of shape (batch_size, n_timesteps, input_dim)
+            max_length: Number of past LSTM outputs attention keeps (the training sequence length)
+
+        Returns:
+            State to pass to stream_step
+        """
+        if self.bidirectional:
+            raise ValueError("Streaming inference needs a unidirectional model (bidirectional=False)")
+
+        lstm_out, (hidden, cell) = self.lstm(x)
+        recent = lstm_out[:, -max_length:, :]
+        return StreamingState(
+            hidden=hidden,
+            cell=cell,
+            keys=self._project(recent, 1),
+            values=self._project(recent, 2),
+            max_length=max_length,
+            ticks=x.shape[1]
+        )
+
+    def stream_step(self,
+                    x_t: torch.Tensor,
+                    state: StreamingState) -> Tuple[torch.Tensor, torch.Tensor, StreamingState]:
+        """
+        Absorb one new timestep and predict from it
+
+        Costs one LSTM step and one attention query over the cached keys/values
+        instead of re-encoding the whole window.
+
+        Args:
+            x_t: New timestep of shape (batch_size, input_dim)
+            state: State from init_stream or the previous stream_step
+
+        Returns:
+            predictions, uncertainty (as in forward) and the updated state
+        """
+        lstm_out, (hidden, cell) = self.lstm(x_t.unsqueeze(1), (state.hidden, state.cell))
+
+        keys = torch.cat([state.keys, self._project(lstm_out, 1)], dim=2)[:, :, -state.max_length:]
+        values = torch.cat([state.values, self._project(lstm_out, 2)], dim=2)[:, :, -state.max_length:]
+
+        combined = lstm_out + self._attend_last(lstm_out, keys, values)
+        predictions, uncertainty = self._head(combined[:, -1, :])
+
+        new_state = StreamingState(hidden, cell, keys, values, state.max_length, state.ticks + 1)
+        return predictions, uncertainty, new_state
+
+
+def cpu_supports_bf16() -> bool:
+    """Whether the CPU has native bfloat16 instructions (AVX512-BF16 or AMX)"""
+    checks = ("_is_avx512_bf16_supported", "_is_amx_tile_supported")
+    return any(getattr(torch.cpu, name, lambda: False)() for name in checks)
+
 
 class LSTMForecaster:
     """
@@ -169,7 +300,8 @@ class LSTMForecaster:
                  num_layers: int = 3,
                  learning_rate: float = 0.001,
                  batch_size: int = 32,
-                 device: str = "auto"):
+                 device: str = "auto",
+                 bidirectional: bool = True):
         """
         Initialize LSTM Forecaster
 
@@ -182,6 +314,7 @@ class LSTMForecaster:
             learning_rate: Learning rate
             batch_size: Batch size for training
             device: Device to use (cpu/cuda/auto)
+            bidirectional: Bidirectional encoder; set False to enable streaming inference
         """
         self.model_name = model_name
         self.sequence_length = sequence_length
@@ -190,6 +323,7 @@ class LSTMForecaster:
         self.num_layers = num_layers
         self.learning_rate = learning_rate
         self.batch_size = batch_size
+        self.bidirectional = bidirectional
 
         # Set device
         if device == "auto":
@@ -202,6 +336,20 @@ class LSTMForecaster:
         self.feature_names: List[str] = []
         self.training_history: List[Dict[str, float]] = []
 
+        # Streaming inference state per asset (see start_stream)
+        self.streams: Dict[str, StreamingState] = {}
+
+        # Exported CPU runtime used by predict_batch instead of the eager model (see load_runtime)
+        self.runtime: Optional[Any] = None
+
+        # Conformal scale factors for prediction intervals (see calibrate_intervals)
+        self.interval_calibration: Optional[Dict[str, Any]] = None
+
+        # Scaler parameters cached as vectors for the inference path (see _scaling)
+        self._scaling_source: Optional[MinMaxScaler] = None
+        self._scale: Optional[np.ndarray] = None
+        self._offset: Optional[np.ndarray] = None
+
         # Paths for saving
         self.save_path = f"models/lstm/{model_name}"
         os.makedirs(self.save_path, exist_ok=True)
@@ -237,7 +385,8 @@ class LSTMForecaster:
             num_layers=self.num_layers,
             output_dim=1,  # Predicting price
             prediction_horizon=self.prediction_horizon,
-            dropout=0.2
+            dropout=0.2,
+            bidirectional=self.bidirectional
         )
         model.to(self.device)
         return model
@@ -247,55 +396,92 @@ class LSTMForecaster:
               val_data: Optional[pd.DataFrame] = None,
               feature_columns: Optional[List[str]] = None,
               epochs: int = 100,
-              early_stopping_patience: int = 10):
+              early_stopping_patience: int = 10,
+              cpu_optimized: bool = False,
+              num_threads: Optional[int] = None,
+              interop_threads: Optional[int] = None,
+              warm_start: bool = False):
         """
         Train the LSTM model
 
+        The best validation state is kept in memory and written once (as the
+        "best" checkpoint) when training ends. Every epoch records its wall
+        time and training samples/sec in training_history.
+
         Args:
             train_data: Training DataFrame
             val_data: Validation DataFrame
             feature_columns: Feature columns to use
             epochs: Number of training epochs
             early_stopping_patience: Patience for early stopping
+            cpu_optimized: CPU training mode: bfloat16 autocast when the CPU supports it
+                natively, plus explicit intra/inter-op thread counts
+            num_threads: Intra-op threads for the CPU mode (defaults to all CPUs)
+            interop_threads: Inter-op threads for the CPU mode; PyTorch only accepts this
+                before any parallel work has run in the process
+            warm_start: Fine-tune the current model and keep its scaler instead of
+                starting from scratch (falls back to a fresh model if none is loaded)
         """
         # Default features if not specified
         if feature_columns is None:
             feature_columns = ['price', 'volume', 'volatility', 'high', 'low']
 
-        # Prepare data
-        train_scaled = self.prepare_data(train_data, feature_columns)
+        warm_start = warm_start and self.model is not None and self.scaler is not None
+        if warm_start and list(feature_columns) != self.feature_names:
+            raise ValueError(f"Cannot warm start on features {feature_columns}; model uses {self.feature_names}")
+
+        # Prepare data (a warm start reuses the fitted scaler)
+        if warm_start:
+            train_scaled = self.scaler.transform(train_data[feature_columns].values)
+        else:
+            train_scaled = self.prepare_data(train_data, feature_columns)
 
-        # Create dataset and dataloader
-        train_dataset = DeFiPriceDataset(train_scaled, self.sequence_length, self.prediction_horizon)
-        train_loader = DataLoader(train_dataset, batch_size=self.batch_size, shuffle=True)
+        # Batches are gathered from strided views of one tensor kept on the training device
+        train_loader = StridedWindowLoader(
+            train_scaled, self.sequence_length, self.prediction_horizon,
+            batch_size=self.batch_size, shuffle=True, device=self.device
+        )
 
         # Validation setup
         val_loader = None
         if val_data is not None:
             val_scaled = self.scaler.transform(val_data[feature_columns].values)
-            val_dataset = DeFiPriceDataset(val_scaled, self.sequence_length, self.prediction_horizon)
-            val_loader = DataLoader(val_dataset, batch_size=self.batch_size, shuffle=False)
-
-        # Create model
-        input_dim = len(feature_columns)
-        self.model = self.create_model(input_dim)
+            val_loader = StridedWindowLoader(
+                val_scaled, self.sequence_length, self.prediction_horizon,
+                batch_size=self.batch_size, device=self.device
+            )
+
+        # Create model; exported runtimes and open streams no longer match it
+        if not warm_start:
+            input_dim = len(feature_columns)
+            self.model = self.create_model(input_dim)
+        self.runtime = None
+        self.streams.clear()
 
         # Loss function and optimizer
         criterion = nn.MSELoss()
         optimizer = optim.AdamW(self.model.parameters(), lr=self.learning_rate, weight_decay=1e-5)
         scheduler = optim.lr_scheduler.ReduceLROnPlateau(optimizer, mode='min', patience=5, factor=0.5)
 
+        use_bf16 = False
+        if cpu_optimized:
+            use_bf16 = self._configure_cpu_training(num_threads, interop_threads)
+
         # Training loop
         best_val_loss = float('inf')
+        best_state: Optional[Dict[str, torch.Tensor]] = None
         patience_counter = 0
 
         logger.info(f"Starting LSTM training for {epochs} epochs...")
 
         for epoch in range(epochs):
+            epoch_start = time.perf_counter()
+
             # Training phase
             self.model.train()
             train_loss = 0.0
             train_batches = 0
+            train_samples = 0
 
             for batch_x, batch_y in train_loader:
                 batch_x = batch_x.to(self.device)
@@ -303,15 +489,16 @@ class LSTMForecaster:
 
                 optimizer.zero_grad()
 
-                # Forward pass
-                predictions, uncertainty = self.model(batch_x)
-                predictions = predictions.squeeze(-1)  # Remove last dimension
+                # Forward pass (autocast is a no-op unless bf16 is enabled)
+                with torch.autocast(self.device.type, dtype=torch.bfloat16, enabled=use_bf16):
+                    predictions, uncertainty = self.model(batch_x)
+                predictions = predictions.squeeze(-1).float()  # Remove last dimension
 
                 # Calculate loss
                 loss = criterion(predictions, batch_y)
 
                 # Add uncertainty regularization
-                uncertainty_reg = 0.01 * torch.mean(uncertainty)
+                uncertainty_reg = 0.01 * torch.mean(uncertainty.float())
                 total_loss = loss + uncertainty_reg
 
                 # Backward pass
@@ -321,7 +508,9 @@ class LSTMForecaster:
 
                 train_loss += loss.item()
                 train_batches += 1
+                train_samples += len(batch_x)
 
+            train_seconds = time.perf_counter() - epoch_start
             avg_train_loss = train_loss / train_batches
 
             # Validation phase
@@ -335,8 +524,9 @@ class LSTMForecaster:
                         batch_x = batch_x.to(self.device)
                         batch_y = batch_y.to(self.device)
 
-                        predictions, _ = self.model(batch_x)
-                        predictions = predictions.squeeze(-1)
+                        with torch.autocast(self.device.type, dtype=torch.bfloat16, enabled=use_bf16):
+                            predictions, _ = self.model(batch_x)
+                        predictions = predictions.squeeze(-1).float()
 
                         loss = criterion(predictions, batch_y)
                         val_loss += loss.item()
@@ -349,7 +539,7 @@ class LSTMForecaster:
                 if avg_val_loss < best_val_loss:
                     best_val_loss = avg_val_loss
                     patience_counter = 0
-                    self.save_model("best")
+                    best_state = {k: v.detach().clone() for k, v in self.model.state_dict().items()}
                 else:
                     patience_counter += 1
 
@@ -362,7 +552,9 @@ class LSTMForecaster:
                 "epoch": epoch + 1,
                 "train_loss": avg_train_loss,
                 "val_loss": avg_val_loss if val_loader else None,
-                "learning_rate": optimizer.param_groups[0]['lr']
+                "learning_rate": optimizer.param_groups[0]['lr'],
+                "epoch_seconds": time.perf_counter() - epoch_start,
+                "samples_per_second": train_samples / train_seconds if train_seconds > 0 else 0.0
             }
             self.training_history.append(log_info)
 
@@ -370,10 +562,36 @@ class LSTMForecaster:
                 logger.info(f"Epoch {epoch+1}/{epochs} - Train Loss: {avg_train_loss:.6f}" +
                            (f" - Val Loss: {avg_val_loss:.6f}" if val_loader else ""))
 
-        # Save final model
+        # Flush the best validation state once, then save the final model
+        if best_state is not None:
+            self.save_model("best", state_dict=best_state)
         self.save_model("final")
         logger.info("LSTM training complete!")
 
+    def _configure_cpu_training(self, num_threads: Optional[int], interop_threads: Optional[int]) -> bool:
+        """
+        Apply the CPU training mode's thread settings
+
+        Args:
+            num_threads: Intra-op threads (defaults to all CPUs)
+            interop_threads: Inter-op threads (left unchanged if None)
+
+        Returns:
+            Whether bfloat16 autocast should be used
+        """
+        torch.set_num_threads(num_threads or os.cpu_count() or 1)
+        if interop_threads is not None:
+            try:
+                torch.set_interop_threads(interop_threads)
+            except RuntimeError as e:
+                logger.warning(f"Could not set inter-op threads: {e}")
+
+        use_bf16 = self.device.type == "cpu" and cpu_supports_bf16()
+        logger.info(f"CPU training mode: {torch.get_num_threads()} intra-op / "
+                    f"{torch.get_num_interop_threads()} inter-op threads, "
+                    f"{'bfloat16 autocast' if use_bf16 else 'float32 (no native bfloat16)'}")
+        return use_bf16
+
     def predict(self,
                 data: Union[pd.DataFrame, np.ndarray],
                 return_uncertainty: bool = True) -> Dict[str, np.ndarray]:
@@ -387,50 +605,468 @@ class LSTMForecaster:
         Returns:
             Dictionary with predictions and optionally uncertainty
         """
-        if self.model is None:
+        if self.model is None and self.runtime is None:
             raise ValueError("No model loaded. Train or load a model first.")
 
-        self.model.eval()
-
-        # Prepare data
+        # Only the last sequence_length rows are used; slice before converting
         if isinstance(data, pd.DataFrame):
-            data = data[self.feature_names].values
+            data = self._tail_values(data)
 
-        # Scale data
-        scaled_data = self.scaler.transform(data)
+        batch = self.predict_batch(np.asarray(data)[None], return_uncertainty=return_uncertainty)
+
+        result = {
+            "predictions": batch["predictions"][0],
+            "prediction_horizons": batch["prediction_horizons"]
+        }
+
+        if return_uncertainty:
+            result["uncertainty"] = batch["uncertainty"][0]
+
+        return result
+
+    def predict_batch(self,
+                      sequences: Union[np.ndarray, List[Union[pd.DataFrame, np.ndarray]]],
+                      return_uncertainty: bool = True,
+                      batch_size: Optional[int] = 1024) -> Dict[str, Any]:
+        """
+        Predict many sequences (several assets or offsets) with batched forward passes
+
+        Args:
+            sequences: Raw (unscaled) array of shape (n_sequences, n_timesteps, n_features),
+                or a list of DataFrames/arrays with the same number of timesteps; only
+                the last sequence_length timesteps of each are used
+            return_uncertainty: Whether to return uncertainty estimates
+            batch_size: Sequences per forward pass (None for a single pass)
+
+        Returns:
+            Dictionary with predictions (and uncertainty) of shape (n_sequences, prediction_horizon)
+        """
+        if self.model is None and self.runtime is None:
+            raise ValueError("No model loaded. Train or load a model first.")
+
+        if isinstance(sequences, list):
+            sequences = np.stack([
+                self._tail_values(item) if isinstance(item, pd.DataFrame) else np.asarray(item)[-self.sequence_length:]
+                for item in sequences
+            ])
+        sequences = np.asarray(sequences)
+        if sequences.ndim != 3:
+            raise ValueError(f"Expected sequences of shape (n, timesteps, features), got {sequences.shape}")
 
         # Ensure we have enough data for sequence
-        if len(scaled_data) < self.sequence_length:
+        if sequences.shape[1] < self.sequence_length:
             raise ValueError(f"Need at least {self.sequence_length} timesteps for prediction")
 
-        # Take last sequence_length timesteps
-        sequence = scaled_data[-self.sequence_length:]
-        sequence_tensor = torch.FloatTensor(sequence).unsqueeze(0).to(self.device)
+        # Scale only the last sequence_length timesteps of every sequence
+        n_sequences = len(sequences)
+        inputs = self._transform(sequences[:, -self.sequence_length:, :])
+
+        runtime = self.runtime or lstm_runtime.EagerRuntime(self.model, self.device)
+
+        step = batch_size or max(n_sequences, 1)
+        predictions, uncertainty = [], []
+        for start in range(0, n_sequences, step):
+            batch_pred, batch_unc = runtime(inputs[start:start + step])
+            predictions.append(batch_pred.reshape(len(batch_pred), -1))
+            uncertainty.append(batch_unc)
 
-        # Make prediction
+        result = {
+            "predictions": self._inverse_transform_price(np.concatenate(predictions)),
+            "prediction_horizons": list(range(1, self.prediction_horizon + 1))
+        }
+
+        if return_uncertainty:
+            result["uncertainty"] = np.concatenate(uncertainty)
+
+        return result
+
+    def sample_batch(self,
+                     sequences: Union[np.ndarray, List[Union[pd.DataFrame, np.ndarray]]],
+                     n_samples: int = 32,
+                     batch_size: Optional[int] = 256) -> np.ndarray:
+        """
+        Monte Carlo dropout forecast samples for many sequences
+
+        Args:
+            sequences: Same input as predict_batch
+            n_samples: Dropout samples per sequence
+            batch_size: Sequences per forward pass (None for a single pass)
+
+        Returns:
+            Price samples of shape (n_sequences, n_samples, prediction_horizon)
+        """
+        if self.model is None:
+            raise ValueError("No model loaded. Train or load a model first.")
+        if n_samples <= 0:
+            raise ValueError("n_samples must be positive")
+
+        if isinstance(sequences, list):
+            sequences = np.stack([
+                self._tail_values(item) if isinstance(item, pd.DataFrame) else np.asarray(item)[-self.sequence_length:]
+                for item in sequences
+            ])
+        sequences = np.asarray(sequences)
+        if sequences.ndim != 3 or sequences.shape[1] < self.sequence_length:
+            raise ValueError(
+                f"Expected sequences of shape (n, >= {self.sequence_length} timesteps, features), got {sequences.shape}"
+            )
+
+        inputs = torch.from_numpy(self._transform(sequences[:, -self.sequence_length:, :]))
+        self.model.eval()
+
+        step = batch_size or max(len(inputs), 1)
+        samples = []
+        with torch.no_grad():
+            for start in range(0, len(inputs), step):
+                samples.append(self.model.sample(inputs[start:start + step].to(self.device), n_samples).cpu())
+
+        return self._inverse_transform_price(torch.cat(samples).numpy())
+
+    def calibrate_intervals(self,
+                            calibration_data: pd.DataFrame,
+                            coverage: Tuple[float, ...] = (0.5, 0.8, 0.9),
+                            n_samples: int = 32) -> Dict[str, Any]:
+        """
+        Calibrate prediction intervals on held-out data (split conformal)
+
+        Every sliding window of the calibration data is forecast with MC
+        dropout; the score |actual - sample mean| / sample std is collected per
+        horizon, and its finite-sample-corrected quantile at each coverage level
+        becomes the multiplier of the sample std in predict_intervals. The
+        calibration is saved with the model.
+
+        Args:
+            calibration_data: Data not used for training, with the feature columns
+            coverage: Interval coverage levels to calibrate
+            n_samples: Dropout samples per window
+
+        Returns:
+            The calibration: coverage levels, std multipliers per level and horizon, and window count
+        """
+        if any(not 0 < level < 1 for level in coverage):
+            raise ValueError("coverage levels must be between 0 and 1")
+
+        values = calibration_data[self.feature_names].to_numpy()
+        n_windows = len(values) - self.sequence_length - self.prediction_horizon + 1
+        if n_windows <= 0:
+            raise ValueError(
+                f"Need more than {self.sequence_length + self.prediction_horizon - 1} rows, got {len(values)}"
+            )
+
+        windows = np.lib.stride_tricks.sliding_window_view(
+            values[:n_windows + self.sequence_length - 1], self.sequence_length, axis=0
+        ).transpose(0, 2, 1)
+        actuals = np.lib.stride_tricks.sliding_window_view(
+            values[self.sequence_length:, 0], self.prediction_horizon
+        )[:n_windows]
+
+        samples = self.sample_batch(windows, n_samples=n_samples)
+        scores = np.abs(actuals - samples.mean(axis=1)) / np.maximum(samples.std(axis=1), 1e-12)
+
+        multipliers = [
+            np.quantile(scores, min(1.0, np.ceil((n_windows + 1) * level) / n_windows), axis=0)
+            for level in coverage
+        ]
+        self.interval_calibration = {
+            "coverage": [float(level) for level in coverage],
+            "multipliers": np.stack(multipliers).tolist(),
+            "n_windows": int(n_windows),
+            "n_samples": int(n_samples)
+        }
+        logger.info(f"Calibrated prediction intervals on {n_windows} windows")
+        return self.interval_calibration
+
+    def predict_intervals(self,
+                          data: Union[pd.DataFrame, np.ndarray],
+                          n_samples: int = 32,
+                          coverage: Optional[Tuple[float, ...]] = None) -> Dict[str, Any]:
+        """
+        Probabilistic forecast: MC dropout mean, spread and prediction intervals
+
+        Intervals are mean +/- multiplier * sample std per horizon. After
+        calibrate_intervals the multipliers are the conformal ones (and only the
+        calibrated coverage levels are available); before, Gaussian multipliers
+        are used and the intervals are uncalibrated.
+
+        Args:
+            data: Input data (DataFrame or numpy array) as for predict()
+            n_samples: Dropout samples
+            coverage: Coverage levels to return (defaults to all calibrated levels, or 0.5/0.8/0.9)
+
+        Returns:
+            Dictionary with predictions (sample mean), median, std, intervals
+            ({coverage: {"lower", "upper"}}), calibrated flag and prediction_horizons
+        """
+        if isinstance(data, pd.DataFrame):
+            data = self._tail_values(data)
+        samples = self.sample_batch(np.asarray(data)[None], n_samples=n_samples)[0]
+        mean = samples.mean(axis=0)
+        std = samples.std(axis=0)
+
+        calibrated = self.interval_calibration is not None
+        if calibrated:
+            multipliers = dict(zip(self.interval_calibration["coverage"],
+                                   np.asarray(self.interval_calibration["multipliers"])))
+            coverage = coverage or tuple(multipliers)
+            missing = [level for level in coverage if level not in multipliers]
+            if missing:
+                raise ValueError(f"Coverage levels {missing} were not calibrated")
+        else:
+            coverage = coverage or (0.5, 0.8, 0.9)
+            multipliers = {level: np.full(self.prediction_horizon, norm.ppf(0.5 + level / 2)) for level in coverage}
+
+        return {
+            "predictions": mean,
+            "median": np.median(samples, axis=0),
+            "std": std,
+            "intervals": {
+                level: {"lower": mean - multipliers[level] * std, "upper": mean + multipliers[level] * std}
+                for level in coverage
+            },
+            "calibrated": calibrated,
+            "prediction_horizons": list(range(1, self.prediction_horizon + 1))
+        }
+
+    def export_runtimes(self,
+                        export_dir: Optional[str] = None,
+                        quantize: bool = True,
+                        sample: Optional[np.ndarray] = None,
+                        latency_runs: int = 50) -> Dict[str, Any]:
+        """
+        Export the model as TorchScript and ONNX CPU runtimes and report their accuracy and latency
+
+        Writes forecaster.ts.pt and forecaster.onnx (plus int8 variants with
+        dynamic quantization of the LSTM/Linear weights when quantize is set)
+        and runtime_report.json with each runtime's deviation from the eager
+        model and its p50/p99 latency on the sample.
+
+        Args:
+            export_dir: Destination directory (defaults to <save_path>/runtime)
+            quantize: Also export dynamically int8-quantized variants
+            sample: Scaled inputs of shape (n, sequence_length, n_features) for the
+                report (defaults to one random sequence)
+            latency_runs: Timed calls per runtime
+
+        Returns:
+            Dictionary with the exported paths and the per-runtime report
+        """
+        if self.model is None:
+            raise ValueError("No model loaded. Train or load a model first.")
+
+        export_dir = export_dir or os.path.join(self.save_path, "runtime")
+        os.makedirs(export_dir, exist_ok=True)
+
+        if sample is None:
+            sample = np.random.default_rng(0).random(
+                (1, self.sequence_length, len(self.feature_names) or self.model.lstm.input_size)
+            )
+        sample = np.ascontiguousarray(sample, dtype=np.float32)
+
+        # Export from a CPU copy so the artifacts never depend on CUDA
+        cpu_model = copy.deepcopy(self.model).cpu().eval()
+        example = torch.from_numpy(sample[:1])
+
+        paths = {}
+        try:
+            paths["torchscript"] = lstm_runtime.export_torchscript(
+                cpu_model, example, os.path.join(export_dir, lstm_runtime.RUNTIME_FILES["torchscript"])
+            )
+            if quantize:
+                paths["torchscript_int8"] = lstm_runtime.export_torchscript(
+                    cpu_model, example, os.path.join(export_dir, lstm_runtime.RUNTIME_FILES["torchscript_int8"]),
+                    quantize=True
+                )
+
+            paths["onnx"] = lstm_runtime.export_onnx(
+                cpu_model, example, os.path.join(export_dir, lstm_runtime.RUNTIME_FILES["onnx"])
+            )
+            if quantize:
+                paths["onnx_int8"] = lstm_runtime.quantize_onnx(
+                    paths["onnx"], os.path.join(export_dir, lstm_runtime.RUNTIME_FILES["onnx_int8"])
+                )
+        except Exception as e:
+            logger.error(f"Error exporting runtimes: {e}")
+            raise
+
+        eager = lstm_runtime.EagerRuntime(cpu_model)
+        runtimes = [eager] + [lstm_runtime.load_runtime(backend, export_dir) for backend in paths]
+        report = lstm_runtime.runtime_report(eager, runtimes, sample, runs=latency_runs)
+
+        with open(os.path.join(export_dir, "runtime_report.json"), "w") as f:
+            json.dump(report, f, indent=2)
+
+        logger.info(f"Runtimes exported to {export_dir}:\n{json.dumps(report, indent=2)}")
+        return {"export_dir": export_dir, "paths": paths, "report": report}
+
+    def load_runtime(self,
+                     export_dir: Optional[str] = None,
+                     backend: str = "auto",
+                     max_prediction_delta: Optional[float] = None,
+                     latency_runs: int = 20,
+                     intra_op_threads: int = 0) -> str:
+        """
+        Serve predictions from an exported runtime instead of the eager model
+
+        With backend="auto" every exported runtime (and the eager model, if
+        loaded) is timed on this host and the fastest one is kept. Runtimes
+        whose recorded deviation from eager exceeds max_prediction_delta
+        (scaled units, from runtime_report.json) are skipped.
+
+        Args:
+            export_dir: Directory written by export_runtimes (defaults to <save_path>/runtime)
+            backend: "auto", "eager" or one of onnx_int8/onnx/torchscript_int8/torchscript
+            max_prediction_delta: Largest acceptable max_abs_prediction_delta
+            latency_runs: Timed calls per runtime when backend="auto"
+            intra_op_threads: ONNX Runtime intra-op threads (0 lets ONNX Runtime decide)
+
+        Returns:
+            Name of the backend in use
+        """
+        export_dir = export_dir or os.path.join(self.save_path, "runtime")
+
+        if backend == "eager":
+            if self.model is None:
+                raise ValueError("No model loaded. Train or load a model first.")
+            self.runtime = None
+            return backend
+        if backend != "auto":
+            self.runtime = lstm_runtime.load_runtime(backend, export_dir, intra_op_threads)
+            logger.info(f"Using {backend} runtime from {export_dir}")
+            return backend
+
+        report = {}
+        report_path = os.path.join(export_dir, "runtime_report.json")
+        if os.path.exists(report_path):
+            with open(report_path, "r") as f:
+                report = json.load(f)
+
+        candidates = []
+        if self.model is not None:
+            candidates.append(lstm_runtime.EagerRuntime(self.model, self.device))
+        for name in lstm_runtime.available_backends(export_dir):
+            delta = report.get(name, {}).get("max_abs_prediction_delta")
+            if max_prediction_delta is not None and (delta is None or delta > max_prediction_delta):
+                logger.info(f"Skipping {name} runtime: prediction delta {delta} exceeds {max_prediction_delta}")
+                continue
+            try:
+                candidates.append(lstm_runtime.load_runtime(name, export_dir, intra_op_threads))
+            except Exception as e:
+                logger.warning(f"Could not load {name} runtime: {e}")
+
+        if not candidates:
+            raise ValueError(f"No usable runtime in {export_dir} and no model loaded")
+
+        input_dim = len(self.feature_names) or self.model.lstm.input_size
+        sample = np.random.default_rng(0).random((1, self.sequence_length, input_dim), dtype=np.float32)
+        latencies = {
+            runtime.name: lstm_runtime.measure_latency(runtime, sample, runs=latency_runs)["p50_ms"]
+            for runtime in candidates
+        }
+        fastest = min(candidates, key=lambda runtime: latencies[runtime.name])
+
+        self.runtime = None if fastest.name == "eager" else fastest
+        logger.info(f"Selected {fastest.name} runtime (p50 ms: {latencies})")
+        return fastest.name
+
+    def _tail_values(self, frame: pd.DataFrame) -> np.ndarray:
+        """Last sequence_length rows of the feature columns (column views, no full-frame copy)"""
+        return np.column_stack([frame[name].to_numpy()[-self.sequence_length:] for name in self.feature_names])
+
+    def _scaling(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Per-feature scale and offset of the fitted MinMaxScaler, recomputed only when the scaler changes"""
+        if self._scaling_source is not self.scaler:
+            self._scale = np.asarray(self.scaler.scale_, dtype=np.float64)
+            self._offset = np.asarray(self.scaler.min_, dtype=np.float64)
+            self._scaling_source = self.scaler
+        return self._scale, self._offset
+
+    def _transform(self, values: np.ndarray) -> np.ndarray:
+        """MinMax-scale raw feature values (last axis = features) into a new float32 array"""
+        scale, offset = self._scaling()
+        values = np.asarray(values, dtype=np.float64)
+        if values.shape[-1] != len(scale):
+            raise ValueError(f"Expected {len(scale)} features, got {values.shape[-1]}")
+        # Computed in float64 (large-magnitude features cancel against the offset) and cast once on output
+        return np.add(values * scale, offset, out=np.empty(values.shape, dtype=np.float32), casting="same_kind")
+
+    def _inverse_transform_price(self, predictions: np.ndarray) -> np.ndarray:
+        """Inverse MinMax transform of the price column (feature 0) for any number of predictions"""
+        scale, offset = self._scaling()
+        return (predictions - offset[0]) / scale[0]
+
+    def start_stream(self, key: str, history: Union[pd.DataFrame, np.ndarray]) -> None:
+        """
+        Start streaming inference for one asset
+
+        Streaming keeps the LSTM state and the cached attention keys/values of the
+        last sequence_length steps, so each new tick costs one LSTM step and one
+        attention query instead of re-encoding the full window (see
+        benchmarks/bench_lstm_streaming.py for latencies).
+
+        Trade-off: the LSTM state carries context from the whole stream rather
+        than restarting at the window start, so predictions drift from a full
+        windowed recompute as the stream ages (attention still only sees the last
+        sequence_length steps). Models trained on sequence_length windows see
+        their training distribution only at the start of a stream; re-prime with
+        start_stream periodically (e.g. daily) to bound the drift. Requires a
+        model built with bidirectional=False.
+
+        Args:
+            key: Stream identifier, e.g. the asset symbol
+            history: Raw history (DataFrame with feature_names or array), ideally sequence_length steps
+        """
+        if self.model is None:
+            raise ValueError("No model loaded. Train or load a model first.")
+
+        if isinstance(history, pd.DataFrame):
+            history = history[self.feature_names].to_numpy()
+        scaled = self._transform(history)
+
+        self.model.eval()
         with torch.no_grad():
-            predictions, uncertainty = self.model(sequence_tensor)
+            inputs = torch.from_numpy(scaled).unsqueeze(0).to(self.device)
+            self.streams[key] = self.model.init_stream(inputs, self.sequence_length)
+
+    def update_stream(self,
+                      key: str,
+                      tick: Union[pd.Series, Dict[str, float], np.ndarray],
+                      return_uncertainty: bool = True) -> Dict[str, Any]:
+        """
+        Absorb one new tick into a stream and predict the next horizon
+
+        Args:
+            key: Stream identifier passed to start_stream
+            tick: Raw feature values (Series/dict keyed by feature_names, or array)
+            return_uncertainty: Whether to return uncertainty estimates
+
+        Returns:
+            Dictionary in the same format as predict()
+        """
+        if key not in self.streams:
+            raise KeyError(f"No stream started for {key}")
 
-        # Convert to numpy
-        predictions_np = predictions.cpu().numpy().squeeze()
-        uncertainty_np = uncertainty.cpu().numpy().squeeze()
+        if isinstance(tick, (pd.Series, dict)):
+            tick = [tick[name] for name in self.feature_names]
+        scaled = self._transform(np.asarray(tick, dtype=np.float64).reshape(1, -1))
 
-        # Inverse transform predictions (only for price column)
-        # Create dummy array with correct shape
-        dummy = np.zeros((len(predictions_np), len(self.feature_names)))
-        dummy[:, 0] = predictions_np  # Assuming price is first feature
-        predictions_original = self.scaler.inverse_transform(dummy)[:, 0]
+        with torch.no_grad():
+            inputs = torch.from_numpy(scaled).to(self.device)
+            predictions, uncertainty, self.streams[key] = self.model.stream_step(inputs, self.streams[key])
 
         result = {
-            "predictions": predictions_original,
+            "predictions": self._inverse_transform_price(predictions.reshape(-1).cpu().numpy()),
             "prediction_horizons": list(range(1, self.prediction_horizon + 1))
         }
 
         if return_uncertainty:
-            result["uncertainty"] = uncertainty_np
+            result["uncertainty"] = uncertainty.reshape(-1).cpu().numpy()
 
         return result
 
+    def end_stream(self, key: str) -> None:
+        """Drop the state of a stream"""
+        self.streams.pop(key, None)
+
     def evaluate(self, test_data: pd.DataFrame, feature_columns: Optional[List[str]] = None) -> Dict[str, float]:
         """
         Evaluate model performance on test data
@@ -450,8 +1086,10 @@ class LSTMForecaster:
 
         # Prepare test data
         test_scaled = self.scaler.transform(test_data[feature_columns].values)
-        test_dataset = DeFiPriceDataset(test_scaled, self.sequence_length, self.prediction_horizon)
-        test_loader = DataLoader(test_dataset, batch_size=self.batch_size, shuffle=False)
+        test_loader = StridedWindowLoader(
+            test_scaled, self.sequence_length, self.prediction_horizon,
+            batch_size=self.batch_size, device=self.device
+        )
 
         self.model.eval()
 
@@ -466,7 +1104,7 @@ class LSTMForecaster:
                 predictions = predictions.squeeze(-1)
 
                 all_predictions.append(predictions.cpu().numpy())
-                all_targets.append(batch_y.numpy())
+                all_targets.append(batch_y.cpu().numpy())
 
         # Concatenate all predictions
         predictions_concat = np.concatenate(all_predictions, axis=0)
@@ -494,8 +1132,14 @@ class LSTMForecaster:
         logger.info(f"Evaluation Results:\n{json.dumps(metrics, indent=2)}")
         return metrics
 
-    def save_model(self, suffix: str = ""):
-        """Save the trained model"""
+    def save_model(self, suffix: str = "", state_dict: Optional[Dict[str, torch.Tensor]] = None):
+        """
+        Save the trained model
+
+        Args:
+            suffix: Appended to the model name in the file names
+            state_dict: Weights to save instead of the current model's (e.g. a kept best state)
+        """
         if self.model is None:
             logger.error("No model to save")
             return
@@ -505,12 +1149,13 @@ class LSTMForecaster:
         # Save model state
         model_path = os.path.join(self.save_path, f"{save_name}.pt")
         torch.save({
-            "model_state_dict": self.model.state_dict(),
+            "model_state_dict": state_dict if state_dict is not None else self.model.state_dict(),
             "model_config": {
                 "input_dim": len(self.feature_names),
                 "hidden_dim": self.hidden_dim,
                 "num_layers": self.num_layers,
-                "prediction_horizon": self.prediction_horizon
+                "prediction_horizon": self.prediction_horizon,
+                "bidirectional": self.bidirectional
             }
         }, model_path)
 
@@ -526,7 +1171,8 @@ class LSTMForecaster:
             "sequence_length": self.sequence_length,
             "prediction_horizon": self.prediction_horizon,
             "feature_names": self.feature_names,
-            "training_history": self.training_history
+            "training_history": self.training_history,
+            "interval_calibration": self.interval_calibration
         }
 
         metadata_path = os.path.join(self.save_path, f"{save_name}_metadata.json")
@@ -542,10 +1188,15 @@ class LSTMForecaster:
 
         # Create model with saved config
         config = checkpoint["model_config"]
+        self.bidirectional = config.get("bidirectional", True)
         self.model = self.create_model(config["input_dim"])
         self.model.load_state_dict(checkpoint["model_state_dict"])
         self.model.eval()
 
+        # Exported runtimes and open streams belong to the previous model
+        self.runtime = None
+        self.streams.clear()
+
         # Load scaler
         scaler_path = model_path.replace(".pt", "_scaler.pkl")
         if os.path.exists(scaler_path):
@@ -560,5 +1211,6 @@ class LSTMForecaster:
                 self.feature_names = metadata.get("feature_names", [])
                 self.sequence_length = metadata.get("sequence_length", self.sequence_length)
                 self.prediction_horizon = metadata.get("prediction_horizon", self.prediction_horizon)
+                self.interval_calibration = metadata.get("interval_calibration")
 
         logger.info(f"Model loaded from {model_path}")
\ No newline at end of file
@@ -0,0 +1,243 @@
+"""
+Exported CPU runtimes for the LSTM forecaster
+
+The eager AttentionLSTM can be exported to TorchScript and ONNX, each
+optionally with dynamic int8 quantization of the LSTM/Linear weights
+(torch.ao.quantization for TorchScript, onnxruntime.quantization for ONNX).
+Every backend is wrapped in a runtime with the same call signature
+(float32 sequences in, NumPy predictions/uncertainty out) so the forecaster
+can switch backends without changing its pre/post-processing, and helpers
+report the accuracy delta and p50/p99 latency of each runtime against eager.
+"""
+
+import logging
+import os
+import time
+import warnings
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+import onnxruntime as ort
+import torch
+import torch.nn as nn
+
+from sei_dlp_ai.models.onnx_runtime import session_options
+
+logger = logging.getLogger(__name__)
+
+# Backend name -> artifact file name inside an export directory
+RUNTIME_FILES = {
+    "onnx_int8": "forecaster_int8.onnx",
+    "onnx": "forecaster.onnx",
+    "torchscript_int8": "forecaster_int8.ts.pt",
+    "torchscript": "forecaster.ts.pt",
+}
+
+# Static preference when backends are not timed: fastest first on typical CPUs
+RUNTIME_PREFERENCE = ["onnx_int8", "onnx", "torchscript_int8", "torchscript", "eager"]
+
+RuntimeOutput = Tuple[np.ndarray, np.ndarray]
+
+
+class EagerRuntime:
+    """The in-memory nn.Module"""
+
+    name = "eager"
+
+    def __init__(self, model: nn.Module, device: torch.device = torch.device("cpu")):
+        self.model = model.eval()
+        self.device = device
+
+    def __call__(self, sequences: np.ndarray) -> RuntimeOutput:
+        with torch.no_grad():
+            predictions, uncertainty = self.model(torch.from_numpy(sequences).to(self.device))
+        return predictions.cpu().numpy(), uncertainty.cpu().numpy()
+
+
+class TorchScriptRuntime:
+    """A traced TorchScript module (CPU)"""
+
+    def __init__(self, path: str, name: str = "torchscript"):
+        self.name = name
+        self.module = torch.jit.load(path, map_location="cpu").eval()
+
+    def __call__(self, sequences: np.ndarray) -> RuntimeOutput:
+        with torch.no_grad():
+            predictions, uncertainty = self.module(torch.from_numpy(sequences))
+        return predictions.numpy(), uncertainty.numpy()
+
+
+class OnnxRuntime:
+    """An ONNX Runtime session on the CPU provider"""
+
+    def __init__(self, path: str, name: str = "onnx", intra_op_threads: int = 0):
+        self.name = name
+        self.session = ort.InferenceSession(
+            path, sess_options=session_options(intra_op_threads), providers=["CPUExecutionProvider"]
+        )
+        self.input_name = self.session.get_inputs()[0].name
+
+    def __call__(self, sequences: np.ndarray) -> RuntimeOutput:
+        predictions, uncertainty = self.session.run(None, {self.input_name: sequences})
+        return predictions, uncertainty
+
+
+def quantize_model(model: nn.Module) -> nn.Module:
+    """Dynamic int8 quantization of the LSTM and Linear layers (weights int8, activations float)"""
+    return torch.ao.quantization.quantize_dynamic(model, {nn.LSTM, nn.Linear}, dtype=torch.qint8)
+
+
+def export_torchscript(model: nn.Module, example: torch.Tensor, path: str, quantize: bool = False) -> str:
+    """
+    Trace a model (optionally int8-quantized) and save it as TorchScript
+
+    Args:
+        model: Eager model in eval mode
+        example: Example input of shape (batch_size, sequence_length, input_dim)
+        path: Destination file
+        quantize: Apply dynamic int8 quantization before tracing
+
+    Returns:
+        The path written
+    """
+    module = quantize_model(model) if quantize else model
+    with torch.no_grad(), warnings.catch_warnings():
+        warnings.simplefilter("ignore", torch.jit.TracerWarning)
+        traced = torch.jit.trace(module.eval(), example, check_trace=False)
+    traced.save(path)
+    return path
+
+
+def export_onnx(model: nn.Module, example: torch.Tensor, path: str, opset_version: int = 17) -> str:
+    """
+    Export a model to ONNX with a dynamic batch dimension
+
+    Args:
+        model: Eager model in eval mode
+        example: Example input of shape (batch_size, sequence_length, input_dim)
+        path: Destination file
+        opset_version: ONNX opset to target
+
+    Returns:
+        The path written
+    """
+    # Exported with autograd enabled: under no_grad nn.MultiheadAttention takes its fused
+    # fast path (aten::_native_multi_head_attention), which has no ONNX symbolic
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        torch.onnx.export(
+            model.eval(),
+            (example,),
+            path,
+            input_names=["sequences"],
+            output_names=["predictions", "uncertainty"],
+            dynamic_axes={"sequences": {0: "batch"}, "predictions": {0: "batch"}, "uncertainty": {0: "batch"}},
+            opset_version=opset_version,
+            dynamo=False
+        )
+    return path
+
+
+def quantize_onnx(source_path: str, path: str) -> str:
+    """Dynamic int8 weight quantization of an exported ONNX model"""
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+    except ImportError as e:
+        raise ImportError("onnx is required for ONNX quantization: pip install onnx") from e
+
+    quantize_dynamic(source_path, path, weight_type=QuantType.QInt8)
+    return path
+
+
+def load_runtime(backend: str, export_dir: str, intra_op_threads: int = 0) -> Callable[[np.ndarray], RuntimeOutput]:
+    """
+    Load an exported runtime
+
+    Args:
+        backend: One of RUNTIME_FILES
+        export_dir: Directory written by LSTMForecaster.export_runtimes
+        intra_op_threads: ONNX Runtime intra-op threads (0 lets ONNX Runtime decide)
+
+    Returns:
+        Runtime callable
+    """
+    if backend not in RUNTIME_FILES:
+        raise ValueError(f"Unknown runtime backend: {backend}")
+    path = os.path.join(export_dir, RUNTIME_FILES[backend])
+    if backend.startswith("onnx"):
+        return OnnxRuntime(path, backend, intra_op_threads)
+    return TorchScriptRuntime(path, backend)
+
+
+def available_backends(export_dir: str) -> List[str]:
+    """Exported backends present in a directory, in RUNTIME_PREFERENCE order"""
+    return [
+        backend for backend in RUNTIME_PREFERENCE
+        if backend in RUNTIME_FILES and os.path.exists(os.path.join(export_dir, RUNTIME_FILES[backend]))
+    ]
+
+
+def measure_latency(runtime: Callable[[np.ndarray], RuntimeOutput], sequences: np.ndarray,
+                    runs: int = 50, warmup: int = 3) -> Dict[str, float]:
+    """
+    Per-call latency percentiles
+
+    Args:
+        runtime: Runtime to time
+        sequences: Input batch
+        runs: Timed calls
+        warmup: Untimed calls first
+
+    Returns:
+        p50_ms, p99_ms and mean_ms
+    """
+    for _ in range(warmup):
+        runtime(sequences)
+    timings = np.empty(runs)
+    for i in range(runs):
+        start = time.perf_counter()
+        runtime(sequences)
+        timings[i] = (time.perf_counter() - start) * 1000
+    return {
+        "p50_ms": float(np.percentile(timings, 50)),
+        "p99_ms": float(np.percentile(timings, 99)),
+        "mean_ms": float(timings.mean())
+    }
+
+
+def accuracy_delta(reference: Callable[[np.ndarray], RuntimeOutput],
+                   candidate: Callable[[np.ndarray], RuntimeOutput],
+                   sequences: np.ndarray) -> Dict[str, float]:
+    """Absolute differences of a runtime's (scaled) outputs from a reference runtime"""
+    expected_predictions, expected_uncertainty = reference(sequences)
+    predictions, uncertainty = candidate(sequences)
+    prediction_error = np.abs(predictions.reshape(expected_predictions.shape) - expected_predictions)
+    return {
+        "max_abs_prediction_delta": float(prediction_error.max()),
+        "mean_abs_prediction_delta": float(prediction_error.mean()),
+        "max_abs_uncertainty_delta": float(np.abs(uncertainty - expected_uncertainty).max())
+    }
+
+
+def runtime_report(reference: Callable[[np.ndarray], RuntimeOutput],
+                   runtimes: List[Any],
+                   sequences: np.ndarray,
+                   runs: int = 50) -> Dict[str, Dict[str, float]]:
+    """
+    Accuracy delta against the reference and latency for each runtime
+
+    Args:
+        reference: Runtime whose outputs count as exact (normally eager)
+        runtimes: Runtimes to compare (each with a `name`)
+        sequences: Input batch for both accuracy and latency
+        runs: Timed calls per runtime
+
+    Returns:
+        Report keyed by runtime name
+    """
+    report = {}
+    for runtime in runtimes:
+        entry = accuracy_delta(reference, runtime, sequences)
+        entry.update(measure_latency(runtime, sequences, runs=runs))
+        report[runtime.name] = entry
+    return report
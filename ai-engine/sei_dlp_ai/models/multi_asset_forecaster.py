@@ -0,0 +1,515 @@
+"""
+Multi-asset LSTM forecaster with a shared encoder
+
+One LSTMForecaster per symbol means one full encoder per symbol in memory and
+one forward pass per symbol at inference. MultiAssetForecaster serves every
+symbol from a single model instead: the LSTM/attention encoder and feature
+extractor are shared, each asset gets a learned embedding (appended to every
+input timestep) and its own prediction/uncertainty head, and one forward pass
+over a batch of assets forecasts all of them. Each asset keeps its own
+MinMaxScaler, since prices differ by orders of magnitude between symbols.
+"""
+
+import json
+import logging
+import math
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import torch
+import torch.nn as nn
+import torch.optim as optim
+from sklearn.preprocessing import MinMaxScaler
+
+from sei_dlp_ai.models.lstm_forecaster import AttentionLSTM
+from sei_dlp_ai.models.window_loader import StridedWindowLoader
+
+logger = logging.getLogger(__name__)
+
+
+class MultiAssetAttentionLSTM(AttentionLSTM):
+    """AttentionLSTM encoder shared across assets, with per-asset embeddings and heads"""
+
+    def __init__(self,
+                 input_dim: int,
+                 hidden_dim: int,
+                 num_layers: int,
+                 n_assets: int,
+                 prediction_horizon: int,
+                 embedding_dim: int = 8,
+                 dropout: float = 0.2,
+                 bidirectional: bool = True):
+        """
+        Initialize the multi-asset model
+
+        Args:
+            input_dim: Number of input features per asset
+            hidden_dim: Hidden layer dimension
+            num_layers: Number of LSTM layers
+            n_assets: Number of assets (embedding rows and heads)
+            prediction_horizon: Number of timesteps to predict
+            embedding_dim: Size of the asset embedding appended to each timestep
+            dropout: Dropout rate
+            bidirectional: Use a bidirectional LSTM
+        """
+        super().__init__(input_dim + embedding_dim, hidden_dim, num_layers, 1, prediction_horizon,
+                         dropout=dropout, bidirectional=bidirectional)
+
+        self.n_assets = n_assets
+        self.asset_embedding = nn.Embedding(n_assets, embedding_dim)
+
+        # Per-asset heads stored as stacked weights, gathered by asset id in one einsum
+        del self.output_head, self.uncertainty_layer
+        feature_dim = hidden_dim // 2
+        bound = 1 / math.sqrt(feature_dim)
+        self.head_weight = nn.Parameter(torch.empty(n_assets, prediction_horizon, feature_dim).uniform_(-bound, bound))
+        self.head_bias = nn.Parameter(torch.empty(n_assets, prediction_horizon).uniform_(-bound, bound))
+        self.uncertainty_weight = nn.Parameter(
+            torch.empty(n_assets, prediction_horizon, feature_dim).uniform_(-bound, bound)
+        )
+        self.uncertainty_bias = nn.Parameter(torch.empty(n_assets, prediction_horizon).uniform_(-bound, bound))
+
+    def forward(self, x: torch.Tensor, asset_ids: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Forward pass for a batch mixing any assets
+
+        Args:
+            x: Input tensor of shape (batch_size, sequence_length, input_dim)
+            asset_ids: Asset index of each sequence, shape (batch_size,)
+
+        Returns:
+            predictions: Predicted values (batch_size, prediction_horizon, 1)
+            uncertainty: Uncertainty estimates (batch_size, prediction_horizon)
+        """
+        return self._head(self._encode_assets(x, asset_ids), asset_ids)
+
+    def _encode_assets(self, x: torch.Tensor, asset_ids: torch.Tensor) -> torch.Tensor:
+        """Encoder output with each sequence's asset embedding appended to every timestep"""
+        embedding = self.asset_embedding(asset_ids)[:, None, :].expand(-1, x.shape[1], -1)
+        return self.encode(torch.cat([x, embedding], dim=-1))
+
+    def _head(self, last_output: torch.Tensor, asset_ids: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Per-asset prediction and uncertainty heads applied to the last encoder output"""
+        features = self.feature_extractor(last_output)
+
+        predictions = torch.einsum("bhd,bd->bh", self.head_weight[asset_ids], features) + self.head_bias[asset_ids]
+        uncertainty = torch.sigmoid(
+            torch.einsum("bhd,bd->bh", self.uncertainty_weight[asset_ids], features)
+            + self.uncertainty_bias[asset_ids]
+        )
+        return predictions.unsqueeze(-1), uncertainty
+
+    def sample(self, x: torch.Tensor, asset_ids: torch.Tensor, n_samples: int) -> torch.Tensor:
+        """
+        Monte Carlo dropout samples of the predictions through each sequence's own head
+
+        Args:
+            x: Input tensor of shape (batch_size, sequence_length, input_dim)
+            asset_ids: Asset index of each sequence, shape (batch_size,)
+            n_samples: Samples per sequence
+
+        Returns:
+            Sampled predictions of shape (batch_size, n_samples, prediction_horizon)
+        """
+        last_output = self._encode_assets(x, asset_ids)
+        was_training = self.feature_extractor.training
+        self.feature_extractor.train()
+        try:
+            predictions, _ = self._head(last_output.repeat_interleave(n_samples, dim=0),
+                                        asset_ids.repeat_interleave(n_samples))
+        finally:
+            self.feature_extractor.train(was_training)
+        return predictions.reshape(x.shape[0], n_samples, -1)
+
+    def init_stream(self, x: torch.Tensor, max_length: int):
+        """Streaming needs per-asset head selection that stream_step does not take, so it is rejected"""
+        raise ValueError("Streaming inference requires a unidirectional single-asset model")
+
+
+class MultiAssetForecaster:
+    """
+    Forecasts several assets from one shared-encoder model
+    """
+
+    def __init__(self,
+                 assets: List[str],
+                 model_name: str = "multi_asset_forecaster",
+                 sequence_length: int = 168,
+                 prediction_horizon: int = 24,
+                 hidden_dim: int = 256,
+                 num_layers: int = 3,
+                 embedding_dim: int = 8,
+                 learning_rate: float = 0.001,
+                 batch_size: int = 32,
+                 device: str = "auto",
+                 bidirectional: bool = True):
+        """
+        Initialize the multi-asset forecaster
+
+        Args:
+            assets: Asset symbols served by the model (order fixes the asset ids)
+            model_name: Name for saving/loading model
+            sequence_length: Number of past timesteps to use
+            prediction_horizon: Number of future timesteps to predict
+            hidden_dim: Hidden layer dimension of the shared encoder
+            num_layers: Number of LSTM layers
+            embedding_dim: Asset embedding size
+            learning_rate: Learning rate
+            batch_size: Batch size for training
+            device: Device to use (cpu/cuda/auto)
+            bidirectional: Bidirectional encoder
+        """
+        if not assets or len(set(assets)) != len(assets):
+            raise ValueError("assets must be a non-empty list of unique symbols")
+
+        self.assets = list(assets)
+        self.asset_ids = {asset: i for i, asset in enumerate(self.assets)}
+        self.model_name = model_name
+        self.sequence_length = sequence_length
+        self.prediction_horizon = prediction_horizon
+        self.hidden_dim = hidden_dim
+        self.num_layers = num_layers
+        self.embedding_dim = embedding_dim
+        self.learning_rate = learning_rate
+        self.batch_size = batch_size
+        self.bidirectional = bidirectional
+
+        if device == "auto":
+            self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        else:
+            self.device = torch.device(device)
+
+        self.model: Optional[MultiAssetAttentionLSTM] = None
+        self.scalers: Dict[str, MinMaxScaler] = {}
+        self.feature_names: List[str] = []
+        self.training_history: List[Dict[str, float]] = []
+
+        self.save_path = f"models/lstm/{model_name}"
+        os.makedirs(self.save_path, exist_ok=True)
+
+        logger.info(f"Multi-asset forecaster for {self.assets} initialized on device: {self.device}")
+
+    def create_model(self, input_dim: int) -> MultiAssetAttentionLSTM:
+        """Create the shared-encoder model"""
+        model = MultiAssetAttentionLSTM(
+            input_dim=input_dim,
+            hidden_dim=self.hidden_dim,
+            num_layers=self.num_layers,
+            n_assets=len(self.assets),
+            prediction_horizon=self.prediction_horizon,
+            embedding_dim=self.embedding_dim,
+            dropout=0.2,
+            bidirectional=self.bidirectional
+        )
+        model.to(self.device)
+        return model
+
+    def _check_assets(self, data: Dict[str, Any]) -> None:
+        unknown = set(data) - set(self.asset_ids)
+        if unknown:
+            raise ValueError(f"Unknown assets: {sorted(unknown)}")
+
+    def _loaders(self, data: Dict[str, pd.DataFrame], shuffle: bool) -> Dict[str, StridedWindowLoader]:
+        """One window loader per asset over its own scaled series"""
+        return {
+            asset: StridedWindowLoader(
+                self.scalers[asset].transform(frame[self.feature_names].values),
+                self.sequence_length, self.prediction_horizon,
+                batch_size=self.batch_size, shuffle=shuffle, device=self.device
+            )
+            for asset, frame in data.items()
+        }
+
+    def _batches(self, loaders: Dict[str, StridedWindowLoader], shuffle: bool):
+        """Batches of all assets, lazily interleaved in random order when shuffling"""
+        assets = list(loaders)
+        iterators = [iter(loaders[asset]) for asset in assets]
+        # One schedule entry per batch, so each asset is drawn in proportion to its loader length
+        schedule = torch.repeat_interleave(torch.arange(len(assets)),
+                                           torch.tensor([len(loaders[asset]) for asset in assets]))
+        if shuffle:
+            generator = torch.Generator()
+            generator.manual_seed(int(torch.randint(2 ** 62, ()).item()))
+            schedule = schedule[torch.randperm(len(schedule), generator=generator)]
+        for index in schedule.tolist():
+            batch_x, batch_y = next(iterators[index])
+            asset_ids = torch.full((len(batch_x),), self.asset_ids[assets[index]], dtype=torch.long,
+                                   device=self.device)
+            yield batch_x, asset_ids, batch_y
+
+    def train(self,
+              train_data: Dict[str, pd.DataFrame],
+              val_data: Optional[Dict[str, pd.DataFrame]] = None,
+              feature_columns: Optional[List[str]] = None,
+              epochs: int = 100,
+              early_stopping_patience: int = 10):
+        """
+        Train the shared model on every asset
+
+        Args:
+            train_data: Training DataFrame per asset (same feature columns for all)
+            val_data: Validation DataFrame per asset
+            feature_columns: Feature columns to use; the first one is the forecast target
+            epochs: Number of training epochs
+            early_stopping_patience: Patience for early stopping
+        """
+        if feature_columns is None:
+            feature_columns = ['price', 'volume', 'volatility', 'high', 'low']
+        self._check_assets(train_data)
+
+        # Per-asset scalers
+        self.feature_names = list(feature_columns)
+        for asset, frame in train_data.items():
+            self.scalers[asset] = MinMaxScaler(feature_range=(0, 1)).fit(frame[feature_columns].values)
+
+        train_loaders = self._loaders(train_data, shuffle=True)
+        val_loaders = self._loaders(val_data, shuffle=False) if val_data else None
+
+        self.model = self.create_model(len(feature_columns))
+
+        criterion = nn.MSELoss()
+        optimizer = optim.AdamW(self.model.parameters(), lr=self.learning_rate, weight_decay=1e-5)
+        scheduler = optim.lr_scheduler.ReduceLROnPlateau(optimizer, mode='min', patience=5, factor=0.5)
+
+        best_val_loss = float('inf')
+        best_state: Optional[Dict[str, torch.Tensor]] = None
+        patience_counter = 0
+
+        logger.info(f"Starting multi-asset training on {list(train_data)} for {epochs} epochs...")
+
+        for epoch in range(epochs):
+            epoch_start = time.perf_counter()
+            self.model.train()
+            train_loss = 0.0
+            train_batches = 0
+            train_samples = 0
+
+            for batch_x, asset_ids, batch_y in self._batches(train_loaders, shuffle=True):
+                optimizer.zero_grad()
+
+                predictions, uncertainty = self.model(batch_x, asset_ids)
+                loss = criterion(predictions.squeeze(-1), batch_y)
+                total_loss = loss + 0.01 * torch.mean(uncertainty)
+
+                total_loss.backward()
+                torch.nn.utils.clip_grad_norm_(self.model.parameters(), max_norm=1.0)
+                optimizer.step()
+
+                train_loss += loss.item()
+                train_batches += 1
+                train_samples += len(batch_x)
+
+            train_seconds = time.perf_counter() - epoch_start
+            avg_train_loss = train_loss / train_batches
+
+            avg_val_loss = None
+            if val_loaders is not None:
+                avg_val_loss = self._loss(val_loaders, criterion)
+                scheduler.step(avg_val_loss)
+
+                if avg_val_loss < best_val_loss:
+                    best_val_loss = avg_val_loss
+                    patience_counter = 0
+                    best_state = {k: v.detach().clone() for k, v in self.model.state_dict().items()}
+                else:
+                    patience_counter += 1
+
+                if patience_counter >= early_stopping_patience:
+                    logger.info(f"Early stopping at epoch {epoch+1}")
+                    break
+
+            self.training_history.append({
+                "epoch": epoch + 1,
+                "train_loss": avg_train_loss,
+                "val_loss": avg_val_loss,
+                "learning_rate": optimizer.param_groups[0]['lr'],
+                "epoch_seconds": time.perf_counter() - epoch_start,
+                "samples_per_second": train_samples / train_seconds if train_seconds > 0 else 0.0
+            })
+
+            if (epoch + 1) % 10 == 0:
+                logger.info(f"Epoch {epoch+1}/{epochs} - Train Loss: {avg_train_loss:.6f}" +
+                            (f" - Val Loss: {avg_val_loss:.6f}" if avg_val_loss is not None else ""))
+
+        if best_state is not None:
+            self.save_model("best", state_dict=best_state)
+        self.save_model("final")
+        logger.info("Multi-asset training complete!")
+
+    def _loss(self, loaders: Dict[str, StridedWindowLoader], criterion: nn.Module) -> float:
+        """Mean loss over all batches of all assets"""
+        self.model.eval()
+        total, batches = 0.0, 0
+        with torch.no_grad():
+            for batch_x, asset_ids, batch_y in self._batches(loaders, shuffle=False):
+                predictions, _ = self.model(batch_x, asset_ids)
+                total += criterion(predictions.squeeze(-1), batch_y).item()
+                batches += 1
+        return total / batches
+
+    def predict(self,
+                data: Dict[str, Union[pd.DataFrame, np.ndarray]],
+                return_uncertainty: bool = True) -> Dict[str, Dict[str, Any]]:
+        """
+        Forecast several assets in one forward pass
+
+        Args:
+            data: Raw history per asset (DataFrame with feature_names or array); at least
+                sequence_length timesteps each, only the last sequence_length are used
+            return_uncertainty: Whether to return uncertainty estimates
+
+        Returns:
+            Per asset, a dictionary in the same format as LSTMForecaster.predict()
+        """
+        if self.model is None:
+            raise ValueError("No model loaded. Train or load a model first.")
+        self._check_assets(data)
+
+        assets = list(data)
+        windows = []
+        for asset in assets:
+            values = data[asset][self.feature_names].values if isinstance(data[asset], pd.DataFrame) else data[asset]
+            values = np.asarray(values)
+            if len(values) < self.sequence_length:
+                raise ValueError(f"Need at least {self.sequence_length} timesteps for prediction ({asset})")
+            windows.append(self.scalers[asset].transform(values[-self.sequence_length:]))
+
+        inputs = torch.from_numpy(np.stack(windows).astype(np.float32)).to(self.device)
+        asset_ids = torch.tensor([self.asset_ids[asset] for asset in assets], device=self.device)
+
+        self.model.eval()
+        with torch.no_grad():
+            predictions, uncertainty = self.model(inputs, asset_ids)
+        predictions = predictions.squeeze(-1).cpu().numpy()
+        uncertainty = uncertainty.cpu().numpy()
+
+        results = {}
+        for i, asset in enumerate(assets):
+            scaler = self.scalers[asset]
+            results[asset] = {
+                "predictions": (predictions[i] - scaler.min_[0]) / scaler.scale_[0],
+                "prediction_horizons": list(range(1, self.prediction_horizon + 1))
+            }
+            if return_uncertainty:
+                results[asset]["uncertainty"] = uncertainty[i]
+        return results
+
+    def evaluate(self, test_data: Dict[str, pd.DataFrame]) -> Dict[str, Dict[str, float]]:
+        """
+        Evaluate each asset on its test data (scaled space, as LSTMForecaster.evaluate)
+
+        Args:
+            test_data: Test DataFrame per asset
+
+        Returns:
+            Per asset, mse/mae/rmse at 1/6/12/24h and averages
+        """
+        if self.model is None:
+            raise ValueError("No model loaded. Train or load a model first.")
+        self._check_assets(test_data)
+
+        self.model.eval()
+        metrics = {}
+        for asset, loader in self._loaders(test_data, shuffle=False).items():
+            asset_id = self.asset_ids[asset]
+            predictions, targets = [], []
+            with torch.no_grad():
+                for batch_x, batch_y in loader:
+                    asset_ids = torch.full((len(batch_x),), asset_id, dtype=torch.long, device=self.device)
+                    batch_pred, _ = self.model(batch_x, asset_ids)
+                    predictions.append(batch_pred.squeeze(-1).cpu().numpy())
+                    targets.append(batch_y.cpu().numpy())
+            errors = np.concatenate(predictions) - np.concatenate(targets)
+
+            asset_metrics = {}
+            for horizon in [1, 6, 12, 24]:
+                if horizon <= self.prediction_horizon:
+                    asset_metrics[f"mse_{horizon}h"] = float(np.mean(errors[:, horizon - 1] ** 2))
+                    asset_metrics[f"mae_{horizon}h"] = float(np.mean(np.abs(errors[:, horizon - 1])))
+                    asset_metrics[f"rmse_{horizon}h"] = float(np.sqrt(asset_metrics[f"mse_{horizon}h"]))
+            asset_metrics["avg_mse"] = float(np.mean(errors ** 2))
+            asset_metrics["avg_mae"] = float(np.mean(np.abs(errors)))
+            asset_metrics["avg_rmse"] = float(np.sqrt(asset_metrics["avg_mse"]))
+            metrics[asset] = asset_metrics
+
+        logger.info(f"Multi-asset evaluation results:\n{json.dumps(metrics, indent=2)}")
+        return metrics
+
+    def save_model(self, suffix: str = "", state_dict: Optional[Dict[str, torch.Tensor]] = None):
+        """
+        Save the model, per-asset scalers and metadata
+
+        Args:
+            suffix: Appended to the model name in the file names
+            state_dict: Weights to save instead of the current model's
+        """
+        if self.model is None:
+            logger.error("No model to save")
+            return
+
+        save_name = f"{self.model_name}_{suffix}" if suffix else self.model_name
+
+        model_path = os.path.join(self.save_path, f"{save_name}.pt")
+        torch.save({
+            "model_state_dict": state_dict if state_dict is not None else self.model.state_dict(),
+            "model_config": {
+                "input_dim": len(self.feature_names),
+                "hidden_dim": self.hidden_dim,
+                "num_layers": self.num_layers,
+                "prediction_horizon": self.prediction_horizon,
+                "embedding_dim": self.embedding_dim,
+                "bidirectional": self.bidirectional,
+                "assets": self.assets
+            }
+        }, model_path)
+
+        import joblib
+        joblib.dump(self.scalers, os.path.join(self.save_path, f"{save_name}_scalers.pkl"))
+
+        metadata = {
+            "model_name": self.model_name,
+            "timestamp": datetime.now().isoformat(),
+            "assets": self.assets,
+            "sequence_length": self.sequence_length,
+            "prediction_horizon": self.prediction_horizon,
+            "feature_names": self.feature_names,
+            "training_history": self.training_history
+        }
+        with open(os.path.join(self.save_path, f"{save_name}_metadata.json"), "w") as f:
+            json.dump(metadata, f, indent=2)
+
+        logger.info(f"Multi-asset model saved to {model_path}")
+
+    def load_model(self, model_path: str):
+        """Load a saved multi-asset model"""
+        checkpoint = torch.load(model_path, map_location=self.device)
+
+        config = checkpoint["model_config"]
+        self.assets = list(config["assets"])
+        self.asset_ids = {asset: i for i, asset in enumerate(self.assets)}
+        self.hidden_dim = config["hidden_dim"]
+        self.num_layers = config["num_layers"]
+        self.prediction_horizon = config["prediction_horizon"]
+        self.embedding_dim = config["embedding_dim"]
+        self.bidirectional = config["bidirectional"]
+        self.model = self.create_model(config["input_dim"])
+        self.model.load_state_dict(checkpoint["model_state_dict"])
+        self.model.eval()
+
+        scalers_path = model_path.replace(".pt", "_scalers.pkl")
+        if os.path.exists(scalers_path):
+            import joblib
+            self.scalers = joblib.load(scalers_path)
+
+        metadata_path = model_path.replace(".pt", "_metadata.json")
+        if os.path.exists(metadata_path):
+            with open(metadata_path, "r") as f:
+                metadata = json.load(f)
+                self.feature_names = metadata.get("feature_names", [])
+                self.sequence_length = metadata.get("sequence_length", self.sequence_length)
+
+        logger.info(f"Multi-asset model loaded from {model_path}")
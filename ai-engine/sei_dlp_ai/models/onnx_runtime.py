@@ -0,0 +1,163 @@
+"""ONNX Runtime inference session for exported liquidity models
+
+Wraps onnxruntime.InferenceSession with input/output names resolved once,
+configurable thread pools and a reusable input buffer bound through
+IOBinding, so repeated predictions avoid per-call lookups and allocations.
+"""
+
+import logging
+import threading
+import numpy as np
+import onnxruntime as ort
+from typing import Any, Dict, Optional, Union
+from numpy.typing import NDArray
+
+logger = logging.getLogger(__name__)
+
+# Metadata key written by LiquidityOptimizer.export_onnx when the scaler is part of the graph
+SCALER_FOLDED_KEY = "sei_dlp.scaler_folded"
+
+
+def session_options(intra_op_threads: int = 0, inter_op_threads: int = 0) -> ort.SessionOptions:
+    """Session options for low-latency CPU inference with the given thread pool sizes"""
+    options = ort.SessionOptions()
+    options.intra_op_num_threads = intra_op_threads
+    options.inter_op_num_threads = inter_op_threads
+    options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return options
+
+
+def prepend_scaler(onnx_model: Any, mean: NDArray[np.float64], scale: NDArray[np.float64],
+                   input_name: str = "features", scaled_name: str = "scaled") -> Any:
+    """
+    Prepend float64 standard scaling to a converted model whose float32 input is scaled_name
+
+    The new float64 input_name is scaled as (x - mean) / scale before the cast to float32, which
+    is the same arithmetic as StandardScaler.transform followed by a float32 tree model. A float32
+    Scaler op would round the inputs first and flip split decisions near thresholds.
+
+    Args:
+        onnx_model: onnx.ModelProto converted with a single float32 input named scaled_name
+        mean: Per-feature mean
+        scale: Per-feature scale
+        input_name: Name of the new float64 input
+        scaled_name: Name of the model's existing float32 input
+
+    Returns:
+        The same ModelProto, modified in place
+    """
+    from onnx import TensorProto, helper, numpy_helper
+
+    graph = onnx_model.graph
+    n_features = len(mean)
+    graph.initializer.extend([
+        numpy_helper.from_array(np.asarray(mean, dtype=np.float64), "scaler_mean"),
+        numpy_helper.from_array(np.asarray(scale, dtype=np.float64), "scaler_scale")
+    ])
+    scaling = [
+        helper.make_node("Sub", [input_name, "scaler_mean"], ["centered"], name="scaler_sub"),
+        helper.make_node("Div", ["centered", "scaler_scale"], ["scaled_double"], name="scaler_div"),
+        helper.make_node("Cast", ["scaled_double"], [scaled_name], to=TensorProto.FLOAT, name="scaler_cast")
+    ]
+    nodes = scaling + list(graph.node)
+    del graph.node[:]
+    graph.node.extend(nodes)
+    del graph.input[:]
+    graph.input.append(helper.make_tensor_value_info(input_name, TensorProto.DOUBLE, [None, n_features]))
+    return onnx_model
+
+
+class OnnxInferenceSession:
+    """
+    Reusable ONNX Runtime session for a single float32 or float64 feature input
+
+    The input buffer is shared between calls, so runs are serialized with a lock.
+    """
+
+    def __init__(self, session: ort.InferenceSession, initial_batch_size: int = 64) -> None:
+        """
+        Wrap a loaded ONNX Runtime session
+
+        Args:
+            session: Session whose model has a single 2D float or double input
+            initial_batch_size: Rows preallocated in the input buffer
+        """
+        self.session = session
+
+        # Resolve names once instead of on every call
+        inputs = self.session.get_inputs()
+        if len(inputs) != 1:
+            raise ValueError(f"Expected a single model input, got {len(inputs)}")
+        self.input_name: str = inputs[0].name
+        self.output_name: str = self.session.get_outputs()[0].name
+
+        n_features = inputs[0].shape[1] if len(inputs[0].shape) > 1 else None
+        self.n_features: Optional[int] = n_features if isinstance(n_features, int) else None
+
+        self.metadata: Dict[str, str] = dict(self.session.get_modelmeta().custom_metadata_map)
+        self.scaler_folded = self.metadata.get(SCALER_FOLDED_KEY) == "true"
+
+        self.input_dtype = np.float64 if inputs[0].type == "tensor(double)" else np.float32
+        self._buffer: NDArray = np.empty((initial_batch_size, self.n_features or 0), dtype=self.input_dtype)
+        self._binding = self.session.io_binding()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(
+        cls,
+        model: Union[str, bytes],
+        intra_op_threads: int = 0,
+        inter_op_threads: int = 0,
+        initial_batch_size: int = 64
+    ) -> "OnnxInferenceSession":
+        """
+        Load an ONNX model with explicit thread pool sizes
+
+        Args:
+            model: Path to an .onnx file or serialized model bytes
+            intra_op_threads: Threads used inside an operator (0 lets ONNX Runtime decide)
+            inter_op_threads: Threads used across operators (0 lets ONNX Runtime decide)
+            initial_batch_size: Rows preallocated in the input buffer
+        """
+        session = ort.InferenceSession(
+            model,
+            sess_options=session_options(intra_op_threads, inter_op_threads),
+            providers=["CPUExecutionProvider"]
+        )
+        return cls(session, initial_batch_size=initial_batch_size)
+
+    def _input_view(self, features: NDArray[np.float64]) -> NDArray:
+        """Copy features into the reusable input buffer, growing it when needed"""
+        n_rows, n_cols = features.shape
+        if self._buffer.shape[0] < n_rows or self._buffer.shape[1] != n_cols:
+            capacity = max(n_rows, 2 * self._buffer.shape[0]) if self._buffer.shape[1] == n_cols else n_rows
+            self._buffer = np.empty((capacity, n_cols), dtype=self.input_dtype)
+        view = self._buffer[:n_rows]
+        np.copyto(view, features, casting="same_kind")
+        return view
+
+    def run(self, features: NDArray[np.float64]) -> NDArray[np.float32]:
+        """
+        Run inference on a feature matrix
+
+        Args:
+            features: Feature matrix of shape (n_samples, n_features)
+
+        Returns:
+            First model output, shape (n_samples, n_outputs)
+        """
+        features = np.asarray(features)
+        if features.ndim == 1:
+            features = features.reshape(1, -1)
+        if self.n_features is not None and features.shape[1] != self.n_features:
+            raise ValueError(f"Expected {self.n_features} features, got {features.shape[1]}")
+
+        with self._lock:
+            self._binding.bind_cpu_input(self.input_name, self._input_view(features))
+            self._binding.bind_output(self.output_name)
+            self.session.run_with_iobinding(self._binding)
+            result = self._binding.copy_outputs_to_cpu()[0]
+            self._binding.clear_binding_inputs()
+            self._binding.clear_binding_outputs()
+        return result
@@ -0,0 +1,216 @@
+"""Range prediction cache for the Liquidity Optimizer
+
+Near-identical queries for the same pool within a block map to the same
+quantized feature key, so repeat traffic is answered without running the model.
+Entries expire after a TTL, the least recently used entry is evicted when full,
+and all entries of a pool are dropped as soon as its tick changes.
+"""
+
+import math
+import threading
+import time
+import numpy as np
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Optional, Set, Tuple
+from numpy.typing import NDArray
+
+from sei_dlp_ai.types import LiquidityPool, LiquidityRange
+from sei_dlp_ai.models.liquidity_features import FEATURE_NAMES
+
+# Feature columns quantized with the volume bucket; all others use the price bucket
+VOLUME_LIKE_MARKERS = ("volume", "reserve", "liquidity", "position_size", "depth", "data_points")
+
+CacheKey = Tuple[Hashable, ...]
+
+
+@dataclass
+class CacheStats:
+    """Counters describing cache effectiveness"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class _CacheEntry:
+    value: LiquidityRange
+    expires_at: float
+
+
+class RangePredictionCache:
+    """LRU + TTL cache of LiquidityRange predictions keyed on quantized features"""
+
+    def __init__(
+        self,
+        max_size: int = 4096,
+        ttl_seconds: float = 2.0,
+        price_bucket: float = 0.001,
+        volume_bucket: float = 0.05,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """
+        Initialize the cache
+
+        Args:
+            max_size: Maximum number of cached predictions
+            ttl_seconds: Lifetime of a cached prediction
+            price_bucket: Relative bucket width for price-like features (0.001 = 0.1%)
+            volume_bucket: Relative bucket width for volume/reserve/size features
+            clock: Monotonic time source
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        if price_bucket <= 0 or volume_bucket <= 0:
+            raise ValueError("Bucket widths must be positive")
+
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.price_bucket = price_bucket
+        self.volume_bucket = volume_bucket
+        self.clock = clock
+        self.stats = CacheStats()
+
+        # Per-column log bucket widths, in FEATURE_NAMES order
+        self._log_widths = np.array([
+            math.log1p(volume_bucket if any(marker in name for marker in VOLUME_LIKE_MARKERS) else price_bucket)
+            for name in FEATURE_NAMES
+        ], dtype=np.float64)
+
+        self._entries: "OrderedDict[CacheKey, _CacheEntry]" = OrderedDict()
+        self._keys_by_pool: Dict[str, Set[CacheKey]] = {}
+        self._pool_ticks: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def quantize(self, features: NDArray[np.float64]) -> Tuple[int, ...]:
+        """
+        Map a feature vector onto relative (log-spaced) buckets
+
+        Args:
+            features: Feature vector in FEATURE_NAMES order
+
+        Returns:
+            Tuple of bucket codes combining the log-magnitude bucket and the sign
+        """
+        features = np.asarray(features, dtype=np.float64).ravel()
+        magnitude = np.abs(features)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            buckets = np.floor(np.log(magnitude) / self._log_widths[:len(features)])
+        buckets = np.where(magnitude > 0, np.nan_to_num(buckets, nan=0, posinf=0, neginf=0), 0)
+        codes = buckets.astype(np.int64) * 3 + (np.sign(np.nan_to_num(features)).astype(np.int64) + 1)
+        return tuple(codes.tolist())
+
+    def make_key(self, pool: LiquidityPool, features: NDArray[np.float64], risk_tolerance: float) -> CacheKey:
+        """Cache key for a pool, its feature vector and the requested risk tolerance"""
+        return (pool.address, round(float(risk_tolerance), 3)) + self.quantize(features)
+
+    def _sync_tick(self, pool: LiquidityPool) -> None:
+        """Drop a pool's entries if its tick moved since they were cached (lock held)"""
+        tick = getattr(pool, "tick", None)
+        previous = self._pool_ticks.get(pool.address)
+        if previous is not None and previous != tick:
+            self._invalidate_pool(pool.address)
+        self._pool_ticks[pool.address] = tick
+
+    def _invalidate_pool(self, address: str) -> int:
+        """Drop every entry of a pool (lock held)"""
+        keys = self._keys_by_pool.pop(address, set())
+        for key in keys:
+            self._entries.pop(key, None)
+        self.stats.invalidations += len(keys)
+        return len(keys)
+
+    def _remove(self, key: CacheKey) -> None:
+        """Remove a single entry and its pool index (lock held)"""
+        self._entries.pop(key, None)
+        pool_keys = self._keys_by_pool.get(key[0])
+        if pool_keys is not None:
+            pool_keys.discard(key)
+            if not pool_keys:
+                del self._keys_by_pool[key[0]]
+
+    def get(
+        self,
+        pool: LiquidityPool,
+        features: NDArray[np.float64],
+        risk_tolerance: float
+    ) -> Optional[LiquidityRange]:
+        """
+        Look up a cached prediction
+
+        Args:
+            pool: Pool the prediction is for
+            features: Feature vector for the query
+            risk_tolerance: Requested risk tolerance
+
+        Returns:
+            Copy of the cached LiquidityRange, or None on a miss
+        """
+        key = self.make_key(pool, features, risk_tolerance)
+        with self._lock:
+            self._sync_tick(pool)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            if entry.expires_at <= self.clock():
+                self._remove(key)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry.value.model_copy()
+
+    def put(
+        self,
+        pool: LiquidityPool,
+        features: NDArray[np.float64],
+        risk_tolerance: float,
+        value: LiquidityRange
+    ) -> None:
+        """Store a prediction, evicting the least recently used entry when full"""
+        key = self.make_key(pool, features, risk_tolerance)
+        with self._lock:
+            self._sync_tick(pool)
+            self._entries[key] = _CacheEntry(value=value.model_copy(), expires_at=self.clock() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            self._keys_by_pool.setdefault(pool.address, set()).add(key)
+
+            while len(self._entries) > self.max_size:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.stats.evictions += 1
+
+    def invalidate(self, pool_address: Optional[str] = None) -> int:
+        """
+        Drop cached predictions
+
+        Args:
+            pool_address: Pool to invalidate, or None to clear everything
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if pool_address is not None:
+                return self._invalidate_pool(pool_address)
+
+            removed = len(self._entries)
+            self._entries.clear()
+            self._keys_by_pool.clear()
+            self._pool_ticks.clear()
+            self.stats.invalidations += removed
+            return removed
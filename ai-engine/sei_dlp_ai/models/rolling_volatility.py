@@ -0,0 +1,204 @@
+"""Streaming volatility statistics for the Liquidity Optimizer
+
+Maintains the volatility features of LiquidityOptimizer._calculate_volatility_features
+incrementally from price/volume/funding ticks using Welford-style running moments,
+so feature latency stays constant regardless of history length.
+"""
+
+import math
+import numpy as np
+import pandas as pd
+from collections import deque
+from typing import Deque, Dict, Optional
+
+
+class RunningMoments:
+    """Welford running mean/variance of a single series"""
+
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, value: float) -> None:
+        """Add one observation"""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (ddof=1), 0.0 with fewer than two observations"""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1)"""
+        return math.sqrt(max(self.variance, 0.0))
+
+
+class RunningCoMoments:
+    """Welford running co-moment of two paired series"""
+
+    __slots__ = ("x", "y", "c2")
+
+    def __init__(self) -> None:
+        self.x = RunningMoments()
+        self.y = RunningMoments()
+        self.c2 = 0.0
+
+    def update(self, x: float, y: float) -> None:
+        """Add one (x, y) pair"""
+        dx = x - self.x.mean
+        self.x.update(x)
+        self.y.update(y)
+        self.c2 += dx * (y - self.y.mean)
+
+    @property
+    def correlation(self) -> float:
+        """Pearson correlation, 0.0 when undefined"""
+        denominator = math.sqrt(self.x.m2 * self.y.m2)
+        if self.x.count < 2 or denominator == 0.0:
+            return 0.0
+        return max(-1.0, min(1.0, self.c2 / denominator))
+
+
+class RollingVolatilityState:
+    """
+    Per-pool streaming volatility statistics
+
+    Produces the same features as LiquidityOptimizer._calculate_volatility_features
+    over the full tick history, but each tick is absorbed in O(1) time and memory.
+    Standard deviations of a single observation are reported as 0.0 rather than NaN.
+    """
+
+    def __init__(self, short_window: int = 12):
+        """
+        Initialize the state
+
+        Args:
+            short_window: Number of most recent returns used for 1h volatility
+                (12 samples of 5-minute data)
+        """
+        self.short_window = short_window
+
+        self.n_ticks = 0
+        self._last_price: Optional[float] = None
+        self._last_volume: Optional[float] = None
+        self._last_funding: Optional[float] = None
+        self._has_volume = False
+        self._has_funding = False
+
+        self._returns = RunningMoments()
+        self._recent_returns: Deque[float] = deque(maxlen=short_window)
+        self._volume_changes = RunningMoments()
+        self._funding_diffs = RunningMoments()
+        self._price_volume = RunningCoMoments()
+
+    @property
+    def empty(self) -> bool:
+        return self.n_ticks == 0
+
+    def __len__(self) -> int:
+        return self.n_ticks
+
+    @staticmethod
+    def _finite(value: Optional[float]) -> bool:
+        return value is not None and math.isfinite(value)
+
+    def update(
+        self,
+        price: float,
+        volume: Optional[float] = None,
+        funding_rate: Optional[float] = None
+    ) -> None:
+        """
+        Absorb a new tick
+
+        Args:
+            price: Latest price
+            volume: Latest volume, if available
+            funding_rate: Latest funding rate, if available
+        """
+        price = float(price)
+        if not math.isfinite(price):
+            return
+
+        self.n_ticks += 1
+
+        price_return = None
+        if self._last_price is not None and self._last_price != 0:
+            price_return = price / self._last_price - 1
+            self._returns.update(price_return)
+            self._recent_returns.append(price_return)
+        self._last_price = price
+
+        if volume is not None:
+            volume = float(volume)
+            self._has_volume = True
+            if self._finite(self._last_volume) and self._last_volume != 0 and math.isfinite(volume):
+                volume_change = volume / self._last_volume - 1
+                self._volume_changes.update(volume_change)
+                if price_return is not None:
+                    self._price_volume.update(price_return, volume_change)
+            self._last_volume = volume
+
+        if funding_rate is not None:
+            funding_rate = float(funding_rate)
+            self._has_funding = True
+            if self._finite(self._last_funding) and math.isfinite(funding_rate):
+                self._funding_diffs.update(funding_rate - self._last_funding)
+            self._last_funding = funding_rate
+
+    @classmethod
+    def from_dataframe(cls, historical_data: pd.DataFrame, short_window: int = 12) -> "RollingVolatilityState":
+        """Build a state by replaying a historical DataFrame with price/volume/funding_rate columns"""
+        state = cls(short_window=short_window)
+        if historical_data.empty or 'price' not in historical_data.columns:
+            return state
+
+        n_rows = len(historical_data)
+        prices = historical_data['price'].to_numpy(dtype=np.float64)
+        volumes = (
+            historical_data['volume'].to_numpy(dtype=np.float64)
+            if 'volume' in historical_data.columns else [None] * n_rows
+        )
+        funding = (
+            historical_data['funding_rate'].to_numpy(dtype=np.float64)
+            if 'funding_rate' in historical_data.columns else [None] * n_rows
+        )
+        for price, volume, funding_rate in zip(prices, volumes, funding):
+            state.update(price, volume, funding_rate)
+        return state
+
+    @property
+    def price_volatility(self) -> Optional[float]:
+        """Full-history return volatility, or None before the first return"""
+        return self._returns.std if self._returns.count > 0 else None
+
+    def features(self) -> Dict[str, float]:
+        """Current volatility features, keyed like _calculate_volatility_features"""
+        features = {
+            "price_volatility_1h": 0.0,
+            "price_volatility_24h": 0.0,
+            "volume_volatility_24h": 0.0,
+            "funding_rate_volatility": 0.0,
+            "cross_correlation": 0.0
+        }
+
+        if self._returns.count > 0:
+            features["price_volatility_24h"] = self._returns.std
+            if self._returns.count > self.short_window:
+                features["price_volatility_1h"] = float(np.std(self._recent_returns, ddof=1))
+
+        if self._has_volume:
+            features["volume_volatility_24h"] = self._volume_changes.std
+            features["cross_correlation"] = self._price_volume.correlation
+
+        if self._has_funding:
+            features["funding_rate_volatility"] = self._funding_diffs.std
+
+        return features
@@ -0,0 +1,233 @@
+"""Concentrated-liquidity tick math for SEI DLP
+
+Integer-exact ports of the Uniswap V3 TickMath library (getSqrtRatioAtTick /
+getTickAtSqrtRatio) used by the vault contracts, price <-> tick helpers, and
+vectorized NumPy variants for aligning many ranges at once.
+
+Prices are token1 per token0 in raw units: price = 1.0001 ** tick and
+sqrt_price_x96 = sqrt(price) * 2 ** 96.
+"""
+
+import math
+import numpy as np
+from decimal import Decimal, ROUND_CEILING, localcontext
+from fractions import Fraction
+from typing import Union
+from numpy.typing import ArrayLike, NDArray
+
+MIN_TICK = -887272
+MAX_TICK = 887272
+MIN_SQRT_RATIO = 4295128739
+MAX_SQRT_RATIO = 1461446703485210103287273052203988822378723970342
+Q96 = 1 << 96
+
+_MAX_UINT256 = (1 << 256) - 1
+_LOG_TICK_BASE = math.log(1.0001)
+
+Price = Union[Decimal, float, int, Fraction]
+
+# Magic multipliers of the Solidity implementation: 2**128 / sqrt(1.0001) ** (2 ** i)
+_TICK_FACTORS = (
+    (0x2, 0xfff97272373d413259a46990580e213a),
+    (0x4, 0xfff2e50f5f656932ef12357cf3c7fdcc),
+    (0x8, 0xffe5caca7e10e4e61c3624eaa0941cd0),
+    (0x10, 0xffcb9843d60f6159c9db58835c926644),
+    (0x20, 0xff973b41fa98c081472e6896dfb254c0),
+    (0x40, 0xff2ea16466c96a3843ec78b326b52861),
+    (0x80, 0xfe5dee046a99a2a811c461f1969c3053),
+    (0x100, 0xfcbe86c7900a88aedcffc83b479aa3a4),
+    (0x200, 0xf987a7253ac413176f2b074cf7815e54),
+    (0x400, 0xf3392b0822b70005940c7a398e4b70f3),
+    (0x800, 0xe7159475a2c29b7443b29c7fa6e889d9),
+    (0x1000, 0xd097f3bdfd2022b8845ad8f792aa5825),
+    (0x2000, 0xa9f746462d870fdf8a65dc1f90e061e5),
+    (0x4000, 0x70d869a156d2a1b890bb3df62baf32f7),
+    (0x8000, 0x31be135f97d08fd981231505542fcfa6),
+    (0x10000, 0x9aa508b5b7a84e1c677de54f3e99bc9),
+    (0x20000, 0x5d6af8dedb81196699c329225ee604),
+    (0x40000, 0x2216e584f5fa1ea926041bedfe98),
+    (0x80000, 0x48a170391f7dc42444e8fa2),
+)
+
+
+def get_sqrt_ratio_at_tick(tick: int) -> int:
+    """
+    Exact sqrt(1.0001 ** tick) * 2 ** 96 as computed on-chain
+
+    Args:
+        tick: Tick in [MIN_TICK, MAX_TICK]
+
+    Returns:
+        Q64.96 sqrt price
+    """
+    tick = int(tick)
+    abs_tick = abs(tick)
+    if abs_tick > MAX_TICK:
+        raise ValueError(f"Tick {tick} outside [{MIN_TICK}, {MAX_TICK}]")
+
+    ratio = 0xfffcb933bd6fad37aa2d162d1a594001 if abs_tick & 0x1 else 1 << 128
+    for mask, factor in _TICK_FACTORS:
+        if abs_tick & mask:
+            ratio = (ratio * factor) >> 128
+
+    if tick > 0:
+        ratio = _MAX_UINT256 // ratio
+
+    # Q128.128 -> Q64.96, rounding up
+    return (ratio >> 32) + (0 if ratio % (1 << 32) == 0 else 1)
+
+
+def get_tick_at_sqrt_ratio(sqrt_price_x96: int) -> int:
+    """
+    Greatest tick whose sqrt ratio is <= sqrt_price_x96, as computed on-chain
+
+    Args:
+        sqrt_price_x96: Q64.96 sqrt price in [MIN_SQRT_RATIO, MAX_SQRT_RATIO)
+
+    Returns:
+        Tick
+    """
+    sqrt_price_x96 = int(sqrt_price_x96)
+    if not MIN_SQRT_RATIO <= sqrt_price_x96 < MAX_SQRT_RATIO:
+        raise ValueError(f"sqrt_price_x96 {sqrt_price_x96} outside [MIN_SQRT_RATIO, MAX_SQRT_RATIO)")
+
+    # Float estimate, then exact integer correction against get_sqrt_ratio_at_tick
+    estimate = 2 * (math.log2(sqrt_price_x96) - 96) * math.log(2) / _LOG_TICK_BASE
+    tick = max(MIN_TICK, min(MAX_TICK, math.floor(estimate)))
+    while tick > MIN_TICK and get_sqrt_ratio_at_tick(tick) > sqrt_price_x96:
+        tick -= 1
+    while tick < MAX_TICK and get_sqrt_ratio_at_tick(tick + 1) <= sqrt_price_x96:
+        tick += 1
+    return tick
+
+
+def price_to_sqrt_price_x96(price: Price) -> int:
+    """Exact floor(sqrt(price) * 2 ** 96) for a positive price"""
+    ratio = Fraction(price)
+    if ratio <= 0:
+        raise ValueError("Price must be positive")
+    scaled = ratio * (1 << 192)
+    return math.isqrt(scaled.numerator // scaled.denominator)
+
+
+def sqrt_price_x96_to_price(sqrt_price_x96: int) -> Decimal:
+    """Price encoded by a Q64.96 sqrt price, rounded up so it maps back to the same tick"""
+    with localcontext() as ctx:
+        ctx.prec = 40
+        ctx.rounding = ROUND_CEILING
+        return Decimal(int(sqrt_price_x96) ** 2) / Decimal(1 << 192)
+
+
+def price_to_tick(price: Price) -> int:
+    """Greatest tick whose price is <= price (clamped to the valid tick range)"""
+    sqrt_price_x96 = min(max(price_to_sqrt_price_x96(price), MIN_SQRT_RATIO), MAX_SQRT_RATIO - 1)
+    return get_tick_at_sqrt_ratio(sqrt_price_x96)
+
+
+def tick_to_price(tick: int) -> Decimal:
+    """Price at a tick, derived from its exact sqrt ratio"""
+    return sqrt_price_x96_to_price(get_sqrt_ratio_at_tick(tick))
+
+
+def min_usable_tick(tick_spacing: int) -> int:
+    """Lowest tick that is a multiple of tick_spacing"""
+    return -(-MIN_TICK // tick_spacing) * tick_spacing
+
+
+def max_usable_tick(tick_spacing: int) -> int:
+    """Highest tick that is a multiple of tick_spacing"""
+    return (MAX_TICK // tick_spacing) * tick_spacing
+
+
+def align_tick(tick: int, tick_spacing: int, rounding: str = "nearest") -> int:
+    """
+    Snap a tick onto the tick spacing grid
+
+    Args:
+        tick: Tick to align
+        tick_spacing: Pool tick spacing
+        rounding: "floor", "ceil" or "nearest"
+
+    Returns:
+        Aligned tick within the usable tick range
+    """
+    if tick_spacing <= 0:
+        raise ValueError("tick_spacing must be positive")
+    if rounding == "floor":
+        aligned = (tick // tick_spacing) * tick_spacing
+    elif rounding == "ceil":
+        aligned = -(-tick // tick_spacing) * tick_spacing
+    elif rounding == "nearest":
+        aligned = ((2 * tick + tick_spacing) // (2 * tick_spacing)) * tick_spacing
+    else:
+        raise ValueError(f"Unknown rounding mode: {rounding}")
+    return max(min_usable_tick(tick_spacing), min(max_usable_tick(tick_spacing), aligned))
+
+
+def prices_to_ticks(prices: ArrayLike) -> NDArray[np.int64]:
+    """
+    Vectorized price_to_tick for float prices
+
+    The log-based estimate is corrected by one tick where float rounding put it
+    on the wrong side of a tick boundary, so results match price_to_tick for
+    float64 inputs away from the extreme ends of the tick range.
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    if np.any(~(prices > 0)):
+        raise ValueError("Prices must be positive")
+
+    ticks = np.floor(np.log(prices) / _LOG_TICK_BASE).astype(np.int64)
+    ticks = np.clip(ticks, MIN_TICK, MAX_TICK)
+    ticks -= ticks_to_prices(ticks) > prices
+    ticks += (ticks < MAX_TICK) & (ticks_to_prices(np.minimum(ticks + 1, MAX_TICK)) <= prices)
+    return ticks
+
+
+def ticks_to_prices(ticks: ArrayLike) -> NDArray[np.float64]:
+    """Vectorized 1.0001 ** tick"""
+    return np.exp(np.asarray(ticks, dtype=np.float64) * _LOG_TICK_BASE)
+
+
+def align_ticks(ticks: ArrayLike, tick_spacing: int, rounding: str = "nearest") -> NDArray[np.int64]:
+    """Vectorized align_tick"""
+    if tick_spacing <= 0:
+        raise ValueError("tick_spacing must be positive")
+    ticks = np.asarray(ticks, dtype=np.int64)
+    if rounding == "floor":
+        aligned = np.floor_divide(ticks, tick_spacing) * tick_spacing
+    elif rounding == "ceil":
+        aligned = -np.floor_divide(-ticks, tick_spacing) * tick_spacing
+    elif rounding == "nearest":
+        aligned = np.floor_divide(2 * ticks + tick_spacing, 2 * tick_spacing) * tick_spacing
+    else:
+        raise ValueError(f"Unknown rounding mode: {rounding}")
+    return np.clip(aligned, min_usable_tick(tick_spacing), max_usable_tick(tick_spacing))
+
+
+def align_price_ranges(
+    lower_prices: ArrayLike,
+    upper_prices: ArrayLike,
+    tick_spacing: int
+) -> NDArray[np.int64]:
+    """
+    Align many (lower, upper) price ranges to the tick grid
+
+    Both bounds are snapped to the nearest usable tick; ranges that collapse
+    to a single tick become the one-spacing range containing the lower price.
+
+    Returns:
+        Array of shape (n, 2) with aligned (lower_tick, upper_tick)
+    """
+    lower_ticks = prices_to_ticks(lower_prices)
+    lower = align_ticks(lower_ticks, tick_spacing)
+    upper = align_ticks(prices_to_ticks(upper_prices), tick_spacing)
+
+    collapsed = upper <= lower
+    if np.any(collapsed):
+        floor_lower = np.minimum(
+            align_ticks(lower_ticks, tick_spacing, rounding="floor"),
+            max_usable_tick(tick_spacing) - tick_spacing
+        )
+        lower = np.where(collapsed, floor_lower, lower)
+        upper = np.where(collapsed, floor_lower + tick_spacing, upper)
+    return np.column_stack([lower, upper])
@@ -0,0 +1,297 @@
+"""
+Walk-forward backtesting for the LSTM forecaster
+
+LSTMForecaster.evaluate scores one static test split. The backtester instead
+rolls the training cutoff through the series: each fold trains on data up to
+its cutoff and forecasts every origin in the following test window, so all
+errors are out of sample.
+
+Folds are split into contiguous chains, one per worker process. A chain
+trains from scratch at its first fold; later folds either retrain from
+scratch ("retrain") or fine-tune the previous fold's model on the rows added
+since its cutoff ("finetune"). Per-origin, per-horizon forecasts are
+collected into one long table and optionally written as Parquet.
+"""
+
+import inspect
+import logging
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import torch
+
+from sei_dlp_ai.models.lstm_forecaster import LSTMForecaster
+
+logger = logging.getLogger(__name__)
+
+RETRAIN = "retrain"
+FINETUNE = "finetune"
+
+
+@dataclass
+class Fold:
+    """One walk-forward step: train on rows [train_start, cutoff), forecast origins [cutoff, test_end)"""
+    index: int
+    train_start: int
+    cutoff: int
+    test_end: int
+
+
+@dataclass
+class WalkForwardResult:
+    """Forecasts and error metrics of a walk-forward run"""
+    forecasts: pd.DataFrame
+    fold_metrics: pd.DataFrame
+    wall_time_seconds: float
+    output_path: Optional[str] = None
+
+    def summary(self, horizons: Optional[List[int]] = None) -> Dict[str, float]:
+        """
+        Out-of-sample error over all folds
+
+        Args:
+            horizons: Horizons to report (defaults to 1, 6, 12 and 24 where available)
+
+        Returns:
+            mse/mae/rmse per horizon plus averages over all horizons
+        """
+        return _error_metrics(self.forecasts, horizons)
+
+
+def _error_metrics(forecasts: pd.DataFrame, horizons: Optional[List[int]] = None) -> Dict[str, float]:
+    """MSE/MAE/RMSE at the given horizons and over all horizons (price units)"""
+    max_horizon = int(forecasts["horizon"].max())
+    horizons = horizons or [h for h in (1, 6, 12, 24) if h <= max_horizon]
+    errors = forecasts["prediction"].to_numpy() - forecasts["actual"].to_numpy()
+
+    metrics = {}
+    for horizon in horizons:
+        at_horizon = errors[forecasts["horizon"].to_numpy() == horizon]
+        metrics[f"mse_{horizon}h"] = float(np.mean(at_horizon ** 2))
+        metrics[f"mae_{horizon}h"] = float(np.mean(np.abs(at_horizon)))
+        metrics[f"rmse_{horizon}h"] = float(np.sqrt(metrics[f"mse_{horizon}h"]))
+
+    metrics["avg_mse"] = float(np.mean(errors ** 2))
+    metrics["avg_mae"] = float(np.mean(np.abs(errors)))
+    metrics["avg_rmse"] = float(np.sqrt(metrics["avg_mse"]))
+    return metrics
+
+
+def _forecast_fold(forecaster: LSTMForecaster, data: pd.DataFrame, fold: Fold) -> pd.DataFrame:
+    """Forecast every origin of a fold in one batched prediction"""
+    values = data[forecaster.feature_names].to_numpy()
+    prices = values[:, 0]
+    horizon = forecaster.prediction_horizon
+    origins = np.arange(fold.cutoff, fold.test_end)
+
+    # windows[i] holds the sequence_length rows before origins[i]
+    windows = np.lib.stride_tricks.sliding_window_view(
+        values[fold.cutoff - forecaster.sequence_length:fold.test_end - 1], forecaster.sequence_length, axis=0
+    ).transpose(0, 2, 1)
+    result = forecaster.predict_batch(windows)
+    actuals = np.lib.stride_tricks.sliding_window_view(prices[fold.cutoff:fold.test_end - 1 + horizon], horizon)
+
+    n_origins = len(origins)
+    return pd.DataFrame({
+        "fold": np.full(n_origins * horizon, fold.index, dtype=np.int32),
+        "cutoff": np.full(n_origins * horizon, fold.cutoff, dtype=np.int64),
+        "origin": np.repeat(origins, horizon),
+        "origin_label": np.repeat(data.index[origins].astype(str), horizon),
+        "horizon": np.tile(np.arange(1, horizon + 1, dtype=np.int32), n_origins),
+        "prediction": result["predictions"].reshape(-1).astype(np.float64),
+        "actual": actuals.reshape(-1).astype(np.float64),
+        "uncertainty": result["uncertainty"].reshape(-1).astype(np.float64)
+    })
+
+
+def _run_chain(data: pd.DataFrame,
+               folds: List[Fold],
+               forecaster_params: Dict[str, Any],
+               feature_columns: List[str],
+               mode: str,
+               epochs: int,
+               finetune_epochs: int,
+               work_dir: str,
+               num_threads: int) -> List[Dict[str, Any]]:
+    """
+    Train and forecast a chain of consecutive folds (runs in a worker process)
+
+    Returns:
+        One entry per fold with its forecasts and training time
+    """
+    torch.set_num_threads(num_threads)
+    forecaster = LSTMForecaster(**forecaster_params)
+    forecaster.save_path = os.path.join(work_dir, f"chain_{folds[0].index}")
+    os.makedirs(forecaster.save_path, exist_ok=True)
+
+    outputs = []
+    previous: Optional[Fold] = None
+    for fold in folds:
+        start = time.perf_counter()
+        if previous is None or mode == RETRAIN:
+            forecaster.training_history = []
+            forecaster.train(data.iloc[fold.train_start:fold.cutoff], None, feature_columns, epochs=epochs)
+        else:
+            # Fine-tune on the windows whose targets include rows added since the previous cutoff
+            context = forecaster.sequence_length + forecaster.prediction_horizon - 1
+            recent = data.iloc[max(fold.train_start, previous.cutoff - context):fold.cutoff]
+            forecaster.train(recent, None, feature_columns, epochs=finetune_epochs, warm_start=True)
+        train_seconds = time.perf_counter() - start
+
+        outputs.append({
+            "fold": fold,
+            "forecasts": _forecast_fold(forecaster, data, fold),
+            "train_seconds": train_seconds,
+            "final_train_loss": forecaster.training_history[-1]["train_loss"]
+        })
+        previous = fold
+    return outputs
+
+
+class WalkForwardBacktester:
+    """Rolling-origin backtest of LSTMForecaster with parallel fold chains"""
+
+    def __init__(self,
+                 feature_columns: List[str],
+                 initial_train_size: int,
+                 test_size: int,
+                 step_size: Optional[int] = None,
+                 train_window: Optional[int] = None,
+                 mode: str = RETRAIN,
+                 epochs: int = 20,
+                 finetune_epochs: int = 5,
+                 forecaster_params: Optional[Dict[str, Any]] = None,
+                 max_workers: Optional[int] = None,
+                 mp_start_method: str = "spawn"):
+        """
+        Initialize the backtester
+
+        Args:
+            feature_columns: Forecaster features; the first one is the forecast target
+            initial_train_size: Rows before the first cutoff
+            test_size: Forecast origins per fold
+            step_size: Rows between cutoffs (defaults to test_size)
+            train_window: Train on only the last train_window rows before each cutoff
+                (None for an expanding window)
+            mode: "retrain" trains every fold from scratch; "finetune" warm-starts each
+                fold from the previous fold of its chain on the newly added rows
+            epochs: Epochs for from-scratch training
+            finetune_epochs: Epochs for fine-tuning
+            forecaster_params: LSTMForecaster keyword arguments (sequence_length, hidden_dim, ...)
+            max_workers: Worker processes (defaults to the CPU count; 1 runs in-process)
+            mp_start_method: multiprocessing start method for the workers
+        """
+        if mode not in (RETRAIN, FINETUNE):
+            raise ValueError(f"Unknown walk-forward mode: {mode}")
+        if test_size <= 0 or (step_size is not None and step_size <= 0):
+            raise ValueError("test_size and step_size must be positive")
+
+        self.feature_columns = list(feature_columns)
+        self.initial_train_size = initial_train_size
+        self.test_size = test_size
+        self.step_size = step_size or test_size
+        self.train_window = train_window
+        self.mode = mode
+        self.epochs = epochs
+        self.finetune_epochs = finetune_epochs
+        self.forecaster_params = {"device": "cpu", **(forecaster_params or {})}
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.mp_start_method = mp_start_method
+
+        defaults = inspect.signature(LSTMForecaster).parameters
+        self.sequence_length = self.forecaster_params.get("sequence_length", defaults["sequence_length"].default)
+        self.prediction_horizon = self.forecaster_params.get(
+            "prediction_horizon", defaults["prediction_horizon"].default
+        )
+
+        min_train = self.sequence_length + self.prediction_horizon
+        if initial_train_size < min_train or (train_window is not None and train_window < min_train):
+            raise ValueError(
+                f"initial_train_size and train_window must be at least sequence_length + prediction_horizon "
+                f"({min_train})"
+            )
+
+    def folds(self, n_rows: int) -> List[Fold]:
+        """
+        Fold boundaries for a series of n_rows rows
+
+        Every origin of a fold needs prediction_horizon actual rows after it,
+        so the last fold may be shorter than test_size.
+        """
+        last_origin = n_rows - self.prediction_horizon
+        folds = []
+        cutoff = self.initial_train_size
+        while cutoff <= last_origin:
+            train_start = max(0, cutoff - self.train_window) if self.train_window else 0
+            folds.append(Fold(len(folds), train_start, cutoff, min(cutoff + self.test_size, last_origin + 1)))
+            cutoff += self.step_size
+        return folds
+
+    def run(self, data: pd.DataFrame, output_path: Optional[str] = None) -> WalkForwardResult:
+        """
+        Run the backtest
+
+        Args:
+            data: Time-ordered DataFrame with the feature columns
+            output_path: Write the forecasts here as Parquet (needs pyarrow)
+
+        Returns:
+            Forecasts (one row per fold, origin and horizon) and per-fold metrics
+        """
+        start = time.perf_counter()
+        folds = self.folds(len(data))
+        if not folds:
+            raise ValueError(
+                f"Need more than {self.initial_train_size + self.prediction_horizon - 1} rows, got {len(data)}"
+            )
+
+        n_workers = min(self.max_workers, len(folds))
+        chains = [list(chain) for chain in np.array_split(np.array(folds, dtype=object), n_workers)]
+        threads_per_worker = max(1, (os.cpu_count() or 1) // n_workers)
+        logger.info(f"Walk-forward backtest: {len(folds)} folds ({self.mode}) on {n_workers} workers")
+
+        try:
+            with tempfile.TemporaryDirectory() as work_dir:
+                args = (self.forecaster_params, self.feature_columns, self.mode, self.epochs,
+                        self.finetune_epochs, work_dir, threads_per_worker)
+                if n_workers == 1:
+                    outputs = [_run_chain(data, chains[0], *args)]
+                else:
+                    with ProcessPoolExecutor(
+                        max_workers=n_workers, mp_context=multiprocessing.get_context(self.mp_start_method)
+                    ) as pool:
+                        futures = [pool.submit(_run_chain, data, chain, *args) for chain in chains]
+                        outputs = [future.result() for future in futures]
+        except Exception as e:
+            logger.error(f"Walk-forward backtest failed: {e}")
+            raise
+
+        fold_outputs = [output for chain in outputs for output in chain]
+        forecasts = pd.concat([output["forecasts"] for output in fold_outputs], ignore_index=True)
+        fold_metrics = pd.DataFrame([
+            {
+                "fold": output["fold"].index,
+                "train_start": output["fold"].train_start,
+                "cutoff": output["fold"].cutoff,
+                "n_origins": output["fold"].test_end - output["fold"].cutoff,
+                "train_seconds": output["train_seconds"],
+                "final_train_loss": output["final_train_loss"],
+                **_error_metrics(output["forecasts"])
+            }
+            for output in fold_outputs
+        ])
+
+        if output_path is not None:
+            forecasts.to_parquet(output_path, index=False)
+            logger.info(f"Walk-forward forecasts written to {output_path}")
+
+        result = WalkForwardResult(forecasts, fold_metrics, time.perf_counter() - start, output_path)
+        logger.info(f"Walk-forward backtest finished in {result.wall_time_seconds:.1f}s: {result.summary()}")
+        return result
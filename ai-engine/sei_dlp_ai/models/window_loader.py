@@ -0,0 +1,110 @@
+"""
+Strided sliding-window batches for sequence model training
+
+DeFiPriceDataset slices one (sequence, target) window per index and DataLoader
+collates them sample by sample in Python. StridedWindowLoader instead keeps the
+whole series as one contiguous tensor, exposes every window as an as_strided
+view of it (no copies), and builds each batch with a single index_select
+gather, optionally into pinned memory or directly on the training device.
+"""
+
+import logging
+from typing import Iterator, Optional, Tuple, Union
+
+import numpy as np
+import torch
+
+logger = logging.getLogger(__name__)
+
+
+class StridedWindowLoader:
+    """Batches of (sequence, target) windows gathered from one contiguous tensor"""
+
+    def __init__(self,
+                 data: Union[np.ndarray, torch.Tensor],
+                 sequence_length: int,
+                 prediction_horizon: int,
+                 batch_size: int = 32,
+                 shuffle: bool = False,
+                 drop_last: bool = False,
+                 target_column: int = 0,
+                 pin_memory: bool = False,
+                 device: Optional[Union[str, torch.device]] = None,
+                 seed: Optional[int] = None):
+        """
+        Initialize the loader
+
+        Args:
+            data: Array of shape (n_timesteps, n_features)
+            sequence_length: Number of past timesteps per input window
+            prediction_horizon: Number of future timesteps per target window
+            batch_size: Windows per batch
+            shuffle: Shuffle window order every epoch
+            drop_last: Drop the final incomplete batch
+            target_column: Feature column used as the target
+            pin_memory: Gather CPU batches into pinned memory (needs CUDA)
+            device: Keep the series on this device and gather batches there
+            seed: Seed for the shuffling generator (drawn from torch's global RNG when None)
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        series = torch.as_tensor(data, dtype=torch.float32)
+        if series.ndim != 2:
+            raise ValueError(f"Expected data of shape (n_timesteps, n_features), got {tuple(series.shape)}")
+        if device is not None:
+            series = series.to(device)
+        self.data = series.contiguous()
+
+        self.sequence_length = sequence_length
+        self.prediction_horizon = prediction_horizon
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self.n_samples = len(self.data) - sequence_length - prediction_horizon + 1
+        if self.n_samples <= 0:
+            raise ValueError(
+                f"Need more than {sequence_length + prediction_horizon - 1} timesteps, got {len(self.data)}"
+            )
+
+        self.pin_memory = pin_memory and self.data.device.type == "cpu"
+        if self.pin_memory and not torch.cuda.is_available():
+            logger.warning("pin_memory requested but CUDA is not available; using pageable memory")
+            self.pin_memory = False
+
+        # windows[i] == data[i:i + sequence_length]; targets[i] == data[i + sequence_length:..., target_column]
+        n_features = self.data.shape[1]
+        row_stride, col_stride = self.data.stride()
+        self.windows = self.data.as_strided(
+            (self.n_samples, sequence_length, n_features), (row_stride, row_stride, col_stride)
+        )
+        self.targets = self.data.as_strided(
+            (self.n_samples, prediction_horizon),
+            (row_stride, row_stride),
+            self.data.storage_offset() + sequence_length * row_stride + target_column * col_stride
+        )
+
+        # Without an explicit seed, follow torch.manual_seed like DataLoader's default sampler
+        self.generator = torch.Generator(device=self.data.device)
+        self.generator.manual_seed(seed if seed is not None else int(torch.randint(2 ** 62, ()).item()))
+
+    def __len__(self) -> int:
+        if self.drop_last:
+            return self.n_samples // self.batch_size
+        return -(-self.n_samples // self.batch_size)
+
+    def _gather(self, view: torch.Tensor, index: torch.Tensor) -> torch.Tensor:
+        """Copy the selected windows into one contiguous (optionally pinned) batch"""
+        out = torch.empty((len(index),) + tuple(view.shape[1:]), dtype=view.dtype,
+                          device=view.device, pin_memory=self.pin_memory)
+        return torch.index_select(view, 0, index, out=out)
+
+    def __iter__(self) -> Iterator[Tuple[torch.Tensor, torch.Tensor]]:
+        if self.shuffle:
+            order = torch.randperm(self.n_samples, generator=self.generator, device=self.data.device)
+        else:
+            order = torch.arange(self.n_samples, device=self.data.device)
+
+        for start in range(0, len(self) * self.batch_size, self.batch_size):
+            index = order[start:start + self.batch_size]
+            yield self._gather(self.windows, index), self._gather(self.targets, index)
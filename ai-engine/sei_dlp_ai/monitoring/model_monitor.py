@@ -626,17 +626,31 @@ class ModelEvaluator:
         window_size = 168  # 1 week of hourly data
         prediction_horizon = 24  # 24 hours ahead
 
-        for i in range(len(test_data) - window_size - prediction_horizon):
-            input_window = test_data.iloc[i:i+window_size]
-            actual_values = test_data.iloc[i+window_size:i+window_size+prediction_horizon]['price'].values
+        n_windows = len(test_data) - window_size - prediction_horizon
 
-            # Get prediction
-            result = model.predict(input_window, return_uncertainty=True)
+        if hasattr(model, 'predict_batch') and n_windows > 0:
+            # Every sliding window as a zero-copy view, predicted in batched forward passes
+            features = test_data[model.feature_names].to_numpy()
+            windows = np.lib.stride_tricks.sliding_window_view(features, window_size, axis=0)[:n_windows]
+            result = model.predict_batch(windows.transpose(0, 2, 1), return_uncertainty=True)
 
-            predictions.append(result['predictions'])
-            actuals.append(actual_values)
+            prices = test_data['price'].to_numpy()
+            predictions = result['predictions']
+            actuals = np.lib.stride_tricks.sliding_window_view(prices[window_size:], prediction_horizon)[:n_windows]
             if 'uncertainty' in result:
-                uncertainties.append(result['uncertainty'])
+                uncertainties = list(result['uncertainty'])
+        else:
+            for i in range(n_windows):
+                input_window = test_data.iloc[i:i+window_size]
+                actual_values = test_data.iloc[i+window_size:i+window_size+prediction_horizon]['price'].values
+
+                # Get prediction
+                result = model.predict(input_window, return_uncertainty=True)
+
+                predictions.append(result['predictions'])
+                actuals.append(actual_values)
+                if 'uncertainty' in result:
+                    uncertainties.append(result['uncertainty'])
 
         predictions = np.array(predictions)
         actuals = np.array(actuals)
@@ -17,6 +17,8 @@ from pathlib import Path
 
 from sei_dlp_ai.models.rl_agent import DeFiRLAgent
 from sei_dlp_ai.models.lstm_forecaster import LSTMForecaster
+from sei_dlp_ai.models.multi_asset_forecaster import MultiAssetForecaster
+from sei_dlp_ai.models.impermanent_loss import impermanent_loss
 from sei_dlp_ai.models.impermanent_loss_predictor import ImpermanentLossPredictor
 from sei_dlp_ai.models.rl_environment import DeFiTradingEnv
 
@@ -72,7 +74,8 @@ class MLTrainingPipeline:
                 'sequence_length': 168,  # 7 days
                 'prediction_horizon': 24,  # 24 hours
                 'epochs': 100,
-                'batch_size': 32
+                'batch_size': 32,
+                'multi_asset': False  # One shared-encoder model for all symbols
             },
             'il_config': {
                 'n_estimators': 200,
@@ -274,10 +277,8 @@ class MLTrainingPipeline:
             il_data['market_trend'] = il_data['price_token0'].pct_change().rolling(window=24).mean()
 
             # Calculate actual impermanent loss
-            il_data['impermanent_loss'] = il_data.apply(
-                lambda row: self._calculate_il(row['initial_price_ratio'], row['current_price_ratio']),
-                axis=1
-            )
+            il_data['impermanent_loss'] = impermanent_loss(il_data['initial_price_ratio'].to_numpy(),
+                                                        il_data['current_price_ratio'].to_numpy())
 
         # ETH-USDC pair
         if 'ETH-USD_Close' in self.historical_data.columns:
@@ -291,10 +292,8 @@ class MLTrainingPipeline:
             eth_il_data['initial_price_ratio'] = eth_il_data['initial_price_token0'] / eth_il_data['initial_price_token1']
             eth_il_data['current_price_ratio'] = eth_il_data['price_token0'] / eth_il_data['price_token1']
 
-            eth_il_data['impermanent_loss'] = eth_il_data.apply(
-                lambda row: self._calculate_il(row['initial_price_ratio'], row['current_price_ratio']),
-                axis=1
-            )
+            eth_il_data['impermanent_loss'] = impermanent_loss(eth_il_data['initial_price_ratio'].to_numpy(),
+                                                            eth_il_data['current_price_ratio'].to_numpy())
 
             # Combine datasets
             il_data = pd.concat([il_data, eth_il_data], ignore_index=True)
@@ -307,16 +306,6 @@ class MLTrainingPipeline:
 
         return il_data
 
-    def _calculate_il(self, initial_ratio: float, current_ratio: float) -> float:
-        """Calculate impermanent loss"""
-        if initial_ratio == 0:
-            return 0
-        price_ratio = current_ratio / initial_ratio
-        if price_ratio <= 0:
-            return 0
-        il = 2 * np.sqrt(price_ratio) / (1 + price_ratio) - 1
-        return il
-
     async def train_rl_agent(self):
         """Train the Reinforcement Learning agent"""
         logger.info("Starting RL agent training...")
@@ -352,8 +341,82 @@ class MLTrainingPipeline:
 
         return metrics
 
+    def prepare_multi_asset_lstm_data(self) -> Dict[str, pd.DataFrame]:
+        """
+        Prepare per-symbol data for the multi-asset forecaster
+
+        Returns:
+            DataFrame with price, volume, volatility, high and low, keyed by symbol without -USD
+        """
+        if self.historical_data is None or self.historical_data.empty:
+            raise ValueError("No historical data available. Run fetch_historical_data first.")
+
+        asset_data = {}
+        for symbol in self.config['symbols']:
+            if f"{symbol}_Close" not in self.historical_data.columns:
+                logger.warning(f"No price data for {symbol}; skipping")
+                continue
+
+            price = self.historical_data[f"{symbol}_Close"]
+            frame = pd.DataFrame({
+                'price': price,
+                'volume': self.historical_data.get(f"{symbol}_Volume", 0),
+                'volatility': self.historical_data.get(f"{symbol}_volatility", 0),
+                'high': self.historical_data.get(f"{symbol}_High", price),
+                'low': self.historical_data.get(f"{symbol}_Low", price)
+            })
+            frame.dropna(inplace=True)
+            asset_data[symbol.replace('-USD', '')] = frame
+
+        self.processed_data['lstm_multi_asset'] = asset_data
+        logger.info(f"Prepared multi-asset LSTM data for {list(asset_data)}")
+
+        return asset_data
+
+    async def train_multi_asset_forecaster(self):
+        """Train one shared-encoder forecaster for all symbols"""
+        logger.info("Starting multi-asset LSTM forecaster training...")
+
+        if self.historical_data is None:
+            logger.info("Fetching historical data...")
+            await self.fetch_historical_data()
+
+        asset_data = self.prepare_multi_asset_lstm_data()
+
+        # Split every asset chronologically into train/val/test
+        train_data, val_data, test_data = {}, {}, {}
+        for asset, frame in asset_data.items():
+            split_idx = int(len(frame) * self.config['train_test_split'])
+            val_split_idx = int(split_idx * (1 - self.config['validation_split']))
+            train_data[asset] = frame[:val_split_idx]
+            val_data[asset] = frame[val_split_idx:split_idx]
+            test_data[asset] = frame[split_idx:]
+
+        self.lstm_forecaster = MultiAssetForecaster(
+            assets=list(asset_data),
+            model_name="multi_asset_price_forecaster",
+            sequence_length=self.config['lstm_config']['sequence_length'],
+            prediction_horizon=self.config['lstm_config']['prediction_horizon'],
+            batch_size=self.config['lstm_config']['batch_size']
+        )
+
+        self.lstm_forecaster.train(
+            train_data=train_data,
+            val_data=val_data,
+            feature_columns=['price', 'volume', 'volatility', 'high', 'low'],
+            epochs=self.config['lstm_config']['epochs']
+        )
+
+        metrics = self.lstm_forecaster.evaluate(test_data)
+        logger.info(f"Multi-asset LSTM Forecaster Metrics: {metrics}")
+
+        return metrics
+
     async def train_lstm_forecaster(self):
         """Train the LSTM forecasting model"""
+        if self.config['lstm_config'].get('multi_asset', False):
+            return await self.train_multi_asset_forecaster()
+
         logger.info("Starting LSTM forecaster training...")
 
         # Fetch historical data if not available
@@ -119,4 +119,51 @@ def api_client():
     from fastapi.testclient import TestClient
     from api_server import app
 
-    return TestClient(app)
\ No newline at end of file
+    return TestClient(app)
+
+
+@pytest.fixture
+def lstm_frame():
+    """Factory for a random-walk price/volume frame with the LSTM forecaster's five features
+
+    With base_price the walk is geometric around that price, so frames for different assets
+    can sit on very different scales.
+    """
+    def build(n_rows=300, seed=0, base_price=None):
+        rng = np.random.default_rng(seed)
+        if base_price is None:
+            price = 1.5 + np.cumsum(rng.normal(0, 0.01, n_rows))
+        else:
+            price = base_price * np.exp(np.cumsum(rng.normal(0, 0.01, n_rows)))
+        return pd.DataFrame({
+            'price': price,
+            'volume': rng.uniform(1e5, 2e5, n_rows),
+            'volatility': rng.uniform(0.01, 0.05, n_rows),
+            'high': price * 1.01,
+            'low': price * 0.99
+        })
+
+    return build
+
+
+@pytest.fixture
+def small_forecaster(tmp_path, monkeypatch):
+    """Factory for a small CPU forecaster (LSTMForecaster unless forecaster_cls) saving under tmp_path
+
+    When a frame is given the model is created and the scaler fitted to it.
+    """
+    import torch
+    from sei_dlp_ai.models.lstm_forecaster import LSTMForecaster
+
+    monkeypatch.chdir(tmp_path)
+
+    def build(frame=None, sequence_length=24, prediction_horizon=6, forecaster_cls=LSTMForecaster, **kwargs):
+        torch.manual_seed(0)
+        forecaster = forecaster_cls(sequence_length=sequence_length, prediction_horizon=prediction_horizon,
+                                    hidden_dim=16, num_layers=1, device="cpu", **kwargs)
+        if frame is not None:
+            forecaster.model = forecaster.create_model(frame.shape[1])
+            forecaster.prepare_data(frame, list(frame.columns))
+        return forecaster
+
+    return build
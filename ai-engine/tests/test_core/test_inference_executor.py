@@ -0,0 +1,139 @@
+"""Tests for off-loop model inference"""
+
+import asyncio
+import threading
+import time
+import pytest
+import numpy as np
+import pandas as pd
+
+from sei_dlp_ai.core.engine import SEIDLPEngine
+from sei_dlp_ai.core.inference_executor import InferenceExecutor, InferenceQueueFull
+from sei_dlp_ai.models.liquidity_optimizer import LiquidityOptimizer
+
+
+def _fail(_):
+    raise RuntimeError("model exploded")
+
+
+@pytest.fixture
+def executor():
+    executor = InferenceExecutor(max_threads=2, max_processes=1, max_queue_depth=2, submit_timeout=0.05)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture
+def training_data():
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(rng.normal(size=(80, 4)), columns=[f"feature_{i}" for i in range(4)])
+    data['lower_bound'] = rng.uniform(0.40, 0.44, 80)
+    data['upper_bound'] = rng.uniform(0.46, 0.50, 80)
+    data['confidence'] = rng.uniform(0.6, 0.9, 80)
+    return data
+
+
+class TestInferenceExecutor:
+    """Test bounded off-loop execution and metrics"""
+
+    @pytest.mark.asyncio
+    async def test_runs_in_thread_and_records_timings(self, executor):
+        result = await executor.run(np.sum, np.arange(10))
+
+        metrics = executor.metrics()
+        assert result == 45
+        assert metrics["thread"]["completed"] == 1 and metrics["thread"]["submitted"] == 1
+        assert metrics["thread"]["compute_seconds"] >= 0 and metrics["thread"]["queue_wait_seconds"] >= 0
+        assert metrics["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_event_loop_keeps_running_during_inference(self, executor):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.create_task(ticker())
+        await executor.run(time.sleep, 0.2)
+        task.cancel()
+
+        assert ticks >= 5
+        assert executor.metrics()["thread"]["max_compute_seconds"] >= 0.2
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_is_full(self, executor):
+        release = threading.Event()
+        blocked = [asyncio.create_task(executor.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(InferenceQueueFull):
+            await executor.run(np.sum, np.arange(3))
+
+        release.set()
+        await asyncio.gather(*blocked)
+        metrics = executor.metrics()["thread"]
+        assert metrics["rejected"] == 1 and metrics["completed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_waits_for_slot_without_timeout(self):
+        executor = InferenceExecutor(max_threads=1, max_queue_depth=1, submit_timeout=None)
+        try:
+            results = await asyncio.gather(*[executor.run(time.sleep, 0.02) for _ in range(3)])
+        finally:
+            executor.shutdown()
+
+        metrics = executor.metrics()["thread"]
+        assert results == [None, None, None]
+        assert metrics["completed"] == 3 and metrics["rejected"] == 0
+
+    @pytest.mark.asyncio
+    async def test_worker_errors_propagate(self, executor):
+        with pytest.raises(RuntimeError, match="model exploded"):
+            await executor.run(_fail, None)
+
+        assert executor.metrics()["thread"]["failed"] == 1
+
+    def test_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            InferenceExecutor(max_queue_depth=0)
+
+
+class TestOptimizerOffload:
+    """LiquidityOptimizer inference through the executor"""
+
+    @pytest.mark.asyncio
+    async def test_sklearn_runs_in_primed_process(self, executor, training_data):
+        features = np.random.default_rng(1).normal(size=(16, 4))
+        optimizer = LiquidityOptimizer()
+        optimizer.train_model(training_data, n_estimators=10)
+        inline = await optimizer._predict_batch_with_sklearn(features)
+
+        optimizer.enable_inference_executor(executor)
+        offloaded = await optimizer._predict_batch_with_sklearn(features)
+
+        assert executor.has_process_workers
+        assert offloaded == inline
+        assert executor.metrics()["process"]["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_untrained_mocks_use_threads(self, executor):
+        optimizer = LiquidityOptimizer()
+        optimizer.enable_inference_executor(executor)
+        optimizer.scaler = type("Scaler", (), {"transform": staticmethod(lambda X: X)})()
+        optimizer.ml_model = type("Model", (), {"predict": staticmethod(lambda X: np.tile([0.4, 0.5, 0.8], (len(X), 1)))})()
+        optimizer.is_trained = True
+
+        predictions = await optimizer._predict_batch_with_sklearn(np.zeros((3, 4)))
+
+        assert len(predictions) == 3
+        assert executor.metrics()["thread"]["completed"] == 1
+
+    def test_engine_wires_executor(self, executor):
+        engine = SEIDLPEngine(inference_executor=executor)
+
+        assert engine.liquidity_optimizer.inference_executor is executor
+        assert engine.get_inference_metrics()["max_queue_depth"] == 2
+        assert SEIDLPEngine().get_inference_metrics() == {}
@@ -0,0 +1,85 @@
+"""Tests for the single-graph ONNX impermanent loss ensemble"""
+
+import json
+import pytest
+import numpy as np
+import pandas as pd
+import onnx
+
+from sei_dlp_ai.models.ensemble_onnx import ENSEMBLE_WEIGHTS_KEY, FEATURE_COLUMNS_KEY
+from sei_dlp_ai.models.impermanent_loss_predictor import ImpermanentLossPredictor
+from sei_dlp_ai.models.onnx_runtime import SCALER_FOLDED_KEY
+
+FEATURES = [f"f{i}" for i in range(8)]
+
+
+def make_data(n_rows: int, seed: int):
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame(rng.normal(0, 1, (n_rows, len(FEATURES))) * [1, 10, 100, 0.1, 1, 1, 5, 50], columns=FEATURES)
+    y = pd.Series(-0.1 * X['f0'] ** 2 + 0.001 * X['f1'] + rng.normal(0, 0.01, n_rows))
+    return X, y
+
+
+@pytest.fixture(scope="module")
+def trained(tmp_path_factory):
+    workdir = tmp_path_factory.mktemp("il_onnx")
+    cwd = pytest.MonkeyPatch()
+    cwd.chdir(workdir)
+    X, y = make_data(600, 0)
+    predictor = ImpermanentLossPredictor(feature_engineering=False, n_estimators=30, max_depth=6, max_workers=1)
+    predictor.feature_names = FEATURES
+    predictor.train(X, y, feature_selection=False)
+    path = str(workdir / "il_ensemble.onnx")
+    predictor.export_onnx(path)
+    yield predictor, path
+    cwd.undo()
+
+
+class TestEnsembleOnnx:
+    """Parity of the compiled ensemble with the Python models"""
+
+    def test_single_graph_with_metadata(self, trained):
+        predictor, path = trained
+        model = onnx.load(path)
+        metadata = {prop.key: prop.value for prop in model.metadata_props}
+
+        assert [i.name for i in model.graph.input] == ["features"]
+        assert metadata[SCALER_FOLDED_KEY] == "true"
+        assert metadata[FEATURE_COLUMNS_KEY] == ",".join(FEATURES)
+        weights = json.loads(metadata[ENSEMBLE_WEIGHTS_KEY])
+        assert set(weights) == set(predictor.models) and sum(weights.values()) == pytest.approx(1.0)
+
+    def test_matches_weighted_python_ensemble(self, trained, tmp_path, monkeypatch):
+        predictor, path = trained
+        monkeypatch.chdir(tmp_path)
+        X, _ = make_data(2000, 1)
+        expected = predictor.predict(X)
+
+        compiled = ImpermanentLossPredictor(feature_engineering=False)
+        compiled.load_onnx_model(path)
+        actual = compiled.predict(X)
+
+        assert compiled.feature_names == FEATURES
+        np.testing.assert_allclose(actual, expected, rtol=1e-5, atol=1e-6)
+        np.testing.assert_allclose(compiled.predict(X.iloc[:1]), expected[:1], rtol=1e-5, atol=1e-6)
+
+    def test_individual_predictions_bypass_graph(self, trained):
+        predictor, path = trained
+        predictor.load_onnx_model(path)
+        X, _ = make_data(10, 2)
+
+        individual = predictor.predict(X, return_individual=True)
+        predictor.onnx_session = None
+
+        assert set(individual) == set(predictor.models)
+
+    def test_rejects_mismatched_features(self, trained, tmp_path, monkeypatch):
+        _, path = trained
+        monkeypatch.chdir(tmp_path)
+        other = ImpermanentLossPredictor(feature_engineering=False)
+        other.feature_names = FEATURES[:3]
+
+        with pytest.raises(ValueError, match="expects features"):
+            other.load_onnx_model(path)
+        with pytest.raises(ValueError, match="not trained"):
+            other.export_onnx(str(tmp_path / "untrained.onnx"))
@@ -0,0 +1,89 @@
+"""Tests for concurrent ensemble training and inference"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import ExtraTreesRegressor, GradientBoostingRegressor, RandomForestRegressor
+
+from sei_dlp_ai.models.ensemble_scheduler import EnsembleScheduler
+from sei_dlp_ai.models.impermanent_loss_predictor import ImpermanentLossPredictor
+
+
+def make_models():
+    return {
+        'random_forest': RandomForestRegressor(n_estimators=10, max_depth=4, n_jobs=-1, random_state=0),
+        'gradient_boosting': GradientBoostingRegressor(n_estimators=10, max_depth=3, random_state=0),
+        'extra_trees': ExtraTreesRegressor(n_estimators=10, max_depth=4, n_jobs=-1, random_state=0)
+    }
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(0, 1, (300, 6))
+    y = X[:, 0] ** 2 - 0.5 * X[:, 1] + rng.normal(0, 0.1, 300)
+    return X[:240], y[:240], X[240:]
+
+
+class TestEnsembleScheduler:
+    """Thread budgets and concurrent fits"""
+
+    def test_budget_shares_cores(self):
+        assert EnsembleScheduler(n_threads=8).budget(5) == (5, 1)
+        assert EnsembleScheduler(n_threads=8, max_workers=2).budget(5) == (2, 4)
+        assert EnsembleScheduler(n_threads=8).budget(1) == (1, 8)
+        assert EnsembleScheduler(n_threads=2).budget(5) == (2, 1)
+
+    def test_process_pool_matches_sequential_fit(self, data):
+        X_train, y_train, X_val = data
+
+        parallel = EnsembleScheduler(max_workers=2, n_threads=2).fit(make_models(), X_train, y_train, X_val)
+        sequential = EnsembleScheduler(max_workers=1, n_threads=1).fit(make_models(), X_train, y_train, X_val)
+
+        assert list(parallel) == ['random_forest', 'gradient_boosting', 'extra_trees']
+        for name, fit in parallel.items():
+            np.testing.assert_allclose(fit.val_pred, sequential[name].val_pred)
+            np.testing.assert_allclose(fit.model.predict(X_val), fit.val_pred)
+            assert fit.n_threads == 1 and fit.train_seconds > 0
+        assert parallel['random_forest'].model.n_jobs == 1
+
+    def test_predict_records_timings(self, data):
+        X_train, y_train, X_val = data
+        scheduler = EnsembleScheduler(n_threads=3)
+        models = {name: fit.model for name, fit in
+                  EnsembleScheduler(max_workers=1).fit(make_models(), X_train, y_train, X_val).items()}
+
+        predictions = scheduler.predict(models, X_val)
+        scheduler.shutdown()
+
+        for name, model in models.items():
+            np.testing.assert_array_equal(predictions[name], model.predict(X_val))
+            assert scheduler.timings[name]['predict_seconds'] > 0
+
+    def test_fit_errors_propagate(self, data):
+        X_train, y_train, X_val = data
+
+        with pytest.raises(ValueError):
+            EnsembleScheduler(max_workers=1).fit(make_models(), X_train, y_train[:10], X_val)
+
+
+class TestPredictorUsesScheduler:
+    """ImpermanentLossPredictor trains and predicts through the scheduler"""
+
+    def test_train_and_predict(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        rng = np.random.default_rng(1)
+        X = pd.DataFrame(rng.normal(0, 1, (200, 5)), columns=[f"f{i}" for i in range(5)])
+        y = pd.Series(0.1 * X['f0'] ** 2 + rng.normal(0, 0.01, 200))
+        predictor = ImpermanentLossPredictor(feature_engineering=False, n_estimators=10, max_depth=4,
+                                             max_workers=1, n_threads=2)
+        predictor.feature_names = X.columns.tolist()
+
+        predictor.train(X, y, feature_selection=False)
+        individual = predictor.predict(X.iloc[:20], return_individual=True)
+
+        assert set(predictor.member_timings) == set(predictor.models) == set(individual)
+        for name, timing in predictor.member_timings.items():
+            assert timing['train_seconds'] > 0 and timing['predict_seconds'] > 0
+            assert predictor.validation_metrics[name]['r2'] > 0
+        assert predictor.models['xgboost'].n_jobs == 2
@@ -0,0 +1,122 @@
+"""Tests for the compact memory-mapped forest artifact"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from sei_dlp_ai.models.liquidity_optimizer import LiquidityOptimizer
+from sei_dlp_ai.models.liquidity_features import FEATURE_NAMES
+from sei_dlp_ai.models.forest_artifact import CompactForest, FORMAT_MAGIC, _float32_floor
+
+
+@pytest.fixture(scope="module")
+def trained_optimizer():
+    """Optimizer trained on synthetic data with the production feature layout"""
+    rng = np.random.default_rng(7)
+    n = 400
+    data = pd.DataFrame(rng.normal(0, 1, (n, len(FEATURE_NAMES))) * 10 + 50, columns=FEATURE_NAMES)
+    data['lower_bound'] = 0.9 + 0.01 * data['sei_price']
+    data['upper_bound'] = data['lower_bound'] + 0.1 + 0.001 * data['position_size']
+    data['confidence'] = 0.5 + 0.002 * data['liquidity']
+
+    optimizer = LiquidityOptimizer()
+    optimizer.train_model(data, n_estimators=30)
+    return optimizer
+
+
+@pytest.fixture(scope="module")
+def artifact_path(trained_optimizer, tmp_path_factory):
+    path = tmp_path_factory.mktemp("forest") / "liquidity.forest"
+    trained_optimizer.save_model(str(path))
+    return str(path)
+
+
+@pytest.fixture
+def features():
+    return np.random.default_rng(9).normal(0, 1, (64, len(FEATURE_NAMES))) * 10 + 50
+
+
+class TestCompactForest:
+    """Test the flattened forest format and its inference"""
+
+    def test_float32_floor_preserves_comparisons(self):
+        thresholds = np.random.default_rng(0).normal(0, 100, 10000)
+        inputs = thresholds.astype(np.float32)
+
+        floored = _float32_floor(thresholds)
+
+        assert (floored.astype(np.float64) <= thresholds).all()
+        np.testing.assert_array_equal(inputs <= floored, inputs.astype(np.float64) <= thresholds)
+
+    def test_loaded_forest_matches_sklearn(self, trained_optimizer, artifact_path, features):
+        forest = CompactForest.load(artifact_path)
+
+        expected = trained_optimizer.ml_model.predict(trained_optimizer.scaler.transform(features))
+
+        assert forest.n_trees == 30 and forest.n_outputs == 3
+        assert forest.feature_columns == list(FEATURE_NAMES)
+        np.testing.assert_allclose(forest.predict(features), expected, rtol=1e-6)
+        np.testing.assert_allclose(forest.predict(features[0]), expected[:1], rtol=1e-6)
+
+    def test_load_is_zero_copy(self, artifact_path):
+        forest = CompactForest.load(artifact_path)
+
+        for array in forest.arrays.values():
+            assert isinstance(array.base, np.memmap) or isinstance(array, np.memmap)
+            assert not array.flags.writeable
+        assert forest.threshold.dtype == np.float32 and forest.children.dtype == np.int32
+
+    def test_rejects_unknown_files(self, artifact_path, tmp_path):
+        with pytest.raises(ValueError, match="not a forest artifact"):
+            bad = tmp_path / "bad.forest"
+            bad.write_bytes(b"not a model at all")
+            CompactForest.load(str(bad))
+
+        with open(artifact_path, "rb") as f:
+            data = bytearray(f.read())
+        data[len(FORMAT_MAGIC)] = 99
+        future = tmp_path / "future.forest"
+        future.write_bytes(bytes(data))
+        with pytest.raises(ValueError, match="Unsupported forest artifact version 99"):
+            CompactForest.load(str(future))
+
+    def test_rejects_wrong_feature_count(self, artifact_path):
+        forest = CompactForest.load(artifact_path)
+
+        with pytest.raises(ValueError, match="Expected 29 features"):
+            forest.predict(np.zeros((2, 5)))
+
+
+class TestOptimizerModelArtifact:
+    """Test LiquidityOptimizer save_model / load_model"""
+
+    def test_save_requires_trained_model(self, tmp_path):
+        optimizer = LiquidityOptimizer()
+        with pytest.raises(ValueError, match="ML model not initialized or not trained"):
+            optimizer.save_model(str(tmp_path / "model.forest"))
+
+    @pytest.mark.asyncio
+    async def test_loaded_model_predicts_like_sklearn(self, trained_optimizer, artifact_path, features):
+        optimizer = LiquidityOptimizer()
+        optimizer.load_model(artifact_path)
+
+        loaded = await optimizer._predict_batch_with_compact_forest(features)
+        expected = await trained_optimizer._predict_batch_with_sklearn(features)
+
+        assert optimizer.feature_columns == list(FEATURE_NAMES)
+        for loaded_pred, sklearn_pred in zip(loaded, expected):
+            assert float(loaded_pred["lower_price"]) == pytest.approx(float(sklearn_pred["lower_price"]), rel=1e-6)
+            assert float(loaded_pred["upper_price"]) == pytest.approx(float(sklearn_pred["upper_price"]), rel=1e-6)
+            assert loaded_pred["confidence"] == pytest.approx(sklearn_pred["confidence"], rel=1e-6)
+
+    def test_retraining_drops_loaded_artifact(self, artifact_path):
+        optimizer = LiquidityOptimizer()
+        optimizer.load_model(artifact_path)
+        rng = np.random.default_rng(1)
+        data = pd.DataFrame(rng.normal(size=(20, 3)), columns=["a", "b", "c"])
+        data['lower_bound'], data['upper_bound'], data['confidence'] = 0.4, 0.5, 0.8
+
+        optimizer.train_model(data, n_estimators=5)
+
+        assert optimizer.compact_forest is None
+        assert optimizer.feature_columns == ["a", "b", "c"]
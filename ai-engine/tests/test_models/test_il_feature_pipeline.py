@@ -0,0 +1,154 @@
+"""Tests for the compiled impermanent loss feature pipeline"""
+
+import pickle
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from sei_dlp_ai.models.il_feature_pipeline import ILFeaturePipeline, engineered_columns
+from sei_dlp_ai.models.impermanent_loss_predictor import ImpermanentLossPredictor
+
+RAW = ['price_token0', 'price_token1', 'initial_price_token0', 'initial_price_token1',
+       'volatility_token0', 'volatility_token1', 'correlation', 'volume_token0', 'volume_token1',
+       'liquidity', 'range_lower', 'range_upper', 'time_in_pool', 'fee_tier', 'market_trend', 'var_95']
+
+
+def reference_engineering(X):
+    """The pandas feature engineering ImpermanentLossPredictor used before the pipeline"""
+    X_eng = X.copy()
+    X_eng['price_ratio'] = X['price_token0'] / (X['price_token1'] + 1e-8)
+    X_eng['log_price_ratio'] = np.log1p(X_eng['price_ratio'])
+    X_eng['sqrt_price_ratio'] = np.sqrt(X_eng['price_ratio'])
+    X_eng['price_ratio_squared'] = X_eng['price_ratio'] ** 2
+    initial_ratio = X['initial_price_token0'] / (X['initial_price_token1'] + 1e-8)
+    X_eng['price_divergence'] = np.abs(X_eng['price_ratio'] - initial_ratio) / initial_ratio
+    X_eng['price_divergence_squared'] = X_eng['price_divergence'] ** 2
+    X_eng['volatility_product'] = X['volatility_token0'] * X['volatility_token1']
+    X_eng['volatility_ratio'] = X['volatility_token0'] / (X['volatility_token1'] + 1e-8)
+    X_eng['max_volatility'] = np.maximum(X['volatility_token0'], X['volatility_token1'])
+    X_eng['volatility_diff'] = np.abs(X['volatility_token0'] - X['volatility_token1'])
+    X_eng['correlation_squared'] = X['correlation'] ** 2
+    X_eng['correlation_inverse'] = 1 / (np.abs(X['correlation']) + 0.1)
+    X_eng['decorrelation'] = 1 - np.abs(X['correlation'])
+    X_eng['volume_ratio'] = X['volume_token0'] / (X['volume_token1'] + 1e-8)
+    X_eng['total_volume'] = X['volume_token0'] + X['volume_token1']
+    X_eng['volume_imbalance'] = np.abs(X['volume_token0'] - X['volume_token1']) / (X_eng['total_volume'] + 1e-8)
+    X_eng['log_liquidity'] = np.log1p(X['liquidity'])
+    X_eng['liquidity_sqrt'] = np.sqrt(X['liquidity'])
+    X_eng['range_width'] = X['range_upper'] - X['range_lower']
+    X_eng['liquidity_concentration'] = X['liquidity'] / (X_eng['range_width'] + 1)
+    X_eng['time_in_pool_sqrt'] = np.sqrt(X['time_in_pool'])
+    X_eng['time_in_pool_log'] = np.log1p(X['time_in_pool'])
+    X_eng['fee_impact'] = X['fee_tier'] * 10000
+    X_eng['fee_to_volatility_ratio'] = X['fee_tier'] / (X_eng['max_volatility'] + 1e-8)
+    X_eng['abs_market_trend'] = np.abs(X['market_trend'])
+    X_eng['market_trend_squared'] = X['market_trend'] ** 2
+    X_eng['risk_normalized'] = X['var_95'] / (X_eng['total_volume'] + 1e-8)
+    return X_eng
+
+
+def make_frame(n, seed=0):
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({column: rng.uniform(0.1, 2.0, n) for column in RAW})
+    frame['correlation'] = rng.uniform(-1, 1, n)
+    frame['market_trend'] = rng.normal(0, 0.1, n)
+    frame['range_upper'] = frame['range_lower'] + rng.uniform(0.1, 1.0, n)
+    frame['initial_price_ratio'] = frame['initial_price_token0'] / frame['initial_price_token1']
+    frame['current_price_ratio'] = frame['price_token0'] / frame['price_token1']
+    frame['timestamp'] = pd.date_range('2024-01-01', periods=n, freq='h')
+    return frame
+
+
+@pytest.fixture
+def frame():
+    return make_frame(400)
+
+
+@pytest.fixture
+def predictor(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return ImpermanentLossPredictor(use_ensemble=False, n_estimators=20, max_depth=6, n_threads=1)
+
+
+class TestFeaturePipeline:
+    """Fixed-schema NumPy transform"""
+
+    def test_matches_pandas_engineering(self, frame):
+        columns = engineered_columns(frame.columns)
+        pipeline = ILFeaturePipeline(columns)
+        expected = reference_engineering(frame).drop(columns=['timestamp'])
+
+        assert columns == expected.columns.tolist()
+        pd.testing.assert_frame_equal(pipeline.engineer_frame(frame), expected)
+
+    def test_selection_computes_dependencies_only(self, frame):
+        pipeline = ILFeaturePipeline(engineered_columns(frame.columns))
+        pipeline.select(['fee_to_volatility_ratio', 'log_price_ratio'])
+
+        assert pipeline.engineered == ['price_ratio', 'log_price_ratio', 'max_volatility', 'fee_to_volatility_ratio']
+        assert set(pipeline.input_columns) == {'price_token0', 'price_token1', 'volatility_token0',
+                                               'volatility_token1', 'fee_tier'}
+
+        expected = reference_engineering(frame)[pipeline.output_columns].to_numpy()
+        np.testing.assert_allclose(pipeline.transform(frame, scale=False), expected)
+        np.testing.assert_allclose(pipeline.transform(frame[pipeline.input_columns].to_numpy(), scale=False),
+                                   expected)
+
+    def test_transform_scales_like_standard_scaler(self, frame):
+        pipeline = ILFeaturePipeline(engineered_columns(frame.columns)).fit(frame)
+        unscaled = pipeline.engineer_frame(frame).to_numpy()
+
+        np.testing.assert_allclose(pipeline.transform(frame), pipeline.scaler.transform(unscaled))
+
+    def test_rejects_bad_columns(self, frame):
+        pipeline = ILFeaturePipeline(engineered_columns(frame.columns))
+
+        with pytest.raises(ValueError, match="not fitted"):
+            pipeline.transform(frame)
+        with pytest.raises(ValueError, match="Missing feature columns"):
+            pipeline.transform(frame.drop(columns=['fee_tier']), scale=False)
+        with pytest.raises(ValueError, match="Unknown feature columns"):
+            pipeline.select(['not_a_feature'])
+
+    def test_pickle_round_trip(self, frame):
+        pipeline = ILFeaturePipeline(engineered_columns(frame.columns)).fit(frame)
+        pipeline.select(pipeline.feature_columns[:10]).fit(frame)
+
+        restored = pickle.loads(pickle.dumps(pipeline))
+        np.testing.assert_array_equal(restored.transform(frame), pipeline.transform(frame))
+
+
+class TestPredictorPipeline:
+    """Training and every serving path share one transform"""
+
+    def test_selected_models_train_on_scaled_features(self, predictor, frame):
+        X, y = predictor.prepare_training_data(frame)
+        predictor.train(X, y, feature_selection=True)
+
+        pipeline = predictor.feature_pipeline
+        assert len(X.columns) > 20 and predictor.selected_features == pipeline.output_columns
+        assert predictor.scaler is pipeline.scaler and pipeline.scaler.n_features_in_ == len(pipeline.output_columns)
+
+        # Raw frames go through the same engineering, selection and scaling as training
+        model = predictor.models['random_forest']
+        np.testing.assert_allclose(predictor.predict(frame), model.predict(pipeline.transform(frame)))
+
+    def test_uncertainty_engineers_features(self, predictor, frame):
+        X, y = predictor.prepare_training_data(frame)
+        predictor.train(X, y, feature_selection=False)
+
+        result = predictor.predict_with_uncertainty(frame.iloc[:20], n_estimations=50)
+        assert result['prediction'].shape == (20,)
+        assert (result['lower_bound'] <= result['upper_bound']).all()
+
+    def test_save_and_load_keep_the_pipeline(self, predictor, frame):
+        X, y = predictor.prepare_training_data(frame)
+        predictor.train(X, y, feature_selection=True)
+        predictor.save_model("features")
+
+        loaded = ImpermanentLossPredictor(use_ensemble=False, n_estimators=20, n_threads=1)
+        loaded.load_model(f"{predictor.save_path}/{predictor.model_name}_features.pkl")
+
+        assert loaded.feature_pipeline.output_columns == predictor.feature_pipeline.output_columns
+        np.testing.assert_array_equal(loaded.predict(frame), predictor.predict(frame))
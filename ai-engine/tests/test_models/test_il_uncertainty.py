@@ -0,0 +1,66 @@
+"""Tests for vectorized bootstrap uncertainty of ImpermanentLossPredictor"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestRegressor
+
+from sei_dlp_ai.models.impermanent_loss_predictor import ImpermanentLossPredictor
+
+FEATURES = ['price_ratio', 'volatility', 'volume', 'liquidity']
+
+
+def reference_bootstrap(predictor, X, n_estimations):
+    """The original per-round, per-tree loop"""
+    predictions = []
+    for _ in range(n_estimations):
+        n_trees = len(predictor.models['random_forest'].estimators_)
+        tree_indices = np.random.choice(n_trees, n_trees, replace=True)
+        tree_predictions = []
+        for idx in tree_indices[:n_trees // 2]:
+            tree = predictor.models['random_forest'].estimators_[idx]
+            tree_predictions.append(tree.predict(predictor.scaler.transform(X[predictor.feature_names])))
+        predictions.append(np.mean(tree_predictions, axis=0))
+    return np.array(predictions)
+
+
+@pytest.fixture
+def predictor(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(0, 1, (200, len(FEATURES))), columns=FEATURES)
+    y = 0.1 * X['price_ratio'] ** 2 + 0.05 * X['volatility'] + rng.normal(0, 0.01, 200)
+
+    predictor = ImpermanentLossPredictor(use_ensemble=False, feature_engineering=False)
+    predictor.feature_names = FEATURES
+    predictor.models = {'random_forest': RandomForestRegressor(n_estimators=40, max_depth=6, random_state=0)}
+    predictor.models['random_forest'].fit(predictor.scaler.fit_transform(X), y)
+    return predictor
+
+
+@pytest.fixture
+def X():
+    return pd.DataFrame(np.random.default_rng(1).normal(0, 1, (25, len(FEATURES))), columns=FEATURES)
+
+
+class TestPredictWithUncertainty:
+    """Bootstrap over one tree prediction matrix"""
+
+    def test_matches_loop_for_fixed_seed(self, predictor, X):
+        np.random.seed(3)
+        expected = reference_bootstrap(predictor, X, 50)
+        np.random.seed(3)
+        result = predictor.predict_with_uncertainty(X, n_estimations=50)
+
+        np.testing.assert_allclose(result['prediction'], expected.mean(axis=0), rtol=1e-10)
+        np.testing.assert_allclose(result['std'], expected.std(axis=0), rtol=1e-8, atol=1e-12)
+        np.testing.assert_allclose(result['lower_bound'], np.percentile(expected, 2.5, axis=0), rtol=1e-10)
+        np.testing.assert_allclose(result['upper_bound'], np.percentile(expected, 97.5, axis=0), rtol=1e-10)
+
+    def test_bounds_bracket_prediction(self, predictor, X):
+        result = predictor.predict_with_uncertainty(X)
+
+        assert result['prediction'].shape == (len(X),)
+        assert (result['lower_bound'] <= result['prediction']).all()
+        assert (result['prediction'] <= result['upper_bound']).all()
+        assert (result['std'] > 0).all()
@@ -0,0 +1,90 @@
+"""Tests for vectorized impermanent loss"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from sei_dlp_ai.models.impermanent_loss import impermanent_loss, concentrated_impermanent_loss
+from sei_dlp_ai.models.impermanent_loss_predictor import ImpermanentLossPredictor
+from sei_dlp_ai.training_pipeline import MLTrainingPipeline
+
+
+def scalar_il(initial_ratio, current_ratio):
+    price_ratio = current_ratio / initial_ratio
+    return 2 * np.sqrt(price_ratio) / (1 + price_ratio) - 1
+
+
+class TestImpermanentLoss:
+    """Full-range and concentrated closed forms"""
+
+    def test_matches_scalar_formula(self):
+        rng = np.random.default_rng(0)
+        initial, current = rng.uniform(0.1, 10, 1000), rng.uniform(0.1, 10, 1000)
+
+        expected = [scalar_il(i, c) for i, c in zip(initial, current)]
+
+        np.testing.assert_allclose(impermanent_loss(initial, current), expected, rtol=1e-12, atol=1e-15)
+        assert impermanent_loss(1.0, 4.0) == pytest.approx(-0.2)
+        assert np.ndim(impermanent_loss(1.0, 4.0)) == 0
+
+    def test_non_positive_ratios(self):
+        il = impermanent_loss([0.0, 1.0, -1.0, 1.0, np.nan], [1.0, 0.0, -2.0, 1e300, 1.0])
+
+        np.testing.assert_array_equal(il[:3], 0.0)
+        assert il[3] == pytest.approx(-1.0)
+        assert np.isnan(il[4])
+        assert np.isnan(impermanent_loss(0.0, 1.0, invalid=np.nan))
+
+    def test_concentrated_reduces_to_full_range(self):
+        ratios = np.geomspace(0.05, 20, 50)
+
+        np.testing.assert_allclose(concentrated_impermanent_loss(1.0, ratios, 0.0, np.inf),
+                                   impermanent_loss(1.0, ratios), rtol=1e-12, atol=1e-15)
+
+    def test_concentrated_range_amplifies_il(self):
+        # Inside [pa, pb] the loss scales by 1 / (1 - (pa / pb) ** (1/4)) around the entry price
+        il = concentrated_impermanent_loss(2.0, 4.0, 0.5, 2.0)
+
+        assert il == pytest.approx(impermanent_loss(2.0, 4.0) / (1 - 0.25 ** 0.25))
+        # Above the range the position is all token1, so its value stops following the price
+        ratios = np.array([2.0, 3.0])
+        hold_value = ratios * (1 - 1 / np.sqrt(1.1)) + 1 - np.sqrt(0.9)
+        position_value = (1 + concentrated_impermanent_loss(1.0, ratios, 0.9, 1.1)) * hold_value
+        assert position_value[0] == pytest.approx(position_value[1])
+
+    def test_rejects_bad_bounds(self):
+        with pytest.raises(ValueError, match="0 <= lower < upper"):
+            concentrated_impermanent_loss(1.0, 1.0, 1.2, 1.1)
+
+
+class TestCallSites:
+    """Training-data builders use the vectorized labels"""
+
+    def test_predictor_labels(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        df = pd.DataFrame({'initial_price_ratio': [1.0, 2.0, 0.0], 'current_price_ratio': [1.5, 1.0, 1.0],
+                           'volume': [1.0, 2.0, 3.0]})
+
+        _, y = ImpermanentLossPredictor(feature_engineering=False).prepare_training_data(df)
+
+        np.testing.assert_allclose(y[:2], [scalar_il(1.0, 1.5), scalar_il(2.0, 1.0)])
+        assert np.isnan(y[2]) and y.index.equals(df.index)
+
+    def test_pipeline_labels(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        rng = np.random.default_rng(0)
+        n = 60
+        pipeline = MLTrainingPipeline()
+        pipeline.historical_data = pd.DataFrame({
+            'SEI-USD_Close': 0.45 * np.exp(np.cumsum(rng.normal(0, 0.02, n))),
+            'SEI-USD_Volume': rng.uniform(1e5, 2e5, n),
+            'USDC-USD_Close': 1 + rng.normal(0, 1e-4, n),
+            'ETH-USD_Close': 3000 * np.exp(np.cumsum(rng.normal(0, 0.02, n))),
+            'ETH-USD_Volume': rng.uniform(1e6, 2e6, n)
+        })
+
+        il_data = pipeline.prepare_il_data()
+
+        expected = [scalar_il(i, c) for i, c in zip(il_data['initial_price_ratio'], il_data['current_price_ratio'])]
+        np.testing.assert_allclose(il_data['impermanent_loss'], expected, rtol=1e-9, atol=1e-15)
+        assert len(il_data) == 2 * (n - 24)
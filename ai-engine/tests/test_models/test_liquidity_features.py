@@ -0,0 +1,166 @@
+"""Tests for columnar liquidity feature extraction"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from sei_dlp_ai.models.liquidity_optimizer import LiquidityOptimizer
+from sei_dlp_ai.models.liquidity_features import (
+    LiquidityFeatureExtractor, MarketColumns, PoolColumns,
+    FEATURE_NAMES, MARKET_FEATURE_NAMES, VOLATILITY_FEATURE_NAMES
+)
+from sei_dlp_ai.types import AssetSymbol, MarketData, LiquidityPool
+
+
+def make_market_data(n_extra: int = 0):
+    """Create market data with SEI/USDC/ETH entries plus extra noise rows"""
+    now = datetime.now(timezone.utc)
+    rng = np.random.default_rng(3)
+    symbols = [AssetSymbol.SEI, AssetSymbol.USDC, AssetSymbol.ETH]
+    extra = [AssetSymbol.BTC, AssetSymbol.ATOM, AssetSymbol.SEI]
+    symbols += [extra[i] for i in rng.integers(0, len(extra), n_extra)]
+    return [
+        MarketData(
+            symbol=symbol,
+            price=Decimal(str(round(rng.uniform(0.1, 3000), 6))),
+            volume_24h=Decimal(str(round(rng.uniform(0, 1e8), 2))),
+            price_change_24h=Decimal(str(round(rng.normal(0, 0.05), 6))),
+            funding_rate=None if i % 3 == 0 else Decimal(str(round(rng.normal(0, 0.0005), 8))),
+            confidence_score=float(rng.uniform(0.5, 1.0)),
+            timestamp=now,
+            source="pyth"
+        )
+        for i, symbol in enumerate(symbols)
+    ]
+
+
+def make_pools(n: int):
+    """Create pools including one with zero liquidity"""
+    rng = np.random.default_rng(5)
+    return [
+        LiquidityPool(
+            address=f"0x{i:040x}",
+            token0=AssetSymbol.SEI,
+            token1=AssetSymbol.USDC,
+            reserve0=Decimal(str(round(rng.uniform(0, 1e6), 4))),
+            reserve1=Decimal(str(round(rng.uniform(0, 1e6), 4))),
+            fee_tier=float(rng.choice([0.0005, 0.003, 0.01])),
+            liquidity=Decimal("0") if i == 0 else Decimal(str(round(rng.uniform(1, 1e7), 4))),
+            sqrt_price_x96=0,
+            tick=0,
+            timestamp=datetime.now(timezone.utc)
+        )
+        for i in range(n)
+    ]
+
+
+class TestLiquidityFeatureExtractorParity:
+    """Vectorized extraction must match the per-object reference functions"""
+
+    @pytest.fixture
+    def optimizer(self):
+        return LiquidityOptimizer()
+
+    @pytest.mark.parametrize("n_extra", [0, 5, 40])
+    def test_market_features_parity(self, optimizer, n_extra):
+        market_data = make_market_data(n_extra)
+
+        expected = optimizer._extract_market_features(market_data)
+        actual = optimizer.feature_extractor.market_features(MarketColumns.from_market_data(market_data))
+
+        np.testing.assert_allclose(actual, expected, rtol=1e-12)
+
+    def test_market_features_empty(self, optimizer):
+        actual = optimizer.feature_extractor.market_features(MarketColumns.from_market_data([]))
+
+        assert actual.shape == (len(MARKET_FEATURE_NAMES),)
+        assert not actual.any()
+
+    def test_sei_features_parity(self, optimizer):
+        market_data = make_market_data(10)
+        pools = make_pools(16)
+
+        expected = np.array([optimizer._extract_sei_features(pool, market_data) for pool in pools])
+        actual = optimizer.feature_extractor.sei_features(
+            PoolColumns.from_pools(pools), MarketColumns.from_market_data(market_data)
+        )
+
+        np.testing.assert_allclose(actual, expected, rtol=1e-12)
+        assert actual[0, 2] == 0.0  # Zero liquidity pool
+
+    def test_full_feature_matrix_parity(self, optimizer):
+        market_data = make_market_data(10)
+        pools = make_pools(12)
+        sizes = [Decimal(str(100 * (i + 1))) for i in range(len(pools))]
+        rng = np.random.default_rng(11)
+        histories = [
+            pd.DataFrame({
+                'price': np.cumprod(1 + rng.normal(0, 0.01, 40)),
+                'volume': rng.lognormal(12, 0.3, 40),
+                'funding_rate': rng.normal(0.0001, 0.00005, 40)
+            })
+            for _ in pools
+        ]
+
+        matrix = optimizer._stack_features(pools, market_data, histories, sizes)
+
+        assert matrix.shape == (len(pools), len(FEATURE_NAMES))
+        for i, pool in enumerate(pools):
+            volatility = optimizer._calculate_volatility_features(histories[i])
+            expected = (
+                optimizer._extract_market_features(market_data) +
+                [volatility[name] for name in VOLATILITY_FEATURE_NAMES] +
+                optimizer._extract_sei_features(pool, market_data) +
+                [float(sizes[i])] +
+                [float(pool.reserve0), float(pool.reserve1), pool.fee_tier, float(pool.liquidity)]
+            )
+            np.testing.assert_allclose(matrix[i], expected, rtol=1e-12)
+
+    @pytest.mark.asyncio
+    async def test_performance_metrics_parity(self, optimizer):
+        market_data = make_market_data(4)
+        pools = make_pools(6)
+        bounds = [(Decimal("0.40"), Decimal("0.50")), (Decimal("1.0"), Decimal("1.0")),
+                  (Decimal("10"), Decimal("200")), (Decimal("0.01"), Decimal("0.02")),
+                  (Decimal("5"), Decimal("5.5")), (Decimal("0.9"), Decimal("1.1"))]
+
+        metrics = LiquidityFeatureExtractor.performance_metrics(
+            np.array([float(lower) for lower, _ in bounds]),
+            np.array([float(upper) for _, upper in bounds]),
+            PoolColumns.from_pools(pools).fee_tier,
+            MarketColumns.from_market_data(market_data).average_volume
+        )
+
+        for i, ((lower, upper), pool) in enumerate(zip(bounds, pools)):
+            expected = await optimizer._calculate_performance_metrics(
+                {"lower_price": lower, "upper_price": upper}, pool, market_data, Decimal("1000")
+            )
+            for key in ("expected_fees", "il_risk", "capital_efficiency"):
+                assert metrics[key][i] == pytest.approx(expected[key], rel=1e-12)
+
+
+class TestColumnConversion:
+    """Test object-to-column conversion"""
+
+    def test_pool_columns_tolerate_mock_pools(self):
+        pool = MagicMock(spec=["reserve0", "liquidity"])
+        pool.reserve0 = Decimal("10")
+        pool.liquidity = None
+
+        columns = PoolColumns.from_pools([pool])
+
+        assert columns.reserve0[0] == 10.0
+        assert columns.reserve1[0] == 0.0
+        assert columns.fee_tier[0] == 0.003
+        assert columns.liquidity[0] == 0.0
+
+    def test_market_columns_last_entry_wins(self):
+        market_data = make_market_data(0) + make_market_data(0)[:1]
+
+        columns = MarketColumns.from_market_data(market_data)
+
+        assert columns.last_index(AssetSymbol.SEI) == 3
+        assert columns.last_index(AssetSymbol.OSMO) == -1
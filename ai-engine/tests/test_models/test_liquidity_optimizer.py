@@ -1,5 +1,6 @@
 """Tests for Liquidity Optimizer ML model"""
 
+import tracemalloc
 import pytest
 import numpy as np
 import pandas as pd
@@ -10,7 +11,7 @@ from unittest.mock import MagicMock, patch
 from sei_dlp_ai.models.liquidity_optimizer import LiquidityOptimizer, LiquidityRange, VolatilityFeatures
 from sei_dlp_ai.types import (
     MarketData, AssetSymbol, ChainId, TradingSignal, 
-    Position, Portfolio, StrategyType
+    Position, Portfolio, StrategyType, LiquidityPool
 )
 
 
@@ -861,3 +862,221 @@ class TestLiquidityOptimizerHelperMethods:
         
         assert isinstance(aligned_price, Decimal)
         assert aligned_price > 0
+
+
+class TestLiquidityOptimizerBatchPrediction:
+    """Test batched multi-pool range prediction"""
+    
+    @pytest.fixture
+    def market_data(self):
+        """Create market data shared by every pool in a batch"""
+        now = datetime.now(timezone.utc)
+        return [
+            MarketData(
+                symbol=AssetSymbol.SEI, price=Decimal("0.45"), volume_24h=Decimal("1000000"),
+                price_change_24h=Decimal("0.05"), funding_rate=Decimal("0.0001"),
+                confidence_score=0.95, timestamp=now, source="pyth"
+            ),
+            MarketData(
+                symbol=AssetSymbol.USDC, price=Decimal("1.0"), volume_24h=Decimal("5000000"),
+                price_change_24h=Decimal("0.0"), confidence_score=0.99, timestamp=now, source="pyth"
+            ),
+        ]
+    
+    @pytest.fixture
+    def pools(self):
+        """Create a batch of pools with different reserves"""
+        return [
+            LiquidityPool(
+                address=f"0xpool{i}", token0=AssetSymbol.SEI, token1=AssetSymbol.USDC,
+                reserve0=Decimal(str(1000 + 100 * i)), reserve1=Decimal(str(2000 + 50 * i)),
+                fee_tier=0.003, liquidity=Decimal("1000000"), sqrt_price_x96=0, tick=0,
+                timestamp=datetime.now(timezone.utc)
+            )
+            for i in range(8)
+        ]
+    
+    @pytest.fixture
+    def histories(self, pools):
+        """Create one price/volume history per pool"""
+        rng = np.random.default_rng(7)
+        return [
+            pd.DataFrame({
+                'price': 0.45 * np.cumprod(1 + rng.normal(0, 0.01, 50)),
+                'volume': rng.lognormal(15, 0.5, 50)
+            })
+            for _ in pools
+        ]
+    
+    @pytest.fixture
+    def trained_optimizer(self, pools, market_data, histories):
+        """Create an optimizer trained on features of the batch pools"""
+        optimizer = LiquidityOptimizer()
+        sizes = [Decimal("1000")] * len(pools)
+        features = optimizer._stack_features(pools, market_data, histories, sizes)
+        rng = np.random.default_rng(0)
+        training_data = pd.DataFrame(
+            np.repeat(features, 4, axis=0) + rng.normal(0, 0.01, (len(pools) * 4, features.shape[1])),
+            columns=[f"feature_{i}" for i in range(features.shape[1])]
+        )
+        training_data['lower_bound'] = rng.uniform(0.40, 0.44, len(training_data))
+        training_data['upper_bound'] = rng.uniform(0.46, 0.50, len(training_data))
+        training_data['confidence'] = rng.uniform(0.6, 0.9, len(training_data))
+        optimizer.train_model(training_data)
+        return optimizer
+    
+    @pytest.mark.asyncio
+    async def test_batch_matches_single_pool_predictions(self, trained_optimizer, pools, market_data, histories):
+        """Batched predictions match per-pool predict_optimal_range results"""
+        sizes = [Decimal("1000")] * len(pools)
+        
+        batch = await trained_optimizer.predict_optimal_ranges(pools, market_data, histories, sizes)
+        
+        assert len(batch) == len(pools)
+        for pool, history, size, result in zip(pools, histories, sizes, batch):
+            single = await trained_optimizer.predict_optimal_range(pool, market_data, history, size)
+            assert result == single
+    
+    @pytest.mark.asyncio
+    async def test_batch_runs_scaler_and_model_once(self, pools, market_data, histories):
+        """A batch performs a single scaler pass and a single model call"""
+        optimizer = LiquidityOptimizer()
+        mock_model = MagicMock()
+        mock_model.predict.side_effect = lambda X: np.tile([0.40, 0.50, 0.8], (len(X), 1))
+        mock_scaler = MagicMock()
+        mock_scaler.transform.side_effect = lambda X: X
+        optimizer.ml_model = mock_model
+        optimizer.scaler = mock_scaler
+        optimizer.is_trained = True
+        
+        results = await optimizer.predict_optimal_ranges(
+            pools, market_data, histories, [Decimal("1000")] * len(pools)
+        )
+        
+        assert len(results) == len(pools)
+        mock_scaler.transform.assert_called_once()
+        mock_model.predict.assert_called_once()
+        assert mock_model.predict.call_args[0][0].shape[0] == len(pools)
+    
+    @pytest.mark.asyncio
+    async def test_batch_onnx_single_run(self, pools, market_data, histories):
+        """ONNX sessions are invoked once for the whole batch"""
+        optimizer = LiquidityOptimizer()
+        mock_session = MagicMock()
+        mock_input = MagicMock()
+        mock_input.name = "input"
+        mock_session.get_inputs.return_value = [mock_input]
+        mock_session.run.side_effect = lambda _, feeds: [np.tile([0.40, 0.50, 0.8], (len(feeds["input"]), 1))]
+        optimizer.onnx_session = mock_session
+        
+        results = await optimizer.predict_optimal_ranges(
+            pools, market_data, histories, [Decimal("1000")] * len(pools)
+        )
+        
+        assert len(results) == len(pools)
+        mock_session.run.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_batch_statistical_fallback(self, pools, market_data, histories):
+        """Batches fall back to the statistical method without a model"""
+        optimizer = LiquidityOptimizer()
+        
+        results = await optimizer.predict_optimal_ranges(
+            pools, market_data, histories, [Decimal("1000")] * len(pools)
+        )
+        
+        assert all(isinstance(r, LiquidityRange) for r in results)
+        assert all("Statistical" in r.reasoning for r in results)
+    
+    @pytest.mark.asyncio
+    async def test_batch_empty_and_mismatched_inputs(self, pools, market_data, histories):
+        """Empty batches return nothing and mismatched lengths are rejected"""
+        optimizer = LiquidityOptimizer()
+        
+        assert await optimizer.predict_optimal_ranges([], market_data, [], []) == []
+        
+        with pytest.raises(ValueError, match="same length"):
+            await optimizer.predict_optimal_ranges(pools, market_data, histories[:-1], [Decimal("1")] * len(pools))
+
+
+class TestLiquidityOptimizerIncrementalTraining:
+    """Test parallel, warm-start and skip-if-unchanged training"""
+    
+    @staticmethod
+    def make_training_data(seed: int, n_samples: int = 60) -> pd.DataFrame:
+        """Create a random training window"""
+        rng = np.random.default_rng(seed)
+        data = pd.DataFrame(rng.normal(size=(n_samples, 4)), columns=[f"feature_{i}" for i in range(4)])
+        data['lower_bound'] = rng.uniform(0.40, 0.44, n_samples)
+        data['upper_bound'] = rng.uniform(0.46, 0.50, n_samples)
+        data['confidence'] = rng.uniform(0.6, 0.9, n_samples)
+        return data
+    
+    def test_parallel_fit_reports_stats(self):
+        """Training uses the requested cores and reports wall time and memory"""
+        optimizer = LiquidityOptimizer()
+        
+        stats = optimizer.train_model(self.make_training_data(0), n_estimators=20, n_jobs=2)
+        
+        assert optimizer.training_stats is stats
+        assert stats.n_samples == 60 and stats.n_estimators == 20 and stats.trees_added == 20
+        assert stats.wall_time_seconds > 0 and stats.peak_rss_bytes > 0
+        assert stats.peak_python_heap_bytes is None
+        assert not stats.warm_started and not stats.skipped
+        # The fitted model predicts single rows without a thread pool
+        assert optimizer.ml_model.n_jobs is None
+    
+    def test_python_heap_tracing_is_opt_in(self):
+        """tracemalloc runs only when requested and is stopped afterwards"""
+        optimizer = LiquidityOptimizer()
+        
+        stats = optimizer.train_model(self.make_training_data(0), n_estimators=5, trace_python_heap=True)
+        
+        assert stats.peak_python_heap_bytes > 0
+        assert not tracemalloc.is_tracing()
+    
+    def test_warm_start_adds_trees_and_keeps_existing(self):
+        """A warm start keeps the scaler and trees and adds new trees"""
+        optimizer = LiquidityOptimizer()
+        optimizer.train_model(self.make_training_data(0), n_estimators=10)
+        scaler = optimizer.scaler
+        first_trees = list(optimizer.ml_model.estimators_)
+        
+        stats = optimizer.train_model(self.make_training_data(1), n_estimators=5, warm_start=True)
+        
+        assert stats.warm_started and stats.trees_added == 5 and stats.n_estimators == 15
+        assert optimizer.scaler is scaler
+        assert optimizer.ml_model.estimators_[:10] == first_trees
+    
+    def test_warm_start_without_model_fits_fresh(self):
+        """Warm start on an untrained optimizer falls back to a full fit"""
+        optimizer = LiquidityOptimizer()
+        
+        stats = optimizer.train_model(self.make_training_data(0), n_estimators=10, warm_start=True)
+        
+        assert not stats.warm_started and stats.n_estimators == 10
+        assert optimizer.is_trained
+    
+    def test_skip_if_unchanged(self):
+        """Identical data is not refit; changed data is"""
+        optimizer = LiquidityOptimizer()
+        data = self.make_training_data(0)
+        optimizer.train_model(data, n_estimators=10)
+        model = optimizer.ml_model
+        
+        skipped = optimizer.train_model(data.copy(), n_estimators=10, skip_if_unchanged=True)
+        refit = optimizer.train_model(self.make_training_data(1), n_estimators=10, skip_if_unchanged=True)
+        
+        assert skipped.skipped and skipped.trees_added == 0
+        assert not refit.skipped and refit.data_fingerprint != skipped.data_fingerprint
+        assert optimizer.ml_model is not model
+    
+    def test_retrain_invalidates_prediction_cache(self):
+        """Cached predictions from the previous model are dropped on retrain"""
+        optimizer = LiquidityOptimizer()
+        cache = optimizer.enable_prediction_cache()
+        
+        with patch.object(cache, 'invalidate') as invalidate:
+            optimizer.train_model(self.make_training_data(0), n_estimators=5)
+        
+        invalidate.assert_called_once_with()
@@ -0,0 +1,61 @@
+"""Tests for the CPU training mode of LSTMForecaster"""
+
+import os
+
+import pytest
+import numpy as np
+import torch
+
+from sei_dlp_ai.models import lstm_forecaster
+
+
+@pytest.fixture
+def frame(lstm_frame):
+    return lstm_frame(160)
+
+
+@pytest.fixture
+def forecaster(small_forecaster):
+    return small_forecaster(batch_size=16)
+
+
+class TestCpuTrainingMode:
+    """Mixed precision, threading and deferred checkpointing"""
+
+    @pytest.mark.parametrize("bf16", [True, False])
+    def test_trains_with_and_without_bf16(self, forecaster, frame, monkeypatch, bf16):
+        monkeypatch.setattr(lstm_forecaster, "cpu_supports_bf16", lambda: bf16)
+        threads = torch.get_num_threads()
+        try:
+            forecaster.train(frame.iloc[:120], frame.iloc[90:], list(frame.columns), epochs=2,
+                             cpu_optimized=True, num_threads=1)
+            assert torch.get_num_threads() == 1
+        finally:
+            torch.set_num_threads(threads)
+
+        assert len(forecaster.training_history) == 2
+        for entry in forecaster.training_history:
+            assert np.isfinite(entry["train_loss"]) and np.isfinite(entry["val_loss"])
+            assert entry["epoch_seconds"] > 0
+            assert entry["samples_per_second"] > 0
+
+    def test_best_checkpoint_written_once_at_end(self, forecaster, frame, monkeypatch):
+        saved = []
+        save_model = forecaster.save_model
+
+        def record(suffix="", state_dict=None):
+            saved.append(suffix)
+            save_model(suffix, state_dict)
+
+        monkeypatch.setattr(forecaster, "save_model", record)
+        forecaster.train(frame.iloc[:120], frame.iloc[90:], list(frame.columns), epochs=3)
+
+        assert saved == ["best", "final"]
+        best = torch.load(os.path.join(forecaster.save_path, f"{forecaster.model_name}_best.pt"))
+        assert set(best["model_state_dict"]) == set(forecaster.model.state_dict())
+
+    def test_no_best_checkpoint_without_validation(self, forecaster, frame):
+        forecaster.train(frame, None, list(frame.columns), epochs=1)
+
+        assert not os.path.exists(os.path.join(forecaster.save_path, f"{forecaster.model_name}_best.pt"))
+        assert os.path.exists(os.path.join(forecaster.save_path, f"{forecaster.model_name}_final.pt"))
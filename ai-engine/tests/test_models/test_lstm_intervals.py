@@ -0,0 +1,90 @@
+"""Tests for Monte Carlo dropout prediction intervals of LSTMForecaster"""
+
+import pytest
+import numpy as np
+import torch
+
+from sei_dlp_ai.models.lstm_forecaster import AttentionLSTM
+
+
+@pytest.fixture
+def frame(lstm_frame):
+    return lstm_frame(300)
+
+
+@pytest.fixture
+def forecaster(frame, small_forecaster):
+    return small_forecaster(frame)
+
+
+class TestMonteCarloSampling:
+    """Head-only MC dropout in one batched call"""
+
+    def test_samples_vary_and_model_stays_in_eval(self):
+        torch.manual_seed(0)
+        model = AttentionLSTM(5, 16, 1, 1, 6).eval()
+
+        with torch.no_grad():
+            samples = model.sample(torch.randn(3, 20, 5), n_samples=8)
+
+        assert samples.shape == (3, 8, 6)
+        assert (samples.std(dim=1) > 0).all()
+        assert not model.training and not model.feature_extractor.training
+
+    def test_samples_center_on_point_forecast(self, forecaster, frame):
+        samples = forecaster.sample_batch([frame.iloc[:24], frame.iloc[50:74]], n_samples=512)
+        point = forecaster.predict_batch([frame.iloc[:24], frame.iloc[50:74]])["predictions"]
+
+        spread = samples.std(axis=1)
+        assert samples.shape == (2, 512, 6)
+        assert (np.abs(samples.mean(axis=1) - point) < 4 * spread / np.sqrt(512) + 1e-6).all()
+
+
+class TestPredictionIntervals:
+    """Uncalibrated Gaussian and conformally calibrated intervals"""
+
+    def test_uncalibrated_intervals_are_nested(self, forecaster, frame):
+        result = forecaster.predict_intervals(frame.iloc[:24], n_samples=16)
+
+        assert result["calibrated"] is False
+        assert set(result["intervals"]) == {0.5, 0.8, 0.9}
+        inner, outer = result["intervals"][0.5], result["intervals"][0.9]
+        assert (outer["lower"] <= inner["lower"]).all() and (inner["upper"] <= outer["upper"]).all()
+        assert (inner["lower"] <= result["predictions"]).all()
+
+    def test_calibrated_coverage(self, forecaster, frame):
+        torch.manual_seed(0)
+        calibration = forecaster.calibrate_intervals(frame.iloc[:200], coverage=(0.5, 0.8), n_samples=32)
+
+        assert calibration["n_windows"] == 200 - 24 - 6 + 1
+        multipliers = np.asarray(calibration["multipliers"])
+        assert multipliers.shape == (2, 6) and (multipliers[1] >= multipliers[0]).all()
+
+        # Coverage of fresh windows from the same process
+        hits = {0.5: [], 0.8: []}
+        prices = frame["price"].to_numpy()
+        for start in range(200, 270, 2):
+            result = forecaster.predict_intervals(frame.iloc[start - 24:start], n_samples=32)
+            actual = prices[start:start + 6]
+            for level, interval in result["intervals"].items():
+                hits[level].append((interval["lower"] <= actual) & (actual <= interval["upper"]))
+
+        assert np.mean(hits[0.8]) > np.mean(hits[0.5]) > 0.2
+
+    def test_calibration_is_saved(self, forecaster, frame, small_forecaster):
+        forecaster.calibrate_intervals(frame.iloc[:100], coverage=(0.8,), n_samples=8)
+        forecaster.save_model("calibrated")
+
+        loaded = small_forecaster()
+        loaded.load_model(f"{forecaster.save_path}/{forecaster.model_name}_calibrated.pt")
+
+        assert loaded.interval_calibration == forecaster.interval_calibration
+        assert loaded.predict_intervals(frame.iloc[:24], n_samples=8)["calibrated"] is True
+        with pytest.raises(ValueError, match="not calibrated"):
+            loaded.predict_intervals(frame.iloc[:24], n_samples=8, coverage=(0.5,))
+
+    def test_rejects_bad_arguments(self, forecaster, frame):
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            forecaster.calibrate_intervals(frame, coverage=(1.5,))
+        with pytest.raises(ValueError, match="n_samples"):
+            forecaster.sample_batch([frame.iloc[:24]], n_samples=0)
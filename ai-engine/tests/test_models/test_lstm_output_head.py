@@ -0,0 +1,71 @@
+"""Tests for the fused multi-horizon output head of AttentionLSTM"""
+
+import pytest
+import torch
+import torch.nn as nn
+
+from sei_dlp_ai.models.lstm_forecaster import AttentionLSTM, LSTMForecaster
+
+
+@pytest.fixture
+def model():
+    torch.manual_seed(0)
+    return AttentionLSTM(5, 32, 1, 2, 12).eval()
+
+
+def legacy_state_dict(model: AttentionLSTM) -> dict:
+    """State dict in the old layout: one output_layers.{i} Linear per horizon"""
+    state = model.state_dict()
+    weight = state.pop("output_head.weight").view(model.prediction_horizon, model.output_dim, -1)
+    bias = state.pop("output_head.bias").view(model.prediction_horizon, model.output_dim)
+    for i in range(model.prediction_horizon):
+        state[f"output_layers.{i}.weight"] = weight[i].clone()
+        state[f"output_layers.{i}.bias"] = bias[i].clone()
+    return state
+
+
+class TestFusedOutputHead:
+    """One Linear must reproduce the per-horizon layers"""
+
+    def test_matches_per_horizon_layers(self, model):
+        state = legacy_state_dict(model)
+        layers = nn.ModuleList([nn.Linear(16, 2) for _ in range(model.prediction_horizon)])
+        for i, layer in enumerate(layers):
+            layer.weight.data = state[f"output_layers.{i}.weight"]
+            layer.bias.data = state[f"output_layers.{i}.bias"]
+        x = torch.randn(3, 20, 5)
+
+        with torch.no_grad():
+            predictions, _ = model(x)
+            lstm_out, _ = model.lstm(x)
+            attended, _ = model.attention(lstm_out, lstm_out, lstm_out)
+            features = model.feature_extractor((lstm_out + attended)[:, -1])
+            expected = torch.stack([layer(features) for layer in layers], dim=1)
+
+        assert predictions.shape == (3, 12, 2)
+        torch.testing.assert_close(predictions, expected)
+
+    def test_loads_legacy_checkpoint(self, model):
+        torch.manual_seed(1)
+        restored = AttentionLSTM(5, 32, 1, 2, 12).eval()
+
+        restored.load_state_dict(legacy_state_dict(model))
+
+        x = torch.randn(2, 20, 5)
+        with torch.no_grad():
+            torch.testing.assert_close(restored(x), model(x))
+
+    def test_forecaster_loads_legacy_checkpoint(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        torch.manual_seed(0)
+        forecaster = LSTMForecaster(sequence_length=24, prediction_horizon=12, hidden_dim=16, num_layers=1,
+                                    device="cpu")
+        model = forecaster.create_model(5)
+        torch.save({
+            "model_state_dict": legacy_state_dict(model),
+            "model_config": {"input_dim": 5, "hidden_dim": 16, "num_layers": 1, "prediction_horizon": 12}
+        }, tmp_path / "legacy.pt")
+
+        forecaster.load_model(str(tmp_path / "legacy.pt"))
+
+        torch.testing.assert_close(forecaster.model.output_head.weight, model.output_head.weight)
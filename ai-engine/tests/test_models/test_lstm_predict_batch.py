@@ -0,0 +1,91 @@
+"""Tests for batched LSTMForecaster inference"""
+
+import pytest
+import numpy as np
+from types import SimpleNamespace
+
+from sei_dlp_ai.monitoring.model_monitor import ModelEvaluator
+
+
+@pytest.fixture
+def frame(lstm_frame):
+    return lstm_frame(260)
+
+
+@pytest.fixture
+def forecaster(frame, small_forecaster):
+    return small_forecaster(frame, sequence_length=12, prediction_horizon=24)
+
+
+class TestPredictBatch:
+    """predict_batch must match repeated predict calls"""
+
+    def test_matches_single_predictions(self, forecaster, frame):
+        windows = [frame.iloc[i:i + 20] for i in range(0, 200, 25)]
+
+        batch = forecaster.predict_batch(windows, batch_size=3)
+
+        assert batch["predictions"].shape == (len(windows), 24)
+        assert batch["uncertainty"].shape == (len(windows), 24)
+        for i, window in enumerate(windows):
+            single = forecaster.predict(window)
+            np.testing.assert_allclose(batch["predictions"][i], single["predictions"], rtol=1e-5)
+            np.testing.assert_allclose(batch["uncertainty"][i], single["uncertainty"], rtol=1e-5)
+
+    def test_inverse_transform_matches_scaler(self, forecaster, frame):
+        batch = forecaster.predict_batch(frame.to_numpy()[None, :50], return_uncertainty=False)
+
+        scaled = (batch["predictions"][0] - forecaster.scaler.data_min_[0]) / forecaster.scaler.data_range_[0]
+        dummy = np.zeros((24, frame.shape[1]))
+        dummy[:, 0] = scaled
+
+        np.testing.assert_allclose(forecaster.scaler.inverse_transform(dummy)[:, 0], batch["predictions"][0])
+        assert "uncertainty" not in batch
+
+    def test_rejects_short_or_flat_input(self, forecaster, frame):
+        with pytest.raises(ValueError, match="Need at least 12 timesteps"):
+            forecaster.predict_batch(frame.to_numpy()[None, :5])
+        with pytest.raises(ValueError, match="Expected sequences"):
+            forecaster.predict_batch(frame.to_numpy())
+
+
+class TestPrecomputedScaling:
+    """Closed-form scaling must match the fitted MinMaxScaler"""
+
+    def test_transform_matches_scaler(self, forecaster, frame):
+        values = frame.to_numpy()
+
+        scaled = forecaster._transform(values[None])
+
+        assert scaled.dtype == np.float32 and scaled.shape == (1,) + values.shape
+        np.testing.assert_allclose(scaled[0], forecaster.scaler.transform(values), rtol=1e-6, atol=1e-7)
+
+    def test_long_frame_uses_tail_only(self, forecaster, frame):
+        np.testing.assert_allclose(forecaster.predict(frame)["predictions"],
+                                   forecaster.predict(frame.iloc[-12:])["predictions"])
+
+    def test_cache_follows_refit_scaler(self, forecaster, frame):
+        before = forecaster.predict(frame)["predictions"]
+
+        forecaster.prepare_data(frame * 2, list(frame.columns))
+
+        np.testing.assert_allclose(forecaster.predict(frame * 2)["predictions"], before * 2, rtol=1e-5)
+
+    def test_rejects_wrong_feature_count(self, forecaster, frame):
+        with pytest.raises(ValueError, match="Expected 5 features"):
+            forecaster.predict(frame.iloc[:, :3].to_numpy())
+
+
+class TestEvaluatorUsesBatch:
+    """ModelEvaluator evaluates every sliding window in batches"""
+
+    @pytest.mark.asyncio
+    async def test_batched_evaluation_matches_loop(self, forecaster, frame):
+        looped_model = SimpleNamespace(predict=forecaster.predict)
+
+        batched = await ModelEvaluator().evaluate_lstm_forecaster(forecaster, frame)
+        looped = await ModelEvaluator().evaluate_lstm_forecaster(looped_model, frame)
+
+        assert batched['test_size'] == looped['test_size'] == len(frame) - 168 - 24
+        for name, value in looped['metrics'].items():
+            assert batched['metrics'][name] == pytest.approx(value, rel=1e-5)
@@ -0,0 +1,133 @@
+"""Tests for exported TorchScript/ONNX runtimes of the LSTM forecaster"""
+
+import json
+import os
+
+import pytest
+import numpy as np
+import torch
+
+from sei_dlp_ai.models import lstm_runtime
+from sei_dlp_ai.models.lstm_forecaster import AttentionLSTM
+
+
+@pytest.fixture
+def model():
+    torch.manual_seed(0)
+    return AttentionLSTM(5, 16, 1, 1, 12).eval()
+
+
+@pytest.fixture
+def sequences():
+    return np.random.default_rng(0).random((4, 24, 5), dtype=np.float32)
+
+
+@pytest.fixture
+def frame(lstm_frame):
+    return lstm_frame(80)
+
+
+class TestRuntimeExport:
+    """Exported runtimes must reproduce the eager model"""
+
+    def test_torchscript_matches_eager(self, model, sequences, tmp_path):
+        path = lstm_runtime.export_torchscript(model, torch.from_numpy(sequences[:1]), str(tmp_path / "m.ts.pt"))
+
+        delta = lstm_runtime.accuracy_delta(
+            lstm_runtime.EagerRuntime(model), lstm_runtime.TorchScriptRuntime(path), sequences
+        )
+
+        assert delta["max_abs_prediction_delta"] < 1e-6
+        assert delta["max_abs_uncertainty_delta"] < 1e-6
+
+    def test_onnx_has_dynamic_batch(self, model, sequences, tmp_path):
+        path = lstm_runtime.export_onnx(model, torch.from_numpy(sequences[:1]), str(tmp_path / "m.onnx"))
+        runtime = lstm_runtime.OnnxRuntime(path)
+
+        predictions, uncertainty = runtime(sequences)
+
+        expected_predictions, expected_uncertainty = lstm_runtime.EagerRuntime(model)(sequences)
+        np.testing.assert_allclose(predictions, expected_predictions, atol=1e-5)
+        np.testing.assert_allclose(uncertainty, expected_uncertainty, atol=1e-5)
+
+    def test_quantized_runtimes_stay_close(self, model, sequences, tmp_path):
+        example = torch.from_numpy(sequences[:1])
+        onnx_path = lstm_runtime.export_onnx(model, example, str(tmp_path / "m.onnx"))
+        runtimes = [
+            lstm_runtime.TorchScriptRuntime(
+                lstm_runtime.export_torchscript(model, example, str(tmp_path / "q.ts.pt"), quantize=True)
+            ),
+            lstm_runtime.OnnxRuntime(lstm_runtime.quantize_onnx(onnx_path, str(tmp_path / "q.onnx")))
+        ]
+
+        for runtime in runtimes:
+            delta = lstm_runtime.accuracy_delta(lstm_runtime.EagerRuntime(model), runtime, sequences)
+            assert delta["max_abs_prediction_delta"] < 0.05
+
+    def test_latency_percentiles(self, model, sequences):
+        latency = lstm_runtime.measure_latency(lstm_runtime.EagerRuntime(model), sequences, runs=5, warmup=1)
+
+        assert 0 < latency["p50_ms"] <= latency["p99_ms"]
+
+    def test_unknown_backend(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown runtime backend"):
+            lstm_runtime.load_runtime("tensorrt", str(tmp_path))
+
+
+class TestForecasterRuntimes:
+    """LSTMForecaster export and runtime selection"""
+
+    @pytest.fixture
+    def forecaster(self, frame, small_forecaster):
+        return small_forecaster(frame, sequence_length=48, prediction_horizon=12)
+
+    def test_export_writes_artifacts_and_report(self, forecaster):
+        exported = forecaster.export_runtimes(latency_runs=3)
+
+        assert set(exported["paths"]) == {"torchscript", "torchscript_int8", "onnx", "onnx_int8"}
+        assert all(os.path.exists(path) for path in exported["paths"].values())
+        assert set(exported["report"]) == {"eager", "torchscript", "torchscript_int8", "onnx", "onnx_int8"}
+        assert exported["report"]["eager"]["max_abs_prediction_delta"] == 0.0
+        with open(os.path.join(exported["export_dir"], "runtime_report.json")) as f:
+            assert json.load(f) == exported["report"]
+
+    def test_predictions_match_eager_for_each_backend(self, forecaster, frame):
+        forecaster.export_runtimes(quantize=False, latency_runs=3)
+        windows = [frame.iloc[i:i + 48] for i in range(0, 30, 10)]
+        expected = forecaster.predict_batch(windows)
+
+        for backend in ["onnx", "torchscript"]:
+            assert forecaster.load_runtime(backend=backend) == backend
+            result = forecaster.predict_batch(windows)
+
+            np.testing.assert_allclose(result["predictions"], expected["predictions"], rtol=1e-4)
+            np.testing.assert_allclose(result["uncertainty"], expected["uncertainty"], rtol=1e-4, atol=1e-6)
+
+    def test_auto_selects_a_runtime_within_delta(self, forecaster, frame):
+        forecaster.export_runtimes(latency_runs=3)
+
+        backend = forecaster.load_runtime(max_prediction_delta=1e-5, latency_runs=3)
+
+        assert backend in {"eager", "onnx", "torchscript"}
+        assert (forecaster.runtime is None) == (backend == "eager")
+        assert forecaster.predict(frame.iloc[:48])["predictions"].shape == (12,)
+
+    def test_runtime_serves_without_eager_model(self, forecaster, frame):
+        forecaster.export_runtimes(quantize=False, latency_runs=3)
+        expected = forecaster.predict(frame.iloc[:48])
+
+        forecaster.load_runtime(backend="onnx")
+        forecaster.model = None
+
+        np.testing.assert_allclose(forecaster.predict(frame.iloc[:48])["predictions"], expected["predictions"],
+                                   rtol=1e-4)
+
+    def test_loading_a_checkpoint_drops_the_runtime(self, forecaster):
+        forecaster.save_model("checkpoint")
+        forecaster.export_runtimes(quantize=False, latency_runs=3)
+        forecaster.load_runtime(backend="onnx")
+        forecaster.streams["SEI"] = object()  # stand-in for an open stream of the old model
+
+        forecaster.load_model(f"{forecaster.save_path}/{forecaster.model_name}_checkpoint.pt")
+
+        assert forecaster.runtime is None and forecaster.streams == {}
@@ -0,0 +1,88 @@
+"""Tests for streaming AttentionLSTM inference"""
+
+import pytest
+import numpy as np
+import torch
+
+from sei_dlp_ai.models.lstm_forecaster import AttentionLSTM
+
+
+@pytest.fixture
+def model():
+    torch.manual_seed(0)
+    return AttentionLSTM(5, 32, 2, 1, 24, bidirectional=False).eval()
+
+
+@pytest.fixture
+def frame(lstm_frame):
+    return lstm_frame(60)
+
+
+class TestAttentionLSTMStreaming:
+    """Incremental steps must reproduce the full forward pass"""
+
+    def test_steps_match_full_recompute(self, model):
+        x = torch.randn(3, 40, 5)
+
+        with torch.no_grad():
+            state = model.init_stream(x[:, :30], max_length=64)
+            for t in range(30, 40):
+                predictions, uncertainty, state = model.stream_step(x[:, t], state)
+            expected_predictions, expected_uncertainty = model(x)
+
+        torch.testing.assert_close(predictions, expected_predictions, rtol=1e-4, atol=1e-6)
+        torch.testing.assert_close(uncertainty, expected_uncertainty, rtol=1e-4, atol=1e-6)
+        assert state.ticks == 40
+
+    def test_cache_is_bounded(self, model):
+        with torch.no_grad():
+            state = model.init_stream(torch.randn(1, 20, 5), max_length=8)
+            _, _, state = model.stream_step(torch.randn(1, 5), state)
+
+        assert state.keys.shape[2] == 8 and state.values.shape[2] == 8
+
+    def test_bidirectional_model_cannot_stream(self):
+        model = AttentionLSTM(5, 32, 1, 1, 24).eval()
+
+        with pytest.raises(ValueError, match="unidirectional"):
+            model.init_stream(torch.randn(1, 10, 5), max_length=10)
+
+
+class TestForecasterStreaming:
+    """LSTMForecaster stream API"""
+
+    @pytest.fixture
+    def forecaster(self, frame, small_forecaster):
+        return small_forecaster(frame, sequence_length=48, prediction_horizon=24, bidirectional=False)
+
+    def test_stream_matches_predict_within_window(self, forecaster, frame):
+        forecaster.start_stream("SEI", frame.iloc[:40])
+        for i in range(40, 48):
+            result = forecaster.update_stream("SEI", frame.iloc[i])
+
+        expected = forecaster.predict(frame.iloc[:48])
+
+        np.testing.assert_allclose(result["predictions"], expected["predictions"], rtol=1e-5)
+        np.testing.assert_allclose(result["uncertainty"], expected["uncertainty"], rtol=1e-4)
+        assert result["prediction_horizons"] == expected["prediction_horizons"]
+
+    def test_streams_are_independent(self, forecaster, frame):
+        forecaster.start_stream("SEI", frame.iloc[:40])
+        forecaster.start_stream("ETH", frame.iloc[10:50])
+        sei = forecaster.update_stream("SEI", frame.iloc[40].to_dict())
+
+        forecaster.end_stream("ETH")
+
+        assert set(forecaster.streams) == {"SEI"}
+        assert sei["predictions"].shape == (24,)
+        with pytest.raises(KeyError):
+            forecaster.update_stream("ETH", frame.iloc[50])
+
+    def test_save_load_keeps_direction(self, forecaster, small_forecaster):
+        forecaster.save_model("stream")
+
+        loaded = small_forecaster(sequence_length=48, prediction_horizon=24)
+        loaded.load_model(f"{forecaster.save_path}/{forecaster.model_name}_stream.pt")
+
+        assert loaded.bidirectional is False
+        assert not loaded.model.lstm.bidirectional
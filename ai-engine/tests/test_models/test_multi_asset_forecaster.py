@@ -0,0 +1,150 @@
+"""Tests for the shared-encoder multi-asset forecaster"""
+
+import pytest
+import numpy as np
+import torch
+
+from sei_dlp_ai.models.lstm_forecaster import AttentionLSTM
+from sei_dlp_ai.models.multi_asset_forecaster import MultiAssetAttentionLSTM, MultiAssetForecaster
+
+FEATURES = ['price', 'volume', 'volatility', 'high', 'low']
+ASSETS = {'SEI': 0.45, 'ETH': 3200.0, 'BTC': 65000.0}
+
+
+@pytest.fixture
+def asset_data(lstm_frame):
+    return {asset: lstm_frame(100, seed, base_price=price) for seed, (asset, price) in enumerate(ASSETS.items())}
+
+
+@pytest.fixture
+def forecaster(small_forecaster):
+    return small_forecaster(forecaster_cls=MultiAssetForecaster, assets=list(ASSETS), embedding_dim=4, batch_size=16)
+
+
+class TestMultiAssetModel:
+    """Per-asset heads on a shared encoder"""
+
+    def test_batch_matches_single_asset_passes(self):
+        torch.manual_seed(0)
+        model = MultiAssetAttentionLSTM(5, 16, 1, 3, 6, embedding_dim=4).eval()
+        x = torch.randn(3, 20, 5)
+        asset_ids = torch.tensor([2, 0, 1])
+
+        with torch.no_grad():
+            predictions, uncertainty = model(x, asset_ids)
+            singles = [model(x[i:i + 1], asset_ids[i:i + 1]) for i in range(3)]
+
+        assert predictions.shape == (3, 6, 1) and uncertainty.shape == (3, 6)
+        torch.testing.assert_close(predictions, torch.cat([single[0] for single in singles]))
+        torch.testing.assert_close(uncertainty, torch.cat([single[1] for single in singles]))
+
+    def test_assets_get_different_forecasts(self):
+        torch.manual_seed(0)
+        model = MultiAssetAttentionLSTM(5, 16, 1, 2, 6).eval()
+        x = torch.randn(1, 20, 5).repeat(2, 1, 1)
+
+        with torch.no_grad():
+            predictions, _ = model(x, torch.tensor([0, 1]))
+
+        assert not torch.allclose(predictions[0], predictions[1])
+
+    def test_one_model_is_smaller_than_one_per_asset(self):
+        shared = MultiAssetAttentionLSTM(5, 64, 2, 4, 24)
+        single = AttentionLSTM(5, 64, 2, 1, 24)
+
+        n_shared = sum(p.numel() for p in shared.parameters())
+        n_single = sum(p.numel() for p in single.parameters())
+        assert n_shared < 1.1 * n_single < 4 * n_single
+
+    def test_head_selects_each_assets_weights(self):
+        torch.manual_seed(0)
+        model = MultiAssetAttentionLSTM(5, 16, 1, 3, 6).eval()
+        x = torch.randn(2, 20, 5)
+        asset_ids = torch.tensor([2, 1])
+
+        with torch.no_grad():
+            last_output = model._encode_assets(x, asset_ids)
+            predictions, uncertainty = model._head(last_output, asset_ids)
+            expected = model(x, asset_ids)
+
+        torch.testing.assert_close(predictions, expected[0])
+        torch.testing.assert_close(uncertainty, expected[1])
+
+    def test_sample_uses_per_asset_heads(self):
+        torch.manual_seed(0)
+        model = MultiAssetAttentionLSTM(5, 16, 1, 3, 6).eval()
+        x = torch.randn(2, 20, 5)
+        asset_ids = torch.tensor([0, 2])
+
+        with torch.no_grad():
+            samples = model.sample(x, asset_ids, n_samples=50)
+            mean, _ = model(x, asset_ids)
+
+        assert samples.shape == (2, 50, 6)
+        assert samples.std(dim=1).mean() > 0
+        assert not model.feature_extractor.training
+        # Dropout samples scatter around the deterministic per-asset forecast
+        torch.testing.assert_close(samples.mean(dim=1), mean.squeeze(-1), atol=0.1, rtol=0)
+
+    def test_streaming_is_rejected(self):
+        model = MultiAssetAttentionLSTM(5, 16, 1, 2, 6).eval()
+
+        with pytest.raises(ValueError, match="single-asset"):
+            model.init_stream(torch.randn(1, 10, 5), max_length=10)
+
+
+class TestMultiAssetForecaster:
+    """Training, prediction and persistence"""
+
+    def test_predicts_every_asset_in_price_units(self, forecaster, asset_data):
+        forecaster.train(asset_data, {asset: frame[60:] for asset, frame in asset_data.items()}, FEATURES, epochs=2)
+
+        results = forecaster.predict({asset: frame.iloc[-30:] for asset, frame in asset_data.items()})
+
+        assert set(results) == set(ASSETS)
+        for asset, price in ASSETS.items():
+            assert results[asset]["predictions"].shape == (6,)
+            assert results[asset]["uncertainty"].shape == (6,)
+            # Per-asset scalers keep each forecast on its own price scale
+            assert 0.2 * price < np.median(results[asset]["predictions"]) < 5 * price
+        assert len(forecaster.training_history) == 2
+
+    def test_evaluate_reports_per_asset(self, forecaster, asset_data):
+        forecaster.train(asset_data, None, FEATURES, epochs=1)
+
+        metrics = forecaster.evaluate({asset: frame[50:] for asset, frame in asset_data.items()})
+
+        assert set(metrics) == set(ASSETS)
+        assert {"mse_1h", "mae_6h", "avg_rmse"} <= set(metrics["ETH"])
+
+    def test_save_load_roundtrip(self, forecaster, asset_data):
+        forecaster.train(asset_data, None, FEATURES, epochs=1)
+        expected = forecaster.predict({"BTC": asset_data["BTC"]})
+
+        loaded = MultiAssetForecaster(["placeholder"], device="cpu")
+        loaded.load_model(f"{forecaster.save_path}/{forecaster.model_name}_final.pt")
+
+        assert loaded.assets == list(ASSETS)
+        np.testing.assert_allclose(loaded.predict({"BTC": asset_data["BTC"]})["BTC"]["predictions"],
+                                   expected["BTC"]["predictions"], rtol=1e-5)
+
+    def test_batches_interleave_assets_lazily(self, forecaster, asset_data):
+        forecaster.train(asset_data, None, FEATURES, epochs=1)
+        loaders = forecaster._loaders(asset_data, shuffle=True)
+
+        torch.manual_seed(1)
+        order = [int(asset_ids[0]) for _, asset_ids, _ in forecaster._batches(loaders, shuffle=True)]
+        torch.manual_seed(1)
+        again = [int(asset_ids[0]) for _, asset_ids, _ in forecaster._batches(loaders, shuffle=True)]
+
+        # Every batch of every loader appears once, in an order seeded by torch's global RNG
+        assert order == again
+        assert sorted(order) == sorted(i for i, loader in enumerate(loaders.values()) for _ in range(len(loader)))
+        batches = forecaster._batches(loaders, shuffle=False)
+        assert [int(next(batches)[1][0]) for _ in range(len(loaders["SEI"]))] == [0] * len(loaders["SEI"])
+
+    def test_rejects_unknown_assets(self, forecaster, asset_data):
+        forecaster.train({"SEI": asset_data["SEI"]}, None, FEATURES, epochs=1)
+
+        with pytest.raises(ValueError, match="Unknown assets"):
+            forecaster.predict({"DOGE": asset_data["SEI"]})
@@ -0,0 +1,107 @@
+"""Tests for ONNX export and the reusable inference session"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+pytest.importorskip("skl2onnx")
+
+from sei_dlp_ai.models.liquidity_optimizer import LiquidityOptimizer
+from sei_dlp_ai.models.liquidity_features import FEATURE_NAMES
+from sei_dlp_ai.models.onnx_runtime import OnnxInferenceSession
+
+
+@pytest.fixture(scope="module")
+def trained_optimizer():
+    """Optimizer trained on synthetic data with the production feature layout"""
+    rng = np.random.default_rng(7)
+    n = 400
+    data = pd.DataFrame(rng.normal(0, 1, (n, len(FEATURE_NAMES))) * 10 + 50, columns=FEATURE_NAMES)
+    data['lower_bound'] = 0.9 + 0.01 * data['sei_price']
+    data['upper_bound'] = data['lower_bound'] + 0.1 + 0.001 * data['position_size']
+    data['confidence'] = 0.5 + 0.002 * data['liquidity']
+
+    optimizer = LiquidityOptimizer()
+    optimizer.train_model(data)
+    return optimizer
+
+
+@pytest.fixture(scope="module")
+def onnx_path(trained_optimizer, tmp_path_factory):
+    path = tmp_path_factory.mktemp("onnx") / "liquidity.onnx"
+    trained_optimizer.export_onnx(str(path))
+    return str(path)
+
+
+@pytest.fixture
+def features():
+    return np.random.default_rng(9).normal(0, 1, (64, len(FEATURE_NAMES))) * 10 + 50
+
+
+class TestOnnxExport:
+    """Test the folded scaler + forest export"""
+
+    def test_export_requires_trained_model(self, tmp_path):
+        optimizer = LiquidityOptimizer()
+        with pytest.raises(ValueError, match="ML model not initialized or not trained"):
+            optimizer.export_onnx(str(tmp_path / "model.onnx"))
+
+    def test_exported_graph_matches_sklearn(self, trained_optimizer, onnx_path, features):
+        session = OnnxInferenceSession.load(onnx_path)
+
+        expected = trained_optimizer.ml_model.predict(trained_optimizer.scaler.transform(features))
+        actual = session.run(features)
+
+        assert session.scaler_folded
+        assert actual.shape == expected.shape
+        np.testing.assert_allclose(actual, expected, rtol=1e-5)
+
+    @pytest.mark.asyncio
+    async def test_optimizer_does_not_rescale_folded_graph(self, trained_optimizer, onnx_path, features):
+        optimizer = LiquidityOptimizer()
+        optimizer.scaler = trained_optimizer.scaler
+        optimizer.load_onnx_model(onnx_path, intra_op_threads=1, inter_op_threads=1)
+
+        onnx_predictions = await optimizer._predict_batch_with_onnx(features)
+        sklearn_predictions = await trained_optimizer._predict_batch_with_sklearn(features)
+
+        assert len(onnx_predictions) == len(sklearn_predictions)
+        for onnx_pred, sklearn_pred in zip(onnx_predictions, sklearn_predictions):
+            assert float(onnx_pred["lower_price"]) == pytest.approx(float(sklearn_pred["lower_price"]), rel=1e-5)
+            assert float(onnx_pred["upper_price"]) == pytest.approx(float(sklearn_pred["upper_price"]), rel=1e-5)
+
+    def test_loading_clears_prediction_cache(self, onnx_path, features):
+        optimizer = LiquidityOptimizer()
+        cache = optimizer.enable_prediction_cache(ttl_seconds=60)
+        cache.put(SimpleNamespace(address="0xpool", tick=1), features[0], 0.5, MagicMock())
+
+        optimizer.load_onnx_model(onnx_path)
+
+        assert len(cache) == 0
+
+
+class TestOnnxInferenceSession:
+    """Test buffer reuse and input validation"""
+
+    def test_buffer_grows_and_is_reused(self, onnx_path, features):
+        session = OnnxInferenceSession.load(onnx_path, initial_batch_size=4)
+
+        single = session.run(features[0])
+        buffer = session._buffer
+        batch = session.run(features)
+        grown = session._buffer
+        again = session.run(features[:10])
+
+        assert single.shape == (1, 3)
+        assert grown.shape[0] >= len(features) and grown is not buffer
+        assert session._buffer is grown
+        np.testing.assert_allclose(again, batch[:10])
+        np.testing.assert_allclose(single[0], batch[0])
+
+    def test_rejects_wrong_feature_count(self, onnx_path):
+        session = OnnxInferenceSession.load(onnx_path)
+
+        with pytest.raises(ValueError, match="Expected 29 features"):
+            session.run(np.zeros((2, 5)))
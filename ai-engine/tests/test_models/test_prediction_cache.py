@@ -0,0 +1,198 @@
+"""Tests for the range prediction cache"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from sei_dlp_ai.models.forest_artifact import CompactForest
+from sei_dlp_ai.models.liquidity_optimizer import LiquidityOptimizer
+from sei_dlp_ai.models.liquidity_features import FEATURE_NAMES
+from sei_dlp_ai.models.prediction_cache import RangePredictionCache
+from sei_dlp_ai.types import AssetSymbol, LiquidityPool, LiquidityRange
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_pool(address: str = "0xpool", tick: int = 100, reserve0: str = "1000") -> LiquidityPool:
+    return LiquidityPool(
+        address=address, token0=AssetSymbol.SEI, token1=AssetSymbol.USDC,
+        reserve0=Decimal(reserve0), reserve1=Decimal("2000"), fee_tier=0.003,
+        liquidity=Decimal("1000000"), sqrt_price_x96=0, tick=tick,
+        timestamp=datetime.now(timezone.utc)
+    )
+
+
+def make_range(lower: str = "0.9") -> LiquidityRange:
+    return LiquidityRange(
+        lower_price=Decimal(lower), upper_price=Decimal("1.1"), confidence=0.8,
+        expected_fees=Decimal("1"), impermanent_loss_risk=0.1, capital_efficiency=0.5,
+        reasoning="test"
+    )
+
+
+@pytest.fixture
+def features():
+    return np.random.default_rng(0).uniform(0.1, 1000, len(FEATURE_NAMES))
+
+
+class TestRangePredictionCache:
+    """Test keying, LRU/TTL behaviour and tick invalidation"""
+
+    def test_hit_and_miss_counters(self, features):
+        cache = RangePredictionCache()
+        pool = make_pool()
+
+        assert cache.get(pool, features, 0.5) is None
+        cache.put(pool, features, 0.5, make_range())
+        cached = cache.get(pool, features, 0.5)
+
+        assert cached == make_range()
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == 0.5
+
+    def test_small_moves_share_a_bucket(self, features):
+        cache = RangePredictionCache(price_bucket=0.01, volume_bucket=0.1)
+        pool = make_pool()
+        cache.put(pool, features, 0.5, make_range())
+
+        nudged = features * 1.000001
+        moved = features.copy()
+        moved[0] *= 1.5
+
+        assert cache.get(pool, nudged, 0.5) is not None
+        assert cache.get(pool, moved, 0.5) is None
+        assert cache.get(pool, features, 0.7) is None
+
+    def test_sign_is_part_of_the_key(self):
+        cache = RangePredictionCache()
+        positive = np.zeros(len(FEATURE_NAMES))
+        negative = np.zeros(len(FEATURE_NAMES))
+        positive[2] = 0.5
+        negative[2] = -2.0
+
+        assert cache.quantize(positive) != cache.quantize(negative)
+
+    def test_ttl_expiry(self, features):
+        clock = FakeClock()
+        cache = RangePredictionCache(ttl_seconds=1.0, clock=clock)
+        pool = make_pool()
+        cache.put(pool, features, 0.5, make_range())
+
+        clock.now = 0.5
+        assert cache.get(pool, features, 0.5) is not None
+        clock.now = 1.5
+        assert cache.get(pool, features, 0.5) is None
+        assert cache.stats.expirations == 1
+        assert len(cache) == 0
+
+    def test_lru_eviction(self, features):
+        cache = RangePredictionCache(max_size=2)
+        pools = [make_pool(f"0x{i}") for i in range(3)]
+        cache.put(pools[0], features, 0.5, make_range())
+        cache.put(pools[1], features, 0.5, make_range())
+        cache.get(pools[0], features, 0.5)  # pool 1 becomes least recently used
+        cache.put(pools[2], features, 0.5, make_range())
+
+        assert cache.stats.evictions == 1
+        assert cache.get(pools[1], features, 0.5) is None
+        assert cache.get(pools[0], features, 0.5) is not None
+        assert cache.get(pools[2], features, 0.5) is not None
+
+    def test_tick_change_invalidates_pool(self, features):
+        cache = RangePredictionCache()
+        cache.put(make_pool(tick=100), features, 0.5, make_range())
+        cache.put(make_pool(tick=100), features, 0.7, make_range())
+        cache.put(make_pool("0xother", tick=5), features, 0.5, make_range())
+
+        assert cache.get(make_pool(tick=101), features, 0.5) is None
+        assert cache.stats.invalidations == 2
+        assert cache.get(make_pool("0xother", tick=5), features, 0.5) is not None
+
+    def test_cached_values_are_copies(self, features):
+        cache = RangePredictionCache()
+        pool = make_pool()
+        cache.put(pool, features, 0.5, make_range())
+
+        first = cache.get(pool, features, 0.5)
+        first.confidence = 0.1
+
+        assert cache.get(pool, features, 0.5).confidence == 0.8
+
+    def test_invalid_configuration(self):
+        with pytest.raises(ValueError):
+            RangePredictionCache(max_size=0)
+        with pytest.raises(ValueError):
+            RangePredictionCache(ttl_seconds=0)
+        with pytest.raises(ValueError):
+            RangePredictionCache(price_bucket=0)
+
+
+class TestOptimizerPredictionCache:
+    """LiquidityOptimizer only runs the model for cache misses"""
+
+    @pytest.fixture
+    def optimizer(self):
+        optimizer = LiquidityOptimizer()
+        optimizer.scaler = MagicMock()
+        optimizer.scaler.transform.side_effect = lambda x: x
+        optimizer.ml_model = MagicMock()
+        optimizer.ml_model.predict.side_effect = lambda x: np.tile([0.9, 1.1, 0.8], (len(x), 1))
+        optimizer.is_trained = True
+        optimizer.enable_prediction_cache(ttl_seconds=60)
+        return optimizer
+
+    @pytest.fixture
+    def history(self):
+        return pd.DataFrame({'price': np.linspace(0.9, 1.1, 50), 'volume': np.linspace(1e5, 2e5, 50)})
+
+    @pytest.mark.asyncio
+    async def test_repeat_queries_skip_the_model(self, optimizer, history):
+        pool = make_pool()
+
+        first = await optimizer.predict_optimal_range(pool, [], history, Decimal("1000"))
+        second = await optimizer.predict_optimal_range(pool, [], history, Decimal("1000"))
+
+        assert first == second
+        assert optimizer.ml_model.predict.call_count == 1
+        assert optimizer.prediction_cache.stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_predicts_only_misses(self, optimizer, history):
+        pools = [make_pool(f"0x{i}") for i in range(4)]
+        await optimizer.predict_optimal_ranges(pools[:2], [], [history] * 2, [Decimal("1000")] * 2)
+
+        ranges = await optimizer.predict_optimal_ranges(pools, [], [history] * 4, [Decimal("1000")] * 4)
+
+        assert len(ranges) == 4 and all(isinstance(r, LiquidityRange) for r in ranges)
+        assert optimizer.ml_model.predict.call_count == 2
+        assert len(optimizer.ml_model.predict.call_args_list[1][0][0]) == 2
+
+    @pytest.mark.asyncio
+    async def test_tick_change_forces_new_prediction(self, optimizer, history):
+        await optimizer.predict_optimal_range(make_pool(tick=1), [], history, Decimal("1000"))
+        await optimizer.predict_optimal_range(make_pool(tick=2), [], history, Decimal("1000"))
+
+        assert optimizer.ml_model.predict.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_loading_a_model_clears_the_cache(self, optimizer, history, monkeypatch):
+        await optimizer.predict_optimal_range(make_pool(), [], history, Decimal("1000"))
+        assert len(optimizer.prediction_cache) == 1
+
+        forest = MagicMock(feature_columns=['price'])
+        monkeypatch.setattr(CompactForest, "load", lambda path: forest)
+        optimizer.load_model("forest.bin")
+
+        assert len(optimizer.prediction_cache) == 0
@@ -0,0 +1,147 @@
+"""Tests for the Monte Carlo range grid optimizer"""
+
+import math
+import threading
+import pytest
+import numpy as np
+import pandas as pd
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from sei_dlp_ai.models.liquidity_optimizer import LiquidityOptimizer
+from sei_dlp_ai.models.range_grid_optimizer import RangeGridOptimizer, pareto_front
+from sei_dlp_ai.types import AssetSymbol, LiquidityPool, LiquidityRange
+
+
+@pytest.fixture
+def grid_optimizer():
+    return RangeGridOptimizer(grid_size=12, n_paths=200, n_steps=48)
+
+
+class TestParetoFront:
+    """Pareto front must match a brute-force dominance check"""
+
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(0)
+        gains = rng.uniform(0, 1, 300)
+        costs = rng.uniform(0, 1, 300)
+
+        front = set(pareto_front(gains, costs).tolist())
+
+        expected = {
+            i for i in range(len(gains))
+            if not np.any((gains >= gains[i]) & (costs <= costs[i]) & ((gains > gains[i]) | (costs < costs[i])))
+        }
+        assert front == expected
+
+
+class TestRangeGridOptimizer:
+    """Test candidate generation and vectorized scoring"""
+
+    def test_candidates_are_aligned_and_contain_price(self, grid_optimizer):
+        candidates = grid_optimizer.evaluate(0.45, 0.005, tick_spacing=60)
+
+        current_tick = math.log(0.45) / math.log(1.0001)
+        assert len(candidates) == 144
+        assert (candidates.lower_ticks % 60 == 0).all() and (candidates.upper_ticks % 60 == 0).all()
+        assert (candidates.lower_ticks <= current_tick).all() and (candidates.upper_ticks > current_tick).all()
+
+    def test_scores_match_per_path_reference(self, grid_optimizer):
+        price, volatility, fee_tier, volume_to_liquidity = 0.45, 0.005, 0.003, 0.5
+        candidates = grid_optimizer.evaluate(price, volatility, 60, fee_tier, volume_to_liquidity)
+        log_prices = grid_optimizer.simulate_log_prices(price, volatility).astype(np.float64)
+        ticks = log_prices / math.log(1.0001)
+
+        for i in [0, 17, 80, len(candidates) - 1]:
+            lower, upper = candidates.lower_ticks[i], candidates.upper_ticks[i]
+            time_in_range = ((ticks >= lower) & (ticks < upper)).mean(axis=1)
+
+            pa, pb, p_final = 1.0001 ** lower, 1.0001 ** upper, np.exp(log_prices[:, -1])
+            amount0 = 1 / math.sqrt(price) - 1 / math.sqrt(pb)
+            amount1 = math.sqrt(price) - math.sqrt(pa)
+            sqrt_final = np.clip(np.sqrt(p_final), math.sqrt(pa), math.sqrt(pb))
+            value = p_final * (1 / sqrt_final - 1 / math.sqrt(pb)) + sqrt_final - math.sqrt(pa)
+            il = np.maximum(1 - value / (p_final * amount0 + amount1), 0)
+            concentration = 1 / (1 - (pa / pb) ** 0.25)
+
+            assert candidates.time_in_range[i] == pytest.approx(time_in_range.mean(), abs=1e-3)
+            assert candidates.expected_il[i] == pytest.approx(il.mean(), rel=1e-3, abs=1e-6)
+            assert candidates.expected_fees[i] == pytest.approx(
+                (fee_tier * volume_to_liquidity * concentration * time_in_range).mean(), rel=1e-3
+            )
+            assert candidates.capital_efficiency[i] == pytest.approx(1 - 1 / concentration, rel=1e-9)
+
+    def test_optimize_selects_from_pareto_front(self, grid_optimizer):
+        result = grid_optimizer.optimize(0.45, 0.005, risk_tolerance=0.5)
+
+        front = result.candidates.pareto_indices
+        assert any(
+            result.candidates.lower_ticks[i] == result.lower_tick and result.candidates.upper_ticks[i] == result.upper_tick
+            for i in front
+        )
+        assert result.lower_price < 0.45 < result.upper_price
+
+    def test_lower_risk_tolerance_reduces_dispersion(self, grid_optimizer):
+        cautious = grid_optimizer.optimize(0.45, 0.005, risk_tolerance=0.0)
+        aggressive = grid_optimizer.optimize(0.45, 0.005, risk_tolerance=1.0)
+
+        assert cautious.return_std <= aggressive.return_std
+        assert aggressive.expected_return >= cautious.expected_return
+
+    def test_zero_fee_tier_keeps_time_in_range(self, grid_optimizer):
+        with_fees = grid_optimizer.evaluate(0.45, 0.005, fee_tier=0.003)
+        without_fees = grid_optimizer.evaluate(0.45, 0.005, fee_tier=0.0)
+
+        assert np.isfinite(without_fees.time_in_range).all()
+        np.testing.assert_allclose(without_fees.time_in_range, with_fees.time_in_range)
+        assert 0.0 <= grid_optimizer.optimize(0.45, 0.005, fee_tier=0.0).time_in_range <= 1.0
+
+    def test_invalid_inputs(self, grid_optimizer):
+        with pytest.raises(ValueError):
+            grid_optimizer.evaluate(0.0, 0.01)
+        with pytest.raises(ValueError):
+            RangeGridOptimizer(grid_size=0)
+
+
+class TestOptimizerGridSearch:
+    """The statistical fallback can use the grid search"""
+
+    @pytest.fixture
+    def pool(self):
+        return LiquidityPool(
+            address="0xabc", token0=AssetSymbol.SEI, token1=AssetSymbol.USDC,
+            reserve0=Decimal("2000"), reserve1=Decimal("1000"), fee_tier=0.003,
+            liquidity=Decimal("1000000"), sqrt_price_x96=0, tick=0,
+            timestamp=datetime.now(timezone.utc)
+        )
+
+    @pytest.fixture
+    def history(self):
+        return pd.DataFrame({'price': 0.5 * np.cumprod(1 + np.random.default_rng(1).normal(0, 0.005, 200))})
+
+    @pytest.mark.asyncio
+    async def test_statistical_fallback_uses_grid_search(self, pool, history):
+        optimizer = LiquidityOptimizer()
+        optimizer.enable_range_grid_search(grid_size=20, n_paths=100, n_steps=48)
+
+        result = await optimizer.predict_optimal_range(pool, [], history, Decimal("1000"))
+
+        assert isinstance(result, LiquidityRange)
+        assert "grid search over 400" in result.reasoning
+        assert result.lower_price < pool.price_token0_in_token1 < result.upper_price
+
+    @pytest.mark.asyncio
+    async def test_grid_search_runs_off_the_event_loop(self, pool, history):
+        optimizer = LiquidityOptimizer()
+        grid = optimizer.enable_range_grid_search(grid_size=8, n_paths=50, n_steps=24)
+        threads = []
+        optimize = grid.optimize
+
+        def recording_optimize(*args, **kwargs):
+            threads.append(threading.current_thread())
+            return optimize(*args, **kwargs)
+
+        grid.optimize = recording_optimize
+        await optimizer.predict_optimal_ranges([pool] * 3, [], [history] * 3, [Decimal("1000")] * 3)
+
+        assert len(threads) == 3 and threading.main_thread() not in threads
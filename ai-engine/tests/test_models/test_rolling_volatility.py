@@ -0,0 +1,161 @@
+"""Tests for streaming volatility state"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from sei_dlp_ai.models.liquidity_optimizer import LiquidityOptimizer
+from sei_dlp_ai.models.rolling_volatility import RollingVolatilityState, RunningMoments, RunningCoMoments
+from sei_dlp_ai.types import AssetSymbol, LiquidityPool, LiquidityRange
+
+
+@pytest.fixture
+def historical_data():
+    """Create five-minute price/volume/funding history"""
+    rng = np.random.default_rng(42)
+    n = 2000
+    return pd.DataFrame({
+        'price': 0.45 * np.cumprod(1 + rng.normal(0, 0.02, n)),
+        'volume': rng.lognormal(15, 0.5, n),
+        'funding_rate': rng.normal(0.0001, 0.00005, n)
+    })
+
+
+class TestRunningMoments:
+    """Test Welford accumulators"""
+
+    def test_moments_match_numpy(self):
+        values = np.random.default_rng(0).normal(5, 2, 500)
+        moments = RunningMoments()
+        for value in values:
+            moments.update(value)
+
+        assert moments.mean == pytest.approx(values.mean(), rel=1e-12)
+        assert moments.std == pytest.approx(values.std(ddof=1), rel=1e-10)
+
+    def test_comoments_match_corrcoef(self):
+        rng = np.random.default_rng(1)
+        x = rng.normal(size=300)
+        y = 0.6 * x + rng.normal(size=300)
+        comoments = RunningCoMoments()
+        for a, b in zip(x, y):
+            comoments.update(a, b)
+
+        assert comoments.correlation == pytest.approx(np.corrcoef(x, y)[0, 1], rel=1e-10)
+
+    def test_degenerate_series(self):
+        moments = RunningMoments()
+        moments.update(1.0)
+        assert moments.std == 0.0
+
+        comoments = RunningCoMoments()
+        for _ in range(5):
+            comoments.update(1.0, 2.0)
+        assert comoments.correlation == 0.0
+
+
+class TestRollingVolatilityState:
+    """Test streaming feature parity with the DataFrame path"""
+
+    def test_features_match_dataframe_path(self, historical_data):
+        optimizer = LiquidityOptimizer()
+        expected = optimizer._calculate_volatility_features(historical_data)
+
+        state = RollingVolatilityState.from_dataframe(historical_data)
+
+        actual = state.features()
+        assert actual.keys() == expected.keys()
+        for key in expected:
+            assert actual[key] == pytest.approx(expected[key], rel=1e-9, abs=1e-12)
+
+    def test_incremental_updates_match_batch(self, historical_data):
+        optimizer = LiquidityOptimizer()
+        state = RollingVolatilityState()
+
+        for n, row in enumerate(historical_data.itertuples(index=False), start=1):
+            state.update(row.price, row.volume, row.funding_rate)
+            if n in (3, 13, 14, 500):
+                expected = optimizer._calculate_volatility_features(historical_data.iloc[:n])
+                for key, value in state.features().items():
+                    assert value == pytest.approx(expected[key], rel=1e-9, abs=1e-12)
+
+    def test_single_return_is_zero_not_nan(self):
+        state = RollingVolatilityState()
+        state.update(1.0, 100.0, 0.0001)
+        state.update(1.1, 120.0, 0.0002)
+
+        assert all(np.isfinite(value) for value in state.features().values())
+        assert state.features()["price_volatility_24h"] == 0.0
+
+    def test_memory_is_bounded(self, historical_data):
+        state = RollingVolatilityState.from_dataframe(historical_data)
+
+        assert len(state) == len(historical_data)
+        assert len(state._recent_returns) == state.short_window
+
+    def test_price_only_history(self):
+        state = RollingVolatilityState.from_dataframe(pd.DataFrame({'price': [1.0, 1.1, 0.9, 1.05]}))
+
+        features = state.features()
+        assert features["price_volatility_24h"] > 0
+        assert features["volume_volatility_24h"] == 0.0
+        assert features["funding_rate_volatility"] == 0.0
+
+    def test_empty_and_invalid_ticks(self):
+        state = RollingVolatilityState.from_dataframe(pd.DataFrame())
+        assert state.empty
+        assert state.price_volatility is None
+        assert all(value == 0.0 for value in state.features().values())
+
+        state.update(float("nan"))
+        state.update(0.0)
+        state.update(1.0)
+        assert len(state) == 2
+        assert state.price_volatility is None
+
+
+class TestOptimizerStreamingIntegration:
+    """LiquidityOptimizer accepts streaming state in place of a DataFrame"""
+
+    @pytest.fixture
+    def pool(self):
+        return LiquidityPool(
+            address="0xabc", token0=AssetSymbol.SEI, token1=AssetSymbol.USDC,
+            reserve0=Decimal("1000"), reserve1=Decimal("2000"), fee_tier=0.003,
+            liquidity=Decimal("1000000"), sqrt_price_x96=0, tick=0,
+            timestamp=datetime.now(timezone.utc)
+        )
+
+    def test_update_market_tick_tracks_per_pool_state(self, historical_data):
+        optimizer = LiquidityOptimizer()
+        for row in historical_data.head(50).itertuples(index=False):
+            optimizer.update_market_tick("0xabc", row.price, row.volume, row.funding_rate)
+        optimizer.update_market_tick("0xdef", 1.0)
+
+        assert len(optimizer.volatility_states["0xabc"]) == 50
+        assert len(optimizer.volatility_states["0xdef"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_predict_with_streaming_state(self, pool, historical_data):
+        optimizer = LiquidityOptimizer()
+        state = RollingVolatilityState.from_dataframe(historical_data)
+
+        from_state = await optimizer.predict_optimal_range(pool, [], state, Decimal("1000"))
+        from_frame = await optimizer.predict_optimal_range(pool, [], historical_data, Decimal("1000"))
+
+        assert isinstance(from_state, LiquidityRange)
+        assert from_state.lower_price == pytest.approx(from_frame.lower_price, rel=1e-6)
+        assert from_state.upper_price == pytest.approx(from_frame.upper_price, rel=1e-6)
+        assert from_state.confidence == from_frame.confidence
+
+    @pytest.mark.asyncio
+    async def test_extract_features_with_streaming_state(self, pool, historical_data):
+        optimizer = LiquidityOptimizer()
+        state = RollingVolatilityState.from_dataframe(historical_data)
+
+        from_state = await optimizer._extract_features(pool, [], state, Decimal("1000"))
+        from_frame = await optimizer._extract_features(pool, [], historical_data, Decimal("1000"))
+
+        np.testing.assert_allclose(from_state, from_frame, rtol=1e-9, atol=1e-12)
@@ -0,0 +1,137 @@
+"""Tests for concentrated-liquidity tick math"""
+
+import pytest
+import numpy as np
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from sei_dlp_ai.models.liquidity_optimizer import LiquidityOptimizer
+from sei_dlp_ai.models.tick_math import (
+    MIN_TICK, MAX_TICK, MIN_SQRT_RATIO, MAX_SQRT_RATIO, Q96,
+    get_sqrt_ratio_at_tick, get_tick_at_sqrt_ratio, price_to_tick, tick_to_price,
+    align_tick, align_ticks, prices_to_ticks, ticks_to_prices, align_price_ranges
+)
+
+
+class TestExactTickMath:
+    """Integer results must match the on-chain TickMath library"""
+
+    @pytest.mark.parametrize("tick,expected", [
+        (MIN_TICK, MIN_SQRT_RATIO),
+        (MAX_TICK, MAX_SQRT_RATIO),
+        (0, Q96),
+        (50, 79426470787362580746886972461),
+        (-50, 79030349367926598376800521322),
+        (100, 79625275426524748796330556128),
+        (-100, 78833030112140176575862854579),
+    ])
+    def test_sqrt_ratio_at_tick(self, tick, expected):
+        assert get_sqrt_ratio_at_tick(tick) == expected
+
+    def test_tick_out_of_range(self):
+        with pytest.raises(ValueError):
+            get_sqrt_ratio_at_tick(MAX_TICK + 1)
+        with pytest.raises(ValueError):
+            get_tick_at_sqrt_ratio(MIN_SQRT_RATIO - 1)
+        with pytest.raises(ValueError):
+            get_tick_at_sqrt_ratio(MAX_SQRT_RATIO)
+
+    def test_tick_at_sqrt_ratio_bounds(self):
+        assert get_tick_at_sqrt_ratio(MIN_SQRT_RATIO) == MIN_TICK
+        assert get_tick_at_sqrt_ratio(MIN_SQRT_RATIO + 1) == MIN_TICK
+        assert get_tick_at_sqrt_ratio(MAX_SQRT_RATIO - 1) == MAX_TICK - 1
+
+    def test_round_trip_is_greatest_tick_below_ratio(self):
+        rng = np.random.default_rng(0)
+        for tick in rng.integers(MIN_TICK + 1, MAX_TICK, 500).tolist():
+            ratio = get_sqrt_ratio_at_tick(tick)
+            assert get_tick_at_sqrt_ratio(ratio) == tick
+            assert get_tick_at_sqrt_ratio(ratio - 1) == tick - 1
+
+    def test_price_conversions(self):
+        assert price_to_tick(1) == 0
+        assert price_to_tick(tick_to_price(1)) == 1
+        assert price_to_tick(tick_to_price(-1)) == -1
+        assert price_to_tick(Decimal("0.45")) == -7986
+        assert tick_to_price(0) == 1
+        assert float(tick_to_price(-7986)) == pytest.approx(0.45, rel=1e-4)
+
+    def test_price_must_be_positive(self):
+        with pytest.raises(ValueError):
+            price_to_tick(0)
+
+
+class TestVectorizedTickMath:
+    """Vectorized helpers must agree with the exact scalar versions"""
+
+    def test_prices_to_ticks_matches_scalar(self):
+        prices = np.exp(np.random.default_rng(1).uniform(-40, 40, 3000))
+
+        expected = np.array([price_to_tick(float(price)) for price in prices])
+
+        np.testing.assert_array_equal(prices_to_ticks(prices), expected)
+
+    def test_exact_tick_prices(self):
+        ticks = np.arange(-5000, 5000, 7)
+
+        np.testing.assert_array_equal(prices_to_ticks(ticks_to_prices(ticks) * (1 + 1e-12)), ticks)
+
+    @pytest.mark.parametrize("rounding", ["floor", "ceil", "nearest"])
+    def test_align_ticks_matches_scalar(self, rounding):
+        ticks = np.random.default_rng(2).integers(MIN_TICK, MAX_TICK, 1000)
+
+        expected = [align_tick(int(tick), 60, rounding) for tick in ticks]
+
+        np.testing.assert_array_equal(align_ticks(ticks, 60, rounding), expected)
+
+    def test_align_tick_modes(self):
+        assert align_tick(-7986, 60, "floor") == -8040
+        assert align_tick(-7986, 60, "ceil") == -7980
+        assert align_tick(-7986, 60, "nearest") == -7980
+        assert align_tick(MAX_TICK, 60) == 887220
+        assert align_tick(MIN_TICK, 60) == -887220
+        with pytest.raises(ValueError):
+            align_tick(0, 60, "up")
+
+    def test_align_price_ranges_keeps_lower_below_upper(self):
+        ranges = align_price_ranges([0.44, 0.45, 1.0], [0.46, 0.45, 1.0], 60)
+
+        assert (ranges % 60 == 0).all()
+        assert (ranges[:, 0] < ranges[:, 1]).all()
+        # Collapsed ranges cover the requested price
+        assert ticks_to_prices(ranges[1, 0]) <= 0.45 <= ticks_to_prices(ranges[1, 1])
+
+
+class TestOptimizerTickAlignment:
+    """LiquidityOptimizer aligns ranges on the real tick grid"""
+
+    def test_align_to_tick_spacing_is_on_grid(self):
+        optimizer = LiquidityOptimizer()
+        pool = MagicMock()
+        pool.tick_spacing = 10
+
+        aligned = optimizer._align_to_tick_spacing(Decimal("0.45"), pool)
+
+        assert price_to_tick(aligned) % 10 == 0
+        assert float(aligned) == pytest.approx(0.45, rel=1e-3)
+
+    def test_optimize_ranges_batch_matches_single(self):
+        optimizer = LiquidityOptimizer()
+        pools = [MagicMock(spec=[]) for _ in range(50)]
+        rng = np.random.default_rng(3)
+        predictions = []
+        for lower in rng.uniform(0.01, 100, 50):
+            predictions.append({
+                "lower_price": Decimal(str(round(lower, 6))),
+                "upper_price": Decimal(str(round(lower * rng.uniform(1.0001, 1.5), 6))),
+                "confidence": 0.7,
+                "reasoning": "test"
+            })
+
+        batch = optimizer._optimize_ranges_for_sei(predictions, pools)
+
+        for prediction, pool, optimized in zip(predictions, pools, batch):
+            single = optimizer._optimize_for_sei(prediction, pool)
+            assert single == optimized
+            assert optimized["lower_tick"] % 60 == 0 and optimized["upper_tick"] % 60 == 0
+            assert optimized["lower_price"] < optimized["upper_price"]
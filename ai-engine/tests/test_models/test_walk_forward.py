@@ -0,0 +1,118 @@
+"""Tests for walk-forward backtesting of the LSTM forecaster"""
+
+import pytest
+import numpy as np
+import pandas as pd
+import torch
+
+from sei_dlp_ai.models.lstm_forecaster import LSTMForecaster
+from sei_dlp_ai.models.walk_forward import Fold, WalkForwardBacktester
+
+FEATURES = ['price', 'volume', 'volatility', 'high', 'low']
+FORECASTER_PARAMS = {"sequence_length": 12, "prediction_horizon": 4, "hidden_dim": 8, "num_layers": 1,
+                     "batch_size": 32}
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    price = 1.5 + np.cumsum(rng.normal(0, 0.01, 120))
+    return pd.DataFrame({
+        'price': price,
+        'volume': rng.uniform(1e5, 2e5, 120),
+        'volatility': rng.uniform(0.01, 0.05, 120),
+        'high': price * 1.01,
+        'low': price * 0.99
+    }, index=pd.date_range("2024-01-01", periods=120, freq="h"))
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    torch.manual_seed(0)
+
+
+def backtester(**kwargs) -> WalkForwardBacktester:
+    params = {"initial_train_size": 60, "test_size": 20, "epochs": 1, "finetune_epochs": 1,
+              "forecaster_params": FORECASTER_PARAMS, "max_workers": 1, **kwargs}
+    return WalkForwardBacktester(FEATURES, **params)
+
+
+class TestFolds:
+    """Fold boundaries"""
+
+    def test_expanding_folds_stop_before_missing_actuals(self):
+        folds = backtester().folds(120)
+
+        assert folds == [Fold(0, 0, 60, 80), Fold(1, 0, 80, 100), Fold(2, 0, 100, 117)]
+
+    def test_rolling_window_and_step(self):
+        folds = backtester(train_window=40, step_size=30).folds(120)
+
+        assert [(fold.train_start, fold.cutoff, fold.test_end) for fold in folds] == [(20, 60, 80), (50, 90, 110)]
+
+    def test_rejects_short_training(self):
+        with pytest.raises(ValueError, match="at least sequence_length"):
+            backtester(initial_train_size=10)
+        with pytest.raises(ValueError, match="Unknown walk-forward mode"):
+            backtester(mode="expanding")
+
+
+class TestWalkForwardRun:
+    """Out-of-sample forecasts and columnar output"""
+
+    def test_retrain_forecasts_are_out_of_sample(self, frame, tmp_path):
+        result = backtester().run(frame, output_path=str(tmp_path / "forecasts.parquet"))
+        forecasts = result.forecasts
+
+        assert len(forecasts) == (20 + 20 + 17) * 4
+        assert (forecasts["origin"] >= forecasts["cutoff"]).all()
+        expected_actual = frame["price"].to_numpy()[forecasts["origin"] + forecasts["horizon"] - 1]
+        np.testing.assert_allclose(forecasts["actual"], expected_actual)
+        assert np.isfinite(forecasts["prediction"]).all()
+        assert list(result.fold_metrics["fold"]) == [0, 1, 2]
+        assert {"mse_1h", "mae_1h", "avg_rmse"} <= set(result.summary())
+        assert "mae_4h" in result.summary(horizons=[4])
+
+        stored = pd.read_parquet(tmp_path / "forecasts.parquet")
+        pd.testing.assert_frame_equal(stored, forecasts)
+
+    def test_finetune_warm_starts_later_folds(self, frame, monkeypatch):
+        warm_starts = []
+        train = LSTMForecaster.train
+
+        def record(self, train_data, *args, warm_start=False, **kwargs):
+            warm_starts.append((warm_start, len(train_data)))
+            return train(self, train_data, *args, warm_start=warm_start, **kwargs)
+
+        monkeypatch.setattr(LSTMForecaster, "train", record)
+        backtester(mode="finetune").run(frame)
+
+        # Later folds only see the 20 new rows plus sequence_length + horizon - 1 rows of context
+        assert warm_starts == [(False, 60), (True, 35), (True, 35)]
+
+    def test_parallel_chains_match_fold_layout(self, frame):
+        result = backtester(mode="finetune", max_workers=2).run(frame)
+
+        assert list(result.fold_metrics["fold"]) == [0, 1, 2]
+        assert result.forecasts.groupby("fold")["origin"].min().tolist() == [60, 80, 100]
+
+
+class TestWarmStart:
+    """LSTMForecaster.train(warm_start=True)"""
+
+    def test_keeps_model_and_scaler(self, frame):
+        forecaster = LSTMForecaster(**FORECASTER_PARAMS, device="cpu")
+        forecaster.train(frame.iloc[:60], None, FEATURES, epochs=1)
+        model, scaler = forecaster.model, forecaster.scaler
+
+        forecaster.train(frame.iloc[40:80], None, FEATURES, epochs=1, warm_start=True)
+
+        assert forecaster.model is model and forecaster.scaler is scaler
+
+    def test_rejects_other_features(self, frame):
+        forecaster = LSTMForecaster(**FORECASTER_PARAMS, device="cpu")
+        forecaster.train(frame.iloc[:60], None, FEATURES, epochs=1)
+
+        with pytest.raises(ValueError, match="Cannot warm start"):
+            forecaster.train(frame.iloc[:60], None, FEATURES[:3], epochs=1, warm_start=True)
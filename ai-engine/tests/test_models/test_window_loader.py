@@ -0,0 +1,104 @@
+"""Tests for the strided window loader"""
+
+import pytest
+import numpy as np
+import pandas as pd
+import torch
+
+from sei_dlp_ai.models.lstm_forecaster import DeFiPriceDataset, LSTMForecaster
+from sei_dlp_ai.models.window_loader import StridedWindowLoader
+
+
+@pytest.fixture
+def series():
+    return np.random.default_rng(0).normal(size=(120, 5)).astype(np.float32)
+
+
+class TestStridedWindowLoader:
+    """Batches must match the per-sample dataset"""
+
+    def test_windows_are_views_of_one_tensor(self, series):
+        loader = StridedWindowLoader(series, sequence_length=24, prediction_horizon=6)
+
+        assert loader.windows.data_ptr() == loader.data.data_ptr()
+        assert loader.windows.shape == (len(series) - 29, 24, 5)
+        assert loader.targets.shape == (len(series) - 29, 6)
+
+    def test_batches_match_dataset(self, series):
+        dataset = DeFiPriceDataset(series, 24, 6)
+        loader = StridedWindowLoader(series, 24, 6, batch_size=16, target_column=0)
+
+        batches = list(loader)
+        x = torch.cat([batch_x for batch_x, _ in batches])
+        y = torch.cat([batch_y for _, batch_y in batches])
+
+        assert len(batches) == len(loader) == -(-len(dataset) // 16)
+        for i in [0, 1, 37, len(dataset) - 1]:
+            expected_x, expected_y = dataset[i]
+            assert torch.equal(x[i], expected_x)
+            assert torch.equal(y[i], expected_y)
+
+    def test_shuffle_covers_every_window_once(self, series):
+        loader = StridedWindowLoader(series, 24, 6, batch_size=10, shuffle=True, seed=3)
+        first_values = loader.windows[:, 0, 1]
+
+        seen = torch.cat([batch_x[:, 0, 1] for batch_x, _ in loader])
+
+        assert torch.equal(seen.sort().values, first_values.sort().values)
+        assert not torch.equal(seen, first_values)
+
+    def test_unseeded_shuffle_follows_global_seed(self, series):
+        def first_batch():
+            loader = StridedWindowLoader(series, 24, 6, batch_size=10, shuffle=True)
+            return next(iter(loader))[0]
+
+        torch.manual_seed(0)
+        a, b = first_batch(), first_batch()
+        torch.manual_seed(0)
+
+        assert not torch.equal(a, b)
+        assert torch.equal(first_batch(), a)
+
+    def test_drop_last_and_target_column(self, series):
+        loader = StridedWindowLoader(series, 24, 6, batch_size=16, drop_last=True, target_column=2)
+
+        batches = list(loader)
+
+        assert all(len(batch_x) == 16 for batch_x, _ in batches)
+        assert torch.equal(batches[0][1][3], torch.from_numpy(series[27:33, 2]))
+
+    def test_batches_are_contiguous_copies(self, series):
+        loader = StridedWindowLoader(series, 24, 6, batch_size=8)
+
+        batch_x, batch_y = next(iter(loader))
+        batch_x += 1
+
+        assert batch_x.is_contiguous() and batch_y.is_contiguous()
+        assert torch.equal(loader.windows[0], torch.from_numpy(series[:24]))
+
+    def test_pin_memory_without_cuda_falls_back(self, series):
+        loader = StridedWindowLoader(series, 24, 6, pin_memory=True)
+
+        assert loader.pin_memory == torch.cuda.is_available()
+        assert next(iter(loader))[0].is_pinned() == torch.cuda.is_available()
+
+    def test_too_short_series(self, series):
+        with pytest.raises(ValueError, match="Need more than 29 timesteps"):
+            StridedWindowLoader(series[:29], 24, 6)
+
+
+class TestForecasterUsesLoader:
+    """LSTMForecaster trains and evaluates on strided batches"""
+
+    def test_train_and_evaluate(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        rng = np.random.default_rng(1)
+        frame = pd.DataFrame(rng.uniform(1, 2, size=(80, 5)), columns=['price', 'volume', 'volatility', 'high', 'low'])
+        forecaster = LSTMForecaster(sequence_length=12, prediction_horizon=4, hidden_dim=8, num_layers=1,
+                                    batch_size=16, device="cpu")
+
+        forecaster.train(frame, frame, epochs=2)
+        metrics = forecaster.evaluate(frame)
+
+        assert len(forecaster.training_history) == 2
+        assert np.isfinite(metrics["avg_mse"])